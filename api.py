@@ -1,9 +1,17 @@
 import asyncio
+import base64
+import contextvars
+import io
+import itertools
 import json
 import logging
 import os
+import threading
 import time
 import traceback
+import uuid
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from typing import Any
 
 from anyio import Path
@@ -11,7 +19,8 @@ from dotenv import load_dotenv
 from fake_useragent import UserAgent
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from PIL import Image
 from pydantic import BaseModel
 
 # browser-use imports
@@ -36,12 +45,31 @@ app.add_middleware(
 class CommandRequest(BaseModel):
 	command: str
 	model: str = 'auto'
+	log_level: str = 'INFO'  # minimum level of browser_use logs streamed to this client
+	resume_run_id: str | None = None  # continue this run from its last checkpoint instead of starting over
 
 
 # --- PERSISTÊNCIA GLOBAL ---
-current_agent_task = None
-shared_browser = None
-shared_browser_lock = asyncio.Lock()
+# Active runs by run ID, so /stop-agent can cancel one operator's task without touching the others
+active_runs: dict[str, asyncio.Task] = {}
+
+# Run ID of the task that emitted a log record, used to route browser_use logs to the right SSE stream
+current_run_id: contextvars.ContextVar[str | None] = contextvars.ContextVar('current_run_id', default=None)
+
+# Leased pool sessions by their log id -> run ID. Session and watchdog logs come from the session's event bus
+# tasks, which keep the context of whichever run first started them, so they are routed by session instead.
+session_runs: dict[str, str] = {}
+SESSION_LOGGER_PREFIX = 'browser_use.BrowserSession🅑 '
+
+
+def record_run_id(record: logging.LogRecord) -> str | None:
+	"""Run ID a browser_use log record belongs to."""
+	if record.name.startswith(SESSION_LOGGER_PREFIX):
+		session_log_id = record.name[len(SESSION_LOGGER_PREFIX) :].split(' ', 1)[0]
+		if session_log_id in session_runs:
+			return session_runs[session_log_id]
+	return current_run_id.get()
+
 
 SYSTEM_PROMPT_EXT = """
 IMPORTANT INSTRUCTIONS FOR NAVIGATION:
@@ -53,77 +81,284 @@ IMPORTANT INSTRUCTIONS FOR NAVIGATION:
 
 @app.get('/health')
 async def health():
-	return {'status': 'ok'}
+	return {'status': 'ok', 'pool': browser_pool.stats(), 'active_runs': len(active_runs), 'logs': log_stream_counters}
 
 
-async def get_or_create_browser():
-	global shared_browser
-	async with shared_browser_lock:
-		if shared_browser is None:
-			try:
-				print('[SYSTEM] Inicializando Instância Global do Navegador...')
-
-				# Check for Cloud API Key
-				cloud_key = os.getenv('BROWSER_USE_API_KEY')
-				if cloud_key:
-					print('🚀 [MODE] Using Browser-Use Cloud (Stealth & Anti-Detect)')
-					shared_browser = Browser(
-						use_cloud=True,
-						cloud_profile_id=os.getenv('CLOUD_PROFILE_ID'),  # Optional
-					)
-				else:
-					print('🛡️ [MODE] Using Local Browser (Hardened)')
-					abs_profile_path = os.path.abspath(os.path.join(os.getcwd(), 'browser_profile'))  # noqa: ASYNC240
-					if not os.path.exists(abs_profile_path):  # noqa: ASYNC240
-						os.makedirs(abs_profile_path)
-
-					# Cross-platform executable detection
-					chrome_path = os.getenv('BROWSER_EXECUTABLE_PATH')
-					if not chrome_path:
-						# Fallback for Windows
-						for p in [
-							r'C:\Program Files\Google\Chrome\Application\chrome.exe',
-							r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
-						]:
-							if os.path.exists(p):  # noqa: ASYNC240
-								chrome_path = p
-								break
-
-					# User Agent Rotation
+def create_browser(slot: int) -> Browser:
+	"""Creates the browser for a pool slot. Local browsers get one profile dir per slot, Chrome locks it."""
+	try:
+		# Check for Cloud API Key
+		cloud_key = os.getenv('BROWSER_USE_API_KEY')
+		if cloud_key:
+			print('🚀 [MODE] Using Browser-Use Cloud (Stealth & Anti-Detect)')
+			return Browser(
+				use_cloud=True,
+				cloud_profile_id=os.getenv('CLOUD_PROFILE_ID'),  # Optional
+			)
+
+		print(f'🛡️ [MODE] Using Local Browser (Hardened) - slot {slot}')
+		profile_dir = 'browser_profile' if slot == 0 else f'browser_profile_{slot}'
+		abs_profile_path = os.path.abspath(os.path.join(os.getcwd(), profile_dir))
+		if not os.path.exists(abs_profile_path):
+			os.makedirs(abs_profile_path)
+
+		# Cross-platform executable detection
+		chrome_path = os.getenv('BROWSER_EXECUTABLE_PATH')
+		if not chrome_path:
+			# Fallback for Windows
+			for p in [
+				r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+				r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+			]:
+				if os.path.exists(p):
+					chrome_path = p
+					break
+
+		# User Agent Rotation
+		try:
+			ua = UserAgent()
+			user_agent = ua.random
+		except Exception:
+			user_agent = (
+				'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+			)
+
+		print(f'🎭 [STEALTH] User-Agent: {user_agent}')
+
+		is_headless = os.getenv('HEADLESS', 'false').lower() == 'true'
+		return Browser(
+			headless=is_headless,
+			keep_alive=True,
+			executable_path=chrome_path,
+			user_data_dir=abs_profile_path,
+			user_agent=user_agent,
+			args=[
+				'--disable-blink-features=AutomationControlled',
+				'--no-sandbox',
+				'--disable-infobars',
+				'--window-size=1280,720',
+			],
+		)
+	except Exception as e:
+		print(f'[ERROR] Falha crítica ao inicializar navegador: {e}')
+		traceback.print_exc()
+		raise e
+
+
+class BrowserPool:
+	"""
+	Pool of browser sessions leased to one run at a time.
+
+	Keeps at least `min_size` sessions around and never more than `max_size`; leases wait for a free
+	session when the pool is exhausted. Sessions idle for longer than `idle_timeout` seconds are killed
+	(down to `min_size`) and their slot is reused by the next session created.
+	"""
+
+	def __init__(self, factory, min_size: int = 1, max_size: int = 4, idle_timeout: float = 300.0):
+		self.factory = factory
+		self.min_size = max(0, min_size)
+		self.max_size = max(1, max_size, self.min_size)
+		self.idle_timeout = idle_timeout
+		self._idle: list[tuple[Browser, int, float]] = []  # (browser, slot, idle since)
+		self._leased: dict[int, int] = {}  # id(browser) -> slot
+		self._free_slots: list[int] = []
+		self._starting = 0  # sessions being started by warm_up, they hold a slot but are not idle yet
+		self._next_slot = 0
+		self._condition = asyncio.Condition()
+		self._reaper: asyncio.Task | None = None
+
+	@property
+	def size(self) -> int:
+		return len(self._idle) + len(self._leased) + self._starting
+
+	def stats(self) -> dict[str, int]:
+		return {'idle': len(self._idle), 'leased': len(self._leased), 'max': self.max_size}
+
+	def _take_slot(self) -> int:
+		if self._free_slots:
+			self._free_slots.sort()
+			return self._free_slots.pop(0)
+		slot = self._next_slot
+		self._next_slot += 1
+		return slot
+
+	async def _acquire(self) -> tuple[Browser, int]:
+		async with self._condition:
+			while True:
+				if self._idle:
+					browser, slot, _ = self._idle.pop()  # most recently used first, keeps the rest idle long enough to reap
+					break
+				if self.size < self.max_size:
+					slot = self._take_slot()
 					try:
-						ua = UserAgent()
-						user_agent = ua.random
+						browser = self.factory(slot)
 					except Exception:
-						user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-
-					print(f'🎭 [STEALTH] User-Agent: {user_agent}')
-
-					is_headless = os.getenv('HEADLESS', 'false').lower() == 'true'
-					shared_browser = Browser(
-						headless=is_headless,
-						keep_alive=True,
-						executable_path=chrome_path,
-						user_data_dir=abs_profile_path,
-						user_agent=user_agent,
-						args=[
-							'--disable-blink-features=AutomationControlled',
-							'--no-sandbox',
-							'--disable-infobars',
-							'--window-size=1280,720',
-						],
-					)
+						self._free_slots.append(slot)
+						raise
+					break
+				await self._condition.wait()
+			self._leased[id(browser)] = slot
+		self._ensure_reaper()
+		return browser, slot
+
+	async def _release(self, browser: Browser) -> None:
+		async with self._condition:
+			slot = self._leased.pop(id(browser))
+			self._idle.append((browser, slot, time.monotonic()))
+			self._condition.notify()
+
+	@asynccontextmanager
+	async def lease(self):
+		"""Lease a browser session for the duration of the block."""
+		browser, _ = await self._acquire()
+		try:
+			yield browser
+		finally:
+			await self._release(browser)
+
+	async def warm_up(self) -> None:
+		"""Create idle sessions up to `min_size` (at least one) and start them.
+
+		Browsers are started outside the pool lock, so leases are not blocked by a Chrome launch, and only join the
+		idle sessions once started.
+		"""
+		while True:
+			async with self._condition:
+				if self.size >= max(1, self.min_size):
+					break
+				slot = self._take_slot()
+				self._starting += 1
+
+			browser = None
+			try:
+				browser = self.factory(slot)
+				await browser.start()
+			except BaseException:
+				async with self._condition:
+					self._starting -= 1
+					self._free_slots.append(slot)
+					self._condition.notify()
+				if browser is not None:
+					try:
+						await browser.kill()
+					except Exception as e:
+						print(f'[POOL] Failed to close browser session that did not start: {e}')
+				raise
+
+			async with self._condition:
+				self._starting -= 1
+				self._idle.append((browser, slot, time.monotonic()))
+				self._condition.notify()
+		self._ensure_reaper()
+
+	def _ensure_reaper(self) -> None:
+		if self.idle_timeout > 0 and (self._reaper is None or self._reaper.done()):
+			self._reaper = asyncio.create_task(self._reap_idle_loop())
+
+	async def _reap_idle_loop(self) -> None:
+		while True:
+			await asyncio.sleep(max(self.idle_timeout / 4, 1.0))
+			await self.reap_idle()
+
+	async def reap_idle(self) -> int:
+		"""Kill sessions idle for longer than `idle_timeout`, keeping `min_size` sessions. Returns how many were killed."""
+		now = time.monotonic()
+		expired: list[tuple[Browser, int, float]] = []
+		async with self._condition:
+			# oldest first, so the most recently used sessions stay warm
+			for entry in sorted(self._idle, key=lambda entry: entry[2]):
+				if self.size - len(expired) <= self.min_size:
+					break
+				if now - entry[2] >= self.idle_timeout:
+					expired.append(entry)
+			for entry in expired:
+				self._idle.remove(entry)
+				self._free_slots.append(entry[1])
+			if expired:
+				self._condition.notify_all()
+
+		for browser, slot, _ in expired:
+			print(f'[POOL] Recycling idle browser session (slot {slot})')
+			try:
+				await browser.kill()
 			except Exception as e:
-				print(f'[ERROR] Falha crítica ao inicializar navegador: {e}')
-				traceback.print_exc()
-				raise e
+				print(f'[POOL] Failed to close idle browser session: {e}')
+		return len(expired)
+
+
+# --- STEP FRAMES ---
+# Step screenshots are encoded off the event loop and served by /runs/{run_id}/frames/{step_id}
+# instead of being inlined (as megabytes of base64) in the SSE stream.
+FRAME_MAX_WIDTH = int(os.getenv('FRAME_MAX_WIDTH', '960'))
+FRAME_JPEG_QUALITY = int(os.getenv('FRAME_JPEG_QUALITY', '60'))
+
+
+class FrameStore:
+	"""In-memory JPEG frames by run and step, keeping the most recent `max_runs` runs."""
+
+	def __init__(self, max_runs: int = 20, max_frames_per_run: int = 200):
+		self.max_runs = max_runs
+		self.max_frames_per_run = max_frames_per_run
+		self._runs: OrderedDict[str, OrderedDict[str, bytes]] = OrderedDict()
+
+	def put(self, run_id: str, step_id: str, frame: bytes) -> None:
+		frames = self._runs.setdefault(run_id, OrderedDict())
+		self._runs.move_to_end(run_id)
+		frames[step_id] = frame
+		while len(frames) > self.max_frames_per_run:
+			frames.popitem(last=False)
+		while len(self._runs) > self.max_runs:
+			self._runs.popitem(last=False)
 
-		return shared_browser
+	def get(self, run_id: str, step_id: str) -> bytes | None:
+		return self._runs.get(run_id, {}).get(step_id)
+
+
+frame_store = FrameStore()
+
+
+def encode_frame(image_bytes: bytes, max_width: int = FRAME_MAX_WIDTH, quality: int = FRAME_JPEG_QUALITY) -> bytes:
+	"""Downscales a PNG/JPEG screenshot to `max_width` and re-encodes it as JPEG (CPU bound, run in a thread)."""
+	with Image.open(io.BytesIO(image_bytes)) as image:
+		image = image.convert('RGB')
+		if max_width > 0 and image.width > max_width:
+			image = image.resize((max_width, round(image.height * max_width / image.width)), Image.Resampling.BILINEAR)
+		output = io.BytesIO()
+		image.save(output, format='JPEG', quality=quality, optimize=False)
+		return output.getvalue()
+
+
+def read_screenshot(screenshot_path: str | None) -> bytes | None:
+	"""Bytes of the screenshot DOMWatchdog already took for the step's last agent step, if it was saved to disk."""
+	if not screenshot_path or not os.path.exists(screenshot_path):
+		return None
+	with open(screenshot_path, 'rb') as f:
+		return f.read()
+
+
+async def capture_frame(browser: Browser, screenshot_path: str | None) -> bytes | None:
+	"""JPEG frame for a finished step: the agent's own last screenshot if available, else a fresh capture."""
+	image_bytes = await asyncio.to_thread(read_screenshot, screenshot_path)
+	if image_bytes is None:
+		current_page = await browser.get_current_page()
+		if current_page is None:
+			return None
+		image_bytes = base64.b64decode(await current_page.screenshot(format='jpeg', quality=FRAME_JPEG_QUALITY))
+	return await asyncio.to_thread(encode_frame, image_bytes)
+
+
+browser_pool = BrowserPool(
+	create_browser,
+	min_size=int(os.getenv('BROWSER_POOL_MIN_SIZE', '1')),
+	max_size=int(os.getenv('BROWSER_POOL_MAX_SIZE', '4')),
+	idle_timeout=float(os.getenv('BROWSER_POOL_IDLE_TIMEOUT', '300')),
+)
 
 
 @app.post('/open-browser')
 async def open_browser():
 	try:
-		await get_or_create_browser()
+		await browser_pool.warm_up()
 		return {'status': 'success', 'message': 'Navegador ativo'}
 	except Exception as e:
 		return {'status': 'error', 'message': str(e)}
@@ -131,8 +366,9 @@ async def open_browser():
 
 @app.post('/run-agent')
 async def run_agent(request: CommandRequest):
-	global current_agent_task
-	print(f'\n--- [AGENT] Recebido comando: {request.command} (Modelo: {request.model}) ---')
+	# Resuming reuses the run ID, it is also the orchestrator's checkpoint thread
+	run_id = request.resume_run_id or uuid.uuid4().hex
+	print(f'\n--- [AGENT] Recebido comando: {request.command} (Modelo: {request.model}, run {run_id}) ---')
 
 	start_time = time.time()
 	loop = asyncio.get_running_loop()
@@ -141,170 +377,343 @@ async def run_agent(request: CommandRequest):
 		queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
 
 		# technical logging redirect
+		log_level = logging.getLevelNamesMapping().get(request.log_level.upper(), logging.INFO)
+		log_stream = LogStream(loop, lambda: queue.put_nowait({'type': LOG_WAKEUP}), start_time)
 		logger = logging.getLogger('browser_use')
-		logger.setLevel(logging.INFO)
-		handler = SSELogHandler(queue, loop, start_time)
+		handler = SSELogHandler(log_stream, run_id, level=log_level)
 		handler.setFormatter(logging.Formatter('%(message)s'))
-		logger.addHandler(handler)
+		attach_log_handler(logger, handler)
 
 		async def run_task():
 			nonlocal start_time
+			current_run_id.set(run_id)
+			session_log_id = None
+			orchestrator: LAMOrchestrator | None = None
+			step_counter = itertools.count(1)
+			frame_tasks: set[asyncio.Task] = set()
+
+			async def produce_frame(step_id: str, browser: Browser, screenshot_path: str | None, elapsed: float) -> None:
+				try:
+					frame = await capture_frame(browser, screenshot_path)
+				except Exception as e:
+					print(f'[DEBUG] Screenshot failed: {e}')
+					return
+				if frame is None:
+					return
+				frame_store.put(run_id, step_id, frame)
+				await queue.put(
+					{'type': 'frame', 'step_id': step_id, 'url': f'/runs/{run_id}/frames/{step_id}', 'elapsed': elapsed}
+				)
+
 			try:
-				browser_instance = await get_or_create_browser()
-
-				# Instantiate LAM Orchestrator
-				# Determine model based on request (mapping frontend strings to LAM prefixes)
-				model_name = 'gpt-4o'  # Default
-				if request.model == 'ollama':
-					model_name = 'ollama/llama3.2'
-				elif request.model == 'smol':
-					model_name = 'ollama/qwen2.5:3b'
-				elif request.model == 'groq':
-					model_name = 'groq/llama-3.3-70b-versatile'
-				elif request.model == 'openrouter':
-					model_name = 'openrouter/meta-llama/llama-3.3-70b-instruct:free'
-				elif request.model == 'puter':
-					# Puter "Luxury Fallback" - Using Gemini 2.0 via OpenRouter as it matches Puter's promise
-					model_name = 'openrouter/google/gemini-2.0-flash-001'
-					await queue.put({'type': 'info', 'message': '💎 Usando Puter (Gemini 2.0 Luxury Fallback)...', 'elapsed': 0})
-				elif request.model == 'vision':
-					model_name = 'gpt-4o'  # Primary vision model
-				elif request.model == 'jules':
-					model_name = 'google/gemini-1.5-pro'
-					await queue.put(
-						{'type': 'info', 'message': '💎 Conectando Cérebro VIP (Gemini 1.5 Pro via Jules API)...', 'elapsed': 0}
-					)
-				elif request.model == 'auto':
-					# Attempt to use primary model from .env if auto is selected
-					primary = os.getenv('PRIMARY_MODEL', 'groq')
-					if primary == 'groq':
+				if browser_pool.size >= browser_pool.max_size and not browser_pool.stats()['idle']:
+					await queue.put({'type': 'info', 'message': '⏳ Aguardando navegador livre...', 'elapsed': 0})
+				async with browser_pool.lease() as browser_instance:
+					session_log_id = browser_instance._id_for_logs
+					session_runs[session_log_id] = run_id
+					# Instantiate LAM Orchestrator
+					# Determine model based on request (mapping frontend strings to LAM prefixes)
+					model_name = 'gpt-4o'  # Default
+					if request.model == 'ollama':
+						model_name = 'ollama/llama3.2'
+					elif request.model == 'smol':
+						model_name = 'ollama/qwen2.5:3b'
+					elif request.model == 'groq':
 						model_name = 'groq/llama-3.3-70b-versatile'
-					elif primary == 'openrouter':
+					elif request.model == 'openrouter':
 						model_name = 'openrouter/meta-llama/llama-3.3-70b-instruct:free'
-
-				print(f'[SYSTEM] Model selected for LAM: {model_name}')
-
-				orchestrator = LAMOrchestrator(browser=browser_instance, model_name=model_name)
-
-				# Use astream instead of run directly on orchestrator because orchestrator.run is an async generator
-				async for event in orchestrator.run(request.command):
-					now = time.time()
-					elapsed = float(round(now - start_time, 1))
-
-					if 'planner' in event:
-						plan_data = event['planner'].get('plan', [])
-						plan_text = '\n'.join([f'{i + 1}. {step.get("description")}' for i, step in enumerate(plan_data)])
-						await queue.put({'type': 'info', 'message': f'📝 Plano gerado:\n{plan_text}', 'elapsed': elapsed})
-
-					if 'executor' in event:
-						exec_results = event['executor'].get('results', [])
-						for res in exec_results:
-							step_info = res.get('step', {})
-							outcome = res.get('outcome', 'Unknown')
-							history = res.get('history')
-
-							screenshot_b64 = None
-							# Extract screenshot from the latest state if possible
+					elif request.model == 'puter':
+						# Puter "Luxury Fallback" - Using Gemini 2.0 via OpenRouter as it matches Puter's promise
+						model_name = 'openrouter/google/gemini-2.0-flash-001'
+						await queue.put(
+							{'type': 'info', 'message': '💎 Usando Puter (Gemini 2.0 Luxury Fallback)...', 'elapsed': 0}
+						)
+					elif request.model == 'vision':
+						model_name = 'gpt-4o'  # Primary vision model
+					elif request.model == 'jules':
+						model_name = 'google/gemini-1.5-pro'
+						await queue.put(
+							{
+								'type': 'info',
+								'message': '💎 Conectando Cérebro VIP (Gemini 1.5 Pro via Jules API)...',
+								'elapsed': 0,
+							}
+						)
+					elif request.model == 'auto':
+						# Attempt to use primary model from .env if auto is selected
+						primary = os.getenv('PRIMARY_MODEL', 'groq')
+						if primary == 'groq':
+							model_name = 'groq/llama-3.3-70b-versatile'
+						elif primary == 'openrouter':
+							model_name = 'openrouter/meta-llama/llama-3.3-70b-instruct:free'
+
+					print(f'[SYSTEM] Model selected for LAM: {model_name}')
+
+					orchestrator = LAMOrchestrator(browser=browser_instance, model_name=model_name)
+					if request.resume_run_id:
+						await queue.put({'type': 'info', 'message': f'♻️ Retomando execução {run_id}...', 'elapsed': 0})
+						events = orchestrator.resume(run_id)
+					else:
+						events = orchestrator.run(request.command, thread_id=run_id)
+
+					# Use astream instead of run directly on orchestrator because orchestrator.run is an async generator
+					async for event in events:
+						now = time.time()
+						elapsed = float(round(now - start_time, 1))
+
+						if 'planner' in event:
+							plan_data = event['planner'].get('plan', [])
+							plan_text = '\n'.join([f'{i + 1}. {step.get("description")}' for i, step in enumerate(plan_data)])
+							await queue.put({'type': 'info', 'message': f'📝 Plano gerado:\n{plan_text}', 'elapsed': elapsed})
+
+						if 'executor' in event:
+							exec_results = event['executor'].get('results', [])
+							for res in exec_results:
+								step_info = res.get('step', {})
+								outcome = res.get('outcome', 'Unknown')
+
+								# The frame is produced in the background, the client fetches it when the 'frame' event arrives
+								step_id = str(next(step_counter))
+								frame_tasks.add(
+									asyncio.create_task(
+										produce_frame(step_id, browser_instance, res.get('screenshot_path'), elapsed)
+									)
+								)
+
+								res_val = res.get('result')
+								res_str = str(res_val) if res_val is not None else ''
+								memory_snippet = res_str[:150]
+
+								await queue.put(
+									{
+										'type': 'step',
+										'step': step_info.get('description', 'Action'),
+										'thought': f'Executed: {step_info.get("action_type")} - {outcome}',
+										'goal': step_info.get('description'),
+										'memory': f'Result: {memory_snippet}',
+										'url': '...',
+										'elapsed': elapsed,
+										'step_id': step_id,
+									}
+								)
+
+						if 'summarizer' in event:
+							summary = event['summarizer'].get('final_output', 'Done')
+							final_url = 'about:blank'
 							try:
-								# Version 0.11.13 might have different state access
+								# ROBUST PAGE EXTRACTION
 								current_page = await browser_instance.get_current_page()
 								if current_page:
-									screenshot_b64 = await current_page.screenshot(format='jpeg', quality=50)
-									import base64
-
-									if isinstance(screenshot_b64, bytes):
-										screenshot_b64 = base64.b64encode(screenshot_b64).decode('utf-8')
+									final_url = getattr(current_page, 'url', '')
 							except Exception as e:
-								print(f'[DEBUG] Screenshot failed: {e}')
-
-							res_val = res.get('result')
-							res_str = str(res_val) if res_val is not None else ''
-							memory_snippet = res_str[:150]
+								print(f'[DEBUG] Final URL extraction failed: {e}')
 
 							await queue.put(
 								{
-									'type': 'step',
-									'step': step_info.get('description', 'Action'),
-									'thought': f'Executed: {step_info.get("action_type")} - {outcome}',
-									'goal': step_info.get('description'),
-									'memory': f'Result: {memory_snippet}',
-									'url': '...',
-									'elapsed': elapsed,
-									'screenshot': screenshot_b64,
+									'type': 'done',
+									'message': 'Tarefa finalizada.',
+									'final_url': final_url,
+									'summary': summary,
+									'total_time': elapsed,
 								}
 							)
 
-					if 'summarizer' in event:
-						summary = event['summarizer'].get('final_output', 'Done')
-						final_url = 'about:blank'
-						try:
-							# ROBUST PAGE EXTRACTION
-							current_page = await browser_instance.get_current_page()
-							if current_page:
-								final_url = getattr(current_page, 'url', '')
-						except Exception as e:
-							print(f'[DEBUG] Final URL extraction failed: {e}')
-
-						await queue.put(
-							{
-								'type': 'done',
-								'message': 'Tarefa finalizada.',
-								'final_url': final_url,
-								'summary': summary,
-								'total_time': elapsed,
-							}
-						)
+					# Frames still being produced may need the leased browser
+					if frame_tasks:
+						await asyncio.wait(frame_tasks, timeout=10)
 
 			except Exception as e:
 				traceback.print_exc()
 				await queue.put({'type': 'error', 'message': f'Erro fatal: {str(e)}'})
 			finally:
-				logger.removeHandler(handler)
+				for frame_task in frame_tasks:
+					frame_task.cancel()
+				if orchestrator is not None:
+					await orchestrator.close()
+				# the session may already have been leased to the next run
+				if session_log_id is not None and session_runs.get(session_log_id) == run_id:
+					del session_runs[session_log_id]
+				detach_log_handler(logger, handler)
 				await queue.put({'type': 'end'})
 
 		task = asyncio.create_task(run_task())
-		current_agent_task = task
-
-		try:
-			while True:
-				item = await queue.get()
-				if item.get('type') == 'end':
-					break
+		active_runs[run_id] = task
+
+		def forget_run(done: asyncio.Task) -> None:
+			# a resumed run may already have taken over the run ID
+			if active_runs.get(run_id) is done:
+				del active_runs[run_id]
+
+		task.add_done_callback(forget_run)
+
+		# A client disconnect closes only the stream: the run keeps its browser until it finishes and can still be
+		# stopped through /stop-agent, its frames stay fetchable
+		yield f'data: {json.dumps({"type": "run", "run_id": run_id})}\n\n'
+		while True:
+			item = await queue.get()
+			if item.get('type') in (LOG_WAKEUP, 'end'):
+				# all buffered log lines go out in a single write
+				batch = ''.join(f'data: {json.dumps(log_event)}\n\n' for log_event in log_stream.drain_events())
+				if batch:
+					yield batch
+			if item.get('type') == 'end':
+				break
+			if item.get('type') != LOG_WAKEUP:
 				yield f'data: {json.dumps(item)}\n\n'
-		finally:
-			current_agent_task = None
 
-	return StreamingResponse(event_generator(), media_type='text/event-stream')
+	return StreamingResponse(event_generator(), media_type='text/event-stream', headers={'X-Run-Id': run_id})
+
+
+@app.get('/runs/{run_id}/frames/{step_id}')
+async def get_frame(run_id: str, step_id: str):
+	frame = frame_store.get(run_id, step_id)
+	if frame is None:
+		raise HTTPException(status_code=404, detail='Frame não encontrado.')
+	return Response(content=frame, media_type='image/jpeg', headers={'Cache-Control': 'private, max-age=3600'})
 
 
 @app.post('/stop-agent')
-async def stop_agent():
-	global current_agent_task
-	if current_agent_task and not current_agent_task.done():
-		current_agent_task.cancel()
-		return {'status': 'success'}
-	return {'status': 'info'}
+async def stop_agent(run_id: str | None = None):
+	"""Cancels the run with the given ID, or every active run when no ID is given."""
+	if run_id is not None:
+		tasks = [active_runs[run_id]] if run_id in active_runs else []
+	else:
+		tasks = list(active_runs.values())
+
+	stopped = 0
+	for task in tasks:
+		if not task.done():
+			task.cancel()
+			stopped += 1
+	return {'status': 'success' if stopped else 'info', 'stopped': stopped}
 
 
 # Custom Log Handler to stream logs to SSE
-class SSELogHandler(logging.Handler):
-	def __init__(self, queue, loop, start_time):
-		super().__init__()
-		self.queue = queue
+LOG_WAKEUP = '_logs'  # queue item telling the SSE loop that buffered log lines are waiting
+
+# Totals across all runs, reported by /health
+log_stream_counters = {'records': 0, 'coalesced': 0, 'dropped': 0}
+
+
+class LogStream:
+	"""
+	Bounded, thread-safe buffer of log lines for one SSE client.
+
+	Consecutive identical lines are coalesced into one line with a repeat count. When the buffer is full
+	the oldest line is dropped (or the new one, with policy='drop_newest') and counted. The SSE loop is
+	woken through `wake` only when the buffer goes from empty to non-empty, so a burst of log lines costs
+	one event loop callback instead of one task per line.
+	"""
+
+	def __init__(self, loop, wake, start_time: float, max_records: int = 500, policy: str = 'drop_oldest'):
 		self.loop = loop
+		self.wake = wake
 		self.start_time = start_time
+		self.max_records = max_records
+		self.policy = policy
+		self.dropped = 0
+		self.coalesced = 0
+		self._reported_dropped = 0
+		self._records: deque[list] = deque()  # [message, elapsed, repeat count]
+		self._lock = threading.Lock()
+		self._wake_pending = False
+
+	def append(self, message: str) -> None:
+		elapsed = round(time.time() - self.start_time, 1)
+		with self._lock:
+			if self._records and self._records[-1][0] == message:
+				last = self._records[-1]
+				last[1] = elapsed
+				last[2] += 1
+				self.coalesced += 1
+				return
+			if len(self._records) >= self.max_records:
+				self.dropped += 1
+				if self.policy == 'drop_newest':
+					return
+				self._records.popleft()
+			self._records.append([message, elapsed, 1])
+			if self._wake_pending:
+				return
+			self._wake_pending = True
+		try:
+			self.loop.call_soon_threadsafe(self.wake)
+		except RuntimeError:
+			pass  # event loop already closed
+
+	def drain_events(self) -> list[dict[str, Any]]:
+		"""Takes every buffered line as an SSE 'info' event, plus a notice if lines were dropped since the last drain."""
+		with self._lock:
+			records = list(self._records)
+			self._records.clear()
+			self._wake_pending = False
+			dropped = self.dropped - self._reported_dropped
+			self._reported_dropped = self.dropped
+
+		# only ever updated from the event loop thread
+		log_stream_counters['records'] += sum(repeat for _, _, repeat in records) + dropped
+		log_stream_counters['coalesced'] += sum(repeat - 1 for _, _, repeat in records)
+		log_stream_counters['dropped'] += dropped
+
+		events: list[dict[str, Any]] = []
+		if dropped:
+			events.append(
+				{
+					'type': 'info',
+					'message': f'[SYS] ... {dropped} linhas de log descartadas ...',
+					'elapsed': records[0][1] if records else 0,
+				}
+			)
+		for message, elapsed, repeat in records:
+			suffix = f' (x{repeat})' if repeat > 1 else ''
+			events.append({'type': 'info', 'message': f'[SYS] {message}{suffix}', 'elapsed': elapsed})
+		return events
+
+
+class SSELogHandler(logging.Handler):
+	def __init__(self, stream: LogStream, run_id=None, level=logging.NOTSET):
+		super().__init__(level)
+		self.stream = stream
+		self.run_id = run_id
 
 	def emit(self, record):
+		# Only forward records belonging to this run
+		if self.run_id is not None and record_run_id(record) != self.run_id:
+			return
 		try:
-			log_entry = self.format(record)
-			elapsed = float(round(time.time() - self.start_time, 1))
-			self.loop.call_soon_threadsafe(
-				asyncio.create_task, self.queue.put({'type': 'info', 'message': f'[SYS] {log_entry}', 'elapsed': elapsed})
-			)
+			self.stream.append(self.format(record))
 		except Exception:
 			pass
 
 
+# Level of the browser_use logger before clients lowered it, restored once no client needs more detail
+_browser_use_log_level: int | None = None
+
+
+def attach_log_handler(logger: logging.Logger, handler: SSELogHandler) -> None:
+	"""Stream the logger's records to a client, lowering the logger's level while the client wants more detail."""
+	global _browser_use_log_level
+	if not any(isinstance(other, SSELogHandler) for other in logger.handlers):
+		_browser_use_log_level = logger.level
+	logger.addHandler(handler)
+	_apply_client_log_level(logger)
+
+
+def detach_log_handler(logger: logging.Logger, handler: SSELogHandler) -> None:
+	logger.removeHandler(handler)
+	_apply_client_log_level(logger)
+
+
+def _apply_client_log_level(logger: logging.Logger) -> None:
+	"""The logger's own level, or the most detailed level a connected client asked for if that is lower."""
+	if _browser_use_log_level is None:
+		return
+	logger.setLevel(_browser_use_log_level)
+	client_levels = [handler.level for handler in logger.handlers if isinstance(handler, SSELogHandler)]
+	if client_levels and min(client_levels) < logger.getEffectiveLevel():
+		logger.setLevel(max(min(client_levels), 1))  # 0 (NOTSET) would defer to the parent logger
+
+
 @app.post('/save-logs')
 async def save_logs(request: dict):
 	try:
@@ -0,0 +1,45 @@
+"""Queue of actions from a model output that is still being streamed, consumed by Agent.multi_act"""
+
+import asyncio
+from collections.abc import Iterable
+
+from browser_use.tools.registry.views import ActionModel
+
+
+class ActionStream:
+	"""
+	Actions in the order the model produced them. The agent puts each action as soon as its JSON is complete and
+	multi_act executes them as they arrive; closing the stream ends multi_act's loop once the queue is drained.
+	"""
+
+	def __init__(self):
+		self._queue: asyncio.Queue[ActionModel | None] = asyncio.Queue()
+		self._closed = False
+		self.count = 0
+
+	@property
+	def closed(self) -> bool:
+		return self._closed
+
+	def put(self, action: ActionModel) -> None:
+		if self._closed:
+			return
+		self._queue.put_nowait(action)
+		self.count += 1
+
+	def close(self, remaining: Iterable[ActionModel] = ()) -> None:
+		"""Queue the actions that were not streamed early (if any) and end the stream."""
+		for action in remaining:
+			self.put(action)
+		if not self._closed:
+			self._closed = True
+			self._queue.put_nowait(None)
+
+	def __aiter__(self) -> 'ActionStream':
+		return self
+
+	async def __anext__(self) -> ActionModel:
+		action = await self._queue.get()
+		if action is None:
+			raise StopAsyncIteration
+		return action
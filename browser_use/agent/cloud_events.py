@@ -8,6 +8,8 @@ from bubus import BaseEvent
 from pydantic import Field, field_validator
 from uuid_extensions import uuid7str
 
+from browser_use.utils import image_media_type
+
 MAX_STRING_LENGTH = 500000  # 100K chars ~ 25k tokens should be enough
 MAX_URL_LENGTH = 100000
 MAX_TASK_LENGTH = 100000
@@ -157,7 +159,9 @@ class CreateAgentStepEvent(BaseEvent):
 		# Capture screenshot as base64 data URL if available
 		screenshot_url = None
 		if browser_state_summary.screenshot:
-			screenshot_url = f'data:image/png;base64,{browser_state_summary.screenshot}'
+			screenshot_url = (
+				f'data:{image_media_type(browser_state_summary.screenshot)};base64,{browser_state_summary.screenshot}'
+			)
 			import logging
 
 			logger = logging.getLogger(__name__)
@@ -13,6 +13,7 @@ from browser_use.llm.messages import (
 	SystemMessage,
 	UserMessage,
 )
+from browser_use.utils import image_media_type
 
 logger = logging.getLogger(__name__)
 
@@ -81,8 +82,8 @@ def construct_judge_messages(
 				encoded_images.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{encoded}',
-							media_type='image/png',
+							url=f'data:{image_media_type(encoded)};base64,{encoded}',
+							media_type=image_media_type(encoded),
 						)
 					)
 				)
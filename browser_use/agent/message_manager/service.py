@@ -96,6 +96,53 @@ def _log_format_message_line(message: BaseMessage, content: str, is_last_message
 # ========== End of Logging Helper Functions ==========
 
 
+class _HistoryRender:
+	"""Agent history rendered incrementally: each item is rendered once when it is first seen, the joined text is
+	built lazily when read and cached until the next change, and its length is kept as a running count.
+
+	The items list in MessageManagerState stays the source of truth. New items appended to it are picked up by
+	sync(); if the list is replaced or shrinks (restored state, compaction) the render is rebuilt from scratch.
+	"""
+
+	def __init__(self) -> None:
+		self._items: list[HistoryItem] | None = None
+		self._last_item: HistoryItem | None = None
+		self._text: str | None = ''
+		self.strings: list[str] = []
+		self.char_count = 0
+
+	@property
+	def text(self) -> str:
+		if self._text is None:
+			self._text = '\n'.join(self.strings)
+		return self._text
+
+	def _replace(self, strings: list[str]) -> None:
+		self.strings = strings
+		self._text = None
+		self.char_count = sum(len(string) for string in strings) + max(len(strings) - 1, 0)
+
+	def sync(self, items: list[HistoryItem]) -> None:
+		rendered = len(self.strings)
+		if items is not self._items or len(items) < rendered or (rendered and items[rendered - 1] is not self._last_item):
+			self._items = items
+			self._replace([item.to_string() for item in items])
+		elif len(items) > rendered:
+			for item in items[rendered:]:
+				item_string = item.to_string()
+				self.char_count += len(item_string) + (1 if self.strings else 0)
+				self.strings.append(item_string)
+			self._text = None
+		self._last_item = items[-1] if items else None
+
+	def truncate(self, previous_items: list[HistoryItem], items: list[HistoryItem], keep_last: int) -> None:
+		"""Compaction kept the first and the last `keep_last` of `previous_items` in `items`, reuse their strings"""
+		self.sync(previous_items)  # items may have been appended while the summary was generated
+		self._replace([self.strings[0]] + (self.strings[-keep_last:] if keep_last else []))
+		self._items = items
+		self._last_item = items[-1]
+
+
 class MessageManager:
 	vision_detail_level: Literal['auto', 'low', 'high']
 
@@ -137,10 +184,16 @@ class MessageManager:
 		self.sensitive_data = sensitive_data
 		self.last_input_messages = []
 		self.last_state_message_text: str | None = None
+		self._history_render = _HistoryRender()
 		# Only initialize messages if state is empty
 		if len(self.state.history.get_messages()) == 0:
 			self._set_message_with_type(self.system_prompt, 'system')
 
+	def _rendered_history(self) -> _HistoryRender:
+		"""The incrementally rendered agent history, brought up to date with state.agent_history_items"""
+		self._history_render.sync(self.state.agent_history_items)
+		return self._history_render
+
 	@property
 	def agent_history_description(self) -> str:
 		"""Build agent history description from list of items, respecting max_history_items limit"""
@@ -148,15 +201,12 @@ class MessageManager:
 		if self.state.compacted_memory:
 			compacted_prefix = f'<compacted_memory>\n{self.state.compacted_memory}\n</compacted_memory>\n'
 
-		if self.max_history_items is None:
-			# Include all items
-			return compacted_prefix + '\n'.join(item.to_string() for item in self.state.agent_history_items)
-
-		total_items = len(self.state.agent_history_items)
+		rendered = self._rendered_history()
+		total_items = len(rendered.strings)
 
-		# If we have fewer items than the limit, just return all items
-		if total_items <= self.max_history_items:
-			return compacted_prefix + '\n'.join(item.to_string() for item in self.state.agent_history_items)
+		# If there is no limit or we have fewer items than the limit, just return all items
+		if self.max_history_items is None or total_items <= self.max_history_items:
+			return compacted_prefix + rendered.text
 
 		# We have more items than the limit, so we need to omit some
 		omitted_count = total_items - self.max_history_items
@@ -166,11 +216,11 @@ class MessageManager:
 		recent_items_count = self.max_history_items - 1  # -1 for first item
 
 		items_to_include = [
-			self.state.agent_history_items[0].to_string(),  # Keep first item (initialization)
+			rendered.strings[0],  # Keep first item (initialization)
 			f'<sys>[... {omitted_count} previous steps omitted...]</sys>',
 		]
 		# Add most recent items
-		items_to_include.extend([item.to_string() for item in self.state.agent_history_items[-recent_items_count:]])
+		items_to_include.extend(rendered.strings[-recent_items_count:])
 
 		return compacted_prefix + '\n'.join(items_to_include)
 
@@ -221,13 +271,14 @@ class MessageManager:
 		if steps_since < settings.compact_every_n_steps:
 			return False
 
-		# Char floor gate
+		# Char floor gate (running count of the rendered history, no re-rendering)
 		history_items = self.state.agent_history_items
-		full_history_text = '\n'.join(item.to_string() for item in history_items).strip()
+		rendered = self._rendered_history()
 		trigger_char_count = settings.trigger_char_count or 40000
-		if len(full_history_text) < trigger_char_count:
+		if rendered.char_count < trigger_char_count:
 			return False
 
+		full_history_text = rendered.text.strip()
 		logger.debug(f'Compacting message history (items={len(history_items)}, chars={len(full_history_text)})')
 
 		# Build compaction input
@@ -279,6 +330,7 @@ class MessageManager:
 				self.state.agent_history_items = [history_items[0]]
 			else:
 				self.state.agent_history_items = [history_items[0]] + history_items[-keep_last:]
+			self._history_render.truncate(history_items, self.state.agent_history_items, keep_last)
 
 		logger.debug(f'Compaction complete (summary_chars={len(summary)}, history_items={len(self.state.agent_history_items)})')
 
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Literal, Optional
 from browser_use.dom.views import NodeType, SimplifiedNode
 from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
 from browser_use.observability import observe_debug
-from browser_use.utils import is_new_tab_page, sanitize_surrogates
+from browser_use.utils import image_media_type, is_new_tab_page, sanitize_surrogates
 
 if TYPE_CHECKING:
 	from browser_use.agent.views import AgentStepInfo
@@ -446,8 +446,8 @@ Available tabs:
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{processed_screenshot}',
-							media_type='image/png',
+							url=f'data:{image_media_type(processed_screenshot)};base64,{processed_screenshot}',
+							media_type=image_media_type(processed_screenshot),
 							detail=self.vision_detail_level,
 						),
 					)
@@ -524,7 +524,10 @@ def get_rerun_summary_message(prompt: str, screenshot_b64: str | None = None) ->
 			ContentPartTextParam(type='text', text=prompt),
 			ContentPartImageParam(
 				type='image_url',
-				image_url=ImageURL(url=f'data:image/png;base64,{screenshot_b64}'),
+				image_url=ImageURL(
+					url=f'data:{image_media_type(screenshot_b64)};base64,{screenshot_b64}',
+					media_type=image_media_type(screenshot_b64),
+				),
 			),
 		]
 		return UserMessage(content=content_parts)
@@ -6,7 +6,7 @@ import logging
 import re
 import tempfile
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, cast
 from urllib.parse import urlparse
@@ -27,6 +27,7 @@ from browser_use.agent.message_manager.utils import save_conversation
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage, ContentPartImageParam, ContentPartTextParam, UserMessage
+from browser_use.llm.streaming import JSONArrayItemParser, OutputDeltaCallback
 from browser_use.tokens.service import TokenCost
 
 load_dotenv()
@@ -36,6 +37,7 @@ from pydantic import BaseModel, ValidationError
 from uuid_extensions import uuid7str
 
 from browser_use import Browser, BrowserProfile, BrowserSession
+from browser_use.agent.action_stream import ActionStream
 from browser_use.agent.judge import construct_judge_messages
 
 # Lazy import for gif to avoid heavy agent.views import at startup
@@ -122,6 +124,16 @@ def log_response(response: AgentOutput, registry=None, logger=None) -> None:
 		logger.info(f'  \033[34m🎯 Next goal: {next_goal}\033[0m')
 
 
+async def _iterate_actions(actions: list[ActionModel] | ActionStream) -> AsyncIterator[ActionModel]:
+	"""Iterate a list of actions and a streamed ActionStream alike."""
+	if isinstance(actions, ActionStream):
+		async for action in actions:
+			yield action
+	else:
+		for action in actions:
+			yield action
+
+
 Context = TypeVar('Context')
 
 
@@ -173,6 +185,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		available_file_paths: list[str] | None = None,
 		include_attributes: list[str] | None = None,
 		max_actions_per_step: int = 5,
+		stream_actions: bool = False,
 		use_thinking: bool = True,
 		flash_mode: bool = False,
 		demo_mode: bool | None = None,
@@ -370,6 +383,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self._fallback_llm: BaseChatModel | None = fallback_llm
 		self._using_fallback_llm: bool = False
 		self._original_llm: BaseChatModel = llm  # Store original for reference
+		# Executes the actions of the model output being streamed (stream_actions), awaited in _execute_actions
+		self._action_stream: ActionStream | None = None
+		self._action_stream_task: asyncio.Task[list[ActionResult]] | None = None
 		self.directly_open_url = directly_open_url
 		self.include_recent_events = include_recent_events
 		self._url_shortening_limit = _url_shortening_limit
@@ -392,6 +408,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			generate_gif=generate_gif,
 			include_attributes=include_attributes,
 			max_actions_per_step=max_actions_per_step,
+			stream_actions=stream_actions,
 			use_thinking=use_thinking,
 			flash_mode=flash_mode,
 			max_history_items=max_history_items,
@@ -441,6 +458,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self._set_screenshot_service()
 
 		# Action setup
+		self._agent_output_types: dict[type[ActionModel], type[AgentOutput]] = {}
 		self._setup_action_models()
 		self._set_browser_use_version_and_source(source)
 
@@ -765,21 +783,28 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Initially only include actions with no filters
 		self.ActionModel = self.tools.registry.create_action_model()
 		# Create output model with the dynamic actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._agent_output_type(self.ActionModel)
 
 		# used to force the done action when max_steps is reached
 		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'])
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		self.DoneAgentOutput = self._agent_output_type(self.DoneActionModel)
+
+	def _agent_output_type(self, action_model: type[ActionModel]) -> type[AgentOutput]:
+		"""AgentOutput type for the given action model, built once per action model class.
+
+		The registry returns the same action model class while the set of available actions is unchanged,
+		so page changes reuse the output type (and the LLM clients' cached schema for it).
+		"""
+		output_type = self._agent_output_types.get(action_model)
+		if output_type is None:
+			if self.settings.flash_mode:
+				output_type = AgentOutput.type_with_custom_actions_flash_mode(action_model)
+			elif self.settings.use_thinking:
+				output_type = AgentOutput.type_with_custom_actions(action_model)
+			else:
+				output_type = AgentOutput.type_with_custom_actions_no_thinking(action_model)
+			self._agent_output_types[action_model] = output_type
+		return output_type
 
 	def _get_skill_slug(self, skill: 'Skill', all_skills: list['Skill']) -> str:
 		"""Generate a clean slug from skill title for action names
@@ -1156,40 +1181,75 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			f'🤖 Step {self.state.n_steps}: Calling LLM with {len(input_messages)} messages (model: {self.llm.model})...'
 		)
 
+		# With stream_actions, multi_act starts on the first complete action while the model is still generating
+		action_stream = self._start_action_stream() if self.settings.stream_actions else None
+
 		try:
-			model_output = await asyncio.wait_for(
-				self._get_model_output_with_retry(input_messages), timeout=self.settings.llm_timeout
-			)
-		except TimeoutError:
+			try:
+				model_output = await asyncio.wait_for(
+					self._get_model_output_with_retry(input_messages, action_stream), timeout=self.settings.llm_timeout
+				)
+			except TimeoutError:
 
-			@observe(name='_llm_call_timed_out_with_input')
-			async def _log_model_input_to_lmnr(input_messages: list[BaseMessage]) -> None:
-				"""Log the model input"""
-				pass
+				@observe(name='_llm_call_timed_out_with_input')
+				async def _log_model_input_to_lmnr(input_messages: list[BaseMessage]) -> None:
+					"""Log the model input"""
+					pass
 
-			await _log_model_input_to_lmnr(input_messages)
+				await _log_model_input_to_lmnr(input_messages)
 
-			raise TimeoutError(
-				f'LLM call timed out after {self.settings.llm_timeout} seconds. Keep your thinking and output short.'
-			)
+				raise TimeoutError(
+					f'LLM call timed out after {self.settings.llm_timeout} seconds. Keep your thinking and output short.'
+				)
 
-		self.state.last_model_output = model_output
+			self.state.last_model_output = model_output
 
-		# Check again for paused/stopped state after getting model output
-		await self._check_stop_or_pause()
+			# Check again for paused/stopped state after getting model output
+			await self._check_stop_or_pause()
 
-		# Handle callbacks and conversation saving
-		await self._handle_post_llm_processing(browser_state_summary, input_messages)
+			# Handle callbacks and conversation saving
+			await self._handle_post_llm_processing(browser_state_summary, input_messages)
 
-		# check again if Ctrl+C was pressed before we commit the output to history
-		await self._check_stop_or_pause()
+			# check again if Ctrl+C was pressed before we commit the output to history
+			await self._check_stop_or_pause()
+		except BaseException:
+			self._cancel_action_stream()
+			raise
+
+	def _start_action_stream(self) -> ActionStream:
+		"""Start executing the actions of the model output as they are streamed"""
+		self._cancel_action_stream()
+		self._action_stream = ActionStream()
+		self._action_stream_task = asyncio.create_task(self.multi_act(self._action_stream), name='multi_act_streamed')
+		return self._action_stream
+
+	def _cancel_action_stream(self) -> None:
+		"""Stop executing streamed actions, e.g. when the model call failed after some of them already ran"""
+		task, stream = self._action_stream_task, self._action_stream
+		self._action_stream_task = None
+		self._action_stream = None
+		if task is None or stream is None:
+			return
+		if stream.count:
+			self.logger.warning(f'⚠️ Model output failed after {stream.count} streamed action(s) were started')
+		task.cancel()
+		# retrieve the outcome so a failed action is not reported as a never-retrieved task exception
+		task.add_done_callback(lambda t: t.cancelled() or t.exception())
 
 	async def _execute_actions(self) -> None:
 		"""Execute the actions from model output"""
 		if self.state.last_model_output is None:
 			raise ValueError('No model output to execute actions from')
 
-		result = await self.multi_act(self.state.last_model_output.action)
+		if self._action_stream_task is not None and self._action_stream is not None:
+			task, stream = self._action_stream_task, self._action_stream
+			self._action_stream_task = None
+			self._action_stream = None
+			# queue what wasn't dispatched while streaming (e.g. the model doesn't stream, or the retry's noop done)
+			stream.close(self.state.last_model_output.action[stream.count :])
+			result = await task
+		else:
+			result = await self.multi_act(self.state.last_model_output.action)
 		self.state.last_result = result
 
 	async def _post_process(self) -> None:
@@ -1600,9 +1660,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				judge_log += f'   {judgement.reasoning}\n'
 				self.logger.info(judge_log)
 
-	async def _get_model_output_with_retry(self, input_messages: list[BaseMessage]) -> AgentOutput:
+	async def _get_model_output_with_retry(
+		self, input_messages: list[BaseMessage], action_stream: ActionStream | None = None
+	) -> AgentOutput:
 		"""Get model output with retry logic for empty actions"""
-		model_output = await self.get_model_output(input_messages)
+		model_output = await self.get_model_output(input_messages, action_stream)
 		self.logger.debug(
 			f'✅ Step {self.state.n_steps}: Got LLM response with {len(model_output.action) if model_output.action else 0} actions'
 		)
@@ -1619,7 +1681,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			)
 
 			retry_messages = input_messages + [clarification_message]
-			model_output = await self.get_model_output(retry_messages)
+			model_output = await self.get_model_output(retry_messages, action_stream)
 
 			if not model_output.action or all(action.model_dump() == {} for action in model_output.action):
 				self.logger.warning('Model still returned empty after retry. Inserting safe noop action.')
@@ -1875,14 +1937,19 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	@time_execution_async('--get_next_action')
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_model_output')
-	async def get_model_output(self, input_messages: list[BaseMessage]) -> AgentOutput:
-		"""Get next action from LLM based on current state"""
+	async def get_model_output(self, input_messages: list[BaseMessage], action_stream: ActionStream | None = None) -> AgentOutput:
+		"""Get next action from LLM based on current state
+
+		With an action_stream, each action is put on it as soon as the model has streamed it completely.
+		"""
 
 		urls_replaced = self._process_messsages_and_replace_long_urls_shorter_ones(input_messages)
 
 		# Build kwargs for ainvoke
 		# Note: ChatBrowserUse will automatically generate action descriptions from output_format schema
 		kwargs: dict = {'output_format': self.AgentOutput, 'session_id': self.session_id}
+		if action_stream is not None:
+			kwargs['on_output_delta'] = self._make_action_stream_handler(action_stream, urls_replaced)
 
 		try:
 			response = await self.llm.ainvoke(input_messages, **kwargs)
@@ -1906,12 +1973,46 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Just re-raise - Pydantic's validation errors are already descriptive
 			raise
 		except (ModelRateLimitError, ModelProviderError) as e:
+			# Streamed actions that already ran can't be taken back, so don't ask another model for this step
+			if action_stream is not None and action_stream.count:
+				raise
 			# Check if we can switch to a fallback LLM
 			if not self._try_switch_to_fallback_llm(e):
 				# No fallback available, re-raise the original error
 				raise
 			# Retry with the fallback LLM
-			return await self.get_model_output(input_messages)
+			return await self.get_model_output(input_messages, action_stream)
+
+	def _make_action_stream_handler(self, action_stream: ActionStream, urls_replaced: dict[str, str]) -> OutputDeltaCallback:
+		"""Build the on_output_delta callback that puts each completed action of the streamed output on action_stream.
+
+		Actions are only dispatched in order: the first item that isn't a valid, non-empty action stops early
+		dispatch, and whatever follows is queued from the validated output in _execute_actions.
+		"""
+		parser = JSONArrayItemParser('action')
+		halted = False
+
+		def on_output_delta(delta: str) -> None:
+			nonlocal halted
+			if halted:
+				return
+			try:
+				for item in parser.feed(delta):
+					if action_stream.count >= self.settings.max_actions_per_step:
+						halted = True
+						return
+					action = self.ActionModel.model_validate(item)
+					if not action.model_dump(exclude_unset=True):
+						halted = True
+						return
+					if urls_replaced:
+						self._recursive_process_all_strings_inside_pydantic_model(action, urls_replaced)
+					action_stream.put(action)
+			except Exception as e:
+				self.logger.debug(f'Stopped dispatching streamed actions early: {type(e).__name__}: {e}')
+				halted = True
+
+		return on_output_delta
 
 	def _try_switch_to_fallback_llm(self, error: ModelRateLimitError | ModelProviderError) -> bool:
 		"""
@@ -2637,7 +2738,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	@observe_debug(ignore_input=True, ignore_output=True)
 	@time_execution_async('--multi_act')
-	async def multi_act(self, actions: list[ActionModel]) -> list[ActionResult]:
+	async def multi_act(self, actions: list[ActionModel] | ActionStream) -> list[ActionResult]:
 		"""Execute multiple actions with page-change guards.
 
 		Two layers of protection prevent executing actions against stale DOM:
@@ -2645,10 +2746,13 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		     automatically abort remaining queued actions.
 		  2. Runtime detection: after every action, the current URL and focused target are compared
 		     to pre-action values. Any change aborts the remaining queue.
+
+		An ActionStream is executed while the model is still streaming it, so the number of actions is unknown
+		and the guards also run after what turns out to be the last action.
 		"""
 		results: list[ActionResult] = []
 		time_elapsed = 0
-		total_actions = len(actions)
+		total_actions = len(actions) if isinstance(actions, list) else None
 
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 		try:
@@ -2666,7 +2770,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			cached_selector_map = {}
 			cached_element_hashes = set()
 
-		for i, action in enumerate(actions):
+		i = -1
+		async for action in _iterate_actions(actions):
+			i += 1
 			# Get action name from the action model BEFORE try block to ensure it's always available in except
 			action_data = action.model_dump(exclude_unset=True)
 			action_name = next(iter(action_data.keys())) if action_data else 'unknown'
@@ -2674,7 +2780,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			if i > 0:
 				# ONLY ALLOW TO CALL `done` IF IT IS A SINGLE ACTION
 				if action_data.get('done') is not None:
-					msg = f'Done action is allowed only as a single action - stopped after action {i} / {total_actions}.'
+					msg = f'Done action is allowed only as a single action - stopped after action {i} / {total_actions or i + 1}.'
 					self.logger.debug(msg)
 					break
 
@@ -2725,17 +2831,17 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 				results.append(result)
 
-				if results[-1].is_done or results[-1].error or i == total_actions - 1:
+				if results[-1].is_done or results[-1].error or (total_actions is not None and i == total_actions - 1):
 					break
 
+				remaining = f'{total_actions - i - 1}' if total_actions is not None else 'any'
+
 				# --- Page-change guards (only when more actions remain) ---
 
 				# Layer 1: Static flag — action metadata declares it changes the page
 				registered_action = self.tools.registry.registry.actions.get(action_name)
 				if registered_action and registered_action.terminates_sequence:
-					self.logger.info(
-						f'Action "{action_name}" terminates sequence — skipping {total_actions - i - 1} remaining action(s)'
-					)
+					self.logger.info(f'Action "{action_name}" terminates sequence — skipping {remaining} remaining action(s)')
 					break
 
 				# Layer 2: Runtime detection — URL or focus target changed
@@ -2743,7 +2849,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				post_action_focus = self.browser_session.agent_focus_target_id
 
 				if post_action_url != pre_action_url or post_action_focus != pre_action_focus:
-					self.logger.info(f'Page changed after "{action_name}" — skipping {total_actions - i - 1} remaining action(s)')
+					self.logger.info(f'Page changed after "{action_name}" — skipping {remaining} remaining action(s)')
 					break
 
 			except Exception as e:
@@ -2758,7 +2864,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		return results
 
-	async def _log_action(self, action, action_name: str, action_num: int, total_actions: int) -> None:
+	async def _log_action(self, action, action_name: str, action_num: int, total_actions: int | None) -> None:
 		"""Log the action before execution with colored formatting"""
 		# Color definitions
 		blue = '\033[34m'  # Action name
@@ -2766,7 +2872,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		reset = '\033[0m'
 
 		# Format action number and name
-		if total_actions > 1:
+		if total_actions is None:
+			# streamed actions: the total is not known yet
+			action_header = f'▶️  [{action_num}] {blue}{action_name}{reset}:'
+			plain_header = f'▶️  [{action_num}] {action_name}:'
+		elif total_actions > 1:
 			action_header = f'▶️  [{action_num}/{total_actions}] {blue}{action_name}{reset}:'
 			plain_header = f'▶️  [{action_num}/{total_actions}] {action_name}:'
 		else:
@@ -3929,21 +4039,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Create new action model with current page's filtered actions
 		self.ActionModel = self.tools.registry.create_action_model(page_url=page_url)
 		# Update output model with the new actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._agent_output_type(self.ActionModel)
 
 		# Update done action model too
 		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'], page_url=page_url)
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		self.DoneAgentOutput = self._agent_output_type(self.DoneActionModel)
 
 	async def authenticate_cloud_sync(self, show_instructions: bool = True) -> bool:
 		"""
@@ -68,6 +68,7 @@ class AgentSettings(BaseModel):
 	extend_system_message: str | None = None
 	include_attributes: list[str] | None = DEFAULT_INCLUDE_ATTRIBUTES
 	max_actions_per_step: int = 5
+	stream_actions: bool = False  # Execute each action as soon as the model has streamed it (OpenAI and Anthropic chat models)
 	use_thinking: bool = True
 	flash_mode: bool = False  # If enabled, disables evaluation_previous_goal and next_goal, and sets use_thinking = False
 	use_judge: bool = True
@@ -2,13 +2,14 @@ from typing import TYPE_CHECKING
 
 # Type stubs for lazy imports
 if TYPE_CHECKING:
-	from .profile import BrowserProfile, ProxySettings
+	from .profile import BrowserProfile, LeanBrowsingSettings, ProxySettings
 	from .session import BrowserSession
 
 
 # Lazy imports mapping for heavy browser components
 _LAZY_IMPORTS = {
 	'ProxySettings': ('.profile', 'ProxySettings'),
+	'LeanBrowsingSettings': ('.profile', 'LeanBrowsingSettings'),
 	'BrowserProfile': ('.profile', 'BrowserProfile'),
 	'BrowserSession': ('.session', 'BrowserSession'),
 }
@@ -38,4 +39,5 @@ __all__ = [
 	'BrowserSession',
 	'BrowserProfile',
 	'ProxySettings',
+	'LeanBrowsingSettings',
 ]
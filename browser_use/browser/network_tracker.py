@@ -0,0 +1,283 @@
+"""In-flight network request tracking per target, driven by CDP Network events.
+
+One NetworkTracker per BrowserSession owns the CDP handlers for the request lifecycle events
+(Network.requestWillBeSent / responseReceived / loadingFinished / loadingFailed). cdp-use keeps a single
+handler per event method, so other components subscribe to the tracker instead of registering their own
+handlers, which would replace each other's.
+"""
+
+import asyncio
+import inspect
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from browser_use.browser.resource_blocking import TRACKER_DOMAINS
+
+logger = logging.getLogger(__name__)
+
+NetworkEventCallback = Callable[[Any, str | None], Awaitable[None] | None]
+
+TRACKED_EVENTS = ('requestWillBeSent', 'responseReceived', 'loadingFinished', 'loadingFailed')
+
+# Ad, analytics and tracking requests never hold up page stability
+_NOISE_URL_PATTERNS = (
+	*TRACKER_DOMAINS,
+	'analytics',
+	'ads',
+	'tracking',
+	'pixel',
+	# Social media trackers
+	'connect.facebook.net',
+	'platform.twitter.com',
+	'platform.linkedin.com',
+	# CDN/image hosts (usually not critical for functionality)
+	'.cloudfront.net/image/',
+	'.akamaized.net/image/',
+	# Common tracking paths
+	'/tracker/',
+	'/collector/',
+	'/beacon/',
+	'/telemetry/',
+	'/log/',
+	'/events/',
+	'/eventBatch',
+	'/track.',
+	'/metrics/',
+)
+_NOISE_URL_RE = re.compile('|'.join(re.escape(pattern) for pattern in _NOISE_URL_PATTERNS))
+_IMAGE_URL_RE = re.compile(r'\.(jpg|jpeg|png|gif|webp|svg|ico)(\?|$)', re.IGNORECASE)
+
+# Long-lived or fire-and-forget requests that never (or don't need to) finish before the page is usable
+_NON_BLOCKING_TYPES = frozenset({'EventSource', 'WebSocket', 'Ping', 'CSPViolationReport', 'Prefetch', 'Preflight'})
+# Resource types that stop counting as critical once they have been loading for a while
+_SLOW_NON_CRITICAL_TYPES = frozenset({'Image', 'Font', 'Media'})
+
+STALE_REQUEST_SECONDS = 10.0
+SLOW_NON_CRITICAL_SECONDS = 3.0
+MAX_URL_LENGTH = 500
+
+
+@dataclass(slots=True)
+class InFlightRequest:
+	"""A request that was sent and has not finished or failed yet."""
+
+	request_id: str
+	target_id: str | None
+	url: str
+	method: str
+	resource_type: str | None
+	started_at: float  # time.monotonic()
+	blocking: bool  # whether the request can hold up page stability at all (not ads, streams, beacons, ...)
+
+	def loading_seconds(self, now: float | None = None) -> float:
+		return (time.monotonic() if now is None else now) - self.started_at
+
+	def is_critical(self, now: float | None = None) -> bool:
+		"""Whether the page is still waiting on this request: blocking, not stuck and not a slow image/font."""
+		if not self.blocking:
+			return False
+		loading = self.loading_seconds(now)
+		if loading > STALE_REQUEST_SECONDS:
+			return False
+		if loading > SLOW_NON_CRITICAL_SECONDS and (
+			self.resource_type in _SLOW_NON_CRITICAL_TYPES or _IMAGE_URL_RE.search(self.url)
+		):
+			return False
+		return True
+
+
+def is_blocking_request(url: str, resource_type: str | None) -> bool:
+	"""Static part of the critical-request filter, decided once when the request starts."""
+	if resource_type in _NON_BLOCKING_TYPES:
+		return False
+	if url.startswith('data:') or len(url) > MAX_URL_LENGTH:
+		return False
+	return _NOISE_URL_RE.search(url) is None
+
+
+class _TargetNetworkState:
+	__slots__ = ('requests', 'last_activity')
+
+	def __init__(self) -> None:
+		self.requests: dict[str, InFlightRequest] = {}
+		self.last_activity = time.monotonic()
+
+
+class NetworkTracker:
+	"""Tracks in-flight requests of every target from CDP Network events.
+
+	Exposes the in-flight critical requests of a target, since when it has been network idle, and
+	wait_for_network_idle() for callers that need the page to settle.
+	"""
+
+	def __init__(self, resolve_target_id: Callable[[str | None], str | None]):
+		self._resolve_target_id = resolve_target_id
+		self._targets: dict[str | None, _TargetNetworkState] = {}
+		self._subscribers: dict[str, dict[str, NetworkEventCallback]] = {event: {} for event in TRACKED_EVENTS}
+		self._changed = asyncio.Event()
+		self._installed_on: Any = None
+
+	# --- CDP wiring ---
+
+	def install(self, cdp_client: Any) -> None:
+		"""Register the tracker's handlers on a (new) root CDP client."""
+		if self._installed_on is cdp_client:
+			return
+		self.clear_requests()
+		cdp_client.register.Network.requestWillBeSent(self._on_request_will_be_sent)
+		cdp_client.register.Network.responseReceived(self._on_response_received)
+		cdp_client.register.Network.loadingFinished(self._on_loading_finished)
+		cdp_client.register.Network.loadingFailed(self._on_loading_failed)
+		self._installed_on = cdp_client
+
+	def subscribe(self, event: str, name: str, callback: NetworkEventCallback) -> None:
+		"""Receive a tracked Network event (e.g. 'responseReceived') as (event, session_id), replacing any callback of the same name."""
+		if event not in self._subscribers:
+			raise ValueError(f'Network.{event} is not handled by the NetworkTracker, register it on the CDP client directly')
+		self._subscribers[event][name] = callback
+
+	def unsubscribe(self, event: str, name: str) -> None:
+		self._subscribers.get(event, {}).pop(name, None)
+
+	def reset(self) -> None:
+		"""Forget all requests and subscribers, e.g. when the browser session is reset."""
+		self.clear_requests()
+		for callbacks in self._subscribers.values():
+			callbacks.clear()
+		self._installed_on = None
+
+	def clear_requests(self, target_id: str | None = None) -> None:
+		"""Forget the in-flight requests of one target (e.g. a closed tab), or of all targets."""
+		if target_id is None:
+			self._targets.clear()
+		else:
+			self._targets.pop(target_id, None)
+		self._notify()
+
+	async def _dispatch(self, event_name: str, event: Any, session_id: str | None) -> None:
+		for name, callback in list(self._subscribers[event_name].items()):
+			try:
+				result = callback(event, session_id)
+				if inspect.isawaitable(result):
+					await result
+			except Exception as e:
+				logger.debug(f'NetworkTracker subscriber {name} failed on Network.{event_name}: {type(e).__name__}: {e}')
+
+	def _notify(self) -> None:
+		self._changed.set()
+		self._changed = asyncio.Event()
+
+	def _state(self, target_id: str | None) -> _TargetNetworkState:
+		state = self._targets.get(target_id)
+		if state is None:
+			state = self._targets[target_id] = _TargetNetworkState()
+		return state
+
+	async def _on_request_will_be_sent(self, event: Any, session_id: str | None = None) -> None:
+		request_id = event.get('requestId', '')
+		request = event.get('request', {})
+		url = request.get('url', '')
+		resource_type = event.get('type')
+		target_id = self._resolve_target_id(session_id)
+		state = self._state(target_id)
+		# redirects reuse the request id, the request keeps its original start time
+		previous = state.requests.get(request_id)
+		tracked = InFlightRequest(
+			request_id=request_id,
+			target_id=target_id,
+			url=url,
+			method=request.get('method', 'GET'),
+			resource_type=resource_type,
+			started_at=previous.started_at if previous else time.monotonic(),
+			blocking=is_blocking_request(url, resource_type),
+		)
+		state.requests[request_id] = tracked
+		if tracked.blocking:
+			state.last_activity = time.monotonic()
+			self._notify()
+		await self._dispatch('requestWillBeSent', event, session_id)
+
+	async def _on_response_received(self, event: Any, session_id: str | None = None) -> None:
+		await self._dispatch('responseReceived', event, session_id)
+
+	async def _on_loading_finished(self, event: Any, session_id: str | None = None) -> None:
+		self._finish(event.get('requestId', ''), session_id)
+		await self._dispatch('loadingFinished', event, session_id)
+
+	async def _on_loading_failed(self, event: Any, session_id: str | None = None) -> None:
+		self._finish(event.get('requestId', ''), session_id)
+		await self._dispatch('loadingFailed', event, session_id)
+
+	def _finish(self, request_id: str, session_id: str | None) -> None:
+		state = self._targets.get(self._resolve_target_id(session_id))
+		if state is None:
+			return
+		request = state.requests.pop(request_id, None)
+		if request is not None and request.blocking:
+			state.last_activity = time.monotonic()
+			self._notify()
+
+	# --- queries ---
+
+	def in_flight_requests(self, target_id: str | None = None) -> list[InFlightRequest]:
+		"""All in-flight requests of a target, or of every target when target_id is None."""
+		if target_id is None:
+			return [request for state in self._targets.values() for request in state.requests.values()]
+		state = self._targets.get(target_id)
+		return list(state.requests.values()) if state else []
+
+	def in_flight_critical_requests(self, target_id: str | None) -> list[InFlightRequest]:
+		"""In-flight requests of a target the page is still waiting on, oldest first."""
+		now = time.monotonic()
+		return [request for request in self.in_flight_requests(target_id) if request.is_critical(now)]
+
+	def network_idle_since(self, target_id: str | None) -> float | None:
+		"""time.monotonic() since which the target has had no critical request in flight, None while it has one."""
+		if self.in_flight_critical_requests(target_id):
+			return None
+		state = self._targets.get(target_id)
+		if state is None:
+			return 0.0
+		# the last start/finish of a blocking request is the latest point a critical request could have been in flight
+		return state.last_activity
+
+	async def wait_for_network_idle(self, target_id: str | None, quiet_ms: float = 100, max_ms: float = 1000) -> bool:
+		"""Wait until the target has had no critical request in flight for quiet_ms, for at most max_ms.
+
+		Returns True if the network went idle, False if max_ms elapsed first.
+		"""
+		deadline = time.monotonic() + max_ms / 1000
+		quiet = quiet_ms / 1000
+		while True:
+			now = time.monotonic()
+			idle_since = self.network_idle_since(target_id)
+			if idle_since is not None and now - idle_since >= quiet:
+				return True
+			if now >= deadline:
+				return False
+
+			# wake up on the next request start/finish, when the quiet period would be over, or when the
+			# oldest critical request stops counting as critical (stuck / slow image)
+			timeout = deadline - now
+			if idle_since is not None:
+				timeout = min(timeout, idle_since + quiet - now)
+			else:
+				timeout = min(timeout, self._next_criticality_change(target_id, now))
+			changed = self._changed
+			try:
+				await asyncio.wait_for(changed.wait(), timeout=max(timeout, 0.001))
+			except TimeoutError:
+				pass
+
+	def _next_criticality_change(self, target_id: str | None, now: float) -> float:
+		soonest = STALE_REQUEST_SECONDS
+		for request in self.in_flight_critical_requests(target_id):
+			loading = request.loading_seconds(now)
+			soonest = min(soonest, STALE_REQUEST_SECONDS - loading)
+			if loading < SLOW_NON_CRITICAL_SECONDS:
+				soonest = min(soonest, SLOW_NON_CRITICAL_SECONDS - loading)
+		return soonest
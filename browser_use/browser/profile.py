@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Annotated, Any, Literal, Self
 from urllib.parse import urlparse
 
+from cdp_use.cdp.network.types import ResourceType
 from pydantic import AfterValidator, AliasChoices, BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing_extensions import TypedDict
 
@@ -26,7 +27,7 @@ def _get_enable_default_extensions_default() -> bool:
 
 
 CHROME_DEBUG_PORT = 9242  # use a non-default port to avoid conflicts with other tools / devs using 9222
-DOMAIN_OPTIMIZATION_THRESHOLD = 100  # Convert domain lists to sets for O(1) lookup when >= this size
+DOMAIN_OPTIMIZATION_THRESHOLD = 100  # Convert exact-domain lists to sets for O(1) lookup when >= this size
 CHROME_DISABLED_COMPONENTS = [
 	# Playwright defaults: https://github.com/microsoft/playwright/blob/41008eeddd020e2dee1c540f7c0cdfa337e99637/packages/playwright-core/src/server/chromium/chromiumSwitches.ts#L76
 	# AcceptCHFrame,AutoExpandDetailsElement,AvoidUnnecessaryBeforeUnloadCheckSync,CertificateTransparencyComponentUpdater,DeferRendererTasksAfterInput,DestroyProfileOnBrowserClose,DialMediaRouteProvider,ExtensionManifestV2Disabled,GlobalMediaControls,HttpsUpgrades,ImprovedCookieControls,LazyFrameLoading,LensOverlay,MediaRouter,PaintHolding,ThirdPartyStoragePartitioning,Translate
@@ -563,6 +564,27 @@ class ProxySettings(BaseModel):
 		return getattr(self, key)
 
 
+class LeanBrowsingSettings(BaseModel):
+	"""Network-layer blocking of resources the agent doesn't need (BrowserProfile.lean_browsing).
+
+	- resource_types: CDP resource types to block or stub on every page, e.g. "Image", "Media", "Font"
+	- block_trackers: Block requests to well-known ad and analytics domains
+	- blocked_domains: Extra request domains to block, same syntax as allowed_domains
+	- stub_resources: Answer blocked resource-type requests with an empty response (a transparent GIF for
+	  images) instead of failing them, so pages don't run error handlers or show broken-image icons
+	- domain_overrides: Page domain pattern -> resource types to block on pages of that domain instead of
+	  resource_types, e.g. {"*.google.com": []} to load images on Google Maps
+	"""
+
+	model_config = ConfigDict(extra='forbid')
+
+	resource_types: list[ResourceType] = Field(default_factory=lambda: ['Image', 'Media', 'Font'])
+	block_trackers: bool = True
+	blocked_domains: list[str] = Field(default_factory=list)
+	stub_resources: bool = True
+	domain_overrides: dict[str, list[ResourceType]] = Field(default_factory=dict)
+
+
 class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, BrowserLaunchArgs, BrowserNewContextArgs):
 	"""
 	A BrowserProfile is a static template collection of kwargs that can be passed to:
@@ -608,16 +630,20 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	deterministic_rendering: bool = Field(default=False, description='Enable deterministic rendering flags.')
 	allowed_domains: list[str] | set[str] | None = Field(
 		default=None,
-		description='List of allowed domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]. Lists with 100+ items are auto-optimized to sets (no pattern matching).',
+		description='List of allowed domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]. Lists with 100+ exact domains (no patterns) are auto-optimized to sets.',
 	)
 	prohibited_domains: list[str] | set[str] | None = Field(
 		default=None,
-		description='List of prohibited domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]. Allowed domains take precedence over prohibited domains. Lists with 100+ items are auto-optimized to sets (no pattern matching).',
+		description='List of prohibited domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]. Allowed domains take precedence over prohibited domains. Lists with 100+ exact domains (no patterns) are auto-optimized to sets.',
 	)
 	block_ip_addresses: bool = Field(
 		default=False,
 		description='Block navigation to URLs containing IP addresses (both IPv4 and IPv6). When True, blocks all IP-based URLs including localhost and private networks.',
 	)
+	lean_browsing: LeanBrowsingSettings | None = Field(
+		default=None,
+		description='Block images, media, fonts and ad/analytics requests at the network layer to cut page-load time and bandwidth. True uses the defaults, or pass LeanBrowsingSettings(resource_types, block_trackers, blocked_domains, stub_resources, domain_overrides).',
+	)
 	keep_alive: bool | None = Field(default=None, description='Keep browser alive after agent run.')
 
 	# --- Proxy settings ---
@@ -683,6 +709,27 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=True, description='Only show element IDs in highlights if llm_representation is less than 10 characters.'
 	)
 	paint_order_filtering: bool = Field(default=True, description='Enable paint order filtering. Slightly experimental.')
+	incremental_dom_snapshots: bool = Field(
+		default=False,
+		description="Reuse the previous step's DOM tree instead of re-capturing it when no DOM mutations (tracked via CDP DOM events), scrolling, resizing or user input happened in between. Experimental.",
+	)
+	# --- Screenshots ---
+	screenshot_format: Literal['png', 'jpeg', 'webp'] = Field(
+		default='png',
+		description='Image format of the screenshots taken for the agent. jpeg/webp are much faster to encode and smaller.',
+	)
+	screenshot_quality: int = Field(default=80, ge=0, le=100, description='Compression quality for jpeg/webp screenshots.')
+	screenshot_max_dimension: int | None = Field(
+		default=None,
+		ge=100,
+		description='Downscale screenshots (in the browser) so their longest side is at most this many pixels. Click coordinates are scaled back.',
+	)
+	screenshot_change_threshold: float | None = Field(
+		default=None,
+		ge=0,
+		le=1,
+		description='Reuse the previous screenshot of a tab when at most this fraction of a small thumbnail of the viewport changed since it was taken (0 = any visible change triggers a new capture). None always captures.',
+	)
 	interaction_highlight_color: str = Field(
 		default='rgb(255, 127, 39)',
 		description='Color to use for highlighting elements during interactions (CSS color string).',
@@ -710,6 +757,14 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=None, description='Video frame size. If not set, it will use the viewport size.'
 	)
 	record_video_framerate: int = Field(default=30, description='The framerate to use for the video recording.')
+	record_har_max_body_size: int | None = Field(
+		default=None,
+		description='Bodies larger than this many bytes are left out of the HAR recording, only their size is recorded. None records bodies of any size.',
+	)
+	record_har_embed_limit: int | None = Field(
+		default=None,
+		description='With record_har_content="embed", bodies larger than this many bytes are written to the HAR attachments dir and referenced via "_file" instead of being inlined.',
+	)
 
 	# TODO: finish implementing extension support in extensions.py
 	# extension_ids_to_preinstall: list[str] = Field(
@@ -730,20 +785,28 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	@field_validator('allowed_domains', 'prohibited_domains', mode='after')
 	@classmethod
 	def optimize_large_domain_lists(cls, v: list[str] | set[str] | None) -> list[str] | set[str] | None:
-		"""Convert large domain lists (>=100 items) to sets for O(1) lookup performance."""
+		"""Convert large exact-domain lists (>=100 items) to sets, lists with patterns stay lists and are compiled by the SecurityWatchdog."""
 		if v is None or isinstance(v, set):
 			return v
 
 		if len(v) >= DOMAIN_OPTIMIZATION_THRESHOLD:
-			logger.warning(
-				f'🔧 Optimizing domain list with {len(v)} items to set for O(1) lookup. '
-				f'Note: Pattern matching (*.domain.com, etc.) is not supported for lists >= {DOMAIN_OPTIMIZATION_THRESHOLD} items. '
-				f'Use exact domains only or keep list size < {DOMAIN_OPTIMIZATION_THRESHOLD} for pattern support.'
-			)
+			if any('*' in domain or '://' in domain for domain in v):
+				return v
+			logger.debug(f'🔧 Optimizing domain list with {len(v)} exact domains to a set for O(1) lookup.')
 			return set(v)
 
 		return v
 
+	@field_validator('lean_browsing', mode='before')
+	@classmethod
+	def validate_lean_browsing(cls, v: Any) -> Any:
+		"""Accept lean_browsing=True/False as shorthand for the default settings / disabled."""
+		if v is True:
+			return LeanBrowsingSettings()
+		if v is False:
+			return None
+		return v
+
 	@model_validator(mode='after')
 	def copy_old_config_names_to_new(self) -> Self:
 		"""Copy old config window_width & window_height to window_size."""
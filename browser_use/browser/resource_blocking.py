@@ -0,0 +1,150 @@
+"""Lean browsing: decides which requests to block or stub at the network layer (BrowserProfile.lean_browsing).
+
+The decision logic is kept free of CDP so it can be compiled once per session and unit tested; the
+ResourceBlockingWatchdog feeds it Fetch.requestPaused events.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+from urllib.parse import urlparse
+
+from browser_use.browser.domain_policy import CompiledDomainList
+
+if TYPE_CHECKING:
+	from browser_use.browser.profile import LeanBrowsingSettings
+
+# Ad and analytics domains, blocked with their subdomains when LeanBrowsingSettings.block_trackers is on
+TRACKER_DOMAINS = (
+	'doubleclick.net',
+	'googlesyndication.com',
+	'googletagmanager.com',
+	'googleadservices.com',
+	'google-analytics.com',
+	'facebook.net',
+	'hotjar.com',
+	'clarity.ms',
+	'mixpanel.com',
+	'segment.com',
+	'segment.io',
+	'demdex.net',
+	'omtrdc.net',
+	'adobedtm.com',
+	'ensighten.com',
+	'newrelic.com',
+	'nr-data.net',
+	'amazon-adsystem.com',
+	'adnxs.com',
+	'criteo.com',
+	'taboola.com',
+	'outbrain.com',
+	'scorecardresearch.com',
+	'quantserve.com',
+)
+
+# Typical transfer size per request (HTTP Archive medians, rounded), used to estimate the bytes saved
+# since a blocked request never reports its size
+_TYPICAL_BYTES = {'Image': 20_000, 'Media': 250_000, 'Font': 30_000, 'Script': 25_000, 'Stylesheet': 15_000}
+_DEFAULT_TYPICAL_BYTES = 2_000
+
+# Smallest valid image, served for stubbed images so layouts don't show broken-image icons
+TRANSPARENT_GIF_BASE64 = 'R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7'
+
+BlockAction = Literal['block', 'stub']
+
+
+@dataclass
+class ResourceBlockingStats:
+	"""Requests lean browsing kept off the network during a browser session."""
+
+	requests_blocked: int = 0  # failed with BlockedByClient
+	requests_stubbed: int = 0  # answered with an empty response
+	estimated_bytes_saved: int = 0
+	by_resource_type: dict[str, int] = field(default_factory=dict)
+
+	def record(self, resource_type: str, action: BlockAction) -> None:
+		if action == 'stub':
+			self.requests_stubbed += 1
+		else:
+			self.requests_blocked += 1
+		self.estimated_bytes_saved += _TYPICAL_BYTES.get(resource_type, _DEFAULT_TYPICAL_BYTES)
+		self.by_resource_type[resource_type] = self.by_resource_type.get(resource_type, 0) + 1
+
+
+def _host_and_scheme(url: str) -> tuple[str, str] | None:
+	try:
+		parsed = urlparse(url)
+	except ValueError:
+		return None
+	if not parsed.hostname:
+		return None
+	return parsed.hostname, parsed.scheme
+
+
+def _fetch_url_patterns(domain_pattern: str) -> list[str] | None:
+	"""Fetch.enable URL globs covering a domain pattern, None if it can't be expressed as one (then pause all URLs)."""
+	domain = domain_pattern[2:] if domain_pattern.startswith('*.') else domain_pattern
+	if not domain or '*' in domain or '/' in domain or '?' in domain:
+		return None
+	return [f'*://{domain}/*', f'*://*.{domain}/*']
+
+
+class ResourceBlocker:
+	"""LeanBrowsingSettings compiled into domain matchers, answering what to do with a single request."""
+
+	def __init__(self, settings: 'LeanBrowsingSettings'):
+		self.settings = settings
+		self.resource_types = frozenset(settings.resource_types)
+
+		domain_patterns = [f'*.{domain}' for domain in TRACKER_DOMAINS] if settings.block_trackers else []
+		domain_patterns += settings.blocked_domains
+		self._domain_patterns = domain_patterns
+		self._blocked_domains = CompiledDomainList(domain_patterns) if domain_patterns else None
+		self._overrides = [
+			(CompiledDomainList([pattern]), frozenset(resource_types))
+			for pattern, resource_types in settings.domain_overrides.items()
+		]
+
+	def decide(self, url: str, resource_type: str, page_url: str | None = None) -> BlockAction | None:
+		"""What to do with a request of `resource_type` to `url` made by a page at `page_url`: None lets it through."""
+		if url.startswith('data:') or url.startswith('blob:'):
+			return None
+		target = _host_and_scheme(url)
+
+		if self._blocked_domains is not None and target is not None and self._blocked_domains.matches(url, *target):
+			return 'block'
+
+		if resource_type in self._resource_types_for_page(page_url):
+			return 'stub' if self.settings.stub_resources and resource_type != 'Media' else 'block'
+		return None
+
+	def _resource_types_for_page(self, page_url: str | None) -> frozenset[str]:
+		if self._overrides and page_url:
+			page = _host_and_scheme(page_url)
+			if page is not None:
+				for domains, resource_types in self._overrides:
+					if domains.matches(page_url, *page):
+						return resource_types
+		return self.resource_types
+
+	def fetch_patterns(self) -> list[dict[str, str]]:
+		"""Fetch.enable patterns pausing only the requests that decide() might block or stub."""
+		resource_types = set(self.resource_types)
+		for _, override_types in self._overrides:
+			resource_types |= override_types
+		patterns: list[dict[str, str]] = [
+			{'urlPattern': '*', 'resourceType': resource_type, 'requestStage': 'Request'}
+			for resource_type in sorted(resource_types)
+		]
+		for domain_pattern in self._domain_patterns:
+			url_patterns = _fetch_url_patterns(domain_pattern)
+			if url_patterns is None:
+				return [{'urlPattern': '*', 'requestStage': 'Request'}]
+			patterns.extend({'urlPattern': url_pattern, 'requestStage': 'Request'} for url_pattern in url_patterns)
+		return patterns
+
+	@staticmethod
+	def stub_response(resource_type: str) -> tuple[str, str]:
+		"""(content type, base64 body) of the empty response served for a stubbed request."""
+		if resource_type == 'Image':
+			return 'image/gif', TRANSPARENT_GIF_BASE64
+		return 'application/octet-stream', ''
@@ -41,7 +41,8 @@ from browser_use.browser.events import (
 	TabClosedEvent,
 	TabCreatedEvent,
 )
-from browser_use.browser.profile import BrowserProfile, ProxySettings
+from browser_use.browser.network_tracker import NetworkTracker
+from browser_use.browser.profile import BrowserProfile, LeanBrowsingSettings, ProxySettings
 from browser_use.browser.views import BrowserStateSummary, TabInfo
 from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, TargetInfo
 from browser_use.observability import observe_debug
@@ -50,6 +51,7 @@ from browser_use.utils import _log_pretty_url, create_task_with_error_handling,
 if TYPE_CHECKING:
 	from browser_use.actor.page import Page
 	from browser_use.browser.demo_mode import DemoMode
+	from browser_use.browser.resource_blocking import ResourceBlockingStats
 	from browser_use.browser.watchdogs.captcha_watchdog import CaptchaWaitResult
 
 DEFAULT_BROWSER_PROFILE = BrowserProfile()
@@ -142,6 +144,7 @@ class BrowserSession(BaseModel):
 		headers: dict[str, str] | None = None,
 		allowed_domains: list[str] | None = None,
 		prohibited_domains: list[str] | None = None,
+		lean_browsing: bool | LeanBrowsingSettings | None = None,
 		keep_alive: bool | None = None,
 		minimum_wait_page_load_time: float | None = None,
 		wait_for_network_idle_page_load_time: float | None = None,
@@ -176,6 +179,7 @@ class BrowserSession(BaseModel):
 		headers: dict[str, str] | None = None,
 		allowed_domains: list[str] | None = None,
 		prohibited_domains: list[str] | None = None,
+		lean_browsing: bool | LeanBrowsingSettings | None = None,
 		keep_alive: bool | None = None,
 		minimum_wait_page_load_time: float | None = None,
 		wait_for_network_idle_page_load_time: float | None = None,
@@ -277,6 +281,7 @@ class BrowserSession(BaseModel):
 		deterministic_rendering: bool | None = None,
 		allowed_domains: list[str] | None = None,
 		prohibited_domains: list[str] | None = None,
+		lean_browsing: bool | LeanBrowsingSettings | None = None,
 		keep_alive: bool | None = None,
 		proxy: ProxySettings | None = None,
 		enable_default_extensions: bool | None = None,
@@ -382,6 +387,8 @@ class BrowserSession(BaseModel):
 
 	# Cache of original viewport size for coordinate conversion (set when browser state is captured)
 	_original_viewport_size: tuple[int, int] | None = PrivateAttr(default=None)
+	# Ratio of screenshot pixels to CSS pixels when screenshots are downscaled (BrowserProfile.screenshot_max_dimension)
+	_screenshot_scale: float = PrivateAttr(default=1.0)
 
 	@classmethod
 	def from_system_chrome(cls, profile_directory: str | None = None, **kwargs: Any) -> Self:
@@ -501,6 +508,9 @@ class BrowserSession(BaseModel):
 	# PUBLIC: SessionManager instance (OWNS all targets and sessions)
 	session_manager: Any = Field(default=None, exclude=True)  # SessionManager
 
+	# In-flight network requests per target, shared by the watchdogs (owns the CDP Network request handlers)
+	_network_tracker: NetworkTracker | None = PrivateAttr(default=None)
+
 	_cached_browser_state_summary: Any = PrivateAttr(default=None)
 	_cached_selector_map: dict[int, EnhancedDOMTreeNode] = PrivateAttr(default_factory=dict)
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)  # Track files downloaded during this session
@@ -519,6 +529,7 @@ class BrowserSession(BaseModel):
 	_permissions_watchdog: Any | None = PrivateAttr(default=None)
 	_recording_watchdog: Any | None = PrivateAttr(default=None)
 	_captcha_watchdog: Any | None = PrivateAttr(default=None)
+	_resource_blocking_watchdog: Any | None = PrivateAttr(default=None)
 	_watchdogs_attached: bool = PrivateAttr(default=False)
 
 	_cloud_browser_client: CloudBrowserClient = PrivateAttr(default_factory=lambda: CloudBrowserClient())
@@ -584,6 +595,8 @@ class BrowserSession(BaseModel):
 		self._cached_browser_state_summary = None
 		self._cached_selector_map.clear()
 		self._downloaded_files.clear()
+		if self._network_tracker:
+			self._network_tracker.reset()
 
 		self.agent_focus_target_id = None
 		if self.is_local:
@@ -601,6 +614,7 @@ class BrowserSession(BaseModel):
 		self._permissions_watchdog = None
 		self._recording_watchdog = None
 		self._captcha_watchdog = None
+		self._resource_blocking_watchdog = None
 		self._watchdogs_attached = False
 		if self._demo_mode:
 			self._demo_mode.reset()
@@ -1191,6 +1205,19 @@ class BrowserSession(BaseModel):
 		assert self._cdp_client_root is not None, 'CDP client not initialized - browser may not be connected yet'
 		return self._cdp_client_root
 
+	@property
+	def network_tracker(self) -> NetworkTracker:
+		"""In-flight network requests per target. Subscribe to it for Network request events instead of
+		registering handlers on the CDP client, which would replace the tracker's."""
+		if self._network_tracker is None:
+			self._network_tracker = NetworkTracker(self._target_id_for_cdp_session)
+		return self._network_tracker
+
+	def _target_id_for_cdp_session(self, session_id: str | None) -> TargetID | None:
+		if not session_id or not self.session_manager:
+			return None
+		return self.session_manager.get_target_id_from_session_id(session_id)
+
 	async def new_page(self, url: str | None = None) -> 'Page':
 		"""Create a new page (tab)."""
 		from cdp_use.cdp.target.commands import CreateTargetParameters
@@ -1503,6 +1530,7 @@ class BrowserSession(BaseModel):
 		from browser_use.browser.watchdogs.permissions_watchdog import PermissionsWatchdog
 		from browser_use.browser.watchdogs.popups_watchdog import PopupsWatchdog
 		from browser_use.browser.watchdogs.recording_watchdog import RecordingWatchdog
+		from browser_use.browser.watchdogs.resource_blocking_watchdog import ResourceBlockingWatchdog
 		from browser_use.browser.watchdogs.screenshot_watchdog import ScreenshotWatchdog
 		from browser_use.browser.watchdogs.security_watchdog import SecurityWatchdog
 		from browser_use.browser.watchdogs.storage_state_watchdog import StorageStateWatchdog
@@ -1632,6 +1660,12 @@ class BrowserSession(BaseModel):
 			self._captcha_watchdog = CaptchaWatchdog(event_bus=self.event_bus, browser_session=self)
 			self._captcha_watchdog.attach_to_session()
 
+		# Initialize ResourceBlockingWatchdog if lean_browsing is configured (blocks images, fonts, trackers, ... via CDP Fetch)
+		if self.browser_profile.lean_browsing:
+			ResourceBlockingWatchdog.model_rebuild()
+			self._resource_blocking_watchdog = ResourceBlockingWatchdog(event_bus=self.event_bus, browser_session=self)
+			self._resource_blocking_watchdog.attach_to_session()
+
 		# Mark watchdogs as attached to prevent duplicate attachment
 		self._watchdogs_attached = True
 
@@ -1691,6 +1725,9 @@ class BrowserSession(BaseModel):
 			assert self._cdp_client_root is not None
 			await self._cdp_client_root.start()
 
+			# Track network requests from the start, before any target gets Network.enable
+			self.network_tracker.install(self._cdp_client_root)
+
 			# Initialize event-driven session manager FIRST (before enabling autoAttach)
 			# SessionManager will:
 			# 1. Register attach/detach event handlers
@@ -2960,6 +2997,13 @@ class BrowserSession(BaseModel):
 		"""
 		return self._downloaded_files.copy()
 
+	@property
+	def resource_blocking_stats(self) -> 'ResourceBlockingStats | None':
+		"""Requests and estimated bytes lean browsing kept off the network in this session, None if lean_browsing is off."""
+		if self._resource_blocking_watchdog is None:
+			return None
+		return self._resource_blocking_watchdog.stats
+
 	# endregion - ========== Helper Methods ==========
 
 	# region - ========== CDP-based replacements for browser_context operations ==========
@@ -4,6 +4,8 @@ import base64
 import io
 import logging
 import math
+import queue
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -21,6 +23,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Frames waiting for the encoder thread, newer frames are dropped while it is full (about 2s at 30 fps)
+DEFAULT_MAX_QUEUED_FRAMES = 60
+
 
 def _get_padded_size(size: ViewportSize, macro_block_size: int = 16) -> ViewportSize:
 	"""Calculates the dimensions padded to the nearest multiple of macro_block_size."""
@@ -36,9 +41,13 @@ class VideoRecorderService:
 	This service captures individual frames from the CDP screencast, decodes them,
 	and appends them to a video file using a pip-installable ffmpeg backend.
 	It automatically resizes frames to match the target video dimensions.
+
+	`add_frame` only queues the frame: decoding, resizing, padding and encoding happen on a dedicated
+	encoder thread (PIL, numpy and the ffmpeg pipe release the GIL), so the event loop is never blocked.
+	When the encoder falls behind, incoming frames are dropped instead of queued without bound.
 	"""
 
-	def __init__(self, output_path: Path, size: ViewportSize, framerate: int):
+	def __init__(self, output_path: Path, size: ViewportSize, framerate: int, max_queued_frames: int = DEFAULT_MAX_QUEUED_FRAMES):
 		"""
 		Initializes the video recorder.
 
@@ -46,6 +55,7 @@ class VideoRecorderService:
 		    output_path: The full path where the video will be saved.
 		    size: A ViewportSize object specifying the width and height of the video.
 		    framerate: The desired framerate for the output video.
+		    max_queued_frames: How many frames may wait for the encoder thread before new ones are dropped.
 		"""
 		self.output_path = output_path
 		self.size = size
@@ -53,6 +63,11 @@ class VideoRecorderService:
 		self._writer: Optional['Format.Writer'] = None
 		self._is_active = False
 		self.padded_size = _get_padded_size(self.size)
+		self._frames: queue.Queue[str | None] = queue.Queue(maxsize=max_queued_frames)
+		self._encoder_thread: threading.Thread | None = None
+		self._last_queued_frame: str | None = None
+		self.frames_dropped = 0
+		self.frames_duplicated = 0
 
 	def start(self) -> None:
 		"""
@@ -79,6 +94,8 @@ class VideoRecorderService:
 				macro_block_size=None,
 			)
 			self._is_active = True
+			self._encoder_thread = threading.Thread(target=self._encode_frames, name='video-encoder', daemon=True)
+			self._encoder_thread.start()
 			logger.debug(f'Video recorder started. Output will be saved to {self.output_path}')
 		except Exception as e:
 			logger.error(f'Failed to initialize video writer: {e}')
@@ -86,41 +103,55 @@ class VideoRecorderService:
 
 	def add_frame(self, frame_data_b64: str) -> None:
 		"""
-		Decodes a base64-encoded PNG frame, resizes it, pads it to be codec-compatible,
-		and appends it to the video.
+		Queues a base64-encoded PNG/JPEG frame for the encoder thread. Never blocks: the frame is dropped if the
+		queue is full.
 
 		Args:
-		    frame_data_b64: A base64-encoded string of the PNG frame data.
+		    frame_data_b64: A base64-encoded string of the PNG/JPEG frame data.
 		"""
 		if not self._is_active or not self._writer:
 			return
 
+		if frame_data_b64 == self._last_queued_frame:
+			# identical to the previous frame: the encoder re-appends the frame it already decoded
+			self.frames_duplicated += 1
+		self._last_queued_frame = frame_data_b64
 		try:
-			frame_bytes = base64.b64decode(frame_data_b64)
-
-			# Use PIL to handle image processing in memory - much faster than spawning ffmpeg subprocess per frame
-			with Image.open(io.BytesIO(frame_bytes)) as img:
-				# 1. Resize if needed to target viewport size
-				if img.size != (self.size['width'], self.size['height']):
-					# Use BICUBIC as it's faster than LANCZOS and good enough for screen recordings
-					img = img.resize((self.size['width'], self.size['height']), Image.Resampling.BICUBIC)
-
-				# 2. Handle Padding (Macro block alignment for codecs)
-				# Check if padding is actually needed
-				if self.padded_size['width'] != self.size['width'] or self.padded_size['height'] != self.size['height']:
-					new_img = Image.new('RGB', (self.padded_size['width'], self.padded_size['height']), (0, 0, 0))
-					# Center the image
-					x_offset = (self.padded_size['width'] - self.size['width']) // 2
-					y_offset = (self.padded_size['height'] - self.size['height']) // 2
-					new_img.paste(img, (x_offset, y_offset))
-					img = new_img
-
-				# 3. Convert to numpy array for imageio
-				img_array = np.array(img)
-
-			self._writer.append_data(img_array)
-		except Exception as e:
-			logger.warning(f'Could not process and add video frame: {e}')
+			self._frames.put_nowait(frame_data_b64)
+		except queue.Full:
+			self.frames_dropped += 1
+
+	def _encode_frames(self) -> None:
+		"""Encoder thread: decodes, resizes and pads queued frames into one reused buffer and appends them."""
+		assert self._writer is not None
+		width, height = self.size['width'], self.size['height']
+		# Preallocated padded frame, the black border is written once and the frame area overwritten per frame
+		canvas = np.zeros((self.padded_size['height'], self.padded_size['width'], 3), dtype=np.uint8)
+		x_offset = (self.padded_size['width'] - width) // 2
+		y_offset = (self.padded_size['height'] - height) // 2
+		frame_area = canvas[y_offset : y_offset + height, x_offset : x_offset + width]
+		previous_frame: str | None = None
+
+		while True:
+			frame_data_b64 = self._frames.get()
+			if frame_data_b64 is None:
+				return
+			try:
+				if frame_data_b64 != previous_frame:
+					frame_bytes = base64.b64decode(frame_data_b64)
+					# Use PIL to handle image processing in memory - much faster than spawning ffmpeg subprocess per frame
+					with Image.open(io.BytesIO(frame_bytes)) as img:
+						frame = img.convert('RGB')
+						if frame.size != (width, height):
+							# Use BICUBIC as it's faster than LANCZOS and good enough for screen recordings
+							frame = frame.resize((width, height), Image.Resampling.BICUBIC)
+						frame_area[...] = np.asarray(frame)
+					previous_frame = frame_data_b64
+
+				# append_data writes the frame to the ffmpeg pipe before returning, so the canvas can be reused
+				self._writer.append_data(canvas)
+			except Exception as e:
+				logger.warning(f'Could not process and add video frame: {e}')
 
 	def stop_and_save(self) -> None:
 		"""
@@ -131,7 +162,15 @@ class VideoRecorderService:
 		if not self._is_active or not self._writer:
 			return
 
+		self._is_active = False  # no new frames from here on
 		try:
+			if self._encoder_thread is not None:
+				self._frames.put(None)  # after the frames already queued
+				self._encoder_thread.join()
+			if self.frames_dropped or self.frames_duplicated:
+				logger.debug(
+					f'Video recorder dropped {self.frames_dropped} frames (encoder behind), reused {self.frames_duplicated} duplicate frames'
+				)
 			self._writer.close()
 			logger.info(f'📹 Video recording saved successfully to: {self.output_path}')
 		except Exception as e:
@@ -139,3 +178,4 @@ class VideoRecorderService:
 		finally:
 			self._is_active = False
 			self._writer = None
+			self._encoder_thread = None
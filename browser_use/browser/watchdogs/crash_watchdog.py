@@ -24,17 +24,6 @@ if TYPE_CHECKING:
 	pass
 
 
-class NetworkRequestTracker:
-	"""Tracks ongoing network requests."""
-
-	def __init__(self, request_id: str, start_time: float, url: str, method: str, resource_type: str | None = None):
-		self.request_id = request_id
-		self.start_time = start_time
-		self.url = url
-		self.method = method
-		self.resource_type = resource_type
-
-
 class CrashWatchdog(BaseWatchdog):
 	"""Monitors browser health for crashes and network timeouts using CDP."""
 
@@ -52,7 +41,7 @@ class CrashWatchdog(BaseWatchdog):
 	check_interval_seconds: float = Field(default=5.0)  # Reduced frequency to reduce noise
 
 	# Private state
-	_active_requests: dict[str, NetworkRequestTracker] = PrivateAttr(default_factory=dict)
+	_reported_timeouts: set[str] = PrivateAttr(default_factory=set)  # request ids already reported as timed out
 	_monitoring_task: asyncio.Task | None = PrivateAttr(default=None)
 	_last_responsive_checks: dict[str, float] = PrivateAttr(default_factory=dict)  # target_url -> timestamp
 	_cdp_event_tasks: set[asyncio.Task] = PrivateAttr(default_factory=set)  # Track CDP event handler tasks
@@ -79,6 +68,7 @@ class CrashWatchdog(BaseWatchdog):
 
 	async def on_TabClosedEvent(self, event: TabClosedEvent) -> None:
 		"""Clean up tracking when tab closes."""
+		self.browser_session.network_tracker.clear_requests(event.target_id)
 		# Remove target from listener tracking to prevent memory leak
 		if event.target_id in self._targets_with_listeners:
 			self._targets_with_listeners.discard(event.target_id)
@@ -120,44 +110,6 @@ class CrashWatchdog(BaseWatchdog):
 		except Exception as e:
 			self.logger.warning(f'[CrashWatchdog] Failed to attach to target {target_id}: {e}')
 
-	async def _on_request_cdp(self, event: dict) -> None:
-		"""Track new network request from CDP event."""
-		request_id = event.get('requestId', '')
-		request = event.get('request', {})
-
-		self._active_requests[request_id] = NetworkRequestTracker(
-			request_id=request_id,
-			start_time=time.time(),
-			url=request.get('url', ''),
-			method=request.get('method', ''),
-			resource_type=event.get('type'),
-		)
-		# logger.debug(f'[CrashWatchdog] Tracking request: {request.get("method", "")} {request.get("url", "")[:50]}...')
-
-	def _on_response_cdp(self, event: dict) -> None:
-		"""Remove request from tracking on response."""
-		request_id = event.get('requestId', '')
-		if request_id in self._active_requests:
-			elapsed = time.time() - self._active_requests[request_id].start_time
-			response = event.get('response', {})
-			self.logger.debug(f'[CrashWatchdog] Request completed in {elapsed:.2f}s: {response.get("url", "")[:50]}...')
-			# Don't remove yet - wait for loadingFinished
-
-	def _on_request_failed_cdp(self, event: dict) -> None:
-		"""Remove request from tracking on failure."""
-		request_id = event.get('requestId', '')
-		if request_id in self._active_requests:
-			elapsed = time.time() - self._active_requests[request_id].start_time
-			self.logger.debug(
-				f'[CrashWatchdog] Request failed after {elapsed:.2f}s: {self._active_requests[request_id].url[:50]}...'
-			)
-			del self._active_requests[request_id]
-
-	def _on_request_finished_cdp(self, event: dict) -> None:
-		"""Remove request from tracking when loading is finished."""
-		request_id = event.get('requestId', '')
-		self._active_requests.pop(request_id, None)
-
 	async def _on_target_crash_cdp(self, target_id: TargetID) -> None:
 		"""Handle target crash detected via CDP."""
 		self.logger.debug(f'[CrashWatchdog] Target crashed: {target_id[:8]}..., waiting for detach event')
@@ -219,7 +171,7 @@ class CrashWatchdog(BaseWatchdog):
 		self._cdp_event_tasks.clear()
 
 		# Clear all tracking
-		self._active_requests.clear()
+		self._reported_timeouts.clear()
 		self._targets_with_listeners.clear()
 		self._last_responsive_checks.clear()
 
@@ -237,29 +189,29 @@ class CrashWatchdog(BaseWatchdog):
 				self.logger.error(f'[CrashWatchdog] Error in monitoring loop: {e}')
 
 	async def _check_network_timeouts(self) -> None:
-		"""Check for network requests exceeding timeout."""
-		current_time = time.time()
-		timed_out_requests = []
+		"""Check for network requests exceeding timeout, using the session's shared network tracker."""
+		current_time = time.monotonic()
+		in_flight = self.browser_session.network_tracker.in_flight_requests()
+		# Forget reported requests that have finished since
+		self._reported_timeouts.intersection_update(request.request_id for request in in_flight)
 
 		# Debug logging
-		if self._active_requests:
+		if in_flight:
 			self.logger.debug(
-				f'[CrashWatchdog] Checking {len(self._active_requests)} active requests for timeouts (threshold: {self.network_timeout_seconds}s)'
+				f'[CrashWatchdog] Checking {len(in_flight)} active requests for timeouts (threshold: {self.network_timeout_seconds}s)'
 			)
 
-		for request_id, tracker in self._active_requests.items():
-			elapsed = current_time - tracker.start_time
-			self.logger.debug(
-				f'[CrashWatchdog] Request {tracker.url[:30]}... elapsed: {elapsed:.1f}s, timeout: {self.network_timeout_seconds}s'
-			)
-			if elapsed >= self.network_timeout_seconds:
-				timed_out_requests.append((request_id, tracker))
+		for request in in_flight:
+			# ads, beacons and long-lived streams are expected to stay open
+			if not request.blocking or request.request_id in self._reported_timeouts:
+				continue
+			elapsed = request.loading_seconds(current_time)
+			if elapsed < self.network_timeout_seconds:
+				continue
 
-		# Emit events for timed out requests
-		for request_id, tracker in timed_out_requests:
 			self.logger.warning(
 				f'[CrashWatchdog] Network request timeout after {self.network_timeout_seconds}s: '
-				f'{tracker.method} {tracker.url[:100]}...'
+				f'{request.method} {request.url[:100]}...'
 			)
 
 			self.event_bus.dispatch(
@@ -267,16 +219,14 @@ class CrashWatchdog(BaseWatchdog):
 					error_type='NetworkTimeout',
 					message=f'Network request timed out after {self.network_timeout_seconds}s',
 					details={
-						'url': tracker.url,
-						'method': tracker.method,
-						'resource_type': tracker.resource_type,
-						'elapsed_seconds': current_time - tracker.start_time,
+						'url': request.url,
+						'method': request.method,
+						'resource_type': request.resource_type,
+						'elapsed_seconds': elapsed,
 					},
 				)
 			)
-
-			# Remove from tracking
-			del self._active_requests[request_id]
+			self._reported_timeouts.add(request.request_id)
 
 	async def _check_browser_health(self) -> None:
 		"""Check if browser and targets are still responsive."""
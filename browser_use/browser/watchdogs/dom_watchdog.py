@@ -4,6 +4,8 @@ import asyncio
 import time
 from typing import TYPE_CHECKING
 
+from pydantic import Field
+
 from browser_use.browser.events import (
 	BrowserErrorEvent,
 	BrowserStateRequestEvent,
@@ -42,8 +44,9 @@ class DOMWatchdog(BaseWatchdog):
 	# Internal DOM service
 	_dom_service: DomService | None = None
 
-	# Network tracking - maps request_id to (url, start_time, method, resource_type)
-	_pending_requests: dict[str, tuple[str, float, str, str | None]] = {}
+	# Page stability: wait until no critical request has been in flight for the quiet period, capped at the max
+	network_idle_quiet_ms: float = Field(default=100)
+	network_idle_max_ms: float = Field(default=300)
 
 	async def on_TabCreatedEvent(self, event: TabCreatedEvent) -> None:
 		# self.logger.debug('Setting up init scripts in browser')
@@ -89,154 +92,31 @@ class DOMWatchdog(BaseWatchdog):
 		return json.dumps([])  # Return empty JSON array on error
 
 	async def _get_pending_network_requests(self) -> list['NetworkRequest']:
-		"""Get list of currently pending network requests.
+		"""Get list of currently pending network requests of the focused tab.
 
-		Uses document.readyState and performance API to detect pending requests.
-		Filters out ads, tracking, and other noise.
+		Reads the session's CDP-driven network tracker, which already filters out ads, tracking,
+		long-lived streams and stuck or slow non-critical resources.
 
 		Returns:
 			List of NetworkRequest objects representing currently loading resources
 		"""
 		from browser_use.browser.views import NetworkRequest
 
-		try:
-			# get_or_create_cdp_session() now handles focus validation automatically
-			cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
-
-			# Use performance API to get pending requests
-			js_code = """
-(function() {
-	const now = performance.now();
-	const resources = performance.getEntriesByType('resource');
-	const pending = [];
-
-	// Check document readyState
-	const docLoading = document.readyState !== 'complete';
-
-	// Common ad/tracking domains and patterns to filter out
-	const adDomains = [
-		// Standard ad/tracking networks
-		'doubleclick.net', 'googlesyndication.com', 'googletagmanager.com',
-		'facebook.net', 'analytics', 'ads', 'tracking', 'pixel',
-		'hotjar.com', 'clarity.ms', 'mixpanel.com', 'segment.com',
-		// Analytics platforms
-		'demdex.net', 'omtrdc.net', 'adobedtm.com', 'ensighten.com',
-		'newrelic.com', 'nr-data.net', 'google-analytics.com',
-		// Social media trackers
-		'connect.facebook.net', 'platform.twitter.com', 'platform.linkedin.com',
-		// CDN/image hosts (usually not critical for functionality)
-		'.cloudfront.net/image/', '.akamaized.net/image/',
-		// Common tracking paths
-		'/tracker/', '/collector/', '/beacon/', '/telemetry/', '/log/',
-		'/events/', '/eventBatch', '/track.', '/metrics/'
-	];
-
-	// Get resources that are still loading (responseEnd is 0)
-	let totalResourcesChecked = 0;
-	let filteredByResponseEnd = 0;
-	const allDomains = new Set();
-
-	for (const entry of resources) {
-		totalResourcesChecked++;
-
-		// Track all domains from recent resources (for logging)
-		try {
-			const hostname = new URL(entry.name).hostname;
-			if (hostname) allDomains.add(hostname);
-		} catch (e) {}
-
-		if (entry.responseEnd === 0) {
-			filteredByResponseEnd++;
-			const url = entry.name;
-
-			// Filter out ads and tracking
-			const isAd = adDomains.some(domain => url.includes(domain));
-			if (isAd) continue;
-
-			// Filter out data: URLs and very long URLs (often inline resources)
-			if (url.startsWith('data:') || url.length > 500) continue;
-
-			const loadingDuration = now - entry.startTime;
-
-			// Skip requests that have been loading for >10 seconds (likely stuck/polling)
-			if (loadingDuration > 10000) continue;
-
-			const resourceType = entry.initiatorType || 'unknown';
-
-			// Filter out non-critical resources (images, fonts, icons) if loading >3 seconds
-			const nonCriticalTypes = ['img', 'image', 'icon', 'font'];
-			if (nonCriticalTypes.includes(resourceType) && loadingDuration > 3000) continue;
-
-			// Filter out image URLs even if type is unknown
-			const isImageUrl = /\\.(jpg|jpeg|png|gif|webp|svg|ico)(\\?|$)/i.test(url);
-			if (isImageUrl && loadingDuration > 3000) continue;
-
-			pending.push({
-				url: url,
-				method: 'GET',
-				loading_duration_ms: Math.round(loadingDuration),
-				resource_type: resourceType
-			});
-		}
-	}
-
-	return {
-		pending_requests: pending,
-		document_loading: docLoading,
-		document_ready_state: document.readyState,
-		debug: {
-			total_resources: totalResourcesChecked,
-			with_response_end_zero: filteredByResponseEnd,
-			after_all_filters: pending.length,
-			all_domains: Array.from(allDomains)
-		}
-	};
-})()
-"""
-
-			result = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={'expression': js_code, 'returnByValue': True}, session_id=cdp_session.session_id
+		tracker = self.browser_session.network_tracker
+		now = time.monotonic()
+		pending = tracker.in_flight_critical_requests(self.browser_session.agent_focus_target_id)
+		self.logger.debug(f'🔍 Network check: in_flight={len(tracker.in_flight_requests())}, critical={len(pending)}')
+
+		# Limit to 20 to avoid overwhelming the context
+		return [
+			NetworkRequest(
+				url=request.url,
+				method=request.method,
+				loading_duration_ms=round(request.loading_seconds(now) * 1000),
+				resource_type=request.resource_type,
 			)
-
-			if result.get('result', {}).get('type') == 'object':
-				data = result['result'].get('value', {})
-				pending = data.get('pending_requests', [])
-				doc_state = data.get('document_ready_state', 'unknown')
-				doc_loading = data.get('document_loading', False)
-				debug_info = data.get('debug', {})
-
-				# Get all domains that had recent activity (from JS)
-				all_domains = debug_info.get('all_domains', [])
-				all_domains_str = ', '.join(sorted(all_domains)[:5]) if all_domains else 'none'
-				if len(all_domains) > 5:
-					all_domains_str += f' +{len(all_domains) - 5} more'
-
-				# Debug logging
-				self.logger.debug(
-					f'🔍 Network check: document.readyState={doc_state}, loading={doc_loading}, '
-					f'total_resources={debug_info.get("total_resources", 0)}, '
-					f'responseEnd=0: {debug_info.get("with_response_end_zero", 0)}, '
-					f'after_filters={len(pending)}, domains=[{all_domains_str}]'
-				)
-
-				# Convert to NetworkRequest objects
-				network_requests = []
-				for req in pending[:20]:  # Limit to 20 to avoid overwhelming the context
-					network_requests.append(
-						NetworkRequest(
-							url=req['url'],
-							method=req.get('method', 'GET'),
-							loading_duration_ms=req.get('loading_duration_ms', 0.0),
-							resource_type=req.get('resource_type'),
-						)
-					)
-
-				return network_requests
-
-		except Exception as e:
-			self.logger.debug(f'Failed to get pending network requests: {e}')
-
-		return []
+			for request in pending[:20]
+		]
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='browser_state_request_event')
 	async def on_BrowserStateRequestEvent(self, event: BrowserStateRequestEvent) -> 'BrowserStateSummary':
@@ -278,8 +158,14 @@ class DOMWatchdog(BaseWatchdog):
 			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ⏳ Waiting for page stability...')
 			try:
 				if pending_requests_before_wait:
-					# Reduced from 1s to 0.3s for faster DOM builds while still allowing critical resources to load
-					await asyncio.sleep(0.3)
+					# Returns as soon as the critical requests are done instead of always sleeping the full budget
+					went_idle = await self.browser_session.network_tracker.wait_for_network_idle(
+						self.browser_session.agent_focus_target_id,
+						quiet_ms=self.network_idle_quiet_ms,
+						max_ms=self.network_idle_max_ms,
+					)
+					if not went_idle:
+						self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: network still busy, continuing')
 				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Page stability complete')
 			except Exception as e:
 				self.logger.warning(
@@ -547,6 +433,7 @@ class DOMWatchdog(BaseWatchdog):
 					paint_order_filtering=self.browser_session.browser_profile.paint_order_filtering,
 					max_iframes=self.browser_session.browser_profile.max_iframes,
 					max_iframe_depth=self.browser_session.browser_profile.max_iframe_depth,
+					incremental_snapshots=self.browser_session.browser_profile.incremental_dom_snapshots,
 				)
 
 			# Get serialized DOM tree using the service
@@ -564,6 +451,11 @@ class DOMWatchdog(BaseWatchdog):
 			# Build hierarchical timing breakdown as single multi-line string
 			timing_lines = [f'⏱️ Total DOM tree time: {total_time_ms:.2f}ms', '📊 Timing breakdown:']
 
+			# incremental reuse (no CDP captures at all)
+			incremental_reuse_ms = timing_info.get('incremental_reuse_ms', 0)
+			if incremental_reuse_ms > 0:
+				timing_lines.append(f'  ├─ incremental_reuse: {incremental_reuse_ms:.2f}ms')
+
 			# get_all_trees breakdown
 			get_all_trees_ms = timing_info.get('get_all_trees_total_ms', 0)
 			if get_all_trees_ms > 0:
@@ -631,7 +523,8 @@ class DOMWatchdog(BaseWatchdog):
 
 			# Calculate total tracked time for validation
 			main_operations_ms = (
-				get_all_trees_ms
+				incremental_reuse_ms
+				+ get_all_trees_ms
 				+ build_ax_ms
 				+ build_snapshot_ms
 				+ construct_tree_ms
@@ -621,8 +621,9 @@ class DownloadsWatchdog(BaseWatchdog):
 					except Exception as e:
 						self.logger.error(f'[DownloadsWatchdog] Error in network response handler: {type(e).__name__}: {e}')
 
-				# Register the callback globally (once)
-				cdp_client.register.Network.responseReceived(on_response_received)
+				# Subscribe through the session's network tracker, which owns the Network.* request handlers
+				# (a direct registration would replace the tracker's and HAR recording's handler)
+				self.browser_session.network_tracker.subscribe('responseReceived', 'downloads', on_response_received)
 				self._network_callback_registered = True
 				self.logger.debug('[DownloadsWatchdog] ✅ Registered global network response callback')
 
@@ -1,19 +1,24 @@
 """HAR Recording Watchdog for Browser-Use sessions.
 
-Captures HTTPS network activity via CDP Network domain and writes a HAR 1.2
-file on browser shutdown. Respects `record_har_content` (omit/embed/attach)
-and `record_har_mode` (full/minimal).
+Captures HTTPS network activity via CDP Network domain. Every entry is appended
+to a JSONL spool next to the HAR file as soon as its request finishes, and the
+HAR 1.2 file is assembled from the spool on browser shutdown, so memory use does
+not grow with the session and a crash keeps the completed entries. Respects
+`record_har_content` (omit/embed/attach), `record_har_mode` (full/minimal),
+`record_har_max_body_size` and `record_har_embed_limit`.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import json
+import threading
 from dataclasses import dataclass, field
 from importlib import metadata as importlib_metadata
 from pathlib import Path
-from typing import ClassVar
+from typing import IO, ClassVar
 
 from bubus import BaseEvent
 from cdp_use.cdp.network.events import (
@@ -66,6 +71,8 @@ class _HarEntryBuilder:
 	server_port: int | None = None
 	security_details: dict | None = None
 	transfer_size: int | None = None
+	body_omitted: bool = False  # body exceeded record_har_max_body_size
+	body_size: int | None = None
 
 
 def _is_https(url: str | None) -> bool:
@@ -142,7 +149,7 @@ def _generate_har_filename(content: bytes, mime_type: str | None) -> str:
 
 
 class HarRecordingWatchdog(BaseWatchdog):
-	"""Collects HTTPS requests/responses and writes a HAR 1.2 file on stop."""
+	"""Streams HTTPS requests/responses to a JSONL spool as they finish and writes a HAR 1.2 file on stop."""
 
 	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [BrowserConnectedEvent, BrowserStopEvent]
 	EMITS: ClassVar[list[type[BaseEvent]]] = []
@@ -154,6 +161,13 @@ class HarRecordingWatchdog(BaseWatchdog):
 		self._top_level_pages: dict[
 			str, dict
 		] = {}  # frameId -> {url, title, startedDateTime, monotonic_start, onContentLoad, onLoad}
+		# finished entries are written here one JSON object per line, and removed from self._entries
+		self._spool: IO[str] | None = None
+		self._spool_lock = threading.Lock()
+		self._spooled_entries = 0
+		self._sidecar_dir: Path | None = None
+		self._max_body_size: int | None = None
+		self._finish_tasks: set[asyncio.Task] = set()
 
 	async def on_BrowserConnectedEvent(self, event: BrowserConnectedEvent) -> None:
 		profile = self.browser_session.browser_profile
@@ -166,6 +180,12 @@ class HarRecordingWatchdog(BaseWatchdog):
 		self._har_path = Path(str(profile.record_har_path)).expanduser().resolve()
 		self._har_dir = self._har_path.parent
 		self._har_dir.mkdir(parents=True, exist_ok=True)
+		self._max_body_size = profile.record_har_max_body_size
+		if self._content_mode == 'attach' or (self._content_mode == 'embed' and profile.record_har_embed_limit is not None):
+			self._sidecar_dir = self._har_dir / f'{self._har_path.stem}_har_parts'
+			self._sidecar_dir.mkdir(parents=True, exist_ok=True)
+		self._spool_path = self._har_path.with_suffix(self._har_path.suffix + '.jsonl')
+		self._spool = await asyncio.to_thread(open, self._spool_path, 'w', encoding='utf-8')
 
 		try:
 			# Enable Network and Page domains for events
@@ -182,12 +202,15 @@ class HarRecordingWatchdog(BaseWatchdog):
 				self._browser_name = 'Chromium'
 				self._browser_version = ''
 
+			# Request lifecycle events are owned by the session's network tracker and fanned out to subscribers
+			network_tracker = self.browser_session.network_tracker
+			network_tracker.subscribe('requestWillBeSent', 'har', self._on_request_will_be_sent)
+			network_tracker.subscribe('responseReceived', 'har', self._on_response_received)
+			network_tracker.subscribe('loadingFinished', 'har', self._on_loading_finished)
+			network_tracker.subscribe('loadingFailed', 'har', self._on_loading_failed)
+
 			cdp = self.browser_session.cdp_client.register
-			cdp.Network.requestWillBeSent(self._on_request_will_be_sent)
-			cdp.Network.responseReceived(self._on_response_received)
 			cdp.Network.dataReceived(self._on_data_received)
-			cdp.Network.loadingFinished(self._on_loading_finished)
-			cdp.Network.loadingFailed(self._on_loading_failed)
 			cdp.Page.lifecycleEvent(self._on_lifecycle_event)
 			cdp.Page.frameNavigated(self._on_frame_navigated)
 
@@ -200,9 +223,17 @@ class HarRecordingWatchdog(BaseWatchdog):
 	async def on_BrowserStopEvent(self, event: BrowserStopEvent) -> None:
 		if not self._enabled:
 			return
+		self._enabled = False
 		try:
+			# let pending body fetches finish, then spool whatever is still in flight as-is
+			if self._finish_tasks:
+				await asyncio.wait(set(self._finish_tasks), timeout=5)
+			unfinished = list(self._entries.values())
+			self._entries.clear()
+			for entry in unfinished:
+				await asyncio.to_thread(self._write_entry, entry)
 			await self._write_har()
-			self.logger.info(f'📊 HAR file saved: {self._har_path}')
+			self.logger.info(f'📊 HAR file saved: {self._har_path} ({self._spooled_entries} entries)')
 		except Exception as e:
 			self.logger.warning(f'Failed to write HAR: {e}')
 
@@ -371,10 +402,13 @@ class HarRecordingWatchdog(BaseWatchdog):
 				return
 			data = params.get('data') if hasattr(params, 'get') else getattr(params, 'data', None)
 			if isinstance(data, str):
+				entry = self._entries[request_id]
 				try:
-					self._entries[request_id].encoded_data.extend(data.encode('latin1'))
+					entry.encoded_data.extend(data.encode('latin1'))
 				except Exception:
 					pass
+				if self._max_body_size is not None and len(entry.encoded_data) > self._max_body_size:
+					entry.encoded_data = bytearray()  # only the response body fetch can tell the real size now
 		except Exception as e:
 			self.logger.debug(f'dataReceived handling error: {e}')
 
@@ -385,32 +419,6 @@ class HarRecordingWatchdog(BaseWatchdog):
 				return
 			entry = self._entries[request_id]
 			entry.ts_finished = params.get('timestamp')
-			# Fetch response body via CDP as dataReceived may be incomplete
-			import asyncio as _asyncio
-
-			async def _fetch_body(self_ref, req_id, sess_id):
-				try:
-					resp = await self_ref.browser_session.cdp_client.send.Network.getResponseBody(
-						params={'requestId': req_id}, session_id=sess_id
-					)
-					data = resp.get('body', b'')
-					if resp.get('base64Encoded'):
-						import base64 as _b64
-
-						data = _b64.b64decode(data)
-					else:
-						# Ensure data is bytes even if CDP returns a string
-						if isinstance(data, str):
-							data = data.encode('utf-8', errors='replace')
-					# Ensure we always have bytes
-					if not isinstance(data, bytes):
-						data = bytes(data) if data else b''
-					entry.response_body = data
-				except Exception:
-					pass
-
-			# Always schedule the response body fetch task
-			_asyncio.create_task(_fetch_body(self, request_id, session_id))
 
 			encoded_length = (
 				params.get('encodedDataLength') if hasattr(params, 'get') else getattr(params, 'encodedDataLength', None)
@@ -421,14 +429,58 @@ class HarRecordingWatchdog(BaseWatchdog):
 					entry.transfer_size = entry.encoded_data_length
 				except Exception:
 					entry.encoded_data_length = None
+
+			# Fetch response body via CDP as dataReceived may be incomplete, then spool the entry
+			task = asyncio.create_task(self._finish_entry(request_id, session_id))
+			self._finish_tasks.add(task)
+			task.add_done_callback(self._finish_tasks.discard)
 		except Exception as e:
 			self.logger.debug(f'loadingFinished handling error: {e}')
 
+	async def _finish_entry(self, request_id: str, session_id: str | None) -> None:
+		entry = self._entries.get(request_id)
+		if entry is None:
+			return
+		try:
+			resp = await self.browser_session.cdp_client.send.Network.getResponseBody(
+				params={'requestId': request_id}, session_id=session_id
+			)
+			data = resp.get('body', b'')
+			if resp.get('base64Encoded'):
+				data = base64.b64decode(data)
+			else:
+				# Ensure data is bytes even if CDP returns a string
+				if isinstance(data, str):
+					data = data.encode('utf-8', errors='replace')
+			# Ensure we always have bytes
+			if not isinstance(data, bytes):
+				data = bytes(data) if data else b''
+			if self._max_body_size is not None and len(data) > self._max_body_size:
+				entry.body_omitted = True
+				entry.body_size = len(data)
+				entry.encoded_data = bytearray()
+			else:
+				entry.response_body = data
+		except Exception:
+			pass
+
+		# the request ID can be reused (e.g. by a redirect) while the body was being fetched
+		if self._entries.get(request_id) is entry:
+			del self._entries[request_id]
+		try:
+			await asyncio.to_thread(self._write_entry, entry)
+		except Exception as e:
+			self.logger.debug(f'Failed to spool HAR entry: {e}')
+
 	def _on_loading_failed(self, params: LoadingFailedEvent, session_id: str | None) -> None:
 		try:
 			request_id = params.get('requestId') if hasattr(params, 'get') else getattr(params, 'requestId', None)
 			if request_id and request_id in self._entries:
-				self._entries[request_id].failed = True
+				entry = self._entries.pop(request_id)
+				entry.failed = True
+				task = asyncio.create_task(asyncio.to_thread(self._write_entry, entry))
+				self._finish_tasks.add(task)
+				task.add_done_callback(self._finish_tasks.discard)
 		except Exception as e:
 			self.logger.debug(f'loadingFailed handling error: {e}')
 
@@ -486,153 +538,163 @@ class HarRecordingWatchdog(BaseWatchdog):
 			self.logger.debug(f'frameNavigated handling error: {e}')
 
 	# ===================== HAR Writing ==========================
-	async def _write_har(self) -> None:
-		# Filter by mode and HTTPS already respected at collection time
-		entries = [e for e in self._entries.values() if self._include_entry(e)]
-
-		har_entries = []
-		sidecar_dir: Path | None = None
-		if self._content_mode == 'attach':
-			sidecar_dir = self._har_dir / f'{self._har_path.stem}_har_parts'
-			sidecar_dir.mkdir(parents=True, exist_ok=True)
-
-		for e in entries:
-			content_obj: dict = {'mimeType': e.mime_type or ''}
-
-			# Get body data, preferring response_body over encoded_data
-			if e.response_body is not None:
-				body_data = e.response_body
-			else:
-				body_data = e.encoded_data
-
-			# Defensive conversion: ensure body_data is always bytes
-			if isinstance(body_data, str):
-				body_bytes = body_data.encode('utf-8', errors='replace')
-			elif isinstance(body_data, bytearray):
-				body_bytes = bytes(body_data)
-			elif isinstance(body_data, bytes):
-				body_bytes = body_data
-			else:
-				# Fallback: try to convert to bytes
-				try:
-					body_bytes = bytes(body_data) if body_data else b''
-				except (TypeError, ValueError):
-					body_bytes = b''
-
-			content_size = len(body_bytes)
-
-			# Calculate compression (bytes saved by compression)
-			compression = 0
-			if e.content_length is not None and e.encoded_data_length is not None:
-				compression = max(0, e.content_length - e.encoded_data_length)
-
-			if self._content_mode == 'embed' and content_size > 0:
-				# Prefer plain text; fallback to base64 only if decoding fails
-				try:
-					text_decoded = body_bytes.decode('utf-8')
-					content_obj['text'] = text_decoded
-					content_obj['size'] = content_size
-					content_obj['compression'] = compression
-				except UnicodeDecodeError:
-					content_obj['text'] = base64.b64encode(body_bytes).decode('ascii')
-					content_obj['encoding'] = 'base64'
-					content_obj['size'] = content_size
-					content_obj['compression'] = compression
-			elif self._content_mode == 'attach' and content_size > 0 and sidecar_dir is not None:
-				filename = _generate_har_filename(body_bytes, e.mime_type)
-				(sidecar_dir / filename).write_bytes(body_bytes)
-				content_obj['_file'] = filename
+	def _build_entry(self, e: _HarEntryBuilder, sidecar_dir: Path | None) -> dict:
+		"""HAR entry for a finished request. Bodies in attach mode (or above the embed limit) go to `sidecar_dir`."""
+		content_obj: dict = {'mimeType': e.mime_type or ''}
+
+		# Get body data, preferring response_body over encoded_data
+		if e.response_body is not None:
+			body_data = e.response_body
+		else:
+			body_data = e.encoded_data
+
+		# Defensive conversion: ensure body_data is always bytes
+		if isinstance(body_data, str):
+			body_bytes = body_data.encode('utf-8', errors='replace')
+		elif isinstance(body_data, bytearray):
+			body_bytes = bytes(body_data)
+		elif isinstance(body_data, bytes):
+			body_bytes = body_data
+		else:
+			# Fallback: try to convert to bytes
+			try:
+				body_bytes = bytes(body_data) if body_data else b''
+			except (TypeError, ValueError):
+				body_bytes = b''
+
+		content_size = e.body_size if e.body_omitted else len(body_bytes)
+
+		# Calculate compression (bytes saved by compression)
+		compression = 0
+		if e.content_length is not None and e.encoded_data_length is not None:
+			compression = max(0, e.content_length - e.encoded_data_length)
+
+		embed_limit = self.browser_session.browser_profile.record_har_embed_limit
+		spill = embed_limit is not None and len(body_bytes) > embed_limit
+		if e.body_omitted:
+			content_obj['size'] = content_size
+			content_obj['comment'] = 'body larger than record_har_max_body_size, not recorded'
+		elif self._content_mode == 'embed' and content_size > 0 and not spill:
+			# Prefer plain text; fallback to base64 only if decoding fails
+			try:
+				text_decoded = body_bytes.decode('utf-8')
+				content_obj['text'] = text_decoded
 				content_obj['size'] = content_size
 				content_obj['compression'] = compression
-			else:
-				# omit or empty
+			except UnicodeDecodeError:
+				content_obj['text'] = base64.b64encode(body_bytes).decode('ascii')
+				content_obj['encoding'] = 'base64'
 				content_obj['size'] = content_size
-				if content_size > 0:
-					content_obj['compression'] = compression
-
-			started_date_time, total_time_ms, timings = self._compute_timings(e)
-			req_headers_list = [{'name': k, 'value': str(v)} for k, v in (e.request_headers or {}).items()]
-			resp_headers_list = [{'name': k, 'value': str(v)} for k, v in (e.response_headers or {}).items()]
-			request_headers_size = self._calc_headers_size(e.method or 'GET', e.url or '', req_headers_list)
-			response_headers_size = self._calc_headers_size(None, None, resp_headers_list)
-			request_body_size = self._calc_request_body_size(e)
-			request_post_data = None
-			if e.post_data and self._content_mode != 'omit':
-				if self._content_mode == 'embed':
-					request_post_data = {'mimeType': e.request_headers.get('content-type', ''), 'text': e.post_data}
-				elif self._content_mode == 'attach' and sidecar_dir is not None:
-					post_data_bytes = e.post_data.encode('utf-8')
-					req_mime_type = e.request_headers.get('content-type', 'text/plain')
-					req_filename = _generate_har_filename(post_data_bytes, req_mime_type)
-					(sidecar_dir / req_filename).write_bytes(post_data_bytes)
-					request_post_data = {
-						'mimeType': req_mime_type,
-						'_file': req_filename,
-					}
-
-			http_version = e.protocol if e.protocol else 'HTTP/1.1'
-
-			response_body_size = e.transfer_size
-			if response_body_size is None:
-				response_body_size = e.encoded_data_length
-			if response_body_size is None:
-				response_body_size = content_size if content_size > 0 else -1
-
-			entry_dict = {
-				'startedDateTime': started_date_time,
-				'time': total_time_ms,
-				'request': {
-					'method': e.method or 'GET',
-					'url': e.url or '',
-					'httpVersion': http_version,
-					'headers': req_headers_list,
-					'queryString': [],
-					'cookies': [],
-					'headersSize': request_headers_size,
-					'bodySize': request_body_size,
-					'postData': request_post_data,
-				},
-				'response': {
-					'status': e.status or 0,
-					'statusText': e.status_text or '',
-					'httpVersion': http_version,
-					'headers': resp_headers_list,
-					'cookies': [],
-					'content': content_obj,
-					'redirectURL': '',
-					'headersSize': response_headers_size,
-					'bodySize': response_body_size,
-				},
-				'cache': {},
-				'timings': timings,
-				'pageref': self._page_ref_for_entry(e),
-			}
-
-			# Add security/TLS details if available
-			if e.server_ip_address:
-				entry_dict['serverIPAddress'] = e.server_ip_address
-			if e.server_port is not None:
-				entry_dict['_serverPort'] = e.server_port
-			if e.security_details:
-				# Filter to match Playwright's minimal security details set
-				security_filtered = {}
-				if 'protocol' in e.security_details:
-					security_filtered['protocol'] = e.security_details['protocol']
-				if 'subjectName' in e.security_details:
-					security_filtered['subjectName'] = e.security_details['subjectName']
-				if 'issuer' in e.security_details:
-					security_filtered['issuer'] = e.security_details['issuer']
-				if 'validFrom' in e.security_details:
-					security_filtered['validFrom'] = e.security_details['validFrom']
-				if 'validTo' in e.security_details:
-					security_filtered['validTo'] = e.security_details['validTo']
-				if security_filtered:
-					entry_dict['_securityDetails'] = security_filtered
-			if e.transfer_size is not None:
-				entry_dict['response']['_transferSize'] = e.transfer_size
-
-			har_entries.append(entry_dict)
+				content_obj['compression'] = compression
+		elif self._content_mode in ('attach', 'embed') and content_size > 0 and sidecar_dir is not None:
+			filename = _generate_har_filename(body_bytes, e.mime_type)
+			(sidecar_dir / filename).write_bytes(body_bytes)
+			content_obj['_file'] = filename
+			content_obj['size'] = content_size
+			content_obj['compression'] = compression
+		else:
+			# omit or empty
+			content_obj['size'] = content_size
+			if content_size > 0:
+				content_obj['compression'] = compression
 
+		started_date_time, total_time_ms, timings = self._compute_timings(e)
+		req_headers_list = [{'name': k, 'value': str(v)} for k, v in (e.request_headers or {}).items()]
+		resp_headers_list = [{'name': k, 'value': str(v)} for k, v in (e.response_headers or {}).items()]
+		request_headers_size = self._calc_headers_size(e.method or 'GET', e.url or '', req_headers_list)
+		response_headers_size = self._calc_headers_size(None, None, resp_headers_list)
+		request_body_size = self._calc_request_body_size(e)
+		request_post_data = None
+		if e.post_data and self._content_mode != 'omit':
+			if self._content_mode == 'embed':
+				request_post_data = {'mimeType': e.request_headers.get('content-type', ''), 'text': e.post_data}
+			elif self._content_mode == 'attach' and sidecar_dir is not None:
+				post_data_bytes = e.post_data.encode('utf-8')
+				req_mime_type = e.request_headers.get('content-type', 'text/plain')
+				req_filename = _generate_har_filename(post_data_bytes, req_mime_type)
+				(sidecar_dir / req_filename).write_bytes(post_data_bytes)
+				request_post_data = {
+					'mimeType': req_mime_type,
+					'_file': req_filename,
+				}
+
+		http_version = e.protocol if e.protocol else 'HTTP/1.1'
+
+		response_body_size = e.transfer_size
+		if response_body_size is None:
+			response_body_size = e.encoded_data_length
+		if response_body_size is None:
+			response_body_size = content_size if content_size > 0 else -1
+
+		entry_dict = {
+			'startedDateTime': started_date_time,
+			'time': total_time_ms,
+			'request': {
+				'method': e.method or 'GET',
+				'url': e.url or '',
+				'httpVersion': http_version,
+				'headers': req_headers_list,
+				'queryString': [],
+				'cookies': [],
+				'headersSize': request_headers_size,
+				'bodySize': request_body_size,
+				'postData': request_post_data,
+			},
+			'response': {
+				'status': e.status or 0,
+				'statusText': e.status_text or '',
+				'httpVersion': http_version,
+				'headers': resp_headers_list,
+				'cookies': [],
+				'content': content_obj,
+				'redirectURL': '',
+				'headersSize': response_headers_size,
+				'bodySize': response_body_size,
+			},
+			'cache': {},
+			'timings': timings,
+			'pageref': self._page_ref_for_entry(e),
+		}
+
+		# Add security/TLS details if available
+		if e.server_ip_address:
+			entry_dict['serverIPAddress'] = e.server_ip_address
+		if e.server_port is not None:
+			entry_dict['_serverPort'] = e.server_port
+		if e.security_details:
+			# Filter to match Playwright's minimal security details set
+			security_filtered = {}
+			if 'protocol' in e.security_details:
+				security_filtered['protocol'] = e.security_details['protocol']
+			if 'subjectName' in e.security_details:
+				security_filtered['subjectName'] = e.security_details['subjectName']
+			if 'issuer' in e.security_details:
+				security_filtered['issuer'] = e.security_details['issuer']
+			if 'validFrom' in e.security_details:
+				security_filtered['validFrom'] = e.security_details['validFrom']
+			if 'validTo' in e.security_details:
+				security_filtered['validTo'] = e.security_details['validTo']
+			if security_filtered:
+				entry_dict['_securityDetails'] = security_filtered
+		if e.transfer_size is not None:
+			entry_dict['response']['_transferSize'] = e.transfer_size
+		return entry_dict
+
+	def _write_entry(self, e: _HarEntryBuilder) -> None:
+		"""Appends a finished entry to the JSONL spool (runs in a worker thread)."""
+		if not self._include_entry(e):
+			return
+		entry_dict = self._build_entry(e, self._sidecar_dir)
+		line = json.dumps(entry_dict)
+		with self._spool_lock:
+			if self._spool is None:
+				return
+			self._spool.write(line + '\n')
+			self._spool.flush()  # completed entries survive a crash
+			self._spooled_entries += 1
+
+	async def _write_har(self) -> None:
+		"""Assembles the final HAR from the spooled entries without loading them all into memory."""
 		# Try to include our library version in creator
 		try:
 			bu_version = importlib_metadata.version('browser-use')
@@ -640,33 +702,49 @@ class HarRecordingWatchdog(BaseWatchdog):
 			# Fallback when running from source without installed package metadata
 			bu_version = 'dev'
 
-		har_obj = {
-			'log': {
-				'version': '1.2',
-				'creator': {'name': 'browser-use', 'version': bu_version},
-				'browser': {'name': self._browser_name, 'version': self._browser_version},
-				'pages': [
-					{
-						'id': f'page@{pid}',  # Use Playwright format: "page@{frame_id}"
-						'title': page_info.get('title', page_info.get('url', '')),
-						'startedDateTime': self._format_page_started_datetime(page_info.get('startedDateTime')),
-						'pageTimings': (
-							(lambda _ocl, _ol: ({k: v for k, v in (('onContentLoad', _ocl), ('onLoad', _ol)) if v is not None}))(
-								(page_info.get('onContentLoad') if page_info.get('onContentLoad', -1) >= 0 else None),
-								(page_info.get('onLoad') if page_info.get('onLoad', -1) >= 0 else None),
-							)
-						),
-					}
-					for pid, page_info in self._top_level_pages.items()
-				],
-				'entries': har_entries,
-			}
+		log_without_entries = {
+			'version': '1.2',
+			'creator': {'name': 'browser-use', 'version': bu_version},
+			'browser': {'name': self._browser_name, 'version': self._browser_version},
+			'pages': [
+				{
+					'id': f'page@{pid}',  # Use Playwright format: "page@{frame_id}"
+					'title': page_info.get('title', page_info.get('url', '')),
+					'startedDateTime': self._format_page_started_datetime(page_info.get('startedDateTime')),
+					'pageTimings': (
+						(lambda _ocl, _ol: ({k: v for k, v in (('onContentLoad', _ocl), ('onLoad', _ol)) if v is not None}))(
+							(page_info.get('onContentLoad') if page_info.get('onContentLoad', -1) >= 0 else None),
+							(page_info.get('onLoad') if page_info.get('onLoad', -1) >= 0 else None),
+						)
+					),
+				}
+				for pid, page_info in self._top_level_pages.items()
+			],
 		}
+		await asyncio.to_thread(self._assemble_har, log_without_entries)
+
+	def _assemble_har(self, log_without_entries: dict) -> None:
+		"""Writes the HAR document: `log_without_entries` plus every line of the spool, then removes the spool."""
+		with self._spool_lock:
+			if self._spool is not None:
+				self._spool.close()
+				self._spool = None
 
 		tmp_path = self._har_path.with_suffix(self._har_path.suffix + '.tmp')
-		# Write as bytes explicitly to avoid any text/binary mode confusion in different environments
-		tmp_path.write_bytes(json.dumps(har_obj, indent=2).encode('utf-8'))
+		# "entries" is the last key, its empty list is replaced by the spooled lines
+		head, _, tail = json.dumps({'log': {**log_without_entries, 'entries': []}}, indent=2).rpartition('[]')
+		with open(tmp_path, 'w', encoding='utf-8') as har_file:
+			har_file.write(head + '[')
+			first = True
+			with open(self._spool_path, encoding='utf-8') as spool:
+				for line in spool:
+					if not line.strip():
+						continue
+					har_file.write(('\n' if first else ',\n') + line.rstrip('\n'))
+					first = False
+			har_file.write('\n    ]' + tail)
 		tmp_path.replace(self._har_path)
+		self._spool_path.unlink(missing_ok=True)
 
 	def _format_page_started_datetime(self, timestamp: float | None) -> str:
 		"""Format page startedDateTime from timestamp."""
@@ -59,8 +59,9 @@ class RecordingWatchdog(BaseWatchdog):
 
 		self.browser_session.cdp_client.register.Page.screencastFrame(self.on_screencastFrame)
 
+		# JPEG frames are cheaper to produce in the browser and to decode on the encoder thread than PNG
 		self._screencast_params = {
-			'format': 'png',
+			'format': 'jpeg',
 			'quality': 90,
 			'maxWidth': size['width'],
 			'maxHeight': size['height'],
@@ -133,7 +134,7 @@ class RecordingWatchdog(BaseWatchdog):
 
 	def on_screencastFrame(self, event: ScreencastFrameEvent, session_id: str | None) -> None:
 		"""
-		Synchronous handler for incoming screencast frames.
+		Synchronous handler for incoming screencast frames. Only queues the frame, the recorder encodes it on its own thread.
 		"""
 		# Only process frames from the current session we intend to record
 		# This handles race conditions where old session might still send frames before stop completes
@@ -0,0 +1,136 @@
+"""Resource blocking watchdog for lean browsing (BrowserProfile.lean_browsing)."""
+
+import asyncio
+from typing import Any, ClassVar
+
+from bubus import BaseEvent
+from cdp_use.cdp.fetch.events import RequestPausedEvent
+from pydantic import PrivateAttr
+
+from browser_use.browser.events import BrowserConnectedEvent, BrowserStopEvent
+from browser_use.browser.resource_blocking import BlockAction, ResourceBlocker, ResourceBlockingStats
+from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.utils import create_task_with_error_handling
+
+
+class ResourceBlockingWatchdog(BaseWatchdog):
+	"""Blocks or stubs images, media, fonts and tracker requests with CDP Fetch interception.
+
+	Fetch is enabled on the browser target, so requests of every tab and iframe are covered from the first
+	navigation on, and only the requests the blocker might act on are paused.
+	"""
+
+	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [BrowserConnectedEvent, BrowserStopEvent]
+	EMITS: ClassVar[list[type[BaseEvent]]] = []
+
+	_blocker: ResourceBlocker | None = PrivateAttr(default=None)
+	_stats: ResourceBlockingStats = PrivateAttr(default_factory=ResourceBlockingStats)
+	_cdp_event_tasks: set[asyncio.Task] = PrivateAttr(default_factory=set)
+
+	@property
+	def stats(self) -> ResourceBlockingStats:
+		return self._stats
+
+	async def on_BrowserConnectedEvent(self, event: BrowserConnectedEvent) -> None:
+		settings = self.browser_session.browser_profile.lean_browsing
+		if settings is None:
+			return
+
+		self._blocker = ResourceBlocker(settings)
+		self._stats = ResourceBlockingStats()
+		proxy = self.browser_session.browser_profile.proxy
+		proxy_auth = bool(proxy and proxy.username and proxy.password)
+
+		try:
+			cdp_client = self.browser_session.cdp_client
+			# Fetch.enable replaces the proxy auth setup's interception on the browser target: keep answering auth
+			# challenges, which are only raised for paused requests, so every request has to be paused then
+			patterns = [{'urlPattern': '*', 'requestStage': 'Request'}] if proxy_auth else self._blocker.fetch_patterns()
+			await cdp_client.send.Fetch.enable(params={'patterns': patterns, 'handleAuthRequests': proxy_auth})  # type: ignore[typeddict-item]
+			# replaces the proxy auth handler, which only continued paused requests
+			cdp_client.register.Fetch.requestPaused(self._on_request_paused)
+			self.logger.info(
+				f'🪶 Lean browsing: blocking {", ".join(sorted(settings.resource_types)) or "no resource types"}'
+				f'{" and trackers" if settings.block_trackers else ""}'
+			)
+		except Exception as e:
+			self.logger.warning(f'Failed to enable lean browsing: {type(e).__name__}: {e}')
+			self._blocker = None
+
+	async def on_BrowserStopEvent(self, event: BrowserStopEvent) -> None:
+		if self._blocker is None:
+			return
+		stats = self._stats
+		if stats.requests_blocked or stats.requests_stubbed:
+			self.logger.info(
+				f'🪶 Lean browsing kept {stats.requests_blocked + stats.requests_stubbed} requests off the network '
+				f'(~{stats.estimated_bytes_saved / 1_000_000:.1f} MB): {stats.by_resource_type}'
+			)
+		for task in self._cdp_event_tasks:
+			task.cancel()
+		self._cdp_event_tasks.clear()
+		self._blocker = None
+
+	def _page_url(self, event: RequestPausedEvent, session_id: str | None) -> tuple[str | None, bool]:
+		"""URL of the page a paused request belongs to, and whether the request is that page's own navigation."""
+		session_manager = self.browser_session.session_manager
+		if session_manager is None:
+			return None, False
+		frame_id = event.get('frameId')
+		# a main frame's id is its page target's id
+		target = session_manager.get_target(frame_id) if frame_id else None
+		if target is not None:
+			return target.url, event.get('resourceType') == 'Document'
+		target_id = session_manager.get_target_id_from_session_id(session_id) if session_id else None
+		target_id = target_id or self.browser_session.agent_focus_target_id
+		target = session_manager.get_target(target_id) if target_id else None
+		return (target.url if target is not None else None), False
+
+	def _decide(self, event: RequestPausedEvent, session_id: str | None) -> BlockAction | None:
+		if self._blocker is None:
+			return None
+		page_url, is_navigation = self._page_url(event, session_id)
+		if is_navigation:
+			# navigating a tab to a blocked domain is the agent's decision, only subresources are blocked
+			return None
+		return self._blocker.decide(event['request']['url'], event.get('resourceType', 'Other'), page_url)
+
+	def _on_request_paused(self, event: RequestPausedEvent, session_id: str | None = None) -> None:
+		request_id = event.get('requestId')
+		if not request_id:
+			return
+		action = self._decide(event, session_id)
+		resource_type = event.get('resourceType', 'Other')
+		if action is not None:
+			self._stats.record(resource_type, action)
+
+		task = create_task_with_error_handling(
+			self._respond(request_id, action, resource_type, session_id),
+			name='lean_browsing_respond',
+			logger_instance=self.logger,
+			suppress_exceptions=True,
+		)
+		self._cdp_event_tasks.add(task)
+		task.add_done_callback(self._cdp_event_tasks.discard)
+
+	async def _respond(self, request_id: str, action: BlockAction | None, resource_type: str, session_id: str | None) -> None:
+		fetch: Any = self.browser_session.cdp_client.send.Fetch
+		try:
+			if action is None:
+				await fetch.continueRequest(params={'requestId': request_id}, session_id=session_id)
+			elif action == 'block':
+				await fetch.failRequest(params={'requestId': request_id, 'errorReason': 'BlockedByClient'}, session_id=session_id)
+			else:
+				content_type, body = ResourceBlocker.stub_response(resource_type)
+				await fetch.fulfillRequest(
+					params={
+						'requestId': request_id,
+						'responseCode': 200,
+						'responseHeaders': [{'name': 'Content-Type', 'value': content_type}],
+						'body': body,
+					},
+					session_id=session_id,
+				)
+		except Exception as e:
+			# the request may already be gone (tab closed, navigation cancelled)
+			self.logger.debug(f'Lean browsing failed to answer paused request {request_id}: {type(e).__name__}: {e}')
@@ -1,9 +1,13 @@
 """Screenshot watchdog for handling screenshot requests using CDP."""
 
+import base64
+import io
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from bubus import BaseEvent
 from cdp_use.cdp.page import CaptureScreenshotParameters
+from cdp_use.cdp.page.types import Viewport
+from pydantic import PrivateAttr
 
 from browser_use.browser.events import ScreenshotEvent
 from browser_use.browser.views import BrowserError
@@ -13,9 +17,37 @@ from browser_use.observability import observe_debug
 if TYPE_CHECKING:
 	pass
 
+# Width of the viewport thumbnail compared between steps when screenshot_change_threshold is set
+CHANGE_THUMBNAIL_WIDTH = 160
+MAX_CACHED_CAPTURES = 20
+# Per-pixel grayscale difference below which a thumbnail pixel counts as unchanged (JPEG noise)
+CHANGE_PIXEL_TOLERANCE = 16
+
+
+def thumbnail_difference(previous: bytes, current: bytes) -> float:
+	"""Fraction of pixels that visibly differ between two thumbnails (1.0 if they can't be compared)."""
+	if previous == current:
+		return 0.0
+	try:
+		from PIL import Image, ImageChops
+
+		with Image.open(io.BytesIO(previous)) as a, Image.open(io.BytesIO(current)) as b:
+			if a.size != b.size:
+				return 1.0
+			diff = ImageChops.difference(a.convert('L'), b.convert('L'))
+			changed = sum(diff.histogram()[CHANGE_PIXEL_TOLERANCE + 1 :])
+			return changed / (a.size[0] * a.size[1])
+	except Exception:
+		return 1.0
+
 
 class ScreenshotWatchdog(BaseWatchdog):
-	"""Handles screenshot requests using CDP."""
+	"""Handles screenshot requests using CDP.
+
+	Screenshots are taken in BrowserProfile.screenshot_format, downscaled by the browser to
+	screenshot_max_dimension, and with screenshot_change_threshold set, the previous screenshot of a tab is
+	reused as long as a cheap thumbnail of its viewport has not visibly changed.
+	"""
 
 	# Events this watchdog listens to
 	LISTENS_TO: ClassVar[list[type[BaseEvent[Any]]]] = [ScreenshotEvent]
@@ -23,6 +55,9 @@ class ScreenshotWatchdog(BaseWatchdog):
 	# Events this watchdog emits
 	EMITS: ClassVar[list[type[BaseEvent[Any]]]] = []
 
+	# target_id -> (viewport thumbnail, screenshot taken with it)
+	_last_captures: dict[str, tuple[bytes, str]] = PrivateAttr(default_factory=dict)
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='screenshot_event_handler')
 	async def on_ScreenshotEvent(self, event: ScreenshotEvent) -> str:
 		"""Handle screenshot request using CDP.
@@ -52,8 +87,50 @@ class ScreenshotWatchdog(BaseWatchdog):
 
 			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=True)
 
+			profile = self.browser_session.browser_profile
+			detect_changes = profile.screenshot_change_threshold is not None and not event.full_page and event.clip is None
+			viewport = None
+			metrics: Any = {}
+			if detect_changes or profile.screenshot_max_dimension:
+				metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=cdp_session.session_id)
+				viewport = metrics.get('cssVisualViewport') or metrics.get('cssLayoutViewport')
+
+			thumbnail = None
+			if detect_changes and viewport:
+				thumbnail_params = CaptureScreenshotParameters(
+					format='jpeg',
+					quality=60,
+					clip=self._viewport_clip(
+						viewport, CHANGE_THUMBNAIL_WIDTH / (viewport['clientWidth'] * self._device_pixel_ratio(metrics))
+					),
+					optimizeForSpeed=True,
+				)
+				thumbnail_result = await cdp_session.cdp_client.send.Page.captureScreenshot(
+					params=thumbnail_params, session_id=cdp_session.session_id
+				)
+				thumbnail = base64.b64decode(thumbnail_result['data'])
+				previous = self._last_captures.get(target_id)
+				if previous is not None:
+					threshold = profile.screenshot_change_threshold or 0.0
+					difference = thumbnail_difference(previous[0], thumbnail)
+					if difference <= threshold:
+						self.logger.debug(
+							f'[ScreenshotWatchdog] Viewport unchanged ({difference:.1%} differs), reusing screenshot'
+						)
+						return previous[1]
+
 			# Prepare screenshot parameters
-			params = CaptureScreenshotParameters(format='png', captureBeyondViewport=False)
+			params = CaptureScreenshotParameters(format=profile.screenshot_format, captureBeyondViewport=False)
+			if profile.screenshot_format != 'png':
+				params['quality'] = profile.screenshot_quality
+				params['optimizeForSpeed'] = True
+			scale = 1.0
+			if profile.screenshot_max_dimension and viewport:
+				longest_side = max(viewport['clientWidth'], viewport['clientHeight']) * self._device_pixel_ratio(metrics)
+				if longest_side > profile.screenshot_max_dimension:
+					scale = profile.screenshot_max_dimension / longest_side
+					params['clip'] = self._viewport_clip(viewport, scale)
+			self.browser_session._screenshot_scale = scale
 
 			# Take screenshot using CDP
 			self.logger.debug(f'[ScreenshotWatchdog] Taking screenshot with params: {params}')
@@ -62,6 +139,11 @@ class ScreenshotWatchdog(BaseWatchdog):
 			# Return base64-encoded screenshot data
 			if result and 'data' in result:
 				self.logger.debug('[ScreenshotWatchdog] Screenshot captured successfully')
+				if thumbnail is not None:
+					self._last_captures.pop(target_id, None)
+					self._last_captures[target_id] = (thumbnail, result['data'])
+					while len(self._last_captures) > MAX_CACHED_CAPTURES:  # closed tabs
+						del self._last_captures[next(iter(self._last_captures))]
 				return result['data']
 
 			raise BrowserError('[ScreenshotWatchdog] Screenshot result missing data')
@@ -74,3 +156,20 @@ class ScreenshotWatchdog(BaseWatchdog):
 				await self.browser_session.remove_highlights()
 			except Exception:
 				pass
+
+	@staticmethod
+	def _viewport_clip(viewport: dict, scale: float) -> Viewport:
+		"""Clip of the visible viewport (clip coordinates are document coordinates) rendered at `scale`."""
+		return Viewport(
+			x=viewport.get('pageX', 0),
+			y=viewport.get('pageY', 0),
+			width=viewport['clientWidth'],
+			height=viewport['clientHeight'],
+			scale=scale,
+		)
+
+	@staticmethod
+	def _device_pixel_ratio(metrics: Any) -> float:
+		css_width = (metrics.get('cssVisualViewport') or {}).get('clientWidth')
+		device_width = (metrics.get('visualViewport') or {}).get('clientWidth')
+		return device_width / css_width if css_width and device_width else 1.0
@@ -1,9 +1,11 @@
 """Security watchdog for enforcing URL access policies."""
 
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from bubus import BaseEvent
+from pydantic import PrivateAttr
 
+from browser_use.browser.domain_policy import DomainPolicy, is_ip_address, is_root_domain
 from browser_use.browser.events import (
 	BrowserErrorEvent,
 	NavigateToUrlEvent,
@@ -32,6 +34,11 @@ class SecurityWatchdog(BaseWatchdog):
 		BrowserErrorEvent,
 	]
 
+	_domain_policy: DomainPolicy | None = PrivateAttr(default=None)
+	# the profile lists the policy was compiled from, held by identity, and their lengths plus block_ip_addresses
+	_domain_policy_lists: tuple[Any, Any] = PrivateAttr(default=(None, None))
+	_domain_policy_key: tuple[int, int, bool] | None = PrivateAttr(default=None)
+
 	async def on_NavigateToUrlEvent(self, event: NavigateToUrlEvent) -> None:
 		"""Check if navigation URL is allowed before navigation starts."""
 		# Security check BEFORE navigation
@@ -104,11 +111,7 @@ class SecurityWatchdog(BaseWatchdog):
 		Returns:
 			True if it's a simple root domain, False otherwise
 		"""
-		# Skip if it contains wildcards or protocol
-		if '*' in domain or '://' in domain:
-			return False
-
-		return domain.count('.') == 1
+		return is_root_domain(domain)
 
 	def _log_glob_warning(self) -> None:
 		"""Log a warning about glob patterns in allowed_domains."""
@@ -145,16 +148,47 @@ class SecurityWatchdog(BaseWatchdog):
 		Returns:
 			True if the host is an IP address, False otherwise
 		"""
-		import ipaddress
+		return is_ip_address(host)
+
+	def recompile_domain_policy(self) -> None:
+		"""Recompile the domain policy on the next check.
 
-		try:
-			# Try to parse as IP address (handles both IPv4 and IPv6)
-			ipaddress.ip_address(host)
-			return True
-		except ValueError:
-			return False
-		except Exception:
-			return False
+		Replacing the profile's allowed_domains / prohibited_domains, or adding or removing entries in place, is
+		picked up automatically. Call this after an in-place edit that keeps a list's length, e.g.
+		`allowed_domains[0] = 'other.com'`.
+		"""
+		self._domain_policy = None
+
+	def _get_domain_policy(self) -> DomainPolicy:
+		"""The profile's domain policy, compiled on first use and again whenever the profile's lists change."""
+		profile = self.browser_session.browser_profile
+		allowed, prohibited = profile.allowed_domains, profile.prohibited_domains
+		# identity plus length, so checks stay O(1) however long the lists are
+		key = (
+			len(allowed) if allowed is not None else -1,
+			len(prohibited) if prohibited is not None else -1,
+			profile.block_ip_addresses,
+		)
+		compiled_allowed, compiled_prohibited = self._domain_policy_lists
+		if (
+			self._domain_policy is None
+			or compiled_allowed is not allowed
+			or compiled_prohibited is not prohibited
+			or self._domain_policy_key != key
+		):
+			self._domain_policy = DomainPolicy(
+				allowed_domains=allowed,
+				prohibited_domains=prohibited,
+				block_ip_addresses=profile.block_ip_addresses,
+			)
+			self._domain_policy_lists = (allowed, prohibited)
+			self._domain_policy_key = key
+			if any(
+				domain_list is not None and domain_list.has_globs
+				for domain_list in (self._domain_policy.allowed, self._domain_policy.prohibited)
+			):
+				self._log_glob_warning()
+		return self._domain_policy
 
 	def _is_url_allowed(self, url: str) -> bool:
 		"""Check if a URL is allowed based on the allowed_domains configuration.
@@ -165,75 +199,10 @@ class SecurityWatchdog(BaseWatchdog):
 		Returns:
 			True if the URL is allowed, False otherwise
 		"""
-
-		# Always allow internal browser targets (before any other checks)
-		if url in ['about:blank', 'chrome://new-tab-page/', 'chrome://new-tab-page', 'chrome://newtab/']:
-			return True
-
-		# Parse the URL to extract components
-		from urllib.parse import urlparse
-
-		try:
-			parsed = urlparse(url)
-		except Exception:
-			# Invalid URL
-			return False
-
-		# Allow data: and blob: URLs (they don't have hostnames)
-		if parsed.scheme in ['data', 'blob']:
-			return True
-
-		# Get the actual host (domain)
-		host = parsed.hostname
-		if not host:
-			return False
-
-		# Check if IP addresses should be blocked (before domain checks)
-		if self.browser_session.browser_profile.block_ip_addresses:
-			if self._is_ip_address(host):
-				return False
-
-		# If no allowed_domains specified, allow all URLs
-		if (
-			not self.browser_session.browser_profile.allowed_domains
-			and not self.browser_session.browser_profile.prohibited_domains
-		):
-			return True
-
-		# Check allowed domains (fast path for sets, slow path for lists with patterns)
-		if self.browser_session.browser_profile.allowed_domains:
-			allowed_domains = self.browser_session.browser_profile.allowed_domains
-
-			if isinstance(allowed_domains, set):
-				# Fast path: O(1) exact hostname match - check both www and non-www variants
-				host_variant, host_alt = self._get_domain_variants(host)
-				return host_variant in allowed_domains or host_alt in allowed_domains
-			else:
-				# Slow path: O(n) pattern matching for lists
-				for pattern in allowed_domains:
-					if self._is_url_match(url, host, parsed.scheme, pattern):
-						return True
-				return False
-
-		# Check prohibited domains (fast path for sets, slow path for lists with patterns)
-		if self.browser_session.browser_profile.prohibited_domains:
-			prohibited_domains = self.browser_session.browser_profile.prohibited_domains
-
-			if isinstance(prohibited_domains, set):
-				# Fast path: O(1) exact hostname match - check both www and non-www variants
-				host_variant, host_alt = self._get_domain_variants(host)
-				return host_variant not in prohibited_domains and host_alt not in prohibited_domains
-			else:
-				# Slow path: O(n) pattern matching for lists
-				for pattern in prohibited_domains:
-					if self._is_url_match(url, host, parsed.scheme, pattern):
-						return False
-				return True
-
-		return True
+		return self._get_domain_policy().is_url_allowed(url)
 
 	def _is_url_match(self, url: str, host: str, scheme: str, pattern: str) -> bool:
-		"""Check if a URL matches a pattern."""
+		"""Check if a URL matches a single pattern (the reference semantics CompiledDomainList compiles)."""
 
 		# Full URL for matching (scheme + host)
 		full_url_pattern = f'{scheme}://{host}'
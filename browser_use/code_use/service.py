@@ -31,7 +31,7 @@ from browser_use.telemetry.views import AgentTelemetryEvent
 from browser_use.tokens.service import TokenCost
 from browser_use.tokens.views import UsageSummary
 from browser_use.tools.service import CodeAgentTools, Tools
-from browser_use.utils import get_browser_use_version
+from browser_use.utils import get_browser_use_version, image_media_type
 
 from .formatting import format_browser_state_for_llm
 from .namespace import EvaluateError, create_namespace
@@ -682,8 +682,8 @@ class CodeAgent:
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{self._last_screenshot}',
-							media_type='image/png',
+							url=f'data:{image_media_type(self._last_screenshot)};base64,{self._last_screenshot}',
+							media_type=image_media_type(self._last_screenshot),
 							detail='auto',
 						),
 					)
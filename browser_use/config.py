@@ -180,6 +180,10 @@ class OldConfig:
 	def WIN_FONT_DIR(self) -> str:
 		return os.getenv('WIN_FONT_DIR', 'C:\\Windows\\Fonts')
 
+	@property
+	def BROWSER_USE_FILE_SYSTEM_STORAGE(self) -> str:
+		return os.getenv('BROWSER_USE_FILE_SYSTEM_STORAGE', 'memory').lower()
+
 
 class FlatEnvConfig(BaseSettings):
 	"""All environment variables in a flat namespace."""
@@ -218,6 +222,7 @@ class FlatEnvConfig(BaseSettings):
 	IS_IN_EVALS: bool = Field(default=False)
 	WIN_FONT_DIR: str = Field(default='C:\\Windows\\Fonts')
 	BROWSER_USE_VERSION_CHECK: bool = Field(default=True)
+	BROWSER_USE_FILE_SYSTEM_STORAGE: str = Field(default='memory')
 
 	# MCP-specific env vars
 	BROWSER_USE_CONFIG_PATH: str | None = Field(default=None)
@@ -0,0 +1,154 @@
+"""
+Click-listener detection for DomService without a per-snapshot scan of the page.
+
+An init script hooks EventTarget.prototype.addEventListener / removeEventListener and the onclick-style
+property setters, and keeps a marker attribute on every element that currently has a click-like listener.
+The attribute comes back with DOM.getDocument, so detecting listeners costs nothing per snapshot beyond
+maintaining the marker when listeners change. Documents that existed before the hook was installed are
+tagged once with a getEventListeners() scan.
+
+Unlike the getEventListeners() scan this replaces, the registry mutates the page: the marker attribute is
+a real DOM attribute, visible to page scripts (attribute selectors, getAttributeNames()), it fires
+MutationObserver records, and it shows up in outerHTML dumps such as the CLI/MCP HTML output. DomService
+strips it from EnhancedDOMTreeNode.attributes, but nothing else does.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+from cdp_use.cdp.target import SessionID
+
+if TYPE_CHECKING:
+	from browser_use.browser.session import CDPSession
+
+CLICK_LISTENER_ATTRIBUTE = 'data-browser-use-click'
+
+# Event types that make an element clickable for the agent
+CLICK_EVENT_TYPES = ('click', 'mousedown', 'mouseup', 'pointerdown', 'pointerup')
+
+_JS_EVENT_TYPES = '[' + ', '.join(f"'{event_type}'" for event_type in CLICK_EVENT_TYPES) + ']'
+
+# Hooks are Proxies around the native functions so they keep their native toString(). `complete` records
+# whether the hook ran before any page script (a new document has no documentElement yet).
+CLICK_LISTENER_REGISTRY_JS = """
+(() => {
+	if (window.__browserUseClickListeners) return;
+	const ATTR = '%(attribute)s';
+	const TYPES = new Set(%(event_types)s);
+	const PROPERTY_HANDLER = {};
+	const listenersByElement = new WeakMap();
+	const setAttribute = Element.prototype.setAttribute;
+	const removeAttribute = Element.prototype.removeAttribute;
+	const hasAttribute = Element.prototype.hasAttribute;
+
+	const track = (el, type, listener, options, adding) => {
+		if (!(el instanceof Element) || !TYPES.has(type) || !listener) return;
+		const key = type + (options === true || (options && options.capture) ? '|capture' : '');
+		let listeners = listenersByElement.get(el);
+		if (!listeners) {
+			if (!adding) return;
+			listeners = new Map();
+			listenersByElement.set(el, listeners);
+		}
+		let keys = listeners.get(listener);
+		if (adding) {
+			if (!keys) listeners.set(listener, (keys = new Set()));
+			keys.add(key);
+		} else if (keys) {
+			keys.delete(key);
+			if (!keys.size) listeners.delete(listener);
+		}
+		const tagged = hasAttribute.call(el, ATTR);
+		if (listeners.size && !tagged) setAttribute.call(el, ATTR, '');
+		else if (!listeners.size && tagged) removeAttribute.call(el, ATTR);
+	};
+
+	const proto = EventTarget.prototype;
+	const hook = (native, adding) => new Proxy(native, {
+		apply(target, thisArg, args) {
+			try { track(thisArg, args[0], args[1], args[2], adding); } catch (e) {}
+			return Reflect.apply(target, thisArg, args);
+		},
+	});
+	proto.addEventListener = hook(proto.addEventListener, true);
+	proto.removeEventListener = hook(proto.removeEventListener, false);
+
+	for (const type of TYPES) {
+		const descriptor = Object.getOwnPropertyDescriptor(HTMLElement.prototype, 'on' + type);
+		if (!descriptor || !descriptor.set || !descriptor.configurable) continue;
+		const set = new Proxy(descriptor.set, {
+			apply(target, thisArg, args) {
+				try {
+					track(thisArg, type, PROPERTY_HANDLER, false, false);
+					if (typeof args[0] === 'function') track(thisArg, type, PROPERTY_HANDLER, false, true);
+				} catch (e) {}
+				return Reflect.apply(target, thisArg, args);
+			},
+		});
+		Object.defineProperty(HTMLElement.prototype, 'on' + type, {...descriptor, set});
+	}
+
+	Object.defineProperty(window, '__browserUseClickListeners', {
+		value: {complete: !document.documentElement},
+		enumerable: false,
+	});
+})()
+""" % {'attribute': CLICK_LISTENER_ATTRIBUTE, 'event_types': _JS_EVENT_TYPES}
+
+# Tags the elements of a document whose listeners were attached before the hook, via the DevTools-only
+# getEventListeners() (needs includeCommandLineAPI). Without the hook (e.g. the init script could not be
+# added) it runs on every snapshot and also clears tags of elements that lost their listeners.
+SEED_CLICK_LISTENERS_JS = """
+(() => {
+	const registry = window.__browserUseClickListeners;
+	if (registry && registry.complete) return 0;
+	if (typeof getEventListeners !== 'function') return -1;
+	const ATTR = '%(attribute)s';
+	const TYPES = %(event_types)s;
+	const stale = new Set(registry ? [] : document.querySelectorAll('[' + ATTR + ']'));
+	let tagged = 0;
+	for (const el of document.querySelectorAll('*')) {
+		try {
+			const listeners = getEventListeners(el);
+			if (TYPES.some(type => listeners[type])) {
+				stale.delete(el);
+				if (!el.hasAttribute(ATTR)) el.setAttribute(ATTR, '');
+				tagged++;
+			}
+		} catch (e) {}
+	}
+	for (const el of stale) el.removeAttribute(ATTR);
+	if (registry) registry.complete = true;
+	return tagged;
+})()
+""" % {'attribute': CLICK_LISTENER_ATTRIBUTE, 'event_types': _JS_EVENT_TYPES}
+
+
+class ClickListenerRegistry:
+	"""Installs the click-listener init script once per CDP session and seeds documents that predate it."""
+
+	def __init__(self, logger: logging.Logger | None = None):
+		self.logger = logger or logging.getLogger(__name__)
+		self._installed_sessions: set[SessionID] = set()
+
+	async def prepare(self, cdp_session: 'CDPSession') -> None:
+		"""Make sure the session's current document carries up-to-date click-listener markers."""
+		client = cdp_session.cdp_client
+		session_id = cdp_session.session_id
+
+		if session_id not in self._installed_sessions:
+			try:
+				await client.send.Page.addScriptToEvaluateOnNewDocument(
+					params={'source': CLICK_LISTENER_REGISTRY_JS, 'runImmediately': True}, session_id=session_id
+				)
+				self._installed_sessions.add(session_id)
+			except Exception as e:
+				self.logger.debug(f'Failed to install click listener registry in session {session_id[-4:]}: {e}')
+
+		result = await client.send.Runtime.evaluate(
+			params={'expression': SEED_CLICK_LISTENERS_JS, 'includeCommandLineAPI': True, 'returnByValue': True},
+			session_id=session_id,
+		)
+		tagged = result.get('result', {}).get('value')
+		if isinstance(tagged, int) and tagged > 0:
+			self.logger.debug(f'Tagged {tagged} elements with JS click listeners attached before the registry')
@@ -5,10 +5,13 @@ This module provides a unified interface for extracting clean markdown from brow
 used by both the tools service and page actor.
 """
 
+import bisect
+import hashlib
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from browser_use.dom.serializer.html_serializer import HTMLSerializer
 from browser_use.dom.service import DomService
@@ -372,10 +375,6 @@ def _parse_atomic_blocks(content: str) -> list[_AtomicBlock]:
 	return blocks
 
 
-def _block_text(block: _AtomicBlock) -> str:
-	return '\n'.join(block.lines)
-
-
 def _get_table_header(block: _AtomicBlock) -> str | None:
 	"""Extract table header + separator rows from a TABLE block."""
 	assert block.block_type == _BlockType.TABLE
@@ -388,142 +387,184 @@ def _get_table_header(block: _AtomicBlock) -> str | None:
 	return None
 
 
-def chunk_markdown_by_structure(
-	content: str,
-	max_chunk_chars: int = 100_000,
-	overlap_lines: int = 5,
-	start_from_char: int = 0,
-) -> list[MarkdownChunk]:
-	"""Split markdown into structure-aware chunks.
+class _ChunkBoundary(NamedTuple):
+	char_start: int
+	char_end: int
+	overlap_prefix: str
 
-	Algorithm:
-	  Phase 1 — Parse atomic blocks (headers, code fences, tables, list items, paragraphs).
-	  Phase 2 — Greedy chunk assembly: accumulate blocks until exceeding max_chunk_chars.
-	            A single block exceeding the limit is allowed (soft limit).
-	  Phase 3 — Build overlap prefixes for context carry between chunks.
 
-	Args:
-	    content: Full markdown string.
-	    max_chunk_chars: Target maximum chars per chunk (soft limit for single blocks).
-	    overlap_lines: Number of trailing lines from previous chunk to prepend.
-	    start_from_char: Return chunks starting from the chunk that contains this offset.
+# Chunk boundaries of recently chunked pages, keyed by (content hash, max_chunk_chars, overlap_lines), so that
+# start_from_char continuations on the same page slice the cached boundaries instead of re-parsing the markdown
+_CHUNK_CACHE_SIZE = 16
+_chunk_boundary_cache: OrderedDict[tuple[bytes, int, int], tuple[_ChunkBoundary, ...]] = OrderedDict()
 
-	Returns:
-	    List of MarkdownChunk. Empty if start_from_char is past end of content.
-	"""
-	if not content:
-		return [
-			MarkdownChunk(
-				content='',
-				chunk_index=0,
-				total_chunks=1,
-				char_offset_start=0,
-				char_offset_end=0,
-				overlap_prefix='',
-				has_more=False,
-			)
-		]
 
-	if start_from_char >= len(content):
-		return []
+def _assemble_chunks(blocks: list[_AtomicBlock], max_chunk_chars: int) -> list[tuple[int, int]]:
+	"""Phase 2: greedy chunk assembly with header-preferred splitting, as [start, end) block index ranges.
 
-	# Phase 1: parse atomic blocks
-	blocks = _parse_atomic_blocks(content)
-	if not blocks:
-		return []
+	Prefix sums of the block sizes give any chunk prefix size in O(1), and only the last HEADER block of the
+	current chunk needs tracking: earlier headers have smaller prefixes, so if the last one is under the
+	50% floor every earlier one is too.
+	"""
+	prefix_sizes = [0]
+	for block in blocks:
+		prefix_sizes.append(prefix_sizes[-1] + block.char_end - block.char_start)
 
-	# Phase 2: greedy chunk assembly with header-preferred splitting
-	raw_chunks: list[list[_AtomicBlock]] = []
-	current_chunk: list[_AtomicBlock] = []
-	current_size = 0
+	ranges: list[tuple[int, int]] = []
+	chunk_start = 0
+	last_header = -1  # last HEADER block after the first block of the current chunk
 
-	for block in blocks:
-		block_size = block.char_end - block.char_start
+	for i, block in enumerate(blocks):
 		# If adding this block would exceed limit AND we already have content, emit chunk
-		if current_size + block_size > max_chunk_chars and current_chunk:
-			# Prefer splitting at a header boundary within the current chunk.
-			# Scan backwards for the last HEADER block; if found and it wouldn't
-			# create a tiny chunk (< 50% of limit), split right before it so the
-			# header starts the next chunk for better semantic coherence.
-			best_split = len(current_chunk)
-			for j in range(len(current_chunk) - 1, 0, -1):
-				if current_chunk[j].block_type == _BlockType.HEADER:
-					prefix_size = sum(b.char_end - b.char_start for b in current_chunk[:j])
-					if prefix_size >= max_chunk_chars * 0.5:
-						best_split = j
-						break
-			raw_chunks.append(current_chunk[:best_split])
+		if prefix_sizes[i + 1] - prefix_sizes[chunk_start] > max_chunk_chars and i > chunk_start:
+			# Prefer splitting right before the last header, so the header starts the next chunk,
+			# unless that would create a tiny chunk (< 50% of limit)
+			split = i
+			if last_header > chunk_start and prefix_sizes[last_header] - prefix_sizes[chunk_start] >= max_chunk_chars * 0.5:
+				split = last_header
+			ranges.append((chunk_start, split))
 			# Carry remaining blocks (from the header onward) into the next chunk
-			current_chunk = current_chunk[best_split:]
-			current_size = sum(b.char_end - b.char_start for b in current_chunk)
-		current_chunk.append(block)
-		current_size += block_size
+			chunk_start = split
+			last_header = -1
+		if block.block_type == _BlockType.HEADER and i > chunk_start:
+			last_header = i
+
+	ranges.append((chunk_start, len(blocks)))
+	return ranges
+
+
+def _chunk_text_end(content: str, char_end: int) -> int:
+	"""End offset of a chunk's text: blocks end after their trailing newline, which joining leaves out."""
+	if char_end == len(content) and not content.endswith('\n'):
+		return char_end
+	return char_end - 1
+
 
-	if current_chunk:
-		raw_chunks.append(current_chunk)
+def _compute_chunk_boundaries(content: str, max_chunk_chars: int, overlap_lines: int) -> tuple[_ChunkBoundary, ...]:
+	# Phase 1: parse atomic blocks
+	blocks = _parse_atomic_blocks(content)
+	if not blocks:
+		return ()
 
-	total_chunks = len(raw_chunks)
+	# Phase 2: greedy chunk assembly with header-preferred splitting
+	ranges = _assemble_chunks(blocks, max_chunk_chars)
 
-	# Phase 3: build MarkdownChunk objects with overlap prefixes
-	chunks: list[MarkdownChunk] = []
+	# Phase 3: overlap prefixes
+	boundaries: list[_ChunkBoundary] = []
 	# Track table header from previous chunk for table continuations
 	prev_chunk_last_table_header: str | None = None
+	prev_text = ''
 
-	for idx, chunk_blocks in enumerate(raw_chunks):
-		chunk_text = '\n'.join(_block_text(b) for b in chunk_blocks)
-		char_start = chunk_blocks[0].char_start
-		char_end = chunk_blocks[-1].char_end
+	for idx, (block_start, block_end) in enumerate(ranges):
+		char_start = blocks[block_start].char_start
+		char_end = blocks[block_end - 1].char_end
 
 		# Build overlap prefix
 		overlap = ''
 		if idx > 0:
-			prev_blocks = raw_chunks[idx - 1]
-			prev_text = '\n'.join(_block_text(b) for b in prev_blocks)
-			prev_lines = prev_text.split('\n')
+			prev_lines = prev_text.rsplit('\n', overlap_lines)[-overlap_lines:] if overlap_lines > 0 else []
 
 			# Check if current chunk starts with a table continuation
-			first_block = chunk_blocks[0]
-			if first_block.block_type == _BlockType.TABLE and prev_chunk_last_table_header:
+			if blocks[block_start].block_type == _BlockType.TABLE and prev_chunk_last_table_header:
 				# Always prepend table header for continuation
-				trailing = prev_lines[-(overlap_lines):] if overlap_lines > 0 else []
 				header_lines = prev_chunk_last_table_header.split('\n')
 				# Deduplicate: don't repeat header lines if they're already in trailing
 				combined = list(header_lines)
-				for tl in trailing:
+				for tl in prev_lines:
 					if tl not in combined:
 						combined.append(tl)
 				overlap = '\n'.join(combined)
 			elif overlap_lines > 0:
-				overlap = '\n'.join(prev_lines[-(overlap_lines):])
+				overlap = '\n'.join(prev_lines)
 
 		# Track table header from this chunk for next iteration.
 		# Only overwrite if this chunk contains a new header+separator block;
 		# otherwise preserve the previous header so tables spanning 3+ chunks
 		# still get the header carried forward.
-		for b in chunk_blocks:
+		for b in blocks[block_start:block_end]:
 			if b.block_type == _BlockType.TABLE:
 				hdr = _get_table_header(b)
 				if hdr is not None:
 					prev_chunk_last_table_header = hdr
 
-		has_more = idx < total_chunks - 1
-		chunks.append(
+		prev_text = content[char_start : _chunk_text_end(content, char_end)]
+		boundaries.append(_ChunkBoundary(char_start, char_end, overlap))
+
+	return tuple(boundaries)
+
+
+def _get_chunk_boundaries(content: str, max_chunk_chars: int, overlap_lines: int) -> tuple[_ChunkBoundary, ...]:
+	content_hash = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+	key = (content_hash, max_chunk_chars, overlap_lines)
+	boundaries = _chunk_boundary_cache.get(key)
+	if boundaries is not None:
+		_chunk_boundary_cache.move_to_end(key)
+		return boundaries
+
+	boundaries = _compute_chunk_boundaries(content, max_chunk_chars, overlap_lines)
+	_chunk_boundary_cache[key] = boundaries
+	if len(_chunk_boundary_cache) > _CHUNK_CACHE_SIZE:
+		_chunk_boundary_cache.popitem(last=False)
+	return boundaries
+
+
+def chunk_markdown_by_structure(
+	content: str,
+	max_chunk_chars: int = 100_000,
+	overlap_lines: int = 5,
+	start_from_char: int = 0,
+) -> list[MarkdownChunk]:
+	"""Split markdown into structure-aware chunks.
+
+	Algorithm:
+	  Phase 1 — Parse atomic blocks (headers, code fences, tables, list items, paragraphs).
+	  Phase 2 — Greedy chunk assembly: accumulate blocks until exceeding max_chunk_chars.
+	            A single block exceeding the limit is allowed (soft limit).
+	  Phase 3 — Build overlap prefixes for context carry between chunks.
+
+	Chunk boundaries are cached per content hash, so continuing with start_from_char on the same page
+	does not parse the markdown again; only the chunks from start_from_char onward are materialized.
+
+	Args:
+	    content: Full markdown string.
+	    max_chunk_chars: Target maximum chars per chunk (soft limit for single blocks).
+	    overlap_lines: Number of trailing lines from previous chunk to prepend.
+	    start_from_char: Return chunks starting from the chunk that contains this offset.
+
+	Returns:
+	    List of MarkdownChunk. Empty if start_from_char is past end of content.
+	"""
+	if not content:
+		return [
 			MarkdownChunk(
-				content=chunk_text,
-				chunk_index=idx,
-				total_chunks=total_chunks,
-				char_offset_start=char_start,
-				char_offset_end=char_end,
-				overlap_prefix=overlap,
-				has_more=has_more,
+				content='',
+				chunk_index=0,
+				total_chunks=1,
+				char_offset_start=0,
+				char_offset_end=0,
+				overlap_prefix='',
+				has_more=False,
 			)
-		)
+		]
 
-	# Apply start_from_char filter: return chunks from the one containing that offset
-	if start_from_char > 0:
-		for i, chunk in enumerate(chunks):
-			if chunk.char_offset_end > start_from_char:
-				return chunks[i:]
-		return []  # offset past all chunks
+	if start_from_char >= len(content):
+		return []
 
-	return chunks
+	boundaries = _get_chunk_boundaries(content, max_chunk_chars, overlap_lines)
+	total_chunks = len(boundaries)
+
+	# Return chunks from the one containing start_from_char
+	first = bisect.bisect_right(boundaries, start_from_char, key=lambda boundary: boundary.char_end) if start_from_char > 0 else 0
+
+	return [
+		MarkdownChunk(
+			content=content[boundary.char_start : _chunk_text_end(content, boundary.char_end)],
+			chunk_index=idx,
+			total_chunks=total_chunks,
+			char_offset_start=boundary.char_start,
+			char_offset_end=boundary.char_end,
+			overlap_prefix=boundary.overlap_prefix,
+			has_more=idx < total_chunks - 1,
+		)
+		for idx, boundary in enumerate(boundaries[first:], start=first)
+	]
@@ -0,0 +1,135 @@
+"""
+DOM mutation tracking for incremental DOM snapshots.
+
+Counts CDP DOM mutation events per session between agent steps, and probes a cheap in-page layout key
+(scroll, viewport, user input epoch) so DomService can tell whether a previously built enhanced tree is
+still accurate without re-capturing the full DOMSnapshot / DOM / AX trees.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from cdp_use.cdp.target import SessionID
+
+from browser_use.dom.views import EnhancedDOMTreeNode
+
+if TYPE_CHECKING:
+	from browser_use.browser.session import CDPSession
+
+# CDP DOM events that mean the DOM tree we built is no longer accurate
+DOM_MUTATION_EVENTS = (
+	'childNodeInserted',
+	'childNodeRemoved',
+	'childNodeCountUpdated',
+	'setChildNodes',
+	'attributeModified',
+	'attributeRemoved',
+	'characterDataModified',
+	'documentUpdated',
+	'shadowRootPushed',
+	'shadowRootPopped',
+	'pseudoElementAdded',
+	'pseudoElementRemoved',
+	'topLayerElementsUpdated',
+)
+
+# Installs (once per document) capture-phase listeners for events that change layout or form state without
+# necessarily producing a DOM mutation (element scrolling, typing into inputs, focus changes), plus a
+# MutationObserver as a safety net in case another CDP client reset the DOM agent's node bindings.
+LAYOUT_KEY_PROBE_JS = """
+(() => {
+	const w = window;
+	if (!w.__browserUseDomEpoch) {
+		const state = {token: Math.random().toString(36).slice(2), epoch: 0};
+		const bump = () => { state.epoch++; };
+		for (const type of ['scroll', 'input', 'change', 'focusin', 'focusout', 'transitionend', 'animationend']) {
+			document.addEventListener(type, bump, {capture: true, passive: true});
+		}
+		w.addEventListener('resize', bump, {passive: true});
+		try {
+			new MutationObserver(bump).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+		} catch (e) {}
+		w.__browserUseDomEpoch = state;
+	}
+	const iframeScroll = [];
+	for (const iframe of document.querySelectorAll('iframe')) {
+		try {
+			const doc = iframe.contentDocument;
+			iframeScroll.push(doc ? `${doc.documentElement.scrollLeft},${doc.documentElement.scrollTop}` : '-');
+		} catch (e) {
+			iframeScroll.push('x');
+		}
+	}
+	const s = w.__browserUseDomEpoch;
+	return [
+		s.token, s.epoch, location.href, document.readyState,
+		w.scrollX, w.scrollY, w.innerWidth, w.innerHeight, w.devicePixelRatio,
+		iframeScroll.join(';'),
+	].join('|');
+})()
+"""
+
+
+@dataclass
+class ReusableDOMTree:
+	"""An enhanced DOM tree plus everything needed to decide whether it can be reused."""
+
+	root: EnhancedDOMTreeNode
+	layout_key: str
+	mutation_counts: dict[SessionID, int] = field(default_factory=dict)
+
+
+class DOMMutationTracker:
+	"""Counts CDP DOM mutation events per CDP session.
+
+	DOM events are only emitted for nodes the DOM agent has already pushed to the client, which
+	`DOM.getDocument(depth=-1, pierce=True)` in DomService does on every full capture.
+	"""
+
+	def __init__(self, logger: logging.Logger | None = None):
+		self.logger = logger or logging.getLogger(__name__)
+		self._mutation_counts: dict[SessionID, int] = {}
+		self._enabled_sessions: set[SessionID] = set()
+		self._registered_clients: set[int] = set()
+
+	async def watch(self, cdp_session: 'CDPSession') -> None:
+		"""Start receiving DOM mutation events for a session (idempotent)."""
+		client = cdp_session.cdp_client
+		if id(client) not in self._registered_clients:
+			for event_name in DOM_MUTATION_EVENTS:
+				register = getattr(client.register.DOM, event_name, None)
+				if register is not None:
+					register(self._on_dom_mutation)
+			self._registered_clients.add(id(client))
+
+		if cdp_session.session_id not in self._enabled_sessions:
+			await client.send.DOM.enable(session_id=cdp_session.session_id)
+			self._enabled_sessions.add(cdp_session.session_id)
+			self._mutation_counts.setdefault(cdp_session.session_id, 0)
+
+	def _on_dom_mutation(self, event: Any, session_id: SessionID | None = None) -> None:
+		if session_id is None:
+			return
+		self._mutation_counts[session_id] = self._mutation_counts.get(session_id, 0) + 1
+
+	def mutation_count(self, session_id: SessionID) -> int:
+		"""Number of DOM mutation events seen for a session so far."""
+		return self._mutation_counts.get(session_id, 0)
+
+	def is_unchanged(self, mutation_counts: dict[SessionID, int]) -> bool:
+		"""Check that no session has received DOM mutation events since the counts were recorded."""
+		return all(
+			session_id in self._enabled_sessions and self._mutation_counts.get(session_id, 0) == count
+			for session_id, count in mutation_counts.items()
+		)
+
+
+async def probe_layout_key(cdp_session: 'CDPSession') -> str | None:
+	"""Return a string that changes whenever the page was scrolled, resized, navigated or edited by the user."""
+	result = await cdp_session.cdp_client.send.Runtime.evaluate(
+		params={'expression': LAYOUT_KEY_PROBE_JS, 'returnByValue': True},
+		session_id=cdp_session.session_id,
+	)
+	value = result.get('result', {}).get('value')
+	return value if isinstance(value, str) else None
@@ -36,7 +36,7 @@ class ClickableElementDetector:
 		if node.tag_name in {'html', 'body'}:
 			return False
 
-		# Check for JavaScript click event listeners detected via CDP (without DOM mutation)
+		# Check for JavaScript click event listeners (tracked by the click-listener registry, see dom/click_listeners.py)
 		# this handles vue.js @click, react onClick, angular (click), etc.
 		if node.has_js_click_listener:
 			return True
@@ -1,4 +1,6 @@
+import math
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from browser_use.dom.views import SimplifiedNode
@@ -128,13 +130,165 @@ class RectUnionPure:
 		return True
 
 
+class _CoverageTree:
+	"""Segment tree over elementary y intervals supporting range add and global minimum."""
+
+	__slots__ = ('_min', '_add', '_size')
+
+	def __init__(self, size: int):
+		self._size = size
+		self._min = [0] * (4 * size)
+		self._add = [0] * (4 * size)
+
+	def add(self, lo: int, hi: int, delta: int) -> None:
+		"""Add delta to the elementary intervals [lo, hi)."""
+		self._update(1, 0, self._size, lo, hi, delta)
+
+	def _update(self, node: int, node_lo: int, node_hi: int, lo: int, hi: int, delta: int) -> None:
+		if hi <= node_lo or node_hi <= lo:
+			return
+		if lo <= node_lo and node_hi <= hi:
+			self._add[node] += delta
+			self._min[node] += delta
+			return
+		mid = (node_lo + node_hi) // 2
+		self._update(2 * node, node_lo, mid, lo, hi, delta)
+		self._update(2 * node + 1, mid, node_hi, lo, hi, delta)
+		self._min[node] = self._add[node] + min(self._min[2 * node], self._min[2 * node + 1])
+
+	def min(self) -> int:
+		return self._min[1]
+
+
+def _is_covered(r: Rect, rects: list[Rect]) -> bool:
+	"""
+	Sweep line over x: r (with positive area) is covered iff, in every x slab of r,
+	every elementary y interval of r is covered by at least one of the rects.
+	"""
+	clipped = [(max(s.x1, r.x1), max(s.y1, r.y1), min(s.x2, r.x2), min(s.y2, r.y2)) for s in rects if s.intersects(r)]
+	if not clipped:
+		return False
+
+	# cheap rejection: the clipped rects can't cover r if their total area is clearly smaller
+	if math.fsum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in clipped) < r.area() * (1 - 1e-9):
+		return False
+
+	ys = sorted({r.y1, r.y2, *(c[1] for c in clipped), *(c[3] for c in clipped)})
+	y_index = {y: i for i, y in enumerate(ys)}
+	events = []
+	for x1, y1, x2, y2 in clipped:
+		events.append((x1, 1, y_index[y1], y_index[y2]))
+		events.append((x2, -1, y_index[y1], y_index[y2]))
+	events.sort(key=lambda event: event[0])
+	if events[0][0] > r.x1:
+		return False
+
+	tree = _CoverageTree(len(ys) - 1)
+	i = 0
+	while i < len(events):
+		x = events[i][0]
+		while i < len(events) and events[i][0] == x:
+			_, delta, lo, hi = events[i]
+			tree.add(lo, hi, delta)
+			i += 1
+		if x < r.x2 and tree.min() == 0:
+			return False
+	return True
+
+
+class RectUnionGrid:
+	"""
+	Union of (possibly overlapping) rectangles bucketed into a uniform grid.
+	Rectangles are stored whole instead of being split into disjoint pieces, and `contains` runs a
+	sweep line over only the rectangles sharing a grid cell with the query, so neither call degrades
+	with the size of the union. Gives the same answers as RectUnionPure; tens of thousands of
+	rectangles are fine.
+
+	Rectangles spanning more than `max_cells` cells (a `body` or feed wrapper as tall as the document)
+	are kept in a separate list that every query checks linearly, and queries that large scan all
+	rectangles, so the cost never grows with a rectangle's area.
+	"""
+
+	__slots__ = ('_rects', '_cells', '_large', '_cell_size', '_max_cells')
+
+	def __init__(self, cell_size: float = 256.0, max_cells: int = 64):
+		self._rects: list[Rect] = []
+		self._cells: dict[tuple[int, int], list[int]] = {}
+		self._large: list[int] = []
+		self._cell_size = cell_size
+		self._max_cells = max_cells
+
+	# -----------------------------------------------------------------
+	def _cell_ranges(self, r: Rect) -> tuple[range, range]:
+		"""Cells overlapping the *closed* rectangle, so touching rectangles always share a cell."""
+		size = self._cell_size
+		x_cells = range(math.floor(r.x1 / size), math.floor(r.x2 / size) + 1)
+		y_cells = range(math.floor(r.y1 / size), math.floor(r.y2 / size) + 1)
+		return x_cells, y_cells
+
+	def _neighbours(self, r: Rect) -> list[Rect]:
+		x_cells, y_cells = self._cell_ranges(r)
+		if len(x_cells) * len(y_cells) > self._max_cells:
+			return self._rects
+		ids: set[int] = set(self._large)
+		for cx in x_cells:
+			for cy in y_cells:
+				bucket = self._cells.get((cx, cy))
+				if bucket:
+					ids.update(bucket)
+		return [self._rects[i] for i in ids]
+
+	# -----------------------------------------------------------------
+	def contains(self, r: Rect) -> bool:
+		"""
+		True iff r is fully covered by the current union.
+		"""
+		if not self._rects:
+			return False
+
+		neighbours = self._neighbours(r)
+		if r.area() <= 0:
+			# zero-area rects only get clipped along one axis, the reference subtraction handles them cheaply
+			reference = RectUnionPure()
+			reference._rects = neighbours
+			return reference.contains(r)
+		return _is_covered(r, neighbours)
+
+	# -----------------------------------------------------------------
+	def add(self, r: Rect) -> bool:
+		"""
+		Insert r unless it is already covered.
+		Returns True if the union grew.
+		"""
+		if self.contains(r):
+			return False
+
+		index = len(self._rects)
+		self._rects.append(r)
+		x_cells, y_cells = self._cell_ranges(r)
+		if len(x_cells) * len(y_cells) > self._max_cells:
+			self._large.append(index)
+			return True
+		for cx in x_cells:
+			for cy in y_cells:
+				self._cells.setdefault((cx, cy), []).append(index)
+		return True
+
+
+RectUnion = RectUnionPure | RectUnionGrid
+
+
 class PaintOrderRemover:
 	"""
 	Calculates which elements should be removed based on the paint order parameter.
+
+	`union_factory` selects the rectangle union used for coverage checks. RectUnionGrid is the default;
+	RectUnionPure gives identical results and is kept as the reference implementation.
 	"""
 
-	def __init__(self, root: SimplifiedNode):
+	def __init__(self, root: SimplifiedNode, union_factory: Callable[[], RectUnion] = RectUnionGrid):
 		self.root = root
+		self.union_factory = union_factory
 
 	def calculate_paint_order(self) -> None:
 		all_simplified_nodes_with_paint_order: list[SimplifiedNode] = []
@@ -158,7 +312,7 @@ class PaintOrderRemover:
 			if node.original_node.snapshot_node and node.original_node.snapshot_node.paint_order is not None:
 				grouped_by_paint_order[node.original_node.snapshot_node.paint_order].append(node)
 
-		rect_union = RectUnionPure()
+		rect_union = self.union_factory()
 
 		for paint_order, nodes in sorted(grouped_by_paint_order.items(), key=lambda x: -x[0]):
 			rects_to_add = []
@@ -69,6 +69,11 @@ class DOMTreeSerializer:
 		self._interactive_counter = 1
 		self._selector_map: DOMSelectorMap = {}
 		self._previous_cached_selector_map = previous_cached_state.selector_map if previous_cached_state else None
+		self._previous_backend_node_ids: set[int] = (
+			{node.backend_node_id for node in self._previous_cached_selector_map.values()}
+			if self._previous_cached_selector_map
+			else set()
+		)
 		# Add timing tracking
 		self.timing_info: dict[str, float] = {}
 		# Cache for clickable element detection to avoid redundant calls
@@ -153,6 +158,9 @@ class DOMTreeSerializer:
 		if node.tag_name not in ['input', 'select', 'details', 'audio', 'video']:
 			return
 
+		# Start from scratch, the same enhanced tree can be serialized again when it is reused between steps
+		node._compound_children.clear()
+
 		# For input elements, check for compound input types
 		if node.tag_name == 'input':
 			if not node.attributes or node.attributes.get('type') not in [
@@ -718,8 +726,7 @@ class DOMTreeSerializer:
 					node.is_new = True
 				elif self._previous_cached_selector_map:
 					# Check if node is new for regular elements
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
+					if node.original_node.backend_node_id not in self._previous_backend_node_ids:
 						node.is_new = True
 
 		# Process children
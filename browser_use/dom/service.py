@@ -8,10 +8,12 @@ from cdp_use.cdp.accessibility.types import AXNode
 from cdp_use.cdp.dom.types import Node
 from cdp_use.cdp.target import TargetID
 
+from browser_use.dom.click_listeners import CLICK_LISTENER_ATTRIBUTE, ClickListenerRegistry
 from browser_use.dom.enhanced_snapshot import (
 	REQUIRED_COMPUTED_STYLES,
 	build_snapshot_lookup,
 )
+from browser_use.dom.mutation_tracker import DOMMutationTracker, ReusableDOMTree, probe_layout_key
 from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
 from browser_use.dom.serializer.serializer import DOMTreeSerializer
 from browser_use.dom.views import (
@@ -52,6 +54,7 @@ class DomService:
 		max_iframes: int = 100,
 		max_iframe_depth: int = 5,
 		viewport_threshold: int | None = 1000,
+		incremental_snapshots: bool = False,
 	):
 		self.browser_session = browser_session
 		self.logger = logger or browser_session.logger
@@ -60,6 +63,13 @@ class DomService:
 		self.max_iframes = max_iframes
 		self.max_iframe_depth = max_iframe_depth
 		self.viewport_threshold = viewport_threshold
+		self.incremental_snapshots = incremental_snapshots
+
+		# Incremental mode: reuse the last enhanced tree per target while no DOM mutation / scroll / input happened
+		self._mutation_tracker: DOMMutationTracker | None = DOMMutationTracker(self.logger) if incremental_snapshots else None
+		self._reusable_trees: dict[TargetID, ReusableDOMTree] = {}
+		self._click_listener_registry = ClickListenerRegistry(self.logger)
+		self._capture_mutation_counts: dict[str, int] = {}
 
 	async def __aenter__(self):
 		return self
@@ -373,9 +383,53 @@ class DomService:
 
 		return {'nodes': merged_nodes}
 
+	async def _get_reusable_dom_tree(self, target_id: TargetID) -> tuple[EnhancedDOMTreeNode | None, str | None]:
+		"""Return the cached enhanced tree for a target if the page has not changed since it was built.
+
+		Returns:
+			Tuple of (reusable_tree_or_None, current_layout_key). The layout key is None if the probe failed,
+			in which case the tree built next is not cached either.
+		"""
+		assert self._mutation_tracker is not None
+		try:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+			layout_key = await probe_layout_key(cdp_session)
+		except Exception as e:
+			self.logger.debug(f'Incremental DOM probe failed, falling back to full capture: {e}')
+			return None, None
+
+		cached = self._reusable_trees.get(target_id)
+		if (
+			cached is not None
+			and layout_key is not None
+			and cached.layout_key == layout_key
+			and self._mutation_tracker.is_unchanged(cached.mutation_counts)
+		):
+			return cached.root, layout_key
+		return None, layout_key
+
 	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
+		# Refresh the click-listener markers (see dom/click_listeners.py); they arrive as an attribute with the DOM tree.
+		# Before the mutation baseline below, so tagging elements doesn't count as a change of the captured tree
+		start_js_listener_detection = time.time()
+		try:
+			await self._click_listener_registry.prepare(cdp_session)
+		except Exception as e:
+			self.logger.debug(f'Failed to detect JS event listeners: {e}')
+		js_listener_detection_ms = (time.time() - start_js_listener_detection) * 1000
+
+		# Incremental mode: start counting DOM mutations BEFORE capturing, so anything that changes after this point invalidates the tree
+		if self._mutation_tracker is not None:
+			try:
+				await self._mutation_tracker.watch(cdp_session)
+				self._capture_mutation_counts[cdp_session.session_id] = self._mutation_tracker.mutation_count(
+					cdp_session.session_id
+				)
+			except Exception as e:
+				self.logger.debug(f'Failed to enable DOM mutation tracking for target {target_id}: {e}')
+
 		# Wait for the page to be ready first
 		try:
 			ready_state = await cdp_session.cdp_client.send.Runtime.evaluate(
@@ -426,96 +480,6 @@ class DomService:
 			self.logger.debug(f'Failed to get iframe scroll positions: {e}')
 		iframe_scroll_ms = (time.time() - start_iframe_scroll) * 1000
 
-		# Detect elements with JavaScript click event listeners (without mutating DOM)
-		start_js_listener_detection = time.time()
-		js_click_listener_backend_ids: set[int] = set()
-		try:
-			# Step 1: Run JS to find elements with click listeners and return them by reference
-			js_listener_result = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={
-					'expression': """
-					(() => {
-						// getEventListeners is only available in DevTools context via includeCommandLineAPI
-						if (typeof getEventListeners !== 'function') {
-							return null;
-						}
-
-						const elementsWithListeners = [];
-						const allElements = document.querySelectorAll('*');
-
-						for (const el of allElements) {
-							try {
-								const listeners = getEventListeners(el);
-								// Check for click-related event listeners
-								if (listeners.click || listeners.mousedown || listeners.mouseup || listeners.pointerdown || listeners.pointerup) {
-									elementsWithListeners.push(el);
-								}
-							} catch (e) {
-								// Ignore errors for individual elements (e.g., cross-origin)
-							}
-						}
-
-						return elementsWithListeners;
-					})()
-					""",
-					'includeCommandLineAPI': True,  # enables getEventListeners()
-					'returnByValue': False,  # Return object references, not values
-				},
-				session_id=cdp_session.session_id,
-			)
-
-			result_object_id = js_listener_result.get('result', {}).get('objectId')
-			if result_object_id:
-				# Step 2: Get array properties to access each element
-				array_props = await cdp_session.cdp_client.send.Runtime.getProperties(
-					params={
-						'objectId': result_object_id,
-						'ownProperties': True,
-					},
-					session_id=cdp_session.session_id,
-				)
-
-				# Step 3: For each element, get its backend node ID via DOM.describeNode
-				element_object_ids: list[str] = []
-				for prop in array_props.get('result', []):
-					# Array indices are numeric property names
-					prop_name = prop.get('name', '') if isinstance(prop, dict) else ''
-					if isinstance(prop_name, str) and prop_name.isdigit():
-						prop_value = prop.get('value', {}) if isinstance(prop, dict) else {}
-						if isinstance(prop_value, dict):
-							object_id = prop_value.get('objectId')
-							if object_id and isinstance(object_id, str):
-								element_object_ids.append(object_id)
-
-				# Batch resolve backend node IDs (run in parallel)
-				async def get_backend_node_id(object_id: str) -> int | None:
-					try:
-						node_info = await cdp_session.cdp_client.send.DOM.describeNode(
-							params={'objectId': object_id},
-							session_id=cdp_session.session_id,
-						)
-						return node_info.get('node', {}).get('backendNodeId')
-					except Exception:
-						return None
-
-				# Resolve all element object IDs to backend node IDs in parallel
-				backend_ids = await asyncio.gather(*[get_backend_node_id(oid) for oid in element_object_ids])
-				js_click_listener_backend_ids = {bid for bid in backend_ids if bid is not None}
-
-				# Release the array object to avoid memory leaks
-				try:
-					await cdp_session.cdp_client.send.Runtime.releaseObject(
-						params={'objectId': result_object_id},
-						session_id=cdp_session.session_id,
-					)
-				except Exception:
-					pass  # Best effort cleanup
-
-				self.logger.debug(f'Detected {len(js_click_listener_backend_ids)} elements with JS click listeners')
-		except Exception as e:
-			self.logger.debug(f'Failed to detect JS event listeners: {e}')
-		js_listener_detection_ms = (time.time() - start_js_listener_detection) * 1000
-
 		# Define CDP request factories to avoid duplication
 		def create_snapshot_request():
 			return cdp_session.cdp_client.send.DOMSnapshot.captureSnapshot(
@@ -637,7 +601,6 @@ class DomService:
 				'cdp_parallel_calls_ms': cdp_calls_ms,
 				'snapshot_processing_ms': snapshot_processing_ms,
 			},
-			js_click_listener_backend_ids=js_click_listener_backend_ids if js_click_listener_backend_ids else None,
 		)
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_dom_tree')
@@ -664,6 +627,16 @@ class DomService:
 		timing_info: dict[str, float] = {}
 		timing_start_total = time.time()
 
+		# Incremental mode: skip all CDP captures if nothing changed since the last build of this target
+		layout_key: str | None = None
+		if self._mutation_tracker is not None and iframe_depth == 0:
+			reusable_tree, layout_key = await self._get_reusable_dom_tree(target_id)
+			if reusable_tree is not None:
+				reuse_ms = (time.time() - timing_start_total) * 1000
+				self.logger.debug(f'♻️ Reusing enhanced DOM tree for target {target_id}, no DOM changes since last step')
+				return reusable_tree, {'incremental_reuse_ms': reuse_ms, 'get_dom_tree_total_ms': reuse_ms}
+			self._capture_mutation_counts = {}
+
 		# Get all trees from CDP (snapshot, DOM, AX, viewport ratio)
 		start_get_trees = time.time()
 		trees = await self._get_all_trees(target_id)
@@ -675,7 +648,6 @@ class DomService:
 		ax_tree = trees.ax_tree
 		snapshot = trees.snapshot
 		device_pixel_ratio = trees.device_pixel_ratio
-		js_click_listener_backend_ids = trees.js_click_listener_backend_ids or set()
 
 		# Build AX tree lookup
 		start_ax = time.time()
@@ -736,6 +708,8 @@ class DomService:
 				attributes = {}
 				for i in range(0, len(node['attributes']), 2):
 					attributes[node['attributes'][i]] = node['attributes'][i + 1]
+			# internal marker of the click-listener registry, not a page attribute
+			has_js_click_listener = attributes is not None and attributes.pop(CLICK_LISTENER_ATTRIBUTE, None) is not None
 
 			shadow_root_type = None
 			if 'shadowRootType' in node and node['shadowRootType']:
@@ -800,7 +774,7 @@ class DomService:
 				ax_node=enhanced_ax_node,
 				snapshot_node=snapshot_data,
 				is_visible=None,
-				has_js_click_listener=node['backendNodeId'] in js_click_listener_backend_ids,
+				has_js_click_listener=has_js_click_listener,
 				absolute_position=absolute_position,
 			)
 
@@ -983,6 +957,13 @@ class DomService:
 		# Count hidden elements per iframe for LLM hints
 		self._count_hidden_elements_in_iframes(enhanced_dom_tree_node)
 
+		if layout_key is not None:
+			self._reusable_trees[target_id] = ReusableDOMTree(
+				root=enhanced_dom_tree_node,
+				layout_key=layout_key,
+				mutation_counts=dict(self._capture_mutation_counts),
+			)
+
 		# Calculate total time for get_dom_tree
 		total_get_dom_tree_ms = (time.time() - timing_start_total) * 1000
 		timing_info['get_dom_tree_total_ms'] = total_get_dom_tree_ms
@@ -200,8 +200,6 @@ class TargetAllTrees:
 	ax_tree: GetFullAXTreeReturns
 	device_pixel_ratio: float
 	cdp_timing: dict[str, float]
-	js_click_listener_backend_ids: set[int] | None = None
-	"""Backend node IDs of elements with JS click/mouse event listeners (detected via CDP getEventListeners)."""
 
 
 @dataclass(slots=True)
@@ -445,7 +443,7 @@ class EnhancedDOMTreeNode:
 
 	has_js_click_listener: bool = False
 	"""
-	Whether this element has JS click/mouse event listeners attached (detected via CDP getEventListeners)
+	Whether this element has JS click/mouse event listeners attached (tracked by the click-listener registry init script)
 	Used to identify clicks that don't use native interactive HTML tags
 	"""
 
@@ -1,14 +1,17 @@
 import asyncio
 import base64
+import hashlib
 import os
 import re
 import shutil
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from browser_use.config import CONFIG
 
 UNSUPPORTED_BINARY_EXTENSIONS = {
 	'png',
@@ -72,6 +75,10 @@ def _build_filename_error_message(file_name: str, supported_extensions: list[str
 
 
 DEFAULT_FILE_SYSTEM_PATH = 'browseruse_agent_data'
+# Disk storage: text source of files whose output is rendered (pdf, docx), inside the data dir
+DISK_CONTENT_DIR = '.content'
+
+FileStorage = Literal['memory', 'disk']
 
 
 class FileSystemError(Exception):
@@ -81,10 +88,24 @@ class FileSystemError(Exception):
 
 
 class BaseFile(BaseModel, ABC):
-	"""Base class for all file types"""
+	"""Base class for all file types
+
+	With `storage_path` set the file is disk-backed: the content lives in that file and is read on demand,
+	appends are written straight to it and `content` stays empty, so the model (and FileSystemState) only
+	carries the reference, a sha256 of the content, its length and its line count.
+	"""
 
 	name: str
 	content: str = ''
+	storage_path: str | None = None
+	sha256: str | None = None
+	char_count: int = 0
+	line_count: int = 0
+
+	# Whether the file on disk is rendered from the text content (so a disk-backed copy needs a separate source file)
+	rendered_output: ClassVar[bool] = False
+
+	_hasher: Any = PrivateAttr(default=None)
 
 	# --- Subclass must define this ---
 	@property
@@ -99,31 +120,112 @@ class BaseFile(BaseModel, ABC):
 
 	def append_file_content(self, content: str) -> None:
 		"""Append content to internal content"""
-		self.update_content(self.content + content)
+		if self.storage_path is None:
+			self.update_content(self.content + content)
+			return
+
+		hasher = self._content_hasher()
+		line_count = self._line_count_after_append(content)
+		with open(self.storage_path, 'a', encoding='utf-8') as f:
+			f.write(content)
+		hasher.update(content.encode('utf-8'))
+		self.sha256 = hasher.hexdigest()
+		self.char_count += len(content)
+		self.line_count = line_count
 
 	# --- These are shared and implemented here ---
 
 	def update_content(self, content: str) -> None:
-		self.content = content
+		if self.storage_path is None:
+			self.content = content
+			return
+
+		Path(self.storage_path).write_text(content, encoding='utf-8')
+		self._hasher = hashlib.sha256(content.encode('utf-8'))
+		self.sha256 = self._hasher.hexdigest()
+		self.char_count = len(content)
+		self.line_count = len(content.splitlines())
+
+	def _content_hasher(self) -> Any:
+		"""Running sha256 of a disk-backed file, rebuilt from disk once after a restore"""
+		if self._hasher is None:
+			self._hasher = hashlib.sha256()
+			with open(self.storage_path or '', 'rb') as f:
+				for chunk in iter(lambda: f.read(1024 * 1024), b''):
+					self._hasher.update(chunk)
+		return self._hasher
+
+	def _disk_line_count(self) -> int:
+		"""Line count of a disk-backed file, counted from disk once for states saved without it"""
+		if self.char_count and not self.line_count:
+			self.line_count = len(self.read().splitlines())
+		return self.line_count
+
+	def _line_count_after_append(self, content: str) -> int:
+		"""Line count of a disk-backed file once `content` is appended, from the file's last character only"""
+		line_count = self._disk_line_count()
+		if not content:
+			return line_count
+		line_count += len(content.splitlines())
+		if self.char_count:
+			last_char = self._read_tail(1, raw=True)
+			if last_char.splitlines() != ['']:
+				line_count -= 1  # content continues the last line
+			elif last_char == '\r' and content[0] == '\n':
+				line_count -= 1  # the two halves of a \r\n line break
+		return line_count
+
+	def _read_head(self, chars: int) -> str:
+		if self.storage_path is None:
+			return self.content[:chars]
+		with open(self.storage_path, encoding='utf-8') as f:
+			return f.read(chars)
+
+	def _read_tail(self, chars: int, raw: bool = False) -> str:
+		"""Last `chars` characters, reading at most 4 bytes per character from the end of a disk-backed file"""
+		if self.storage_path is None:
+			return self.content[-chars:]
+		with open(self.storage_path, 'rb') as f:
+			f.seek(0, os.SEEK_END)
+			f.seek(max(f.tell() - 4 * chars, 0))
+			tail = f.read().decode('utf-8', errors='ignore')
+		if not raw:  # same newline translation as read()
+			tail = tail.replace('\r\n', '\n').replace('\r', '\n')
+		return tail[-chars:]
+
+	def _is_stored_at(self, file_path: Path) -> bool:
+		return self.storage_path is not None and Path(self.storage_path) == file_path
 
 	def sync_to_disk_sync(self, path: Path) -> None:
 		file_path = path / self.full_name
-		file_path.write_text(self.content)
+		if self._is_stored_at(file_path):
+			return
+		file_path.write_text(self.read())
 
 	async def sync_to_disk(self, path: Path) -> None:
 		file_path = path / self.full_name
+		if self._is_stored_at(file_path):
+			return
 		with ThreadPoolExecutor() as executor:
-			await asyncio.get_event_loop().run_in_executor(executor, lambda: file_path.write_text(self.content))
+			await asyncio.get_event_loop().run_in_executor(executor, lambda: file_path.write_text(self.read()))
 
 	async def write(self, content: str, path: Path) -> None:
-		self.write_file_content(content)
+		if self.storage_path is None:
+			self.write_file_content(content)
+		else:
+			await asyncio.to_thread(self.write_file_content, content)
 		await self.sync_to_disk(path)
 
 	async def append(self, content: str, path: Path) -> None:
-		self.append_file_content(content)
+		if self.storage_path is None:
+			self.append_file_content(content)
+		else:
+			await asyncio.to_thread(self.append_file_content, content)
 		await self.sync_to_disk(path)
 
 	def read(self) -> str:
+		if self.storage_path is not None:
+			return Path(self.storage_path).read_text(encoding='utf-8')
 		return self.content
 
 	@property
@@ -132,11 +234,17 @@ class BaseFile(BaseModel, ABC):
 
 	@property
 	def get_size(self) -> int:
-		return len(self.content)
+		return self.char_count if self.storage_path is not None else len(self.content)
 
 	@property
 	def get_line_count(self) -> int:
-		return len(self.content.splitlines())
+		if self.storage_path is not None:
+			return self._disk_line_count()
+		return len(self.read().splitlines())
+
+	def preview(self, chars: int) -> tuple[str, str]:
+		"""The first and the last `chars` characters, without reading the rest of a disk-backed file"""
+		return self._read_head(chars), self._read_tail(chars)
 
 
 class MarkdownFile(BaseFile):
@@ -182,6 +290,8 @@ class JsonlFile(BaseFile):
 class PdfFile(BaseFile):
 	"""PDF file implementation"""
 
+	rendered_output: ClassVar[bool] = True
+
 	@property
 	def extension(self) -> str:
 		return 'pdf'
@@ -202,7 +312,7 @@ class PdfFile(BaseFile):
 			# Convert markdown content to simple text and add to PDF
 			# For basic implementation, we'll treat content as plain text
 			# This avoids the AGPL license issue while maintaining functionality
-			content_lines = self.content.split('\n')
+			content_lines = self.read().split('\n')
 
 			for line in content_lines:
 				if line.strip():
@@ -231,6 +341,8 @@ class PdfFile(BaseFile):
 class DocxFile(BaseFile):
 	"""DOCX file implementation"""
 
+	rendered_output: ClassVar[bool] = True
+
 	@property
 	def extension(self) -> str:
 		return 'docx'
@@ -243,7 +355,7 @@ class DocxFile(BaseFile):
 			doc = Document()
 
 			# Convert content to DOCX paragraphs
-			content_lines = self.content.split('\n')
+			content_lines = self.read().split('\n')
 
 			for line in content_lines:
 				if line.strip():
@@ -290,22 +402,41 @@ class FileSystemState(BaseModel):
 	files: dict[str, dict[str, Any]] = Field(default_factory=dict)  # full filename -> file data
 	base_dir: str
 	extracted_content_count: int = 0
+	storage: FileStorage = 'memory'  # 'disk': file data holds storage_path + sha256 instead of the content
 
 
 class FileSystem:
-	"""Enhanced file system with in-memory storage and multiple file type support"""
-
-	def __init__(self, base_dir: str | Path, create_default_files: bool = True):
+	"""Enhanced file system with in-memory or disk-backed storage and multiple file type support
+
+	storage='memory' keeps every file's content in memory (and in get_state()). storage='disk' keeps content only on
+	disk and loads it on demand, for agents that accumulate large outputs; it defaults to the
+	BROWSER_USE_FILE_SYSTEM_STORAGE env var.
+	"""
+
+	def __init__(
+		self,
+		base_dir: str | Path,
+		create_default_files: bool = True,
+		storage: FileStorage | None = None,
+		clean_data_dir: bool = True,
+	):
 		# Handle the Path conversion before calling super().__init__
 		self.base_dir = Path(base_dir) if isinstance(base_dir, str) else base_dir
 		self.base_dir.mkdir(parents=True, exist_ok=True)
 
+		storage = storage or CONFIG.BROWSER_USE_FILE_SYSTEM_STORAGE  # type: ignore[assignment]
+		if storage not in ('memory', 'disk'):
+			raise ValueError(f"Invalid file system storage '{storage}', expected 'memory' or 'disk'")
+		self.storage: FileStorage = storage  # type: ignore[assignment]
+
 		# Create and use a dedicated subfolder for all operations
 		self.data_dir = self.base_dir / DEFAULT_FILE_SYSTEM_PATH
-		if self.data_dir.exists():
+		if self.data_dir.exists() and clean_data_dir:
 			# clean the data directory
 			shutil.rmtree(self.data_dir)
 		self.data_dir.mkdir(exist_ok=True)
+		if self.storage == 'disk':
+			(self.data_dir / DISK_CONTENT_DIR).mkdir(exist_ok=True)
 
 		self._file_types: dict[str, type[BaseFile]] = {
 			'md': MarkdownFile,
@@ -334,6 +465,17 @@ class FileSystem:
 		"""Get the appropriate file class for an extension."""
 		return self._file_types.get(extension.lower(), None)
 
+	def _new_file(self, file_class: type[BaseFile], name: str) -> BaseFile:
+		"""Create an empty file object, disk-backed when storage='disk'"""
+		file_obj = file_class(name=name)
+		if self.storage == 'disk':
+			if file_class.rendered_output:
+				file_obj.storage_path = str(self.data_dir / DISK_CONTENT_DIR / f'{file_obj.full_name}.md')
+			else:
+				file_obj.storage_path = str(self.data_dir / file_obj.full_name)
+			file_obj.update_content('')
+		return file_obj
+
 	def _create_default_files(self) -> None:
 		"""Create default results and todo files"""
 		for full_filename in self.default_files:
@@ -342,7 +484,7 @@ class FileSystem:
 			if not file_class:
 				raise ValueError(f"Error: Invalid file extension '{extension}' for file '{full_filename}'.")
 
-			file_obj = file_class(name=name_without_ext)
+			file_obj = self._new_file(file_class, name_without_ext)
 			self.files[full_filename] = file_obj  # Use full filename as key
 			file_obj.sync_to_disk_sync(self.data_dir)
 
@@ -680,7 +822,7 @@ class FileSystem:
 			if full_filename in self.files:
 				file_obj = self.files[full_filename]
 			else:
-				file_obj = file_class(name=name_without_ext)
+				file_obj = self._new_file(file_class, name_without_ext)
 				self.files[full_filename] = file_obj  # Use full filename as key
 
 			# Use file-specific write method
@@ -747,7 +889,7 @@ class FileSystem:
 		"""Save extracted content to a numbered file"""
 		initial_filename = f'extracted_content_{self.extracted_content_count}'
 		extracted_filename = f'{initial_filename}.md'
-		file_obj = MarkdownFile(name=initial_filename)
+		file_obj = self._new_file(MarkdownFile, initial_filename)
 		await file_obj.write(content, self.data_dir)
 		self.files[extracted_filename] = file_obj
 		self.extracted_content_count += 1
@@ -763,32 +905,31 @@ class FileSystem:
 			if file_obj.full_name == 'todo.md':
 				continue
 
-			content = file_obj.read()
-
 			# Handle empty files
-			if not content:
+			if not file_obj.get_size:
 				description += f'<file>\n{file_obj.full_name} - [empty file]\n</file>\n'
 				continue
 
-			lines = content.splitlines()
-			line_count = len(lines)
+			line_count = file_obj.get_line_count
 
 			# For small files, display the entire content
-			whole_file_description = (
-				f'<file>\n{file_obj.full_name} - {line_count} lines\n<content>\n{content}\n</content>\n</file>\n'
-			)
-			if len(content) < int(1.5 * DISPLAY_CHARS):
-				description += whole_file_description
+			if file_obj.get_size < int(1.5 * DISPLAY_CHARS):
+				description += (
+					f'<file>\n{file_obj.full_name} - {line_count} lines\n<content>\n{file_obj.read()}\n</content>\n</file>\n'
+				)
 				continue
 
-			# For larger files, display start and end previews
+			# For larger files, display start and end previews built from the head and tail of the file only.
+			# The previews hold whole lines of at most half_display_chars in total, so windows of DISPLAY_CHARS + 2
+			# characters always contain them, and the first line of the tail (the last of the head) can be partial.
 			half_display_chars = DISPLAY_CHARS // 2
+			head, tail = file_obj.preview(DISPLAY_CHARS + 2)
 
 			# Get start preview
 			start_preview = ''
 			start_line_count = 0
 			chars_count = 0
-			for line in lines:
+			for line in head.splitlines()[:-1]:
 				if chars_count + len(line) + 1 > half_display_chars:
 					break
 				start_preview += line + '\n'
@@ -799,7 +940,7 @@ class FileSystem:
 			end_preview = ''
 			end_line_count = 0
 			chars_count = 0
-			for line in reversed(lines):
+			for line in reversed(tail.splitlines()[1:]):
 				if chars_count + len(line) + 1 > half_display_chars:
 					break
 				end_preview = line + '\n' + end_preview
@@ -809,7 +950,9 @@ class FileSystem:
 			# Calculate lines in between
 			middle_line_count = line_count - start_line_count - end_line_count
 			if middle_line_count <= 0:
-				description += whole_file_description
+				description += (
+					f'<file>\n{file_obj.full_name} - {line_count} lines\n<content>\n{file_obj.read()}\n</content>\n</file>\n'
+				)
 				continue
 
 			start_preview = start_preview.strip('\n').rstrip()
@@ -838,7 +981,10 @@ class FileSystem:
 			files_data[full_filename] = {'type': file_obj.__class__.__name__, 'data': file_obj.model_dump()}
 
 		return FileSystemState(
-			files=files_data, base_dir=str(self.base_dir), extracted_content_count=self.extracted_content_count
+			files=files_data,
+			base_dir=str(self.base_dir),
+			extracted_content_count=self.extracted_content_count,
+			storage=self.storage,
 		)
 
 	def nuke(self) -> None:
@@ -847,9 +993,18 @@ class FileSystem:
 
 	@classmethod
 	def from_state(cls, state: FileSystemState) -> 'FileSystem':
-		"""Restore file system from serializable state at the exact same location"""
+		"""Restore file system from serializable state at the exact same location
+
+		Disk-backed files are re-attached to their files on disk (which are kept, not rewritten); files that no
+		longer exist are skipped.
+		"""
 		# Create file system without default files
-		fs = cls(base_dir=Path(state.base_dir), create_default_files=False)
+		fs = cls(
+			base_dir=Path(state.base_dir),
+			create_default_files=False,
+			storage=state.storage,
+			clean_data_dir=state.storage == 'memory',
+		)
 		fs.extracted_content_count = state.extracted_content_count
 
 		# Restore all files
@@ -875,6 +1030,8 @@ class FileSystem:
 				# Skip unknown file types
 				continue
 			file_obj = file_class(**file_info)
+			if file_obj.storage_path is not None and not Path(file_obj.storage_path).exists():
+				continue
 
 			# Add to files dict and sync to disk
 			fs.files[full_filename] = file_obj
@@ -10,12 +10,18 @@ class LogicExecutor:
 	"""
 	Executes browser actions using a specific configuration.
 	Wraps browser_use.Agent with specific model settings.
+
+	Steps on the configured browser share one Agent, created on the first step and continued with
+	`Agent.add_new_task` afterwards, so tools, message history, file system and DOM caches stay warm
+	across the steps of a run. Call `reset()` before starting an unrelated run.
 	"""
 
-	def __init__(self, browser: Browser, model_name: str = 'gpt-4o'):
+	def __init__(self, browser: Browser, model_name: str = 'gpt-4o', max_steps_per_plan_step: int = 500):
 		self.browser = browser
 		self.model_name = model_name
+		self.max_steps_per_plan_step = max_steps_per_plan_step
 		self.llm = self._get_llm(model_name)
+		self._agent: Agent | None = None
 
 	def _get_llm(self, model_name: str) -> Any:
 		if model_name.startswith('ollama/'):
@@ -39,24 +45,31 @@ class LogicExecutor:
 
 		return ChatOpenAI(model=model_name)
 
-	async def execute_step(self, step: dict[str, Any]) -> dict[str, Any]:
+	async def execute_step(self, step: dict[str, Any], browser: Browser | None = None) -> dict[str, Any]:
 		"""
-		Executes a single step using the configured browser and LLM.
+		Executes a single step using the configured LLM, on `browser` if given, otherwise on the configured browser.
 		"""
 		task_description = f'Perform action: {step.get("description", "")}. Details: {json.dumps(step.get("details", {}))}'
 
 		try:
-			# Disable vision for Groq as it doesn't support image inputs (causes 400 error)
-			use_vision = not self.model_name.startswith('groq/')
-
-			agent = Agent(task=task_description, llm=cast(Any, self.llm), browser=self.browser, use_vision=use_vision)
-
-			history = await agent.run()
+			if browser is not None and browser is not self.browser:
+				# Parallel steps on their own browser get a one-off agent
+				agent = self._create_agent(task_description, browser)
+			elif self._agent is None:
+				agent = self._agent = self._create_agent(task_description, self.browser)
+			else:
+				agent = self._agent
+				agent.add_new_task(task_description)
+
+			# n_steps keeps counting across tasks, so the step budget is relative to where this task starts
+			history = await agent.run(max_steps=agent.state.n_steps - 1 + self.max_steps_per_plan_step)
 
 			# Extract result from history if available
 			result = 'Completed'
+			screenshot_path = None
 			if history and history.history:
 				last_item = history.history[-1]
+				screenshot_path = last_item.state.screenshot_path
 				if last_item.result and last_item.result:
 					# Find the last non-empty result
 					for r in reversed(last_item.result):
@@ -64,7 +77,20 @@ class LogicExecutor:
 							result = r.extracted_content
 							break
 
-			return {'step': step, 'outcome': 'Success', 'result': result, 'history': history}
+			# Results end up in LangGraph checkpoints, so only plain data goes in (not the agent history)
+			return {'step': step, 'outcome': 'Success', 'result': result, 'screenshot_path': screenshot_path}
 		except Exception as e:
 			print(f'[LAM] Error executing step: {e}')
+			# Don't carry a possibly broken agent into the next step
+			if browser is None or browser is self.browser:
+				self._agent = None
 			return {'step': step, 'outcome': 'Failed', 'error': str(e)}
+
+	def _create_agent(self, task: str, browser: Browser) -> Agent:
+		# Disable vision for Groq as it doesn't support image inputs (causes 400 error)
+		use_vision = not self.model_name.startswith('groq/')
+		return Agent(task=task, llm=cast(Any, self.llm), browser=browser, use_vision=use_vision)
+
+	def reset(self) -> None:
+		"""Forget the shared agent, the next step starts a fresh one."""
+		self._agent = None
@@ -1,17 +1,34 @@
+import asyncio
 import operator
+import shutil
+import tempfile
+import uuid
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
 from typing import Annotated, Any, Dict, List, Literal, Optional, TypedDict, cast
 
+import aiosqlite
 from langchain_core.runnables import RunnableConfig
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import END, StateGraph
 
 from browser_use import Browser
+from browser_use.config import CONFIG
 from browser_use.lam.executor import LogicExecutor
 from browser_use.lam.intelligence import AgentStatus, HumanFeedback, NeuroInsights
 from browser_use.lam.planner import CognitivePlanner
 from browser_use.lam.summarizer import SemanticSummarizer
 from browser_use.llm.messages import BaseMessage, UserMessage
 
+# Non-builtin types stored in checkpoints (AgentState.messages)
+CHECKPOINT_MSGPACK_TYPES = [
+	('browser_use.llm.messages', 'UserMessage'),
+	('browser_use.llm.messages', 'SystemMessage'),
+	('browser_use.llm.messages', 'AssistantMessage'),
+]
+
 
 class AgentState(TypedDict):
 	messages: Annotated[List[BaseMessage], operator.add]
@@ -27,17 +44,64 @@ class LAMOrchestrator:
 	"""
 	Orchestrates the cognitive flow using LangGraph.
 	Planner -> Loop(Executor) -> Summarizer
+
+	Each executor pass runs the next batch of consecutive plan steps that only depend on already finished
+	steps (see CognitivePlanner "depends_on"). Batches of more than one step run concurrently, the first
+	step on the main browser and every other step on its own browser session from `browser_factory`.
+
+	Every run is its own checkpoint thread (the run ID). Checkpoints go to a SQLite file in the config dir,
+	so a run stopped at the approval gate, cancelled or killed by a crash can be continued with `resume()`
+	from its last completed step.
 	"""
 
-	def __init__(self, browser: Browser, model_name: str = 'gpt-4o'):
+	def __init__(
+		self,
+		browser: Browser,
+		model_name: str = 'gpt-4o',
+		max_parallel_steps: int = 3,
+		browser_factory: Callable[[], Browser] | None = None,
+		checkpoint_path: str | Path | None = None,
+		checkpointer: BaseCheckpointSaver | None = None,
+	):
 		self.browser = browser
 		self.model_name = model_name
+		self.max_parallel_steps = max(1, max_parallel_steps)
+		self.browser_factory = browser_factory or self._spawn_browser
+		# Profile dirs created by _spawn_browser, removed once their step is done
+		self._spawned_profile_dirs: Dict[int, str] = {}
+		self.checkpoint_path = (
+			Path(checkpoint_path) if checkpoint_path else CONFIG.BROWSER_USE_CONFIG_DIR / 'lam_checkpoints.sqlite'
+		)
 		self.planner = CognitivePlanner(model_name)
 		self.executor = LogicExecutor(browser, model_name)
 		self.summarizer = SemanticSummarizer(model_name)
-		self.graph = self._build_graph()
-
-	def _build_graph(self):
+		self.thread_id: str | None = None
+		self._checkpointer = checkpointer
+		self._owns_checkpointer = checkpointer is None
+		self.graph = self._build_graph(checkpointer) if checkpointer is not None else None
+
+	def _create_checkpointer(self) -> BaseCheckpointSaver:
+		serde = JsonPlusSerializer(allowed_msgpack_modules=CHECKPOINT_MSGPACK_TYPES)
+		self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+		# the connection is opened lazily by the saver, on the running event loop
+		return AsyncSqliteSaver(aiosqlite.connect(str(self.checkpoint_path)), serde=serde)
+
+	async def _get_graph(self):
+		if self.graph is None:
+			if self._checkpointer is None:
+				self._checkpointer = self._create_checkpointer()
+			self.graph = self._build_graph(self._checkpointer)
+		return self.graph
+
+	async def close(self) -> None:
+		"""Closes the checkpoint database connection, if this orchestrator opened one."""
+		if self._owns_checkpointer and isinstance(self._checkpointer, AsyncSqliteSaver):
+			await self._checkpointer.conn.close()
+		if self._owns_checkpointer:
+			self._checkpointer = None
+			self.graph = None
+
+	def _build_graph(self, checkpointer: BaseCheckpointSaver):
 		workflow = StateGraph(AgentState)
 
 		# Nodes
@@ -78,7 +142,7 @@ class LAMOrchestrator:
 		workflow.add_conditional_edges('executor', should_continue)
 		workflow.add_edge('summarizer', END)
 
-		return workflow.compile(checkpointer=MemorySaver(), interrupt_before=['human_approval_gate'])
+		return workflow.compile(checkpointer=checkpointer, interrupt_before=['human_approval_gate'])
 
 	async def planner_node(self, state: AgentState):
 		user_request = ''
@@ -108,16 +172,78 @@ class LAMOrchestrator:
 		if not plan or current_index >= len(plan):
 			return {}
 
-		step = plan[current_index]
-		print(f'[LAM] Executing step {current_index + 1}/{len(plan)}: {step.get("description")}')
-
-		result = await self.executor.execute_step(step)
+		batch = self._next_parallel_batch(plan, current_index, self.max_parallel_steps)
+		if len(batch) == 1:
+			step = plan[current_index]
+			print(f'[LAM] Executing step {current_index + 1}/{len(plan)}: {step.get("description")}')
+			results = [await self.executor.execute_step(step)]
+		else:
+			print(f'[LAM] Executing steps {batch[0] + 1}-{batch[-1] + 1}/{len(plan)} in parallel')
+			results = await self._execute_parallel([plan[index] for index in batch])
+
+		if any(result.get('outcome') != 'Success' for result in results):
+			# a (possibly cached) plan that fails is not worth replaying for the next repeat of this command
+			messages = state.get('messages', [])
+			if messages:
+				self.planner.invalidate_plan(str(messages[-1].content))
 
 		return {
-			'results': [result],
-			'current_step_index': current_index + 1,
+			'results': results,
+			'current_step_index': batch[-1] + 1,
 		}
 
+	@staticmethod
+	def _next_parallel_batch(plan: List[Dict[str, Any]], start: int, max_size: int) -> List[int]:
+		"""Indexes of the consecutive steps from `start` on whose dependencies all finished before `start`."""
+		batch = [start]
+		for index in range(start + 1, min(len(plan), start + max_size)):
+			depends_on = plan[index].get('depends_on', [index - 1])
+			if not isinstance(depends_on, list) or any(not isinstance(dep, int) or dep >= start for dep in depends_on):
+				break
+			batch.append(index)
+		return batch
+
+	async def _execute_parallel(self, steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+		"""Runs independent steps concurrently, results are returned in plan order."""
+		browsers: List[Browser | None] = [None]
+		for _ in steps[1:]:
+			try:
+				browsers.append(self.browser_factory())
+			except Exception as e:
+				print(f'[LAM] Could not create a browser for a parallel step, running it on the main browser: {e}')
+				browsers.append(None)
+
+		# Steps without a browser of their own share the main one, so they still have to take turns
+		main_browser_lock = asyncio.Lock()
+
+		async def run(step: Dict[str, Any], browser: Browser | None) -> Dict[str, Any]:
+			if browser is not None:
+				try:
+					return await self.executor.execute_step(step, browser=browser)
+				finally:
+					# the step's agent has shut its browser down by now (keep_alive=False)
+					profile_dir = self._spawned_profile_dirs.pop(id(browser), None)
+					if profile_dir is not None:
+						shutil.rmtree(profile_dir, ignore_errors=True)
+			async with main_browser_lock:
+				return await self.executor.execute_step(step)
+
+		return list(await asyncio.gather(*(run(step, browser) for step, browser in zip(steps, browsers))))
+
+	def _spawn_browser(self) -> Browser:
+		"""A throwaway browser configured like the main one, with its own profile dir. The Agent closes it when done."""
+		profile_dir = tempfile.mkdtemp(prefix='browser-use-user-data-dir-')
+		profile = self.browser.browser_profile.model_copy(
+			update={
+				'user_data_dir': profile_dir,
+				'cdp_url': None,
+				'keep_alive': False,
+			}
+		)
+		browser = Browser(browser_profile=profile)
+		self._spawned_profile_dirs[id(browser)] = profile_dir
+		return browser
+
 	async def summarizer_node(self, state: AgentState):
 		user_request = ''
 		messages = state.get('messages', [])
@@ -133,11 +259,15 @@ class LAMOrchestrator:
 		summary = await self.summarizer.summarize_results(results, user_request)
 		return {'final_output': summary}
 
-	async def run(self, command: str):
+	async def run(self, command: str, thread_id: str | None = None) -> AsyncIterator[dict[str, Any]]:
 		"""
 		Async generator that runs the LAM graph and yields events.
+		`thread_id` identifies the run's checkpoints (a new one is generated if not given), see `resume()`.
 		"""
-		config: RunnableConfig = {'configurable': {'thread_id': 'lam_session'}}
+		graph = await self._get_graph()
+		self.executor.reset()
+		self.thread_id = thread_id or uuid.uuid4().hex
+		config: RunnableConfig = {'configurable': {'thread_id': self.thread_id}}
 		initial_state: AgentState = {
 			'messages': [UserMessage(content=command)],
 			'plan': [],
@@ -148,5 +278,27 @@ class LAMOrchestrator:
 			'human_feedback': None,
 		}
 
-		async for event in self.graph.astream(initial_state, config=config):
+		async for event in graph.astream(initial_state, config=config):
+			yield event
+
+	async def resume(self, thread_id: str, human_feedback: HumanFeedback | None = None) -> AsyncIterator[dict[str, Any]]:
+		"""
+		Continues a checkpointed run from its last completed step, without re-planning or re-executing
+		finished steps. `human_feedback` answers a run waiting at the approval gate.
+		"""
+		graph = await self._get_graph()
+		config: RunnableConfig = {'configurable': {'thread_id': thread_id}}
+		snapshot = await graph.aget_state(config)
+		if not snapshot.values:
+			raise ValueError(f'No checkpoint found for LAM run {thread_id}')
+
+		self.executor.reset()
+		self.thread_id = thread_id
+		if human_feedback is not None:
+			await graph.aupdate_state(config, {'human_feedback': human_feedback})
+		if not snapshot.next:
+			return  # run already finished
+
+		print(f'[LAM] Resuming run {thread_id} at {", ".join(snapshot.next)}')
+		async for event in graph.astream(None, config=config):
 			yield event
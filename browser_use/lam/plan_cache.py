@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Parameter-like spans of a command, in match priority order. Everything else is the command's template.
+_PARAMETER_PATTERN = re.compile(
+	r'"(?P<dq>[^"]+)"'
+	r"|'(?P<sq>[^']+)'"
+	r'|“(?P<cq>[^”]+)”'
+	r'|(?P<url>https?://\S+)'
+	r'|(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)+)'
+	r'|(?P<domain>\b[\w-]+(?:\.[\w-]+)*\.[a-zA-Z]{2,}\b)'
+	r'|(?P<number>\b\d+(?:[.,:/-]\d+)*\b)'
+)
+_PLACEHOLDER_PATTERN = re.compile(r'⟦(\d+)⟧')
+
+
+def _placeholder(index: int) -> str:
+	return f'⟦{index}⟧'
+
+
+def _map_strings(value: Any, fn) -> Any:
+	if isinstance(value, str):
+		return fn(value)
+	if isinstance(value, list):
+		return [_map_strings(item, fn) for item in value]
+	if isinstance(value, dict):
+		return {key: _map_strings(item, fn) for key, item in value.items()}
+	return value
+
+
+class PlanCache:
+	"""
+	Caches validated plans keyed on the normalized template of a command, so a recurring command that only
+	differs in its parameters (quoted text, URLs, domains, e-mails, numbers) skips the planning LLM call.
+
+	Plans are stored with their parameters replaced by placeholders and filled in with the new command's
+	parameters on a hit. A plan is only cached if every parameter of its command can be found in it, otherwise
+	it could not be reused for other values. Entries live in an in-memory LRU backed by one JSON file per
+	entry on disk, expire after `ttl` seconds and are dropped with `invalidate()` when executing them fails.
+	"""
+
+	def __init__(self, directory: str | Path | None, max_entries: int = 256, ttl: float = 7 * 24 * 3600):
+		self.directory = Path(directory) if directory else None
+		self.max_entries = max_entries
+		self.ttl = ttl
+		self._entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	@staticmethod
+	def normalize(command: str) -> Tuple[str, List[str]]:
+		"""Splits a command into its template (lower-cased, whitespace collapsed) and its parameter values."""
+		params: List[str] = []
+
+		def replace(match: re.Match) -> str:
+			value = next(group for group in match.groups() if group is not None)
+			params.append(value)
+			return _placeholder(len(params) - 1)
+
+		template = _PARAMETER_PATTERN.sub(replace, command.strip())
+		template = ' '.join(template.lower().split()).rstrip('.!?')
+		return template, params
+
+	def _key(self, template: str, namespace: str) -> str:
+		return hashlib.sha256(f'{namespace}\0{template}'.encode()).hexdigest()[:32]
+
+	def _path(self, key: str) -> Path | None:
+		return self.directory / f'{key}.json' if self.directory else None
+
+	def _load(self, key: str) -> Dict[str, Any] | None:
+		entry = self._entries.get(key)
+		if entry is None:
+			path = self._path(key)
+			if path is None or not path.exists():
+				return None
+			try:
+				entry = json.loads(path.read_text())
+			except (OSError, ValueError):
+				return None
+		if time.time() - entry['created_at'] > self.ttl:
+			self._drop(key)
+			return None
+		self._remember(key, entry)
+		return entry
+
+	def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+		self._entries[key] = entry
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.max_entries:
+			self._entries.popitem(last=False)
+
+	def _drop(self, key: str) -> None:
+		self._entries.pop(key, None)
+		path = self._path(key)
+		if path is not None:
+			path.unlink(missing_ok=True)
+
+	def get(self, command: str, namespace: str = '') -> List[Dict[str, Any]] | None:
+		"""The cached plan for `command` with its parameters filled in, or None."""
+		if self.ttl <= 0:
+			return None
+		template, params = self.normalize(command)
+		entry = self._load(self._key(template, namespace))
+		if entry is None or entry['param_count'] != len(params):
+			self.misses += 1
+			return None
+
+		def fill(text: str) -> str:
+			return _PLACEHOLDER_PATTERN.sub(lambda match: params[int(match.group(1))], text)
+
+		self.hits += 1
+		return _map_strings(entry['plan'], fill)
+
+	def put(self, command: str, plan: List[Dict[str, Any]], namespace: str = '') -> bool:
+		"""Caches `plan` for the template of `command`. Returns False if the plan can't be reused for other parameters."""
+		if self.ttl <= 0:
+			return False
+		template, params = self.normalize(command)
+		found: set[int] = set()
+		values = {value: index for index, value in reversed(list(enumerate(params)))}
+		# one pass, longest values first, so "2024-05-01" is not split up by a "1" parameter
+		alternatives = '|'.join(re.escape(value) for value in sorted(values, key=len, reverse=True))
+		pattern = re.compile(rf'(?<!\w)(?:{alternatives})(?!\w)') if params else None
+
+		def substitute(match: re.Match) -> str:
+			index = values[match.group(0)]
+			found.add(index)
+			return _placeholder(index)
+
+		def templatize(text: str) -> str:
+			return pattern.sub(substitute, text) if pattern else text
+
+		templated_plan = _map_strings(plan, templatize)
+		if found != set(values.values()):
+			return False
+
+		key = self._key(template, namespace)
+		entry = {'template': template, 'param_count': len(params), 'plan': templated_plan, 'created_at': time.time()}
+		self._remember(key, entry)
+		path = self._path(key)
+		if path is not None:
+			try:
+				path.parent.mkdir(parents=True, exist_ok=True)
+				tmp_path = path.with_suffix('.tmp')
+				tmp_path.write_text(json.dumps(entry, ensure_ascii=False))
+				os.replace(tmp_path, path)
+			except OSError as e:
+				print(f'[LAM] Could not write plan cache entry: {e}')
+		return True
+
+	def invalidate(self, command: str, namespace: str = '') -> None:
+		"""Drops the cached plan for the template of `command`, e.g. after executing it failed."""
+		template, _ = self.normalize(command)
+		self._drop(self._key(template, namespace))
@@ -2,6 +2,8 @@ import json
 import os
 from typing import Any, Dict, List
 
+from browser_use.config import CONFIG
+from browser_use.lam.plan_cache import PlanCache
 from browser_use.llm import ChatGroq, ChatOllama, ChatOpenAI
 from browser_use.llm.messages import SystemMessage, UserMessage
 
@@ -9,11 +11,19 @@ from browser_use.llm.messages import SystemMessage, UserMessage
 class CognitivePlanner:
 	"""
 	Decomposes a high-level user request into a structured list of actionable steps.
+
+	Plans are cached per model in `plan_cache` (see PlanCache), so repeating a command with other parameters
+	skips the LLM. LAM_PLAN_CACHE_TTL (seconds, 0 disables) and LAM_PLAN_CACHE_SIZE configure the default cache.
 	"""
 
-	def __init__(self, model_name: str = 'gpt-4o'):
+	def __init__(self, model_name: str = 'gpt-4o', plan_cache: PlanCache | None = None):
 		self.model_name = model_name
 		self.llm = self._get_llm(model_name)
+		self.plan_cache = plan_cache or PlanCache(
+			CONFIG.BROWSER_USE_CONFIG_DIR / 'lam_plan_cache',
+			max_entries=int(os.getenv('LAM_PLAN_CACHE_SIZE', '256')),
+			ttl=float(os.getenv('LAM_PLAN_CACHE_TTL', str(7 * 24 * 3600))),
+		)
 
 	def _get_llm(self, model_name: str):
 		# Default temperature for planning: slightly creative but constrained
@@ -53,6 +63,11 @@ class CognitivePlanner:
 		"""
 		Generates a plan (list of steps) for the given user request.
 		"""
+		cached_plan = self.plan_cache.get(user_request, namespace=self.model_name)
+		if cached_plan is not None:
+			print('[LAM] Reusing cached plan')
+			return cached_plan
+
 		system_prompt = """
         You are an expert task planner for a web navigation agent. 
         Your goal is to break down a user's request into a series of logical, sequential steps.
@@ -64,12 +79,21 @@ class CognitivePlanner:
         - "description": A short description of the step (e.g., "Navigate to Doctoralia login page").
         - "action_type": The type of action: "navigate", "click", "fill", "extract", "search".
         - "details": Any specific details needed (e.g., URL, selector hint, text to input).
+        - "depends_on": List of 0-based indexes of EARLIER steps that must finish before this one.
+          Steps that continue on the same page depend on the previous step.
+          Steps that are self-contained (e.g. checking a price on a different website) use [] so they can run in parallel.
 
         Example for "Abra o Google e procure por clima":
         [
-            {"description": "Navigate to Google", "action_type": "navigate", "details": {"url": "https://google.com"}},
-            {"description": "Search for 'clima'", "action_type": "fill", "details": {"selector": "input[name='q']", "value": "clima"}},
-            {"description": "Press Enter", "action_type": "click", "details": {"selector": "input[name='btnK']"}}
+            {"description": "Navigate to Google", "action_type": "navigate", "details": {"url": "https://google.com"}, "depends_on": []},
+            {"description": "Search for 'clima'", "action_type": "fill", "details": {"selector": "input[name='q']", "value": "clima"}, "depends_on": [0]},
+            {"description": "Press Enter", "action_type": "click", "details": {"selector": "input[name='btnK']"}, "depends_on": [1]}
+        ]
+
+        Example for "Compare the price of the iPhone 15 on Amazon and on Best Buy":
+        [
+            {"description": "Find the iPhone 15 price on amazon.com", "action_type": "extract", "details": {"url": "https://amazon.com"}, "depends_on": []},
+            {"description": "Find the iPhone 15 price on bestbuy.com", "action_type": "extract", "details": {"url": "https://bestbuy.com"}, "depends_on": []}
         ]
         """
 
@@ -110,8 +134,28 @@ class CognitivePlanner:
 			if not isinstance(plan, list):
 				raise ValueError('Plan must be a list of steps')
 
+			plan = self.normalize_dependencies(plan)
+			self.plan_cache.put(user_request, plan, namespace=self.model_name)
 			return plan
 		except Exception as e:
 			print(f'[LAM] Error generating plan: {e}. Raw content: {content if "content" in locals() else "N/A"}')
 			# Fallback to a simple single-step plan
-			return [{'description': user_request, 'action_type': 'general', 'details': {}}]
+			return [{'description': user_request, 'action_type': 'general', 'details': {}, 'depends_on': []}]
+
+	def invalidate_plan(self, user_request: str) -> None:
+		"""Forgets the cached plan for this request's template, so the next repeat is planned again."""
+		self.plan_cache.invalidate(user_request, namespace=self.model_name)
+
+	@staticmethod
+	def normalize_dependencies(plan: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+		"""
+		Ensures every step has a valid "depends_on" list of earlier step indexes.
+		Steps with a missing or malformed "depends_on" depend on the previous step (sequential execution).
+		"""
+		for index, step in enumerate(plan):
+			raw_deps = step.get('depends_on')
+			if not isinstance(raw_deps, list):
+				step['depends_on'] = [index - 1] if index > 0 else []
+				continue
+			step['depends_on'] = sorted({dep for dep in raw_deps if isinstance(dep, int) and 0 <= dep < index})
+		return plan
@@ -24,6 +24,7 @@ from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
+from browser_use.llm.streaming import OutputDeltaCallback
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 
 T = TypeVar('T', bound=BaseModel)
@@ -193,14 +194,30 @@ class ChatAnthropic(BaseChatModel):
 				# Force the model to use this tool
 				tool_choice = ToolChoiceToolParam(type='tool', name=tool_name)
 
-				response = await self.get_client().messages.create(
-					model=self.model,
-					messages=anthropic_messages,
-					tools=[tool],
-					system=system_prompt or omit,
-					tool_choice=tool_choice,
-					**self._get_client_params_for_invoke(),
-				)
+				on_output_delta: OutputDeltaCallback | None = kwargs.get('on_output_delta')
+				if on_output_delta is not None:
+					async with self.get_client().messages.stream(
+						model=self.model,
+						messages=anthropic_messages,
+						tools=[tool],
+						system=system_prompt or omit,
+						tool_choice=tool_choice,
+						**self._get_client_params_for_invoke(),
+					) as stream:
+						async for event in stream:
+							# the forced tool's input arrives as partial JSON
+							if event.type == 'input_json' and event.partial_json:
+								on_output_delta(event.partial_json)
+						response = await stream.get_final_message()
+				else:
+					response = await self.get_client().messages.create(
+						model=self.model,
+						messages=anthropic_messages,
+						tools=[tool],
+						system=system_prompt or omit,
+						tool_choice=tool_choice,
+						**self._get_client_params_for_invoke(),
+					)
 
 				# Ensure we have a valid Message object before accessing attributes
 				if not isinstance(response, Message):
@@ -27,3 +27,15 @@ class ModelRateLimitError(ModelProviderError):
 		model: str | None = None,
 	):
 		super().__init__(message, status_code, model)
+
+
+class ModelReplayMissError(ModelProviderError):
+	"""Exception raised when a replay-only ChatRecordReplay has no recorded response for a request."""
+
+	def __init__(
+		self,
+		message: str,
+		status_code: int = 404,
+		model: str | None = None,
+	):
+		super().__init__(message, status_code, model)
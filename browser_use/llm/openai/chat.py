@@ -4,7 +4,7 @@ from typing import Any, Literal, TypeVar, overload
 
 import httpx
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
-from openai.types.chat import ChatCompletionContentPartTextParam
+from openai.types.chat import ChatCompletionChunk, ChatCompletionContentPartTextParam, ChatCompletionMessageParam
 from openai.types.chat.chat_completion import ChatCompletion
 from openai.types.shared.chat_model import ChatModel
 from openai.types.shared_params.reasoning_effort import ReasoningEffort
@@ -16,6 +16,7 @@ from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
 from browser_use.llm.schema import SchemaOptimizer
+from browser_use.llm.streaming import OutputDeltaCallback
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 
 T = TypeVar('T', bound=BaseModel)
@@ -120,7 +121,59 @@ class ChatOpenAI(BaseChatModel):
 	def name(self) -> str:
 		return str(self.model)
 
-	def _get_usage(self, response: ChatCompletion) -> ChatInvokeUsage | None:
+	def _missing_choices_error(self) -> ModelProviderError:
+		base_url = str(self.base_url) if self.base_url is not None else None
+		hint = f' (base_url={base_url})' if base_url is not None else ''
+		return ModelProviderError(
+			message=(
+				'Invalid OpenAI chat completion response: missing or empty `choices`.'
+				' If you are using a proxy via `base_url`, ensure it implements the OpenAI'
+				' `/v1/chat/completions` schema and returns `choices` as a non-empty list.'
+				f'{hint}'
+			),
+			status_code=502,
+			model=self.name,
+		)
+
+	async def _stream_content(
+		self,
+		openai_messages: list[ChatCompletionMessageParam],
+		model_params: dict[str, Any],
+		on_output_delta: OutputDeltaCallback,
+	) -> tuple[str | None, ChatInvokeUsage | None, str | None]:
+		"""Stream a completion, passing each content delta to on_output_delta. Returns the content, usage and finish reason."""
+		stream = await self.get_client().chat.completions.create(
+			model=self.model,
+			messages=openai_messages,
+			stream=True,
+			stream_options={'include_usage': True},
+			**model_params,
+		)
+
+		content_parts: list[str] = []
+		usage: ChatInvokeUsage | None = None
+		finish_reason: str | None = None
+		received_choices = False
+		async for chunk in stream:
+			# with include_usage, the last chunk has no choices and carries the usage of the whole completion
+			if chunk.usage is not None:
+				usage = self._get_usage(chunk)
+			if not chunk.choices:
+				continue
+			received_choices = True
+			choice = chunk.choices[0]
+			if choice.delta.content:
+				content_parts.append(choice.delta.content)
+				on_output_delta(choice.delta.content)
+			if choice.finish_reason is not None:
+				finish_reason = choice.finish_reason
+
+		if not received_choices:
+			raise self._missing_choices_error()
+
+		return (''.join(content_parts) if content_parts else None), usage, finish_reason
+
+	def _get_usage(self, response: ChatCompletion | ChatCompletionChunk) -> ChatInvokeUsage | None:
 		if response.usage is not None:
 			# Note: completion_tokens already includes reasoning_tokens per OpenAI API docs.
 			# Unlike Google Gemini where thinking_tokens are reported separately,
@@ -158,6 +211,7 @@ class ChatOpenAI(BaseChatModel):
 		Args:
 			messages: List of chat messages
 			output_format: Optional Pydantic model class for structured output
+			on_output_delta: Optional callback that receives the structured output's JSON text as it is streamed
 
 		Returns:
 			Either a string response or an instance of output_format
@@ -201,18 +255,7 @@ class ChatOpenAI(BaseChatModel):
 
 				choice = response.choices[0] if response.choices else None
 				if choice is None:
-					base_url = str(self.base_url) if self.base_url is not None else None
-					hint = f' (base_url={base_url})' if base_url is not None else ''
-					raise ModelProviderError(
-						message=(
-							'Invalid OpenAI chat completion response: missing or empty `choices`.'
-							' If you are using a proxy via `base_url`, ensure it implements the OpenAI'
-							' `/v1/chat/completions` schema and returns `choices` as a non-empty list.'
-							f'{hint}'
-						),
-						status_code=502,
-						model=self.name,
-					)
+					raise self._missing_choices_error()
 
 				usage = self._get_usage(response)
 				return ChatInvokeCompletion(
@@ -242,51 +285,41 @@ class ChatOpenAI(BaseChatModel):
 							ChatCompletionContentPartTextParam(text=schema_text, type='text')
 						]
 
-				if self.dont_force_structured_output:
-					response = await self.get_client().chat.completions.create(
-						model=self.model,
-						messages=openai_messages,
-						**model_params,
-					)
-				else:
+				if not self.dont_force_structured_output:
 					# Return structured response
+					model_params['response_format'] = ResponseFormatJSONSchema(json_schema=response_format, type='json_schema')
+
+				on_output_delta: OutputDeltaCallback | None = kwargs.get('on_output_delta')
+				if on_output_delta is not None:
+					content, usage, stop_reason = await self._stream_content(openai_messages, model_params, on_output_delta)
+				else:
 					response = await self.get_client().chat.completions.create(
 						model=self.model,
 						messages=openai_messages,
-						response_format=ResponseFormatJSONSchema(json_schema=response_format, type='json_schema'),
 						**model_params,
 					)
 
-				choice = response.choices[0] if response.choices else None
-				if choice is None:
-					base_url = str(self.base_url) if self.base_url is not None else None
-					hint = f' (base_url={base_url})' if base_url is not None else ''
-					raise ModelProviderError(
-						message=(
-							'Invalid OpenAI chat completion response: missing or empty `choices`.'
-							' If you are using a proxy via `base_url`, ensure it implements the OpenAI'
-							' `/v1/chat/completions` schema and returns `choices` as a non-empty list.'
-							f'{hint}'
-						),
-						status_code=502,
-						model=self.name,
-					)
+					choice = response.choices[0] if response.choices else None
+					if choice is None:
+						raise self._missing_choices_error()
+
+					content = choice.message.content
+					usage = self._get_usage(response)
+					stop_reason = choice.finish_reason
 
-				if choice.message.content is None:
+				if content is None:
 					raise ModelProviderError(
 						message='Failed to parse structured output from model response',
 						status_code=500,
 						model=self.name,
 					)
 
-				usage = self._get_usage(response)
-
-				parsed = output_format.model_validate_json(choice.message.content)
+				parsed = output_format.model_validate_json(content)
 
 				return ChatInvokeCompletion(
 					completion=parsed,
 					usage=usage,
-					stop_reason=choice.finish_reason,
+					stop_reason=stop_reason,
 				)
 
 		except ModelProviderError:
@@ -0,0 +1,226 @@
+"""
+Deterministic record/replay for chat models.
+
+`ChatRecordReplay` wraps any chat model and stores each `ainvoke` response in a local SQLite file, keyed by a hash
+of the model, the serialized messages and the output_format's JSON schema. Identical calls are answered from the
+file, so repeated runs (regression suites, benchmarks of the agent loop itself) need no network and no tokens:
+
+	llm = ChatRecordReplay(llm=ChatOpenAI(model='gpt-4.1-mini'), path='llm_cache.sqlite', mode='record')
+
+Modes:
+- 'record': answer from the file on a hit, call the model and store its response on a miss.
+- 'replay': answer from the file only, a miss raises ModelReplayMissError (fully offline runs).
+- 'passthrough': always call the model, the file is neither read nor written.
+
+By default the key leaves out what changes between runs of the same task (the date, the tab IDs and the pixels of
+the screenshots in the agent's state message), so a recorded agent run replays in a fresh browser session.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal, TypeVar, overload
+
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.exceptions import ModelReplayMissError
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.streaming import OutputDeltaCallback
+from browser_use.llm.views import ChatInvokeCompletion
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+ReplayMode = Literal['record', 'replay', 'passthrough']
+
+# Parts of the agent's state message that differ between otherwise identical runs: today's date, and the tab IDs
+# (last 4 hex digits of the CDP target ID, random per browser launch)
+DEFAULT_IGNORE_PATTERNS: tuple[str, ...] = (
+	r'Today:\d{4}-\d{2}-\d{2}',
+	r'(?<=Tab )[0-9A-Fa-f]{4}(?=:)',
+	r'(?<=Current tab: )[0-9A-Fa-f]{4}',
+)
+
+
+class ReplayStore:
+	"""Content-addressed response store: one SQLite row per request hash, opened lazily."""
+
+	def __init__(self, path: Path):
+		self.path = path
+		self._conn: sqlite3.Connection | None = None
+
+	def _connect(self) -> sqlite3.Connection:
+		if self._conn is None:
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+			conn = sqlite3.connect(self.path, check_same_thread=False)
+			# parallel runs (e.g. one process per task) share the file
+			conn.execute('PRAGMA journal_mode = WAL')
+			conn.execute('PRAGMA busy_timeout = 5000')
+			conn.execute(
+				'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, model TEXT, response TEXT, recorded_at TEXT) WITHOUT ROWID'
+			)
+			conn.commit()
+			self._conn = conn
+		return self._conn
+
+	def get(self, key: str) -> dict[str, Any] | None:
+		row = self._connect().execute('SELECT response FROM responses WHERE key = ?', (key,)).fetchone()
+		return json.loads(row[0]) if row else None
+
+	def put(self, key: str, model: str, response: dict[str, Any]) -> None:
+		conn = self._connect()
+		conn.execute(
+			'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)',
+			(key, model, json.dumps(response, ensure_ascii=False), datetime.now(timezone.utc).isoformat()),
+		)
+		conn.commit()
+
+	def __len__(self) -> int:
+		return self._connect().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+	def close(self) -> None:
+		if self._conn is not None:
+			self._conn.close()
+			self._conn = None
+
+
+@dataclass
+class ChatRecordReplay(BaseChatModel):
+	"""
+	Records the responses of the wrapped chat model and replays them for identical requests.
+
+	Replayed responses report no usage, since no tokens were spent. `hits` and `misses` count the requests
+	answered from and missing in the store.
+	"""
+
+	llm: BaseChatModel
+	path: str | Path = 'llm_replay.sqlite'
+	mode: ReplayMode = 'record'
+	ignore_patterns: Sequence[str] = DEFAULT_IGNORE_PATTERNS  # regexes blanked in the messages before hashing
+	ignore_images: bool = True  # hash image parts (e.g. step screenshots) by position only, not by their pixels
+
+	model: str = field(init=False)
+	hits: int = field(default=0, init=False)
+	misses: int = field(default=0, init=False)
+
+	def __post_init__(self):
+		if self.mode not in ('record', 'replay', 'passthrough'):
+			raise ValueError(f"mode must be 'record', 'replay' or 'passthrough', got {self.mode!r}")
+		self.model = self.llm.model
+		self._store = ReplayStore(Path(self.path).expanduser())
+		self._ignore_regex = (
+			re.compile('|'.join(f'(?:{pattern})' for pattern in self.ignore_patterns)) if self.ignore_patterns else None
+		)
+		self._schemas: dict[type[BaseModel], dict[str, Any]] = {}
+
+	@property
+	def provider(self) -> str:
+		return self.llm.provider
+
+	@property
+	def name(self) -> str:
+		return self.llm.name
+
+	def request_key(self, messages: list[BaseMessage], output_format: type[BaseModel] | None = None) -> str:
+		"""Hash identifying a request: the wrapped model, the messages and the output_format's JSON schema.
+
+		Text matching `ignore_patterns` is blanked and, with `ignore_images`, image data is left out, so the key stays the
+		same across runs that only differ in the date, the tab IDs or the rendered pixels.
+		"""
+		dumped_messages = [message.model_dump(mode='json') for message in messages]
+		if self.ignore_images:
+			for message in dumped_messages:
+				if isinstance(message.get('content'), list):
+					message['content'] = [
+						{'type': 'image_url'} if part.get('type') == 'image_url' else part for part in message['content']
+					]
+		serialized_messages = json.dumps(dumped_messages, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+		if self._ignore_regex is not None:
+			serialized_messages = self._ignore_regex.sub('', serialized_messages)
+
+		schema = None
+		if output_format is not None:
+			schema = self._schemas.get(output_format)
+			if schema is None:
+				schema = self._schemas[output_format] = output_format.model_json_schema()
+
+		request = json.dumps(
+			{'model': f'{self.llm.provider}:{self.llm.model}', 'messages': serialized_messages, 'output_format': schema},
+			sort_keys=True,
+			separators=(',', ':'),
+		)
+		return hashlib.sha256(request.encode()).hexdigest()
+
+	@overload
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T], **kwargs: Any) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		if self.mode == 'passthrough':
+			return await self.llm.ainvoke(messages, output_format, **kwargs)
+
+		key = self.request_key(messages, output_format)
+		recorded = self._store.get(key)
+		if recorded is not None:
+			self.hits += 1
+			logger.debug(f'🎞️ Replaying recorded {self.name} response {key[:12]}')
+			return self._replay(recorded, output_format, kwargs.get('on_output_delta'))
+
+		self.misses += 1
+		if self.mode == 'replay':
+			raise ModelReplayMissError(
+				message=f'No recorded response for this request (key {key[:12]}) in {self._store.path}', model=self.name
+			)
+
+		response = await self.llm.ainvoke(messages, output_format, **kwargs)
+		self._store.put(key, self.llm.model, self._record(response))
+		logger.debug(f'🎞️ Recorded {self.name} response {key[:12]}')
+		return response
+
+	@staticmethod
+	def _record(response: ChatInvokeCompletion[Any]) -> dict[str, Any]:
+		completion = response.completion
+		return {
+			# exclude_unset keeps e.g. the agent's actions as the model wrote them, not with every other action as None
+			'completion': completion.model_dump(mode='json', exclude_unset=True)
+			if isinstance(completion, BaseModel)
+			else completion,
+			'thinking': response.thinking,
+			'redacted_thinking': response.redacted_thinking,
+			'usage': response.usage.model_dump(mode='json') if response.usage is not None else None,
+			'stop_reason': response.stop_reason,
+		}
+
+	@staticmethod
+	def _replay(
+		recorded: dict[str, Any], output_format: type[T] | None, on_output_delta: OutputDeltaCallback | None
+	) -> ChatInvokeCompletion[Any]:
+		completion = recorded['completion']
+		if output_format is not None:
+			if on_output_delta is not None:
+				on_output_delta(json.dumps(completion, ensure_ascii=False))
+			completion = output_format.model_validate(completion)
+		return ChatInvokeCompletion(
+			completion=completion,
+			thinking=recorded.get('thinking'),
+			redacted_thinking=recorded.get('redacted_thinking'),
+			usage=None,
+			stop_reason=recorded.get('stop_reason'),
+		)
+
+	def close(self) -> None:
+		self._store.close()
@@ -2,10 +2,16 @@
 Utilities for creating optimized Pydantic schemas for LLM usage.
 """
 
+import json
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 
+# Optimized schemas serialized as JSON, per model class and optimization flags. Held weakly so that
+# dynamically created models (e.g. per-extraction output schemas) can still be garbage collected.
+_optimized_schema_cache: WeakKeyDictionary[type[BaseModel], dict[tuple[bool, bool], str]] = WeakKeyDictionary()
+
 
 class SchemaOptimizer:
 	@staticmethod
@@ -19,6 +25,9 @@ class SchemaOptimizer:
 		Create the most optimized schema by flattening all $ref/$defs while preserving
 		FULL descriptions and ALL action definitions. Also ensures OpenAI strict mode compatibility.
 
+		The schema is built once per model class and flags; every call returns a fresh copy that the
+		caller may modify.
+
 		Args:
 			model: The Pydantic model to optimize
 			remove_min_items: If True, remove minItems from the schema
@@ -27,6 +36,27 @@ class SchemaOptimizer:
 		Returns:
 			Optimized schema with all $refs resolved and strict mode compatibility
 		"""
+		flags = (remove_min_items, remove_defaults)
+		model_cache = _optimized_schema_cache.get(model)
+		if model_cache is None:
+			model_cache = _optimized_schema_cache.setdefault(model, {})
+		schema_json = model_cache.get(flags)
+		if schema_json is None:
+			schema_json = json.dumps(
+				SchemaOptimizer._build_optimized_json_schema(
+					model, remove_min_items=remove_min_items, remove_defaults=remove_defaults
+				)
+			)
+			model_cache[flags] = schema_json
+		return json.loads(schema_json)
+
+	@staticmethod
+	def _build_optimized_json_schema(
+		model: type[BaseModel],
+		*,
+		remove_min_items: bool,
+		remove_defaults: bool,
+	) -> dict[str, Any]:
 		# Generate original schema
 		original_schema = model.model_json_schema()
 
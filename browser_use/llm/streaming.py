@@ -0,0 +1,112 @@
+"""
+Streaming support for structured output.
+
+Chat models that support it accept an `on_output_delta` callback in `ainvoke(..., output_format=...)` and call it with
+each chunk of the structured output's JSON text as the model generates it. Models that don't support streaming
+ignore the callback and return the same completion.
+
+`JSONArrayItemParser` turns those chunks back into values: it yields every item of one top-level array field as
+soon as the item's JSON is complete, e.g. each action of the agent output while the model is still writing the next.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+OutputDeltaCallback = Callable[[str], None]
+
+_WHITESPACE = ' \t\r\n'
+
+
+class JSONArrayItemParser:
+	"""Incrementally scans a JSON object and returns the completed items of its top-level `key` array.
+
+	Text before the opening brace (e.g. a markdown fence) is skipped, and every character is scanned only once.
+	"""
+
+	def __init__(self, key: str):
+		self.key = key
+		self._text = ''
+		self._pos = 0
+		self._depth = 0
+		self._in_string = False
+		self._escaped = False
+		self._string_start = -1
+		self._expect_key = False
+		self._current_key: str | None = None
+		self._in_array = False
+		self._item_start = -1
+		self._finished = False
+
+	@property
+	def finished(self) -> bool:
+		"""Whether the top-level object has been closed."""
+		return self._finished
+
+	def feed(self, chunk: str) -> list[Any]:
+		"""Add the next chunk of JSON text and return the array items completed by it."""
+		if self._finished or not chunk:
+			return []
+		self._text += chunk
+		items: list[Any] = []
+		text = self._text
+		for pos in range(self._pos, len(text)):
+			char = text[pos]
+
+			if self._in_string:
+				if self._escaped:
+					self._escaped = False
+				elif char == '\\':
+					self._escaped = True
+				elif char == '"':
+					self._in_string = False
+					if self._depth == 1 and self._expect_key:
+						self._current_key = json.loads(text[self._string_start : pos + 1])
+					elif self._in_array and self._depth == 2 and self._item_start == self._string_start:
+						items.append(self._complete_item(pos + 1))
+				continue
+
+			if self._in_array and self._depth == 2 and self._item_start < 0 and char not in _WHITESPACE and char not in ',]':
+				self._item_start = pos
+
+			if char == '"':
+				self._in_string = True
+				self._string_start = pos
+			elif char in '{[':
+				if self._depth == 0 and char != '{':
+					continue
+				self._depth += 1
+				if self._depth == 1:
+					self._expect_key = True
+				elif self._depth == 2 and char == '[' and self._current_key == self.key:
+					self._in_array = True
+			elif char in '}]':
+				if self._depth == 0:
+					continue
+				self._depth -= 1
+				if self._in_array and self._depth == 2 and self._item_start >= 0:
+					items.append(self._complete_item(pos + 1))
+				elif self._in_array and self._depth == 1:
+					if self._item_start >= 0:  # a scalar closed by the end of the array
+						items.append(self._complete_item(pos))
+					self._in_array = False
+				elif self._depth == 0:
+					self._finished = True
+					self._pos = pos + 1
+					return items
+			elif char == ':' and self._depth == 1:
+				self._expect_key = False
+			elif char == ',':
+				if self._depth == 1:
+					self._expect_key = True
+					self._current_key = None
+				elif self._in_array and self._depth == 2 and self._item_start >= 0:
+					items.append(self._complete_item(pos))
+
+		self._pos = len(text)
+		return items
+
+	def _complete_item(self, end: int) -> Any:
+		item_text = self._text[self._item_start : end]
+		self._item_start = -1
+		return json.loads(item_text)
@@ -0,0 +1,110 @@
+"""
+Compact on-disk pricing index for TokenCost.
+
+LiteLLM's pricing JSON (several MB, thousands of models) is compiled into a small SQLite table keyed by model
+name with only the fields TokenCost uses. Opening the index reads nothing up front; each lookup is one
+primary-key probe into the memory-mapped file, memoized per model.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+PRICING_FIELDS = (
+	'input_cost_per_token',
+	'output_cost_per_token',
+	'cache_read_input_token_cost',
+	'cache_creation_input_token_cost',
+	'max_tokens',
+	'max_input_tokens',
+	'max_output_tokens',
+)
+_INTEGER_FIELDS = {'max_tokens', 'max_input_tokens', 'max_output_tokens'}
+
+_MMAP_SIZE = 64 * 1024 * 1024
+
+
+def _numeric(field: str, value: Any) -> float | int | None:
+	"""LiteLLM's JSON has placeholder strings in places (e.g. its sample_spec entry), those become None."""
+	if isinstance(value, bool) or not isinstance(value, (int, float)):
+		return None
+	return int(value) if field in _INTEGER_FIELDS else float(value)
+
+
+def build_pricing_index(path: Path, data: dict[str, Any], fetched_at: datetime) -> None:
+	"""Compile LiteLLM-style pricing data into the index at `path`, atomically replacing any existing index."""
+	path.parent.mkdir(parents=True, exist_ok=True)
+	tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+	tmp_path.unlink(missing_ok=True)
+
+	rows = [
+		(model, *(_numeric(field, entry.get(field)) for field in PRICING_FIELDS))
+		for model, entry in data.items()
+		if isinstance(entry, dict)
+	]
+	conn = sqlite3.connect(tmp_path)
+	try:
+		conn.execute(f'CREATE TABLE pricing (model TEXT PRIMARY KEY, {", ".join(PRICING_FIELDS)}) WITHOUT ROWID')
+		conn.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)')
+		conn.executemany(f'INSERT OR REPLACE INTO pricing VALUES ({", ".join("?" * (len(PRICING_FIELDS) + 1))})', rows)
+		conn.execute("INSERT INTO meta VALUES ('fetched_at', ?)", (fetched_at.isoformat(),))
+		conn.commit()
+	finally:
+		conn.close()
+	os.replace(tmp_path, path)
+
+
+class PricingIndex:
+	"""Read side of the pricing index, opened lazily on the first lookup."""
+
+	def __init__(self, path: Path):
+		self.path = path
+		self._conn: sqlite3.Connection | None = None
+		self._memo: dict[str, dict[str, Any] | None] = {}
+
+	def _connect(self) -> sqlite3.Connection | None:
+		if self._conn is None:
+			if not self.path.exists():
+				return None
+			try:
+				self._conn = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True, check_same_thread=False)
+				self._conn.execute(f'PRAGMA mmap_size = {_MMAP_SIZE}')
+			except sqlite3.Error:
+				self._conn = None
+		return self._conn
+
+	def fetched_at(self) -> datetime | None:
+		"""When the pricing data in the index was fetched, None if there is no readable index."""
+		conn = self._connect()
+		if conn is None:
+			return None
+		try:
+			row = conn.execute("SELECT value FROM meta WHERE key = 'fetched_at'").fetchone()
+			return datetime.fromisoformat(row[0]) if row else None
+		except (sqlite3.Error, ValueError):
+			return None
+
+	def get(self, model: str) -> dict[str, Any] | None:
+		"""Pricing fields of `model`, or None if the model (or the index) is missing."""
+		if model in self._memo:
+			return self._memo[model]
+
+		conn = self._connect()
+		if conn is None:
+			return None
+		try:
+			row = conn.execute(f'SELECT {", ".join(PRICING_FIELDS)} FROM pricing WHERE model = ?', (model,)).fetchone()
+		except sqlite3.Error:
+			return None
+		pricing = dict(zip(PRICING_FIELDS, row)) if row else None
+		self._memo[model] = pricing
+		return pricing
+
+	def close(self) -> None:
+		"""Close the connection and forget memoized lookups, the next lookup reopens the (possibly rebuilt) index."""
+		if self._conn is not None:
+			self._conn.close()
+			self._conn = None
+		self._memo.clear()
@@ -1,12 +1,15 @@
 """
 Token cost service that tracks LLM token usage and costs.
 
-Fetches pricing data from LiteLLM repository and caches it for 1 day.
+Pricing data from the LiteLLM repository is compiled into an on-disk index (see pricing_index.py) and
+refreshed in the background once a day, so initialize() never waits on the network.
 Automatically tracks token usage when LLMs are registered and invoked.
 """
 
+import asyncio
 import logging
 import os
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -19,6 +22,7 @@ from browser_use.llm.base import BaseChatModel
 from browser_use.llm.views import ChatInvokeUsage
 from browser_use.tokens.custom_pricing import CUSTOM_MODEL_PRICING
 from browser_use.tokens.mappings import MODEL_TO_LITELLM
+from browser_use.tokens.pricing_index import PricingIndex, build_pricing_index
 from browser_use.tokens.views import (
 	CachedPricingData,
 	ModelPricing,
@@ -45,41 +49,105 @@ def xdg_cache_home() -> Path:
 	return default
 
 
+class _ModelUsageCounters:
+	"""Running token totals of one model, summed in place on every invocation"""
+
+	__slots__ = ('prompt_tokens', 'prompt_cached_tokens', 'prompt_cache_creation_tokens', 'completion_tokens', 'invocations')
+
+	def __init__(self) -> None:
+		self.prompt_tokens = 0
+		self.prompt_cached_tokens = 0
+		self.prompt_cache_creation_tokens = 0
+		self.completion_tokens = 0
+		self.invocations = 0
+
+	def add(self, usage: ChatInvokeUsage) -> None:
+		self.prompt_tokens += usage.prompt_tokens
+		self.prompt_cached_tokens += usage.prompt_cached_tokens or 0
+		self.prompt_cache_creation_tokens += usage.prompt_cache_creation_tokens or 0
+		self.completion_tokens += usage.completion_tokens
+		self.invocations += 1
+
+	def merge(self, other: '_ModelUsageCounters') -> None:
+		self.prompt_tokens += other.prompt_tokens
+		self.prompt_cached_tokens += other.prompt_cached_tokens
+		self.prompt_cache_creation_tokens += other.prompt_cache_creation_tokens
+		self.completion_tokens += other.completion_tokens
+		self.invocations += other.invocations
+
+	def as_usage(self) -> ChatInvokeUsage:
+		"""The totals as one usage, costs are linear in tokens so pricing it once equals summing per-call costs"""
+		return ChatInvokeUsage(
+			prompt_tokens=self.prompt_tokens,
+			prompt_cached_tokens=self.prompt_cached_tokens,
+			prompt_cache_creation_tokens=self.prompt_cache_creation_tokens,
+			prompt_image_tokens=None,
+			completion_tokens=self.completion_tokens,
+			total_tokens=self.prompt_tokens + self.completion_tokens,
+		)
+
+
 class TokenCost:
 	"""Service for tracking token usage and calculating costs"""
 
 	CACHE_DIR_NAME = 'browser_use/token_cost'
 	CACHE_DURATION = timedelta(days=1)
 	PRICING_URL = 'https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json'
+	PRICING_INDEX_NAME = 'pricing_index.sqlite'
+	# Recent entries kept for get_usage_summary(since=...), totals come from per-model counters
+	USAGE_HISTORY_LIMIT = 1000
+	# Per-minute totals answer get_usage_summary(since=...) once `since` predates the retained entries
+	USAGE_BUCKET_RETENTION = timedelta(days=7)
 
 	def __init__(self, include_cost: bool = False):
 		self.include_cost = include_cost or os.getenv('BROWSER_USE_CALCULATE_COST', 'false').lower() == 'true'
 
-		self.usage_history: list[TokenUsageEntry] = []
+		self.usage_history: deque[TokenUsageEntry] = deque(maxlen=self.USAGE_HISTORY_LIMIT)
 		self.registered_llms: dict[str, BaseChatModel] = {}
-		self._pricing_data: dict[str, Any] | None = None
+		self._usage_counters: dict[str, _ModelUsageCounters] = {}
+		self._usage_by_minute: dict[datetime, dict[str, _ModelUsageCounters]] = {}
+		self._usage_by_minute_pruned: datetime | None = None  # buckets before this minute were dropped
 		self._initialized = False
 		self._cache_dir = xdg_cache_home() / self.CACHE_DIR_NAME
+		self._pricing_index = PricingIndex(self._cache_dir / self.PRICING_INDEX_NAME)
+		self._refresh_task: asyncio.Task | None = None
 
 	async def initialize(self) -> None:
-		"""Initialize the service by loading pricing data"""
+		"""Initialize the service: the pricing index is opened lazily and refreshed in the background when stale"""
 		if not self._initialized:
-			if self.include_cost:
-				await self._load_pricing_data()
+			if self.include_cost and self._pricing_is_stale():
+				self._schedule_pricing_refresh()
 			self._initialized = True
 
-	async def _load_pricing_data(self) -> None:
-		"""Load pricing data from cache or fetch from GitHub"""
-		# Try to find a valid cache file
-		cache_file = await self._find_valid_cache()
+	def _pricing_is_stale(self) -> bool:
+		fetched_at = self._pricing_index.fetched_at()
+		return fetched_at is None or datetime.now() - fetched_at >= self.CACHE_DURATION
 
-		if cache_file:
-			await self._load_from_cache(cache_file)
-		else:
+	def _schedule_pricing_refresh(self) -> None:
+		"""Refresh the pricing index in the background, lookups keep using the current index (if any) meanwhile"""
+		if self._refresh_task is not None and not self._refresh_task.done():
+			return
+		self._refresh_task = create_task_with_error_handling(
+			self._refresh_pricing_index(), name='refresh_pricing_index', logger_instance=logger, suppress_exceptions=True
+		)
+
+	async def _refresh_pricing_index(self) -> None:
+		"""Build the index from a JSON cache of an older version if there is no index yet, then fetch when stale"""
+		if self._pricing_index.fetched_at() is None:
+			cache_file = await self._find_json_cache()
+			if cache_file:
+				await self._load_from_cache(cache_file)
+		if self._pricing_is_stale():
 			await self._fetch_and_cache_pricing_data()
 
-	async def _find_valid_cache(self) -> Path | None:
-		"""Find the most recent valid cache file"""
+	async def _install_pricing_index(self, data: dict[str, Any], fetched_at: datetime) -> None:
+		"""Compile pricing data into the index off the event loop and switch lookups over to it"""
+		self._pricing_index.close()
+		await asyncio.to_thread(build_pricing_index, self._pricing_index.path, data, fetched_at)
+		self._pricing_index.close()
+
+	async def _find_json_cache(self) -> Path | None:
+		"""Find the most recent JSON cache file left by older versions (stale pricing is better than none offline)"""
 		try:
 			# Ensure cache directory exists
 			self._cache_dir.mkdir(parents=True, exist_ok=True)
@@ -93,70 +161,40 @@ class TokenCost:
 			# Sort by modification time (most recent first)
 			cache_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
 
-			# Check each file until we find a valid one
-			for cache_file in cache_files:
-				if await self._is_cache_valid(cache_file):
-					return cache_file
-				else:
-					# Clean up old cache files
-					try:
-						os.remove(cache_file)
-					except Exception:
-						pass
-
-			return None
+			return cache_files[0]
 		except Exception:
 			return None
 
-	async def _is_cache_valid(self, cache_file: Path) -> bool:
-		"""Check if a specific cache file is valid and not expired"""
-		try:
-			if not cache_file.exists():
-				return False
-
-			# Read the cached data
-			cached = CachedPricingData.model_validate_json(await anyio.Path(cache_file).read_text())
-
-			# Check if cache is still valid
-			return datetime.now() - cached.timestamp < self.CACHE_DURATION
-		except Exception:
-			return False
-
 	async def _load_from_cache(self, cache_file: Path) -> None:
-		"""Load pricing data from a specific cache file"""
+		"""Compile a JSON cache file of an older version into the pricing index"""
 		try:
 			content = await anyio.Path(cache_file).read_text()
 			cached = CachedPricingData.model_validate_json(content)
-			self._pricing_data = cached.data
+			await self._install_pricing_index(cached.data, cached.timestamp)
 		except Exception as e:
 			logger.debug(f'Error loading cached pricing data from {cache_file}: {e}')
-			# Fall back to fetching
-			await self._fetch_and_cache_pricing_data()
 
 	async def _fetch_and_cache_pricing_data(self) -> None:
-		"""Fetch pricing data from LiteLLM GitHub and cache it with timestamp"""
+		"""Fetch pricing data from LiteLLM GitHub and compile it into the pricing index"""
 		try:
 			async with httpx.AsyncClient() as client:
 				response = await client.get(self.PRICING_URL, timeout=30)
 				response.raise_for_status()
+				data = response.json()
 
-				self._pricing_data = response.json()
-
-			# Create cache object with timestamp
-			cached = CachedPricingData(timestamp=datetime.now(), data=self._pricing_data or {})
-
-			# Ensure cache directory exists
-			self._cache_dir.mkdir(parents=True, exist_ok=True)
-
-			# Create cache file with timestamp in filename
-			timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-			cache_file = self._cache_dir / f'pricing_{timestamp_str}.json'
-
-			await anyio.Path(cache_file).write_text(cached.model_dump_json(indent=2))
+			await self._install_pricing_index(data, datetime.now())
+			await asyncio.to_thread(self._remove_json_caches)
 		except Exception as e:
+			# Keep whatever index we had, lookups of unknown models return None
 			logger.debug(f'Error fetching pricing data: {e}')
-			# Fall back to empty pricing data
-			self._pricing_data = {}
+
+	def _remove_json_caches(self) -> None:
+		"""The index supersedes the JSON cache files of older versions"""
+		for cache_file in self._cache_dir.glob('*.json'):
+			try:
+				os.remove(cache_file)
+			except Exception:
+				pass
 
 	async def get_model_pricing(self, model_name: str) -> ModelPricing | None:
 		"""Get pricing information for a specific model"""
@@ -181,10 +219,10 @@ class TokenCost:
 		# Map model name to LiteLLM model name if needed
 		litellm_model_name = MODEL_TO_LITELLM.get(model_name, model_name)
 
-		if not self._pricing_data or litellm_model_name not in self._pricing_data:
+		data = self._pricing_index.get(litellm_model_name)
+		if data is None:
 			return None
 
-		data = self._pricing_data[litellm_model_name]
 		return ModelPricing(
 			model=model_name,
 			input_cost_per_token=data.get('input_cost_per_token'),
@@ -225,17 +263,68 @@ class TokenCost:
 		)
 
 	def add_usage(self, model: str, usage: ChatInvokeUsage) -> TokenUsageEntry:
-		"""Add token usage entry to history (without calculating cost)"""
+		"""Add token usage to the model's counters and the recent history (without calculating cost)"""
 		entry = TokenUsageEntry(
 			model=model,
 			timestamp=datetime.now(),
 			usage=usage,
 		)
 
+		counters = self._usage_counters.get(model)
+		if counters is None:
+			counters = self._usage_counters[model] = _ModelUsageCounters()
+		counters.add(usage)
 		self.usage_history.append(entry)
 
+		minute = entry.timestamp.replace(second=0, microsecond=0)
+		bucket = self._usage_by_minute.get(minute)
+		if bucket is None:
+			bucket = self._usage_by_minute[minute] = {}
+			self._prune_usage_buckets(minute)
+		counters = bucket.get(model)
+		if counters is None:
+			counters = bucket[model] = _ModelUsageCounters()
+		counters.add(usage)
+
 		return entry
 
+	def _prune_usage_buckets(self, minute: datetime) -> None:
+		"""Drop per-minute totals older than USAGE_BUCKET_RETENTION (buckets are created in time order)"""
+		cutoff = minute - self.USAGE_BUCKET_RETENTION
+		while self._usage_by_minute:
+			oldest = next(iter(self._usage_by_minute))
+			if oldest >= cutoff:
+				break
+			del self._usage_by_minute[oldest]
+			self._usage_by_minute_pruned = oldest + timedelta(minutes=1)
+
+	def _usage_counters_since(self, since: datetime, model: str | None) -> dict[str, _ModelUsageCounters]:
+		"""Per-model totals of the calls made since `since`"""
+		counters_by_model: dict[str, _ModelUsageCounters] = {}
+		history = self.usage_history
+		if len(history) < self.USAGE_HISTORY_LIMIT or history[0].timestamp < since:
+			# The retained entries reach back to `since`, aggregate them exactly
+			for entry in history:
+				if entry.timestamp >= since and (not model or entry.model == model):
+					counters_by_model.setdefault(entry.model, _ModelUsageCounters()).add(entry.usage)
+			return counters_by_model
+
+		# Older than the retained entries: sum the per-minute totals, including all of the minute `since` falls in
+		start_minute = since.replace(second=0, microsecond=0)
+		if self._usage_by_minute_pruned is not None and start_minute < self._usage_by_minute_pruned:
+			logger.warning(
+				f'Usage before {self._usage_by_minute_pruned} is no longer kept, the summary since {since} is incomplete'
+			)
+		else:
+			logger.debug(f'Usage since {since} predates the recent history, summing per-minute totals from {start_minute}')
+		for minute, bucket in self._usage_by_minute.items():
+			if minute < start_minute:
+				continue
+			for name, counters in bucket.items():
+				if not model or name == model:
+					counters_by_model.setdefault(name, _ModelUsageCounters()).merge(counters)
+		return counters_by_model
+
 	# async def _log_non_usage_llm(self, llm: BaseChatModel) -> None:
 	# 	"""Log non-usage to the logger"""
 	# 	C_CYAN = '\033[96m'
@@ -329,6 +418,7 @@ class TokenCost:
 			return llm
 
 		self.registered_llms[instance_id] = llm
+		self._usage_counters.setdefault(llm.model, _ModelUsageCounters())
 
 		# Store the original method
 		original_ainvoke = llm.ainvoke
@@ -364,76 +454,57 @@ class TokenCost:
 
 	def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
 		"""Get usage tokens for a specific model"""
-		filtered_usage = [u for u in self.usage_history if u.model == model]
+		counters = self._usage_counters.get(model) or _ModelUsageCounters()
 
 		return ModelUsageTokens(
 			model=model,
-			prompt_tokens=sum(u.usage.prompt_tokens for u in filtered_usage),
-			prompt_cached_tokens=sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage),
-			completion_tokens=sum(u.usage.completion_tokens for u in filtered_usage),
-			total_tokens=sum(u.usage.prompt_tokens + u.usage.completion_tokens for u in filtered_usage),
+			prompt_tokens=counters.prompt_tokens,
+			prompt_cached_tokens=counters.prompt_cached_tokens,
+			completion_tokens=counters.completion_tokens,
+			total_tokens=counters.prompt_tokens + counters.completion_tokens,
 		)
 
 	async def get_usage_summary(self, model: str | None = None, since: datetime | None = None) -> UsageSummary:
-		"""Get summary of token usage and costs (costs calculated on-the-fly)"""
-		filtered_usage = self.usage_history
-
-		if model:
-			filtered_usage = [u for u in filtered_usage if u.model == model]
-
+		"""Get summary of token usage and costs (costs calculated on-the-fly, once per model)"""
 		if since:
-			filtered_usage = [u for u in filtered_usage if u.timestamp >= since]
-
-		if not filtered_usage:
-			return UsageSummary(
-				total_prompt_tokens=0,
-				total_prompt_cost=0.0,
-				total_prompt_cached_tokens=0,
-				total_prompt_cached_cost=0.0,
-				total_completion_tokens=0,
-				total_completion_cost=0.0,
-				total_tokens=0,
-				total_cost=0.0,
-				entry_count=0,
-			)
-
-		# Calculate totals
-		total_prompt = sum(u.usage.prompt_tokens for u in filtered_usage)
-		total_completion = sum(u.usage.completion_tokens for u in filtered_usage)
-		total_tokens = total_prompt + total_completion
-		total_prompt_cached = sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage)
-		models = list({u.model for u in filtered_usage})
+			counters_by_model = self._usage_counters_since(since, model)
+		else:
+			counters_by_model = {
+				name: counters
+				for name, counters in self._usage_counters.items()
+				if counters.invocations and (not model or name == model)
+			}
 
-		# Calculate per-model stats with record-by-record cost calculation
+		# Calculate per-model stats from the running totals
 		model_stats: dict[str, ModelUsageStats] = {}
+		total_prompt = total_completion = total_prompt_cached = entry_count = 0
 		total_prompt_cost = 0.0
 		total_completion_cost = 0.0
 		total_prompt_cached_cost = 0.0
 
-		for entry in filtered_usage:
-			if entry.model not in model_stats:
-				model_stats[entry.model] = ModelUsageStats(model=entry.model)
-
-			stats = model_stats[entry.model]
-			stats.prompt_tokens += entry.usage.prompt_tokens
-			stats.completion_tokens += entry.usage.completion_tokens
-			stats.total_tokens += entry.usage.prompt_tokens + entry.usage.completion_tokens
-			stats.invocations += 1
+		for name, counters in counters_by_model.items():
+			stats = ModelUsageStats(
+				model=name,
+				prompt_tokens=counters.prompt_tokens,
+				completion_tokens=counters.completion_tokens,
+				total_tokens=counters.prompt_tokens + counters.completion_tokens,
+				invocations=counters.invocations,
+				average_tokens_per_invocation=(counters.prompt_tokens + counters.completion_tokens) / counters.invocations,
+			)
+			model_stats[name] = stats
+			total_prompt += counters.prompt_tokens
+			total_completion += counters.completion_tokens
+			total_prompt_cached += counters.prompt_cached_tokens
+			entry_count += counters.invocations
 
 			if self.include_cost:
-				# Calculate cost record by record using the updated calculate_cost function
-				cost = await self.calculate_cost(entry.model, entry.usage)
+				cost = await self.calculate_cost(name, counters.as_usage())
 				if cost:
-					stats.cost += cost.total_cost
+					stats.cost = cost.total_cost
 					total_prompt_cost += cost.prompt_cost
 					total_completion_cost += cost.completion_cost
 					total_prompt_cached_cost += cost.prompt_read_cached_cost or 0
 
-		# Calculate averages
-		for stats in model_stats.values():
-			if stats.invocations > 0:
-				stats.average_tokens_per_invocation = stats.total_tokens / stats.invocations
-
 		return UsageSummary(
 			total_prompt_tokens=total_prompt,
 			total_prompt_cost=total_prompt_cost,
@@ -441,9 +512,9 @@ class TokenCost:
 			total_prompt_cached_cost=total_prompt_cached_cost,
 			total_completion_tokens=total_completion,
 			total_completion_cost=total_completion_cost,
-			total_tokens=total_tokens,
+			total_tokens=total_prompt + total_completion,
 			total_cost=total_prompt_cost + total_completion_cost + total_prompt_cached_cost,
-			entry_count=len(filtered_usage),
+			entry_count=entry_count,
 			by_model=model_stats,
 		)
 
@@ -459,9 +530,6 @@ class TokenCost:
 
 	async def log_usage_summary(self) -> None:
 		"""Log a comprehensive usage summary per model with colors and nice formatting"""
-		if not self.usage_history:
-			return
-
 		summary = await self.get_usage_summary()
 
 		if summary.entry_count == 0:
@@ -506,18 +574,14 @@ class TokenCost:
 
 			# Format cost display (only if cost tracking is enabled)
 			if self.include_cost:
-				# Calculate per-model costs on-the-fly
-				total_model_cost = 0.0
+				# Calculate per-model costs on-the-fly from the model's totals
 				model_prompt_cost = 0.0
 				model_completion_cost = 0.0
 
-				# Calculate costs for this model
-				for entry in self.usage_history:
-					if entry.model == model:
-						cost = await self.calculate_cost(entry.model, entry.usage)
-						if cost:
-							model_prompt_cost += cost.prompt_cost
-							model_completion_cost += cost.completion_cost
+				cost = await self.calculate_cost(model, self._usage_counters[model].as_usage())
+				if cost:
+					model_prompt_cost = cost.prompt_cost
+					model_completion_cost = cost.completion_cost
 
 				total_model_cost = model_prompt_cost + model_completion_cost
 
@@ -546,11 +610,14 @@ class TokenCost:
 		return summary.by_model
 
 	def clear_history(self) -> None:
-		"""Clear usage history"""
-		self.usage_history = []
+		"""Clear usage history and counters"""
+		self.usage_history.clear()
+		self._usage_counters = {}
+		self._usage_by_minute = {}
+		self._usage_by_minute_pruned = None
 
 	async def refresh_pricing_data(self) -> None:
-		"""Force refresh of pricing data from GitHub"""
+		"""Force refresh of pricing data from GitHub (awaits the fetch, unlike the background refresh)"""
 		if self.include_cost:
 			await self._fetch_and_cache_pricing_data()
 
@@ -578,5 +645,5 @@ class TokenCost:
 	async def ensure_pricing_loaded(self) -> None:
 		"""Ensure pricing data is loaded in the background. Call this after creating the service."""
 		if not self._initialized and self.include_cost:
-			# This will run in the background and won't block
+			# Only schedules the refresh, never waits on the network
 			await self.initialize()
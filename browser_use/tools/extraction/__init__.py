@@ -1,4 +1,5 @@
+from browser_use.tools.extraction.merge import merge_structured_results, merge_text_results
 from browser_use.tools.extraction.schema_utils import schema_dict_to_pydantic_model
 from browser_use.tools.extraction.views import ExtractionResult
 
-__all__ = ['schema_dict_to_pydantic_model', 'ExtractionResult']
+__all__ = ['schema_dict_to_pydantic_model', 'ExtractionResult', 'merge_structured_results', 'merge_text_results']
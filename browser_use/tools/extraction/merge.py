@@ -0,0 +1,82 @@
+"""Merges per-chunk extraction results into a single result for multi-chunk extraction."""
+
+import json
+import re
+from typing import Any
+
+# Lines that are individual records in free-text answers: list items and table rows
+_RECORD_LINE_RE = re.compile(r'^\s*(?:[-*+]\s|\d+[.)]\s|\|)')
+
+
+def _canonical(value: Any) -> str:
+	return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+def _is_empty(value: Any) -> bool:
+	return value is None or value == '' or value == [] or value == {}
+
+
+def _merge_values(values: list[Any]) -> Any:
+	non_empty = [value for value in values if not _is_empty(value)]
+	if not non_empty:
+		return values[0] if values else None
+
+	if all(isinstance(value, dict) for value in non_empty):
+		return merge_structured_results(non_empty)
+
+	if all(isinstance(value, list) for value in non_empty):
+		merged: list[Any] = []
+		seen: set[str] = set()
+		for value in non_empty:
+			for item in value:
+				key = _canonical(item)
+				if key not in seen:
+					seen.add(key)
+					merged.append(item)
+		return merged
+
+	# Scalars (or mismatched types): the first chunk that found a value wins
+	return non_empty[0]
+
+
+def merge_structured_results(results: list[dict[str, Any]]) -> dict[str, Any]:
+	"""Merge structured extraction results of consecutive chunks.
+
+	Objects are merged key by key, arrays are concatenated in chunk order with duplicate items (e.g. records
+	repeated in the overlap between chunks) removed, and scalars keep the first non-empty value.
+	"""
+	keys: dict[str, None] = {}
+	for result in results:
+		keys.update(dict.fromkeys(result))
+	return {key: _merge_values([result[key] for result in results if key in result]) for key in keys}
+
+
+def merge_text_results(results: list[str]) -> str:
+	"""Merge free-text extraction results of consecutive chunks.
+
+	Paragraphs repeated verbatim across chunks are kept once, as are list items and table rows, which
+	chunks re-extract from the overlap context they share with their predecessor.
+	"""
+	seen_blocks: set[str] = set()
+	seen_records: set[str] = set()
+	merged_blocks: list[str] = []
+
+	for result in results:
+		for block in re.split(r'\n\s*\n', result.strip()):
+			normalized = ' '.join(block.split())
+			if not normalized or normalized in seen_blocks:
+				continue
+			seen_blocks.add(normalized)
+
+			lines = []
+			for line in block.splitlines():
+				if _RECORD_LINE_RE.match(line):
+					record = ' '.join(line.split())
+					if record in seen_records:
+						continue
+					seen_records.add(record)
+				lines.append(line)
+			if any(line.strip() for line in lines):
+				merged_blocks.append('\n'.join(lines))
+
+	return '\n\n'.join(merged_blocks)
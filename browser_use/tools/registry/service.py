@@ -37,6 +37,8 @@ class Registry(Generic[Context]):
 		self.telemetry = ProductTelemetry()
 		# Create a new list to avoid mutable default argument issues
 		self.exclude_actions = list(exclude_actions) if exclude_actions is not None else []
+		# Action models built by create_action_model, keyed by the active actions they were built from
+		self._action_model_cache: dict[tuple[tuple[str, int], ...], type[ActionModel]] = {}
 
 	def exclude_action(self, action_name: str) -> None:
 		"""Exclude an action from the registry after initialization.
@@ -51,6 +53,7 @@ class Registry(Generic[Context]):
 		# Remove from registry if already registered
 		if action_name in self.registry.actions:
 			del self.registry.actions[action_name]
+			self._action_model_cache.clear()
 			logger.debug(f'Excluded action "{action_name}" from registry')
 
 	def _get_special_param_types(self) -> dict[str, type | UnionType | None]:
@@ -319,6 +322,7 @@ class Registry(Generic[Context]):
 				terminates_sequence=terminates_sequence,
 			)
 			self.registry.actions[func.__name__] = action
+			self._action_model_cache.clear()
 
 			# Return the normalized function so it can be called with kwargs
 			return normalized_func
@@ -510,9 +514,10 @@ class Registry(Generic[Context]):
 
 		Each action model contains only the specific action being used,
 		rather than all actions with most set to None.
-		"""
-		from typing import Union
 
+		Models are cached per set of active actions, so navigating between pages that enable the same
+		domain-filtered actions returns the same model class instead of rebuilding it.
+		"""
 		# Filter actions based on page_url if provided:
 		#   if page_url is None, only include actions with no filters
 		#   if page_url is provided, only include actions that match the URL
@@ -535,6 +540,18 @@ class Registry(Generic[Context]):
 			if domain_is_allowed:
 				available_actions[name] = action
 
+		cache_key = tuple((name, id(action)) for name, action in available_actions.items())
+		cached_model = self._action_model_cache.get(cache_key)
+		if cached_model is not None:
+			return cached_model
+
+		result_model = self._build_action_model(available_actions)
+		self._action_model_cache[cache_key] = result_model
+		return result_model
+
+	def _build_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		from typing import Union
+
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
 
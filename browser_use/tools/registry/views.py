@@ -1,7 +1,7 @@
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from browser_use.browser import BrowserSession
 from browser_use.filesystem.file_system import FileSystem
@@ -28,8 +28,16 @@ class RegisteredAction(BaseModel):
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	# prompt_description() generates the param model's JSON schema, built once per action
+	_prompt_description: str | None = PrivateAttr(default=None)
+
 	def prompt_description(self) -> str:
 		"""Get a description of the action for the prompt in unstructured format"""
+		if self._prompt_description is None:
+			self._prompt_description = self._build_prompt_description()
+		return self._prompt_description
+
+	def _build_prompt_description(self) -> str:
 		schema = self.param_model.model_json_schema()
 		params = []
 
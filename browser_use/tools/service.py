@@ -480,7 +480,7 @@ class Tools(Generic[Context]):
 
 		# Helper function for coordinate conversion
 		def _convert_llm_coordinates_to_viewport(llm_x: int, llm_y: int, browser_session: BrowserSession) -> tuple[int, int]:
-			"""Convert coordinates from LLM screenshot size to original viewport size."""
+			"""Convert coordinates from LLM screenshot size (or downscaled screenshot size) to original viewport size."""
 			if browser_session.llm_screenshot_size and browser_session._original_viewport_size:
 				original_width, original_height = browser_session._original_viewport_size
 				llm_width, llm_height = browser_session.llm_screenshot_size
@@ -494,6 +494,10 @@ class Tools(Generic[Context]):
 					f'→ Viewport ({actual_x}, {actual_y}) @ {original_width}x{original_height}'
 				)
 				return actual_x, actual_y
+			if browser_session._screenshot_scale != 1.0:
+				# the LLM saw a screenshot downscaled by the browser (screenshot_max_dimension)
+				scale = browser_session._screenshot_scale
+				return int(llm_x / scale), int(llm_y / scale)
 			return llm_x, llm_y
 
 		# Element Interaction Actions
@@ -958,10 +962,13 @@ class Tools(Generic[Context]):
 		):
 			# Constants
 			MAX_CHAR_LIMIT = 100000
+			MAX_PARALLEL_CHUNKS = 20
+			MAX_CONCURRENT_CHUNK_EXTRACTIONS = 4
 			query = params['query'] if isinstance(params, dict) else params.query
 			extract_links = params['extract_links'] if isinstance(params, dict) else params.extract_links
 			start_from_char = params['start_from_char'] if isinstance(params, dict) else params.start_from_char
 			output_schema: dict | None = params.get('output_schema') if isinstance(params, dict) else params.output_schema
+			all_chunks = params.get('all_chunks', False) if isinstance(params, dict) else params.all_chunks
 
 			# If the LLM didn't provide an output_schema, use the agent-injected extraction_schema
 			if output_schema is None and extraction_schema is not None:
@@ -993,47 +1000,58 @@ class Tools(Generic[Context]):
 
 			# Structure-aware chunking replaces naive char-based truncation
 			from browser_use.dom.markdown_extractor import chunk_markdown_by_structure
+			from browser_use.dom.views import MarkdownChunk
 
 			chunks = chunk_markdown_by_structure(content, max_chunk_chars=MAX_CHAR_LIMIT, start_from_char=start_from_char)
 			if not chunks:
 				return ActionResult(
 					error=f'start_from_char ({start_from_char}) exceeds content length {final_filtered_length} characters.'
 				)
-			chunk = chunks[0]
-			content = chunk.content
-			truncated = chunk.has_more
-
-			# Prepend overlap context for continuation chunks (e.g. table headers)
-			if chunk.overlap_prefix:
-				content = chunk.overlap_prefix + '\n' + content
+			parallel = all_chunks and len(chunks) > 1
+			chunks = chunks[:MAX_PARALLEL_CHUNKS] if parallel else chunks[:1]
+			last_chunk = chunks[-1]
+			truncated = last_chunk.has_more
 
 			if start_from_char > 0:
 				content_stats['started_from_char'] = start_from_char
 			if truncated:
-				content_stats['truncated_at_char'] = chunk.char_offset_end
-				content_stats['next_start_char'] = chunk.char_offset_end
-				content_stats['chunk_index'] = chunk.chunk_index
-				content_stats['total_chunks'] = chunk.total_chunks
+				content_stats['truncated_at_char'] = last_chunk.char_offset_end
+				content_stats['next_start_char'] = last_chunk.char_offset_end
+				content_stats['chunk_index'] = last_chunk.chunk_index
+				content_stats['total_chunks'] = last_chunk.total_chunks
+			if parallel:
+				content_stats['chunks_extracted'] = len(chunks)
 
 			# Add content statistics to the result
 			original_html_length = content_stats['original_html_chars']
 			initial_markdown_length = content_stats['initial_markdown_chars']
 			chars_filtered = content_stats['filtered_chars_removed']
 
-			stats_summary = f"""Content processed: {original_html_length:,} HTML chars → {initial_markdown_length:,} initial markdown → {final_filtered_length:,} filtered markdown"""
+			base_stats_summary = f"""Content processed: {original_html_length:,} HTML chars → {initial_markdown_length:,} initial markdown → {final_filtered_length:,} filtered markdown"""
 			if start_from_char > 0:
-				stats_summary += f' (started from char {start_from_char:,})'
-			if truncated:
-				chunk_info = f'chunk {chunk.chunk_index + 1} of {chunk.total_chunks}, '
-				stats_summary += f' → {len(content):,} final chars ({chunk_info}use start_from_char={content_stats["next_start_char"]} to continue)'
-			elif chars_filtered > 0:
-				stats_summary += f' (filtered {chars_filtered:,} chars of noise)'
-
-			# Sanitize surrogates from content to prevent UTF-8 encoding errors
-			content = sanitize_surrogates(content)
+				base_stats_summary += f' (started from char {start_from_char:,})'
+
+			# Build the (content, stats summary) input of every chunk that gets extracted
+			chunk_inputs: list[tuple[str, str]] = []
+			for chunk in chunks:
+				content = chunk.content
+				# Prepend overlap context for continuation chunks (e.g. table headers)
+				if chunk.overlap_prefix:
+					content = chunk.overlap_prefix + '\n' + content
+
+				stats_summary = base_stats_summary
+				chunk_info = f'chunk {chunk.chunk_index + 1} of {chunk.total_chunks}'
+				if parallel:
+					stats_summary += f' → {len(content):,} final chars ({chunk_info}, the other chunks are extracted separately)'
+				elif truncated:
+					stats_summary += f' → {len(content):,} final chars ({chunk_info}, use start_from_char={content_stats["next_start_char"]} to continue)'
+				elif chars_filtered > 0:
+					stats_summary += f' (filtered {chars_filtered:,} chars of noise)'
+
+				# Sanitize surrogates from content to prevent UTF-8 encoding errors
+				chunk_inputs.append((sanitize_surrogates(content), stats_summary))
 			query = sanitize_surrogates(query)
 
-			# --- Structured extraction path ---
 			if structured_model is not None:
 				assert output_schema is not None
 				system_prompt = """
@@ -1050,64 +1068,9 @@ You will be given a query, a JSON Schema, and the markdown of a webpage that has
 - If the content was truncated, extract what is available from the visible portion.
 </instructions>
 """.strip()
-
 				schema_json = json.dumps(output_schema, indent=2)
-				prompt = (
-					f'<query>\n{query}\n</query>\n\n'
-					f'<output_schema>\n{schema_json}\n</output_schema>\n\n'
-					f'<content_stats>\n{stats_summary}\n</content_stats>\n\n'
-					f'<webpage_content>\n{content}\n</webpage_content>'
-				)
-
-				try:
-					response = await asyncio.wait_for(
-						page_extraction_llm.ainvoke(
-							[SystemMessage(content=system_prompt), UserMessage(content=prompt)],
-							output_format=structured_model,
-						),
-						timeout=120.0,
-					)
-
-					# response.completion is a pydantic model instance
-					result_data: dict = response.completion.model_dump(mode='json')  # type: ignore[union-attr]
-					result_json = json.dumps(result_data)
-
-					current_url = await browser_session.get_current_page_url()
-					extracted_content = f'<url>\n{current_url}\n</url>\n<query>\n{query}\n</query>\n<structured_result>\n{result_json}\n</structured_result>'
-
-					from browser_use.tools.extraction.views import ExtractionResult
-
-					extraction_meta = ExtractionResult(
-						data=result_data,
-						schema_used=output_schema,
-						is_partial=truncated,
-						source_url=current_url,
-						content_stats=content_stats,
-					)
-
-					# Simple memory handling
-					MAX_MEMORY_LENGTH = 10000
-					if len(extracted_content) < MAX_MEMORY_LENGTH:
-						memory = extracted_content
-						include_extracted_content_only_once = False
-					else:
-						file_name = await file_system.save_extracted_content(extracted_content)
-						memory = f'Query: {query}\nContent in {file_name} and once in <read_state>.'
-						include_extracted_content_only_once = True
-
-					logger.info(f'📄 {memory}')
-					return ActionResult(
-						extracted_content=extracted_content,
-						include_extracted_content_only_once=include_extracted_content_only_once,
-						long_term_memory=memory,
-						metadata={'structured_extraction': True, 'extraction_result': extraction_meta.model_dump(mode='json')},
-					)
-				except Exception as e:
-					logger.debug(f'Error in structured extraction: {e}')
-					raise RuntimeError(str(e))
-
-			# --- Free-text extraction path (default) ---
-			system_prompt = """
+			else:
+				system_prompt = """
 You are an expert at extracting data from the markdown of a webpage.
 
 <input>
@@ -1128,18 +1091,101 @@ You will be given a query and the markdown of a webpage that has been filtered t
 </output>
 """.strip()
 
-			prompt = f'<query>\n{query}\n</query>\n\n<content_stats>\n{stats_summary}\n</content_stats>\n\n<webpage_content>\n{content}\n</webpage_content>'
+			async def extract_chunk(content: str, stats_summary: str) -> dict | str:
+				if structured_model is not None:
+					prompt = (
+						f'<query>\n{query}\n</query>\n\n'
+						f'<output_schema>\n{schema_json}\n</output_schema>\n\n'
+						f'<content_stats>\n{stats_summary}\n</content_stats>\n\n'
+						f'<webpage_content>\n{content}\n</webpage_content>'
+					)
+					response = await asyncio.wait_for(
+						page_extraction_llm.ainvoke(
+							[SystemMessage(content=system_prompt), UserMessage(content=prompt)],
+							output_format=structured_model,
+						),
+						timeout=120.0,
+					)
+					# response.completion is a pydantic model instance
+					return response.completion.model_dump(mode='json')  # type: ignore[union-attr]
 
-			try:
+				prompt = f'<query>\n{query}\n</query>\n\n<content_stats>\n{stats_summary}\n</content_stats>\n\n<webpage_content>\n{content}\n</webpage_content>'
 				response = await asyncio.wait_for(
 					page_extraction_llm.ainvoke([SystemMessage(content=system_prompt), UserMessage(content=prompt)]),
 					timeout=120.0,
 				)
+				return response.completion
+
+			try:
+				failed_chunks: list[MarkdownChunk] = []
+				if parallel:
+					# Map: every chunk goes to the extraction LLM concurrently, bounded by a semaphore
+					semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNK_EXTRACTIONS)
+
+					async def extract_chunk_limited(content: str, stats_summary: str) -> dict | str:
+						async with semaphore:
+							return await extract_chunk(content, stats_summary)
+
+					outcomes = await asyncio.gather(
+						*(extract_chunk_limited(content, stats_summary) for content, stats_summary in chunk_inputs),
+						return_exceptions=True,
+					)
+					chunk_results = []
+					for chunk, outcome in zip(chunks, outcomes):
+						if isinstance(outcome, BaseException):
+							logger.warning(
+								f'Extraction of chunk {chunk.chunk_index + 1} failed: {type(outcome).__name__}: {outcome}'
+							)
+							failed_chunks.append(chunk)
+						else:
+							chunk_results.append(outcome)
+					if not chunk_results:
+						raise RuntimeError(f'Extraction failed for all {len(chunks)} chunks: {outcomes[0]}')
+					if failed_chunks:
+						content_stats['failed_chunks'] = [chunk.chunk_index + 1 for chunk in failed_chunks]
+				else:
+					chunk_results = [await extract_chunk(*chunk_inputs[0])]
 
 				current_url = await browser_session.get_current_page_url()
-				extracted_content = (
-					f'<url>\n{current_url}\n</url>\n<query>\n{query}\n</query>\n<result>\n{response.completion}\n</result>'
-				)
+				extracted_content = f'<url>\n{current_url}\n</url>\n<query>\n{query}\n</query>\n'
+				metadata = None
+
+				# Reduce: merge and deduplicate the per-chunk results
+				if structured_model is not None:
+					from browser_use.tools.extraction.merge import merge_structured_results
+					from browser_use.tools.extraction.views import ExtractionResult
+
+					result_data: dict = chunk_results[0]  # type: ignore[assignment]
+					if len(chunk_results) > 1:
+						merged = merge_structured_results(chunk_results)  # type: ignore[arg-type]
+						result_data = structured_model.model_validate(merged).model_dump(mode='json')
+					extracted_content += f'<structured_result>\n{json.dumps(result_data)}\n</structured_result>'
+
+					extraction_meta = ExtractionResult(
+						data=result_data,
+						schema_used=output_schema,
+						is_partial=truncated or bool(failed_chunks),
+						source_url=current_url,
+						content_stats=content_stats,
+					)
+					metadata = {'structured_extraction': True, 'extraction_result': extraction_meta.model_dump(mode='json')}
+				else:
+					from browser_use.tools.extraction.merge import merge_text_results
+
+					result_text = chunk_results[0] if len(chunk_results) == 1 else merge_text_results(chunk_results)  # type: ignore[arg-type]
+					extracted_content += f'<result>\n{result_text}\n</result>'
+
+				if failed_chunks or (parallel and truncated):
+					notes = []
+					for chunk in failed_chunks:
+						notes.append(
+							f'Extraction of chunk {chunk.chunk_index + 1} failed, use start_from_char={chunk.char_offset_start} to retry it'
+						)
+					if parallel and truncated:
+						notes.append(
+							f'Stopped after {len(chunks)} chunks, use start_from_char={content_stats["next_start_char"]} to continue'
+						)
+					extracted_content += '\n<note>\n' + '\n'.join(notes) + '\n</note>'
 
 				# Simple memory handling
 				MAX_MEMORY_LENGTH = 10000
@@ -1156,6 +1202,7 @@ You will be given a query and the markdown of a webpage that has been filtered t
 					extracted_content=extracted_content,
 					include_extracted_content_only_once=include_extracted_content_only_once,
 					long_term_memory=memory,
+					metadata=metadata,
 				)
 			except Exception as e:
 				logger.debug(f'Error extracting content: {e}')
@@ -17,6 +17,10 @@ class ExtractAction(BaseModel):
 		default=None,
 		description='Optional JSON Schema dict. When provided, extraction returns validated JSON matching this schema instead of free-text.',
 	)
+	all_chunks: bool = Field(
+		default=False,
+		description='Set True for long pages to extract from all remaining chunks in parallel and merge the results, instead of only the first chunk',
+	)
 
 
 class SearchPageAction(BaseModel):
@@ -10,7 +10,7 @@ from fnmatch import fnmatch
 from functools import cache, wraps
 from pathlib import Path
 from sys import stderr
-from typing import Any, ParamSpec, TypeVar
+from typing import Any, Literal, ParamSpec, TypeVar
 from urllib.parse import urlparse
 
 import httpx
@@ -453,6 +453,15 @@ def is_new_tab_page(url: str) -> bool:
 	return url in ('about:blank', 'chrome://new-tab-page/', 'chrome://new-tab-page', 'chrome://newtab/', 'chrome://newtab')
 
 
+def image_media_type(image_b64: str) -> Literal['image/png', 'image/jpeg', 'image/webp']:
+	"""Media type of a base64-encoded PNG/JPEG/WebP image (e.g. a screenshot taken in BrowserProfile.screenshot_format)."""
+	if image_b64.startswith('/9j/'):
+		return 'image/jpeg'
+	if image_b64.startswith('UklGR'):
+		return 'image/webp'
+	return 'image/png'
+
+
 def match_url_with_domain_pattern(url: str, domain_pattern: str, log_warnings: bool = False) -> bool:
 	"""
 	Check if a URL matches a domain pattern. SECURITY CRITICAL.
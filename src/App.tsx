@@ -22,6 +22,7 @@ export default function App() {
   const [logs, setLogs] = useState<LogEntry[]>([]);
   const [puterLogs, setPuterLogs] = useState<any[]>([]);
   const [reasoning, setReasoning] = useState<ReasoningState | null>(null);
+  const runIdRef = useRef<string | null>(null);
 
   const addLog = (level: LogEntry['level'], message: string) => {
     setLogs(prev => [...prev, {
@@ -46,7 +47,8 @@ export default function App() {
   const handleStopAgent = async () => {
     addLog('SYSTEM', 'Interrompendo agente...');
     try {
-      await fetch('http://localhost:8000/stop-agent', { method: 'POST' });
+      const query = runIdRef.current ? `?run_id=${encodeURIComponent(runIdRef.current)}` : '';
+      await fetch(`http://localhost:8000/stop-agent${query}`, { method: 'POST' });
     } catch (e) {
       addLog('ERROR', 'Falha ao enviar signal de stop.');
     }
@@ -122,7 +124,9 @@ export default function App() {
           if (line.startsWith('data: ')) {
             const data = JSON.parse(line.substring(6));
 
-            if (data.type === 'step') {
+            if (data.type === 'run') {
+              runIdRef.current = data.run_id;
+            } else if (data.type === 'step') {
               setAgentState('ACTING');
               setReasoning({
                 thought: data.thought,
@@ -132,10 +136,12 @@ export default function App() {
                 isWaiting: false
               });
               if (data.url) setCurrentUrl(data.url);
-              if (data.screenshot) setCurrentScreenshot(data.screenshot);
+              if (data.screenshot) setCurrentScreenshot(`data:image/png;base64,${data.screenshot}`);
               if (data.thought) {
                 addLog('LLM', `[PASSO ${data.step} | ${data.elapsed}s] ${data.thought}`);
               }
+            } else if (data.type === 'frame') {
+              setCurrentScreenshot(`http://localhost:8000${data.url}`);
             } else if (data.type === 'info') {
               addLog('INFO', `[${data.elapsed || '...'}s] ${data.message}`);
               if (data.message.includes('Usando') || data.message.includes('Conectando')) {
@@ -158,6 +164,7 @@ export default function App() {
       addLog('ERROR', `Error: ${error instanceof Error ? error.message : 'Desconhecido'}`);
       setAgentState('ERROR');
     } finally {
+      runIdRef.current = null;
       setTimeout(() => {
         setAgentState('IDLE');
         setReasoning(null);
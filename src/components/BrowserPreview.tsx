@@ -6,7 +6,7 @@ import { AgentState } from './TopBar';
 interface BrowserPreviewProps {
   currentUrl: string;
   agentState: AgentState;
-  screenshot?: string | null;
+  screenshot?: string | null; // image URL (frame endpoint or data: URL)
 }
 
 export function BrowserPreview({ currentUrl, agentState, screenshot }: BrowserPreviewProps) {
@@ -36,7 +36,7 @@ export function BrowserPreview({ currentUrl, agentState, screenshot }: BrowserPr
       <div className="flex-1 bg-white relative overflow-hidden flex flex-col">
         {screenshot ? (
            <img
-             src={`data:image/png;base64,${screenshot}`}
+             src={screenshot}
              alt="Browser View"
              className="w-full h-full object-contain bg-gray-100"
            />
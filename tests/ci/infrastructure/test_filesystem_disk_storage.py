@@ -0,0 +1,97 @@
+"""Tests for the disk-backed FileSystem storage mode."""
+
+import hashlib
+
+from browser_use.filesystem.file_system import DEFAULT_FILE_SYSTEM_PATH, DISK_CONTENT_DIR, FileSystem, FileSystemState
+
+
+async def test_disk_files_keep_no_content_in_memory(tmp_path):
+	fs = FileSystem(tmp_path, storage='disk')
+
+	assert await fs.write_file('results.md', '# Results\n') == 'Data written to file results.md successfully.'
+	for i in range(3):
+		await fs.append_file('results.md', f'- item {i}\n')
+
+	expected = '# Results\n- item 0\n- item 1\n- item 2\n'
+	file_obj = fs.get_file('results.md')
+	assert file_obj is not None
+	assert file_obj.content == ''
+	assert file_obj.read() == expected
+	assert file_obj.get_size == len(expected)
+	assert file_obj.sha256 == hashlib.sha256(expected.encode()).hexdigest()
+	assert (tmp_path / DEFAULT_FILE_SYSTEM_PATH / 'results.md').read_text() == expected
+	assert expected in await fs.read_file('results.md')
+
+	await fs.replace_file_str('results.md', 'item 1', 'item one')
+	assert 'item one' in file_obj.read()
+	assert file_obj.sha256 == hashlib.sha256(file_obj.read().encode()).hexdigest()
+
+
+async def test_disk_state_records_references_and_restores(tmp_path):
+	fs = FileSystem(tmp_path, storage='disk')
+	await fs.write_file('data.jsonl', '{"a": 1}\n' * 1000)
+	await fs.save_extracted_content('extracted page')
+
+	state = fs.get_state()
+	assert state.storage == 'disk'
+	data = state.files['data.jsonl']['data']
+	assert data['content'] == ''
+	assert data['storage_path'] == str(tmp_path / DEFAULT_FILE_SYSTEM_PATH / 'data.jsonl')
+	assert data['char_count'] == 9000
+	assert len(state.model_dump_json()) < 2000
+
+	restored = FileSystem.from_state(FileSystemState.model_validate_json(state.model_dump_json()))
+	assert restored.get_file('data.jsonl').read() == '{"a": 1}\n' * 1000  # type: ignore[union-attr]
+	assert restored.display_file('extracted_content_0.md') == 'extracted page'
+
+	# the running hash is rebuilt from disk after a restore
+	await restored.append_file('data.jsonl', '{"b": 2}\n')
+	content = '{"a": 1}\n' * 1000 + '{"b": 2}\n'
+	assert restored.get_file('data.jsonl').sha256 == hashlib.sha256(content.encode()).hexdigest()  # type: ignore[union-attr]
+
+
+async def test_rendered_files_keep_text_source_on_disk(tmp_path):
+	fs = FileSystem(tmp_path, storage='disk')
+	await fs.write_file('report.docx', '# Title\nBody')
+
+	file_obj = fs.get_file('report.docx')
+	assert file_obj is not None
+	assert file_obj.storage_path == str(tmp_path / DEFAULT_FILE_SYSTEM_PATH / DISK_CONTENT_DIR / 'report.docx.md')
+	assert file_obj.read() == '# Title\nBody'
+	assert (tmp_path / DEFAULT_FILE_SYSTEM_PATH / 'report.docx').exists()
+	assert 'report.docx' in fs.list_files()
+
+
+def test_storage_defaults_to_env(tmp_path, monkeypatch):
+	assert FileSystem(tmp_path / 'a').storage == 'memory'
+
+	monkeypatch.setenv('BROWSER_USE_FILE_SYSTEM_STORAGE', 'disk')
+	fs = FileSystem(tmp_path / 'b')
+	assert fs.storage == 'disk'
+	assert fs.get_file('todo.md').storage_path is not None  # type: ignore[union-attr]
+
+
+async def test_describe_reads_only_the_head_and_tail_of_disk_files(tmp_path):
+	fs = FileSystem(tmp_path, storage='disk')
+	await fs.write_file('results.md', '# Results\n')
+	for i in range(5000):
+		await fs.append_file('results.md', f'- item {i}' + ('\n' if i % 2 else ' (continued)\n'))
+
+	file_obj = fs.get_file('results.md')
+	assert file_obj is not None
+	expected_lines = file_obj.read().splitlines()
+	assert file_obj.line_count == len(expected_lines) == 5001
+
+	def read_whole_file():
+		raise AssertionError('describe() read the whole file')
+
+	object.__setattr__(file_obj, 'read', read_whole_file)
+	description = fs.describe()
+	assert 'results.md - 5001 lines' in description
+	assert description.startswith('<file>\nresults.md - 5001 lines\n<content>\n# Results\n- item 0 (continued)\n')
+	assert '- item 4999\n</content>' in description
+
+	# appends that split a line keep the count
+	await fs.append_file('results.md', 'no newline')
+	await fs.append_file('results.md', ' yet\n')
+	assert file_obj.get_line_count == 5002
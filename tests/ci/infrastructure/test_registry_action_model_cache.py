@@ -0,0 +1,108 @@
+"""Tests for the per-action-set caches of Registry.create_action_model and the prompt descriptions."""
+
+from pydantic import BaseModel
+
+from browser_use.agent.service import Agent
+from browser_use.agent.views import AgentOutput
+from browser_use.llm.schema import SchemaOptimizer
+from browser_use.tools.service import Tools
+from tests.ci.conftest import create_mock_llm
+
+
+class LookupParams(BaseModel):
+	term: str
+
+
+def _tools_with_domain_action() -> Tools:
+	tools = Tools()
+
+	@tools.registry.action('Look something up on example sites', param_model=LookupParams, domains=['*.example.com'])
+	async def lookup(params: LookupParams):
+		return params.term
+
+	return tools
+
+
+def test_action_model_is_reused_for_the_same_action_set():
+	tools = _tools_with_domain_action()
+	registry = tools.registry
+
+	base = registry.create_action_model()
+	on_example = registry.create_action_model(page_url='https://www.example.com/a')
+	assert registry.create_action_model() is base
+	assert registry.create_action_model(page_url='https://docs.example.com/b') is on_example
+	assert on_example is not base
+
+	# pages without domain-filtered actions share one model
+	assert registry.create_action_model(page_url='https://other.org') is registry.create_action_model(
+		page_url='https://another.org'
+	)
+	assert registry.create_action_model(include_actions=['done']) is registry.create_action_model(include_actions=['done'])
+
+
+def test_action_model_cache_is_invalidated_on_registration_and_exclusion():
+	tools = _tools_with_domain_action()
+	registry = tools.registry
+	base = registry.create_action_model()
+
+	@registry.action('Say hello')
+	async def hello():
+		return 'hello'
+
+	with_hello = registry.create_action_model()
+	assert with_hello is not base
+	assert 'hello' in with_hello.model_json_schema()['$defs']['HelloActionModel']['properties']
+
+	registry.exclude_action('hello')
+	without_hello = registry.create_action_model()
+	assert without_hello is not with_hello
+	assert 'HelloActionModel' not in without_hello.model_json_schema()['$defs']
+
+
+def test_prompt_description_is_built_once_per_action(monkeypatch):
+	tools = _tools_with_domain_action()
+	calls = 0
+	original = LookupParams.model_json_schema.__func__  # type: ignore[attr-defined]
+
+	def counting_schema(cls, *args, **kwargs):
+		nonlocal calls
+		calls += 1
+		return original(cls, *args, **kwargs)
+
+	monkeypatch.setattr(LookupParams, 'model_json_schema', classmethod(counting_schema))
+
+	first = tools.registry.get_prompt_description(page_url='https://www.example.com')
+	for _ in range(5):
+		assert tools.registry.get_prompt_description(page_url='https://www.example.com') == first
+	assert first.startswith('lookup: Look something up on example sites. (term=string')
+	assert calls == 1
+
+
+def test_optimized_schema_is_cached_and_copied():
+	tools = Tools()
+	output_model = AgentOutput.type_with_custom_actions(tools.registry.create_action_model())
+
+	first = SchemaOptimizer.create_optimized_json_schema(output_model)
+	first['properties'].clear()
+	second = SchemaOptimizer.create_optimized_json_schema(output_model)
+	assert second['properties']
+	assert second == SchemaOptimizer._build_optimized_json_schema(output_model, remove_min_items=False, remove_defaults=False)
+	assert SchemaOptimizer.create_optimized_json_schema(output_model, remove_min_items=True) != second
+
+
+async def test_agent_reuses_output_types_across_page_changes():
+	tools = _tools_with_domain_action()
+	agent = Agent(task='Test task', llm=create_mock_llm(), tools=tools)
+	base_output = agent.AgentOutput
+
+	await agent._update_action_models_for_page('https://other.org')
+	assert agent.AgentOutput is base_output
+
+	await agent._update_action_models_for_page('https://www.example.com')
+	example_output = agent.AgentOutput
+	assert example_output is not base_output
+
+	# forcing done swaps in the done output type, the next page update restores the full one
+	agent.AgentOutput = agent.DoneAgentOutput
+	await agent._update_action_models_for_page('https://docs.example.com')
+	assert agent.AgentOutput is example_output
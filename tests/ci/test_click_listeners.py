@@ -0,0 +1,204 @@
+"""Tests for the click-listener registry that replaced the per-snapshot getEventListeners scan."""
+
+import logging
+from types import SimpleNamespace
+
+from pytest_httpserver import HTTPServer
+
+from browser_use.dom.click_listeners import (
+	CLICK_LISTENER_ATTRIBUTE,
+	CLICK_LISTENER_REGISTRY_JS,
+	SEED_CLICK_LISTENERS_JS,
+	ClickListenerRegistry,
+)
+from browser_use.dom.service import DomService
+from browser_use.dom.views import EnhancedDOMTreeNode, TargetAllTrees
+
+
+class _FakeSend:
+	def __init__(self, fail_install: bool = False):
+		self.calls = []
+		self.fail_install = fail_install
+		self.Page = SimpleNamespace(addScriptToEvaluateOnNewDocument=self._add_script)
+		self.Runtime = SimpleNamespace(evaluate=self._evaluate)
+
+	async def _add_script(self, params=None, session_id=None):
+		self.calls.append(('addScriptToEvaluateOnNewDocument', params, session_id))
+		if self.fail_install:
+			raise RuntimeError('Page domain not available')
+		return {'identifier': '1'}
+
+	async def _evaluate(self, params=None, session_id=None):
+		self.calls.append(('evaluate', params, session_id))
+		return {'result': {'type': 'number', 'value': 3}}
+
+
+def _cdp_session(send: _FakeSend, session_id: str):
+	return SimpleNamespace(cdp_client=SimpleNamespace(send=send), session_id=session_id)
+
+
+async def test_registry_is_installed_once_per_session():
+	send = _FakeSend()
+	registry = ClickListenerRegistry()
+
+	await registry.prepare(_cdp_session(send, 'session-a'))  # type: ignore[arg-type]
+	await registry.prepare(_cdp_session(send, 'session-a'))  # type: ignore[arg-type]
+	await registry.prepare(_cdp_session(send, 'session-b'))  # type: ignore[arg-type]
+
+	installs = [(params, session_id) for method, params, session_id in send.calls if method == 'addScriptToEvaluateOnNewDocument']
+	assert installs == [
+		({'source': CLICK_LISTENER_REGISTRY_JS, 'runImmediately': True}, 'session-a'),
+		({'source': CLICK_LISTENER_REGISTRY_JS, 'runImmediately': True}, 'session-b'),
+	]
+	# one cheap seed check per snapshot, which only scans documents that predate the registry
+	seeds = [params for method, params, _ in send.calls if method == 'evaluate']
+	assert len(seeds) == 3
+	assert seeds[0] == {'expression': SEED_CLICK_LISTENERS_JS, 'includeCommandLineAPI': True, 'returnByValue': True}
+
+
+async def test_failed_install_still_seeds_and_retries():
+	send = _FakeSend(fail_install=True)
+	registry = ClickListenerRegistry()
+
+	await registry.prepare(_cdp_session(send, 'session-a'))  # type: ignore[arg-type]
+	await registry.prepare(_cdp_session(send, 'session-a'))  # type: ignore[arg-type]
+
+	assert [method for method, _, _ in send.calls] == ['addScriptToEvaluateOnNewDocument', 'evaluate'] * 2
+
+
+def test_scripts_use_the_marker_attribute():
+	assert f"'{CLICK_LISTENER_ATTRIBUTE}'" in CLICK_LISTENER_REGISTRY_JS
+	assert f"'{CLICK_LISTENER_ATTRIBUTE}'" in SEED_CLICK_LISTENERS_JS
+	assert '%(' not in CLICK_LISTENER_REGISTRY_JS + SEED_CLICK_LISTENERS_JS
+
+
+async def test_marker_attribute_sets_has_js_click_listener(monkeypatch):
+	async def get_or_create_cdp_session(target_id=None, focus=True):
+		return SimpleNamespace(session_id='session-a', target_id=target_id)
+
+	browser_session = SimpleNamespace(
+		get_or_create_cdp_session=get_or_create_cdp_session, logger=logging.getLogger('test_click_listeners')
+	)
+	service = DomService(browser_session)  # type: ignore[arg-type]
+
+	def element(node_id: int, name: str, attributes: list[str], children=()):
+		return {
+			'nodeId': node_id,
+			'backendNodeId': node_id,
+			'nodeType': 1,
+			'nodeName': name,
+			'localName': name.lower(),
+			'nodeValue': '',
+			'attributes': attributes,
+			'children': list(children),
+		}
+
+	clickable = element(3, 'DIV', ['class', 'card', CLICK_LISTENER_ATTRIBUTE, ''])
+	plain = element(4, 'DIV', ['class', 'card'])
+	body = element(2, 'BODY', [], [clickable, plain])
+	document = {'nodeId': 1, 'backendNodeId': 1, 'nodeType': 9, 'nodeName': '#document', 'nodeValue': '', 'children': [body]}
+
+	async def get_all_trees(target_id):
+		return TargetAllTrees(
+			snapshot={'documents': [], 'strings': []},  # type: ignore[typeddict-item]
+			dom_tree={'root': document},  # type: ignore[typeddict-item]
+			ax_tree={'nodes': []},
+			device_pixel_ratio=1.0,
+			cdp_timing={},
+		)
+
+	monkeypatch.setattr(service, '_get_all_trees', get_all_trees)
+	root, _ = await service.get_dom_tree('target-1')
+
+	body_node = root.children_nodes[0]  # type: ignore[index]
+	clickable_node, plain_node = body_node.children_nodes  # type: ignore[misc]
+	assert clickable_node.has_js_click_listener
+	assert clickable_node.attributes == {'class': 'card'}  # the marker is not a page attribute
+	assert not plain_node.has_js_click_listener
+
+
+# ---------------------------------------------------------------------------
+# Integration tests — require browser + httpserver
+# ---------------------------------------------------------------------------
+
+LISTENER_PAGE = """
+<html><body>
+	<div id="added">added by a page script</div>
+	<div id="removed">added then removed</div>
+	<div id="property">onclick property</div>
+	<div id="late">gets a listener after load</div>
+	<div id="plain">no listener</div>
+	<script>
+		const noop = () => {};
+		document.getElementById('added').addEventListener('click', noop);
+		document.getElementById('removed').addEventListener('mousedown', noop, true);
+		document.getElementById('removed').removeEventListener('mousedown', noop, {capture: true});
+		document.getElementById('property').onclick = noop;
+	</script>
+</body></html>
+"""
+
+
+def _click_listener_flags(node: EnhancedDOMTreeNode, flags: dict[str, bool] | None = None) -> dict[str, bool]:
+	"""has_js_click_listener of every element with an id, by id."""
+	flags = {} if flags is None else flags
+	if node.attributes and 'id' in node.attributes:
+		flags[node.attributes['id']] = node.has_js_click_listener
+	for child in node.children_nodes or []:
+		_click_listener_flags(child, flags)
+	if node.content_document:
+		_click_listener_flags(node.content_document, flags)
+	return flags
+
+
+class TestClickListenerRegistryIntegration:
+	"""Integration tests using browser session and httpserver."""
+
+	async def _flags(self, service: DomService, browser_session) -> dict[str, bool]:
+		root, _ = await service.get_dom_tree(browser_session.agent_focus_target_id)
+		return _click_listener_flags(root)
+
+	async def _evaluate(self, browser_session, expression: str):
+		cdp_session = await browser_session.get_or_create_cdp_session()
+		result = await cdp_session.cdp_client.send.Runtime.evaluate(
+			params={'expression': expression, 'returnByValue': True}, session_id=cdp_session.session_id
+		)
+		return result.get('result', {}).get('value')
+
+	async def test_listeners_attached_before_the_registry_are_seeded(self, browser_session, httpserver: HTTPServer):
+		"""The first document predates the init script, so its listeners come from the getEventListeners() seed."""
+		httpserver.expect_request('/listeners').respond_with_data(LISTENER_PAGE, content_type='text/html')
+		await browser_session.navigate_to(httpserver.url_for('/listeners'))
+		service = DomService(browser_session)
+
+		flags = await self._flags(service, browser_session)
+
+		assert flags == {'added': True, 'removed': False, 'property': True, 'late': False, 'plain': False}
+		assert await self._evaluate(browser_session, 'window.__browserUseClickListeners.complete') is True
+
+	async def test_registry_tracks_listeners_in_documents_loaded_after_install(self, browser_session, httpserver: HTTPServer):
+		"""Documents loaded after the init script are tracked by the hooks alone, including later changes."""
+		httpserver.expect_request('/first').respond_with_data('<html><body>first</body></html>', content_type='text/html')
+		httpserver.expect_request('/listeners').respond_with_data(LISTENER_PAGE, content_type='text/html')
+		service = DomService(browser_session)
+		await browser_session.navigate_to(httpserver.url_for('/first'))
+		await self._flags(service, browser_session)  # installs the registry
+
+		await browser_session.navigate_to(httpserver.url_for('/listeners'))
+		# the hook ran before any page script, so the seed scan is skipped for this document
+		assert await self._evaluate(browser_session, 'window.__browserUseClickListeners.complete') is True
+		flags = await self._flags(service, browser_session)
+		assert flags == {'added': True, 'removed': False, 'property': True, 'late': False, 'plain': False}
+
+		await self._evaluate(
+			browser_session,
+			"""
+			document.getElementById('late').addEventListener('pointerdown', () => {});
+			document.getElementById('added').removeEventListener('click', noop);
+			document.getElementById('property').onclick = null;
+			""",
+		)
+		flags = await self._flags(service, browser_session)
+		assert flags == {'added': False, 'removed': False, 'property': False, 'late': True, 'plain': False}
+		# the marker comes back with the DOM but is not reported as a page attribute
+		assert await self._evaluate(browser_session, f"document.querySelectorAll('[{CLICK_LISTENER_ATTRIBUTE}]').length") == 1
@@ -0,0 +1,65 @@
+"""Tests for DOMMutationTracker, the mutation counter behind incremental DOM snapshots."""
+
+from types import SimpleNamespace
+
+from browser_use.dom.mutation_tracker import DOM_MUTATION_EVENTS, DOMMutationTracker
+
+
+class _FakeDOMRegister:
+	def __init__(self):
+		self.handlers = {}
+
+	def __getattr__(self, name):
+		if name not in DOM_MUTATION_EVENTS:
+			raise AttributeError(name)
+		return lambda callback: self.handlers.__setitem__(name, callback)
+
+
+class _FakeDOMSend:
+	def __init__(self):
+		self.enabled_sessions = []
+
+	async def enable(self, session_id=None):
+		self.enabled_sessions.append(session_id)
+
+
+def _make_cdp_session(client, session_id: str):
+	return SimpleNamespace(cdp_client=client, session_id=session_id, target_id=f'target-{session_id}')
+
+
+def _make_client():
+	return SimpleNamespace(register=SimpleNamespace(DOM=_FakeDOMRegister()), send=SimpleNamespace(DOM=_FakeDOMSend()))
+
+
+async def test_watch_registers_handlers_and_enables_dom_once():
+	client = _make_client()
+	tracker = DOMMutationTracker()
+
+	await tracker.watch(_make_cdp_session(client, 'session-a'))  # type: ignore[arg-type]
+	await tracker.watch(_make_cdp_session(client, 'session-a'))  # type: ignore[arg-type]
+	await tracker.watch(_make_cdp_session(client, 'session-b'))  # type: ignore[arg-type]
+
+	assert set(client.register.DOM.handlers) == set(DOM_MUTATION_EVENTS)
+	assert client.send.DOM.enabled_sessions == ['session-a', 'session-b']
+
+
+async def test_mutations_invalidate_only_their_session():
+	client = _make_client()
+	tracker = DOMMutationTracker()
+	await tracker.watch(_make_cdp_session(client, 'session-a'))  # type: ignore[arg-type]
+	await tracker.watch(_make_cdp_session(client, 'session-b'))  # type: ignore[arg-type]
+
+	recorded_a = {'session-a': tracker.mutation_count('session-a')}
+	recorded_b = {'session-b': tracker.mutation_count('session-b')}
+	assert tracker.is_unchanged(recorded_a)
+	assert tracker.is_unchanged(recorded_b)
+
+	client.register.DOM.handlers['attributeModified']({'nodeId': 5, 'name': 'class', 'value': 'open'}, 'session-a')
+
+	assert not tracker.is_unchanged(recorded_a)
+	assert tracker.is_unchanged(recorded_b)
+
+
+async def test_unwatched_session_is_never_reported_unchanged():
+	tracker = DOMMutationTracker()
+	assert not tracker.is_unchanged({'never-watched': 0})
@@ -0,0 +1,176 @@
+"""Tests for map-reduce extraction over all markdown chunks (extract with all_chunks=True)."""
+
+import asyncio
+import json
+import logging
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.dom import markdown_extractor
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.views import ChatInvokeCompletion
+from browser_use.tools.extraction.merge import merge_structured_results, merge_text_results
+from browser_use.tools.service import Tools
+
+PRODUCT_COUNT = 12000
+SCHEMA = {
+	'type': 'object',
+	'properties': {
+		'store': {'type': 'string'},
+		'products': {
+			'type': 'array',
+			'items': {
+				'type': 'object',
+				'properties': {'name': {'type': 'string'}, 'price': {'type': 'number'}},
+				'required': ['name', 'price'],
+			},
+		},
+	},
+	'required': ['store', 'products'],
+}
+
+
+def _page_markdown() -> str:
+	rows = '\n\n'.join(f'Product {i:05d} costs ${i}.99 and is described in some detail here.' for i in range(PRODUCT_COUNT))
+	return f'# Store\n\n{rows}\n'
+
+
+class FakeExtractionLLM:
+	"""Extraction LLM that 'extracts' every product line of the chunk it is given, tracking concurrency."""
+
+	model = 'fake-extraction-llm'
+	provider = 'fake'
+
+	def __init__(self, fail_on_call: int | None = None):
+		self.calls = 0
+		self.active = 0
+		self.max_active = 0
+		self.fail_on_call = fail_on_call
+
+	async def ainvoke(self, messages, output_format=None, **kwargs):
+		self.calls += 1
+		call = self.calls
+		self.active += 1
+		self.max_active = max(self.max_active, self.active)
+		try:
+			await asyncio.sleep(0.01)
+			if call == self.fail_on_call:
+				raise TimeoutError('extraction timed out')
+			page = messages[1].text.split('<webpage_content>')[1]
+			products = re.findall(r'(Product \d+) costs \$(\d+\.\d+)', page)
+			if output_format is not None:
+				data = {
+					'store': 'Store' if '# Store' in page else '',
+					'products': [{'name': n, 'price': float(p)} for n, p in products],
+				}
+				return ChatInvokeCompletion(completion=output_format.model_validate(data), usage=None)
+			return ChatInvokeCompletion(completion='\n'.join(f'- {n}: ${p}' for n, p in products), usage=None)
+		finally:
+			self.active -= 1
+
+
+@pytest.fixture
+def page(monkeypatch):
+	content = _page_markdown()
+
+	async def fake_extract_clean_markdown(browser_session, extract_links=False, **kwargs):
+		stats = {
+			'original_html_chars': len(content) * 2,
+			'initial_markdown_chars': len(content),
+			'final_filtered_chars': len(content),
+			'filtered_chars_removed': 0,
+		}
+		return content, stats
+
+	monkeypatch.setattr(markdown_extractor, 'extract_clean_markdown', fake_extract_clean_markdown)
+
+	async def get_current_page_url():
+		return 'https://store.example/products'
+
+	return SimpleNamespace(get_current_page_url=get_current_page_url, cdp_client=None, logger=logging.getLogger(__name__))
+
+
+def _structured_result(extracted_content: str) -> dict:
+	return json.loads(extracted_content.split('<structured_result>\n')[1].split('\n</structured_result>')[0])
+
+
+def test_merge_structured_results():
+	merged = merge_structured_results(
+		[
+			{'title': '', 'items': [{'id': 1}, {'id': 2}], 'meta': {'page': 1, 'tags': ['a']}},
+			{'title': 'Shop', 'items': [{'id': 2}, {'id': 3}], 'meta': {'page': 2, 'tags': ['a', 'b']}, 'extra': None},
+		]
+	)
+	assert merged == {
+		'title': 'Shop',
+		'items': [{'id': 1}, {'id': 2}, {'id': 3}],
+		'meta': {'page': 1, 'tags': ['a', 'b']},
+		'extra': None,
+	}
+
+
+def test_merge_text_results():
+	merged = merge_text_results(
+		[
+			'Products found:\n- A: $1\n- B: $2',
+			'Products found:\n- A: $1\n- B: $2\n\n- B: $2\n- C: $3\n\n| A | 1 |\n| B | 2 |',
+			'| B | 2 |\n| D | 4 |',
+		]
+	)
+	assert merged == 'Products found:\n- A: $1\n- B: $2\n\n- C: $3\n\n| A | 1 |\n| B | 2 |\n\n| D | 4 |'
+
+
+async def test_all_chunks_structured_extraction_is_merged(page, tmp_path):
+	llm = FakeExtractionLLM()
+	result = await Tools().extract(
+		query='List all products',
+		output_schema=SCHEMA,
+		all_chunks=True,
+		browser_session=page,
+		page_extraction_llm=llm,
+		file_system=FileSystem(tmp_path),
+	)
+
+	assert llm.calls > 1
+	assert llm.max_active == 4  # bounded by the concurrency limit
+	assert result.metadata is not None
+	data = result.metadata['extraction_result']['data']
+	assert data['store'] == 'Store'
+	assert [product['name'] for product in data['products']] == [f'Product {i:05d}' for i in range(PRODUCT_COUNT)]
+	assert result.metadata['extraction_result']['is_partial'] is False
+	assert result.metadata['extraction_result']['content_stats']['chunks_extracted'] == llm.calls
+	assert result.extracted_content is not None
+	assert _structured_result(result.extracted_content) == data
+
+
+async def test_default_extracts_only_first_chunk(page, tmp_path):
+	llm = FakeExtractionLLM()
+	result = await Tools().extract(
+		query='List all products',
+		browser_session=page,
+		page_extraction_llm=llm,
+		file_system=FileSystem(tmp_path),
+	)
+
+	assert llm.calls == 1
+	assert result.extracted_content is not None
+	assert 'Product 00000' in result.extracted_content
+	assert f'Product {PRODUCT_COUNT - 1:05d}' not in result.extracted_content
+
+
+async def test_failed_chunk_marks_result_partial(page, tmp_path):
+	llm = FakeExtractionLLM(fail_on_call=2)
+	result = await Tools().extract(
+		query='List all products',
+		all_chunks=True,
+		browser_session=page,
+		page_extraction_llm=llm,
+		file_system=FileSystem(tmp_path),
+	)
+
+	assert result.error is None
+	assert result.extracted_content is not None
+	assert 'Product 00000' in result.extracted_content
+	assert 'Extraction of chunk 2 failed, use start_from_char=' in result.extracted_content
@@ -0,0 +1,111 @@
+"""Tests for HarRecordingWatchdog spooling finished entries to disk instead of buffering the whole session."""
+
+import base64
+import json
+from types import SimpleNamespace
+
+from bubus import EventBus
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.events import BrowserConnectedEvent, BrowserStopEvent
+from browser_use.browser.watchdogs.har_recording_watchdog import HarRecordingWatchdog
+
+BODIES = {'small': b'hello', 'large': b'x' * 2048}
+
+
+class _Recorder:
+	"""Stands in for cdp_client.register / cdp_client.send, remembering handlers and answering commands."""
+
+	def __init__(self, handlers):
+		self.handlers = handlers
+
+	def __getattr__(self, domain):
+		async def command(params=None, session_id=None):
+			if params and 'requestId' in params:
+				return {'body': base64.b64encode(BODIES[params['requestId']]).decode(), 'base64Encoded': True}
+			return {'product': 'Chrome/1', 'jsVersion': '1'}
+
+		def register(handler):
+			self.handlers[handler.__name__] = handler
+
+		events = ('requestWillBeSent', 'responseReceived', 'dataReceived', 'loadingFinished', 'loadingFailed')
+		events += ('lifecycleEvent', 'frameNavigated')
+		commands = ('enable', 'getVersion', 'getResponseBody')
+		return SimpleNamespace(**{name: register for name in events}, **{name: command for name in commands})
+
+
+async def _start_recording(tmp_path, **profile_kwargs):
+	har_path = tmp_path / 'session.har'
+	session = BrowserSession(browser_profile=BrowserProfile(record_har_path=har_path, user_data_dir=None, **profile_kwargs))
+	handlers = {}
+	client = SimpleNamespace(register=_Recorder(handlers), send=_Recorder(handlers))
+	session._cdp_client_root = client  # type: ignore[assignment]
+
+	async def get_or_create_cdp_session(*args, **kwargs):
+		return SimpleNamespace(cdp_client=client, session_id='session-1')
+
+	object.__setattr__(session, 'get_or_create_cdp_session', get_or_create_cdp_session)
+	watchdog = HarRecordingWatchdog(browser_session=session, event_bus=EventBus())
+	await watchdog.on_BrowserConnectedEvent(BrowserConnectedEvent(cdp_url='ws://fake'))
+	# request lifecycle events reach the watchdog through the session's network tracker
+	for subscribers in session.network_tracker._subscribers.values():
+		handlers.update({callback.__name__: callback for callback in subscribers.values()})
+	return watchdog, handlers, har_path
+
+
+def _request(handlers, request_id):
+	handlers['_on_request_will_be_sent'](
+		{
+			'requestId': request_id,
+			'request': {'url': f'https://example.com/{request_id}', 'method': 'GET', 'headers': {}},
+			'timestamp': 1.0,
+			'wallTime': 1700000000.0,
+			'type': 'Fetch',
+		},
+		'session-1',
+	)
+	handlers['_on_response_received'](
+		{'requestId': request_id, 'response': {'status': 200, 'headers': {}, 'mimeType': 'text/plain'}, 'timestamp': 1.1},
+		'session-1',
+	)
+
+
+async def test_finished_entries_are_spooled_before_stop(tmp_path):
+	watchdog, handlers, har_path = await _start_recording(tmp_path)
+
+	_request(handlers, 'small')
+	handlers['_on_loading_finished']({'requestId': 'small', 'timestamp': 1.2, 'encodedDataLength': 5}, 'session-1')
+	await next(iter(watchdog._finish_tasks))
+
+	spooled = [json.loads(line) for line in watchdog._spool_path.read_text().splitlines()]
+	assert [entry['request']['url'] for entry in spooled] == ['https://example.com/small']
+	assert spooled[0]['response']['content']['text'] == 'hello'
+	assert watchdog._entries == {}
+
+	_request(handlers, 'in-flight')
+	await watchdog.on_BrowserStopEvent(BrowserStopEvent())
+
+	har = json.loads(har_path.read_text())
+	assert [entry['request']['url'] for entry in har['log']['entries']] == [
+		'https://example.com/small',
+		'https://example.com/in-flight',
+	]
+	assert har['log']['browser'] == {'name': 'Chrome/1', 'version': '1'}
+	assert not watchdog._spool_path.exists()
+
+
+async def test_body_size_cap_and_spill_to_disk(tmp_path):
+	watchdog, handlers, har_path = await _start_recording(tmp_path, record_har_max_body_size=1024, record_har_embed_limit=4)
+
+	for request_id in BODIES:
+		_request(handlers, request_id)
+		handlers['_on_loading_finished']({'requestId': request_id, 'timestamp': 1.2}, 'session-1')
+	await watchdog.on_BrowserStopEvent(BrowserStopEvent())
+
+	entries = {
+		entry['request']['url']: entry['response']['content'] for entry in json.loads(har_path.read_text())['log']['entries']
+	}
+	small, large = entries['https://example.com/small'], entries['https://example.com/large']
+
+	assert 'text' not in small and (tmp_path / 'session_har_parts' / small['_file']).read_bytes() == b'hello'
+	assert large['size'] == 2048 and 'text' not in large and '_file' not in large
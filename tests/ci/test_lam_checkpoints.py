@@ -0,0 +1,74 @@
+"""Tests for LAM runs checkpointing to SQLite and resuming from their last completed step."""
+
+from browser_use.lam.orchestrator import LAMOrchestrator
+
+
+class _FakePlanner:
+	def __init__(self):
+		self.calls = 0
+
+	async def plan_task(self, request):
+		self.calls += 1
+		return [{'description': 'open site'}, {'description': 'read price'}]
+
+
+class _FakeExecutor:
+	def __init__(self):
+		self.executed = []
+
+	def reset(self):
+		pass
+
+	async def execute_step(self, step, browser=None):
+		self.executed.append(step['description'])
+		return {'step': step['description'], 'outcome': 'Success', 'result': 'ok', 'screenshot_path': None}
+
+
+class _FakeSummarizer:
+	async def summarize_results(self, results, request):
+		return f'{len(results)} steps'
+
+
+def _make_orchestrator(monkeypatch, checkpoint_path) -> LAMOrchestrator:
+	monkeypatch.setenv('OPENAI_API_KEY', 'test')
+	orchestrator = LAMOrchestrator(browser=object(), checkpoint_path=checkpoint_path)  # type: ignore[arg-type]
+	orchestrator.planner = _FakePlanner()  # type: ignore[assignment]
+	orchestrator.executor = _FakeExecutor()  # type: ignore[assignment]
+	orchestrator.summarizer = _FakeSummarizer()  # type: ignore[assignment]
+	return orchestrator
+
+
+async def test_run_is_resumed_from_its_checkpoint_by_a_new_orchestrator(monkeypatch, tmp_path):
+	checkpoint_path = tmp_path / 'checkpoints.sqlite'
+
+	first = _make_orchestrator(monkeypatch, checkpoint_path)
+	events = [event async for event in first.run('compare prices', thread_id='run-1')]
+	await first.close()
+
+	# the run stops at the approval gate right after planning
+	assert [next(iter(event)) for event in events] == ['planner', '__interrupt__']
+	assert checkpoint_path.exists()
+
+	# e.g. after a server restart
+	second = _make_orchestrator(monkeypatch, checkpoint_path)
+	events = [event async for event in second.resume('run-1')]
+	while 'summarizer' not in events[-1]:
+		events = [event async for event in second.resume('run-1')]
+	await second.close()
+
+	assert second.planner.calls == 0  # type: ignore[attr-defined]
+	assert second.executor.executed == ['open site', 'read price']  # type: ignore[attr-defined]
+	assert 'summarizer' in events[-1]
+
+
+async def test_resume_of_unknown_run_raises(monkeypatch, tmp_path):
+	orchestrator = _make_orchestrator(monkeypatch, tmp_path / 'checkpoints.sqlite')
+
+	try:
+		events = [event async for event in orchestrator.resume('missing')]
+	except ValueError as e:
+		assert 'missing' in str(e)
+	else:
+		raise AssertionError(f'expected ValueError, got {events}')
+	finally:
+		await orchestrator.close()
@@ -0,0 +1,77 @@
+"""Tests for LogicExecutor reusing one Agent across the plan steps of a run."""
+
+from types import SimpleNamespace
+
+import browser_use.lam.executor as executor_module
+from browser_use.lam.executor import LogicExecutor
+
+
+class _FakeAgent:
+	created: list['_FakeAgent'] = []
+
+	def __init__(self, task, llm, browser, use_vision):
+		self.tasks = [task]
+		self.browser = browser
+		self.run_budgets = []
+		self.state = SimpleNamespace(n_steps=1)
+		_FakeAgent.created.append(self)
+
+	def add_new_task(self, task):
+		self.tasks.append(task)
+
+	async def run(self, max_steps=500):
+		self.run_budgets.append(max_steps)
+		self.state.n_steps += 3  # pretend every task takes three steps
+		if 'explode' in self.tasks[-1]:
+			raise RuntimeError('boom')
+		result = SimpleNamespace(extracted_content=f'done: {self.tasks[-1]}')
+		state = SimpleNamespace(screenshot_path=f'/tmp/step_{self.state.n_steps}.png')
+		return SimpleNamespace(history=[SimpleNamespace(result=[result], state=state)])
+
+
+def _make_executor(monkeypatch) -> LogicExecutor:
+	_FakeAgent.created = []
+	monkeypatch.setattr(executor_module, 'Agent', _FakeAgent)
+	monkeypatch.setenv('OPENAI_API_KEY', 'test')
+	return LogicExecutor(browser=object(), model_name='gpt-4o', max_steps_per_plan_step=10)  # type: ignore[arg-type]
+
+
+async def test_steps_share_one_agent_with_relative_step_budget(monkeypatch):
+	executor = _make_executor(monkeypatch)
+
+	first = await executor.execute_step({'description': 'open site'})
+	second = await executor.execute_step({'description': 'read price'})
+
+	assert len(_FakeAgent.created) == 1
+	agent = _FakeAgent.created[0]
+	assert len(agent.tasks) == 2 and 'read price' in agent.tasks[1]
+	assert agent.run_budgets == [10, 13]
+	assert first['outcome'] == second['outcome'] == 'Success'
+	assert 'read price' in second['result']
+	assert second['screenshot_path'] == '/tmp/step_7.png'
+
+
+async def test_failed_step_and_reset_start_a_fresh_agent(monkeypatch):
+	executor = _make_executor(monkeypatch)
+
+	await executor.execute_step({'description': 'open site'})
+	failed = await executor.execute_step({'description': 'explode'})
+	await executor.execute_step({'description': 'retry'})
+	executor.reset()
+	await executor.execute_step({'description': 'next run'})
+
+	assert failed['outcome'] == 'Failed'
+	assert len(_FakeAgent.created) == 3
+
+
+async def test_step_on_other_browser_gets_its_own_agent(monkeypatch):
+	executor = _make_executor(monkeypatch)
+	other_browser = object()
+
+	await executor.execute_step({'description': 'main'})
+	await executor.execute_step({'description': 'parallel'}, browser=other_browser)  # type: ignore[arg-type]
+	await executor.execute_step({'description': 'main again'})
+
+	assert len(_FakeAgent.created) == 2
+	assert _FakeAgent.created[1].browser is other_browser
+	assert len(_FakeAgent.created[0].tasks) == 2
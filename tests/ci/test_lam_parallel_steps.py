@@ -0,0 +1,80 @@
+"""Tests for dependency-aware batching of LAM plan steps."""
+
+import os
+
+import pytest
+
+from browser_use import Browser
+from browser_use.lam.orchestrator import LAMOrchestrator
+from browser_use.lam.planner import CognitivePlanner
+
+
+def _step(description: str, **extra):
+	return {'description': description, 'action_type': 'extract', 'details': {}, **extra}
+
+
+def test_normalize_dependencies_defaults_to_sequential():
+	plan = CognitivePlanner.normalize_dependencies(
+		[
+			_step('open site'),
+			_step('search', depends_on='previous'),
+			_step('price on A', depends_on=[]),
+			_step('compare', depends_on=[2, 1, 7, -1, 'x', 3]),
+		]
+	)
+
+	assert [step['depends_on'] for step in plan] == [[], [0], [], [1, 2]]
+
+
+def test_independent_steps_are_batched_up_to_the_limit():
+	plan = CognitivePlanner.normalize_dependencies(
+		[
+			_step('price on A', depends_on=[]),
+			_step('price on B', depends_on=[]),
+			_step('price on C', depends_on=[]),
+			_step('price on D', depends_on=[]),
+			_step('compare', depends_on=[0, 1, 2, 3]),
+		]
+	)
+
+	assert LAMOrchestrator._next_parallel_batch(plan, 0, max_size=3) == [0, 1, 2]
+	assert LAMOrchestrator._next_parallel_batch(plan, 3, max_size=3) == [3]
+	assert LAMOrchestrator._next_parallel_batch(plan, 4, max_size=3) == [4]
+
+
+def test_steps_without_dependency_info_run_one_at_a_time():
+	plan = [_step('first'), _step('second'), _step('third')]
+
+	assert LAMOrchestrator._next_parallel_batch(plan, 0, max_size=3) == [0]
+	assert LAMOrchestrator._next_parallel_batch(plan, 1, max_size=3) == [1]
+
+
+def _is_dir(path: str) -> bool:
+	return os.path.isdir(path)
+
+
+async def test_parallel_step_profile_dirs_are_removed(monkeypatch):
+	monkeypatch.setenv('OPENAI_API_KEY', 'test')
+	orchestrator = LAMOrchestrator(browser=Browser(headless=True))
+	profile_dirs: list[str] = []
+
+	class _Executor:
+		async def execute_step(self, step, browser=None):
+			if browser is not None:
+				profile_dir = str(browser.browser_profile.user_data_dir)
+				assert _is_dir(profile_dir)
+				profile_dirs.append(profile_dir)
+				if step['description'] == 'fails':
+					raise RuntimeError('step failed')
+			return {'step': step, 'outcome': 'Success'}
+
+	orchestrator.executor = _Executor()  # type: ignore[assignment]
+	results = await orchestrator._execute_parallel([_step('main'), _step('price on B'), _step('price on C')])
+	assert [result['outcome'] for result in results] == ['Success'] * 3
+
+	with pytest.raises(RuntimeError):
+		await orchestrator._execute_parallel([_step('main'), _step('fails')])
+
+	assert len(profile_dirs) == 3
+	assert not any(_is_dir(profile_dir) for profile_dir in profile_dirs)
+	assert orchestrator._spawned_profile_dirs == {}
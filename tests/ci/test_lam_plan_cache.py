@@ -0,0 +1,91 @@
+"""Tests for reusing LAM plans across commands that only differ in their parameters."""
+
+import json
+import time
+
+from browser_use.lam.plan_cache import PlanCache
+from browser_use.lam.planner import CognitivePlanner
+
+
+def _plan(product: str, site: str):
+	return [
+		{
+			'description': f'Navigate to {site}',
+			'action_type': 'navigate',
+			'details': {'url': f'https://{site}'},
+			'depends_on': [],
+		},
+		{'description': f'Search for "{product}"', 'action_type': 'fill', 'details': {'value': product}, 'depends_on': [0]},
+	]
+
+
+def test_normalize_extracts_parameters():
+	template, params = PlanCache.normalize('  Check the price of "iPhone 15" on amazon.com,  quantity 2. ')
+
+	assert template == 'check the price of ⟦0⟧ on ⟦1⟧, quantity ⟦2⟧'
+	assert params == ['iPhone 15', 'amazon.com', '2']
+
+
+def test_cached_plan_is_filled_with_new_parameters_and_survives_restart(tmp_path):
+	cache = PlanCache(tmp_path)
+	assert cache.put('Check the price of "iPhone 15" on amazon.com', _plan('iPhone 15', 'amazon.com'))
+
+	reloaded = PlanCache(tmp_path)
+	plan = reloaded.get('check the price of "Pixel 9"  on bestbuy.com', namespace='')
+
+	assert plan == _plan('Pixel 9', 'bestbuy.com')
+	assert reloaded.get('Check the stock of "Pixel 9" on bestbuy.com') is None
+	assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+
+def test_plan_missing_a_parameter_is_not_cached(tmp_path):
+	cache = PlanCache(tmp_path)
+	plan = [{'description': 'Navigate to the store', 'details': {}, 'depends_on': []}]
+
+	assert not cache.put('Open "Acme" store', plan)
+	assert cache.get('Open "Acme" store') is None
+
+
+def test_expired_and_invalidated_plans_are_dropped(tmp_path):
+	cache = PlanCache(tmp_path, ttl=60)
+	cache.put('Open amazon.com', _plan('x', 'amazon.com')[:1])
+	cache.invalidate('Open bestbuy.com')
+	assert cache.get('Open amazon.com') is None
+	assert list(tmp_path.iterdir()) == []
+
+	cache.put('Open amazon.com', _plan('x', 'amazon.com')[:1])
+	for entry in cache._entries.values():
+		entry['created_at'] = time.time() - 61
+	assert cache.get('Open amazon.com') is None
+
+
+def test_lru_keeps_most_recently_used_entries_in_memory():
+	cache = PlanCache(None, max_entries=2)
+	cache.put('Open a.com', _plan('x', 'a.com')[:1])
+	cache.put('Log in to b.com', _plan('x', 'b.com')[:1])
+	assert cache.get('Open c.com') is not None  # same template as "Open a.com", now most recently used
+	cache.put('Search "x" on d.com', _plan('x', 'd.com'))
+
+	assert cache.get('Open a.com') is not None
+	assert cache.get('Log in to b.com') is None
+
+
+async def test_planner_skips_llm_on_cache_hit(monkeypatch, tmp_path):
+	monkeypatch.setenv('OPENAI_API_KEY', 'test')
+	planner = CognitivePlanner('gpt-4o', plan_cache=PlanCache(tmp_path))
+	calls = []
+
+	async def ainvoke(messages):
+		calls.append(messages)
+		return type('Response', (), {'content': json.dumps(_plan('iPhone 15', 'amazon.com'))})()
+
+	monkeypatch.setattr(planner, 'llm', type('LLM', (), {'ainvoke': staticmethod(ainvoke)})())
+
+	await planner.plan_task('Check the price of "iPhone 15" on amazon.com')
+	plan = await planner.plan_task('Check the price of "Pixel 9" on bestbuy.com')
+	assert len(calls) == 1
+	assert plan[1]['details'] == {'value': 'Pixel 9'}
+
+	planner.invalidate_plan('Check the price of "Galaxy" on ebay.com')
+	await planner.plan_task('Check the price of "Pixel 9" on bestbuy.com')
+	assert len(calls) == 2
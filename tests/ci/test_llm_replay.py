@@ -0,0 +1,182 @@
+"""Tests for ChatRecordReplay, the record/replay cache wrapper for chat models."""
+
+import base64
+import io
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from PIL import Image
+from pydantic import BaseModel
+
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.views import AgentOutput, AgentStepInfo
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm import BaseChatModel, ChatRecordReplay, SystemMessage, UserMessage
+from browser_use.llm.exceptions import ModelReplayMissError
+from browser_use.llm.messages import ContentPartImageParam
+from browser_use.llm.streaming import JSONArrayItemParser
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+from browser_use.tools.service import Tools
+
+_USAGE = ChatInvokeUsage(
+	prompt_tokens=100,
+	prompt_cached_tokens=None,
+	prompt_cache_creation_tokens=None,
+	prompt_image_tokens=None,
+	completion_tokens=20,
+	total_tokens=120,
+)
+
+
+class _Answer(BaseModel):
+	answer: str
+
+
+def _mock_llm(model: str = 'mock-llm') -> BaseChatModel:
+	llm = AsyncMock(spec=BaseChatModel)
+	llm.model = llm.name = llm.model_name = model
+	llm.provider = 'mock'
+
+	async def mock_ainvoke(messages, output_format=None, **kwargs):
+		if output_format is None:
+			return ChatInvokeCompletion(completion=f'echo: {messages[-1].text}', usage=_USAGE, stop_reason='stop')
+		return ChatInvokeCompletion(completion=output_format.model_validate({'answer': messages[-1].text}), usage=_USAGE)
+
+	llm.ainvoke.side_effect = mock_ainvoke
+	return llm
+
+
+async def test_record_then_replay(tmp_path):
+	path = tmp_path / 'replay.sqlite'
+	inner = _mock_llm()
+	llm = ChatRecordReplay(llm=inner, path=path)
+	messages = [SystemMessage(content='be brief'), UserMessage(content='hello')]
+
+	first = await llm.ainvoke(messages)
+	second = await llm.ainvoke(messages)
+	assert first.completion == second.completion == 'echo: hello'
+	assert first.usage == _USAGE and second.usage is None  # replays spend no tokens
+	assert second.stop_reason == 'stop'
+	assert inner.ainvoke.call_count == 1
+	assert (llm.hits, llm.misses) == (1, 1)
+
+	structured = await llm.ainvoke(messages, _Answer)
+	assert structured.completion == _Answer(answer='hello')
+	assert inner.ainvoke.call_count == 2  # the output format is part of the key
+	llm.close()
+
+	# a later, offline run replays from the same file
+	offline_inner = _mock_llm()
+	offline = ChatRecordReplay(llm=offline_inner, path=path, mode='replay')
+	assert (await offline.ainvoke(messages, _Answer)).completion == _Answer(answer='hello')
+	with pytest.raises(ModelReplayMissError):
+		await offline.ainvoke([UserMessage(content='something new')])
+	assert offline_inner.ainvoke.call_count == 0
+	offline.close()
+
+
+async def test_passthrough_does_not_touch_the_store(tmp_path):
+	inner = _mock_llm()
+	llm = ChatRecordReplay(llm=inner, path=tmp_path / 'replay.sqlite', mode='passthrough')
+	for _ in range(2):
+		await llm.ainvoke([UserMessage(content='hello')])
+	assert inner.ainvoke.call_count == 2
+	assert not (tmp_path / 'replay.sqlite').exists()
+
+	with pytest.raises(ValueError):
+		ChatRecordReplay(llm=inner, path=tmp_path / 'replay.sqlite', mode='offline')  # type: ignore[arg-type]
+
+
+def test_request_key(tmp_path):
+	llm = ChatRecordReplay(llm=_mock_llm(), path=tmp_path / 'replay.sqlite')
+
+	def key(text: str, output_format=None, model: ChatRecordReplay = llm) -> str:
+		return model.request_key([UserMessage(content=text)], output_format)
+
+	assert key('Step1 maximum:10\nToday:2026-01-01') == key('Step1 maximum:10\nToday:2026-10-18')
+	assert key('Step1') != key('Step2')
+	assert key('hello') != key('hello', _Answer)
+	other_model = ChatRecordReplay(llm=_mock_llm('other-llm'), path=tmp_path / 'replay.sqlite')
+	assert key('hello') != key('hello', model=other_model)
+
+
+async def test_agent_output_round_trips_with_only_the_chosen_actions(tmp_path):
+	ActionModel = Tools().registry.create_action_model()
+	AgentOutputWithActions = AgentOutput.type_with_custom_actions(ActionModel)
+	output_json = json.dumps(
+		{
+			'thinking': 't',
+			'evaluation_previous_goal': 'e',
+			'memory': 'm',
+			'next_goal': 'n',
+			'action': [{'click': {'index': 3}}, {'input': {'index': 4, 'text': 'hi'}}],
+		}
+	)
+
+	inner = AsyncMock(spec=BaseChatModel)
+	inner.model = inner.name = 'mock-llm'
+	inner.provider = 'mock'
+	inner.ainvoke.return_value = ChatInvokeCompletion(
+		completion=AgentOutputWithActions.model_validate_json(output_json), usage=None
+	)
+	llm = ChatRecordReplay(llm=inner, path=tmp_path / 'replay.sqlite')
+	messages = [UserMessage(content='fill the form')]
+	recorded = await llm.ainvoke(messages, AgentOutputWithActions)
+
+	parser = JSONArrayItemParser('action')
+	streamed: list = []
+	replayed = await llm.ainvoke(
+		messages, AgentOutputWithActions, on_output_delta=lambda delta: streamed.extend(parser.feed(delta))
+	)
+
+	assert [action.model_dump(exclude_unset=True) for action in replayed.completion.action] == [
+		action.model_dump(exclude_unset=True) for action in recorded.completion.action
+	]
+	assert streamed == [{'click': {'index': 3}}, {'input': {'index': 4, 'text': 'hi'}}]
+
+
+def _state_messages(tmp_path, target_ids: list[str], screenshot_color: str) -> list:
+	"""The messages the agent sends for its first step on example.com, in a browser with the given tab IDs."""
+	buffer = io.BytesIO()
+	Image.new('RGB', (8, 8), screenshot_color).save(buffer, format='PNG')
+	browser_state = BrowserStateSummary(
+		url='https://example.com/',
+		title='Example Domain',
+		tabs=[
+			TabInfo(target_id=target_ids[0], url='https://example.com/', title='Example Domain'),
+			TabInfo(target_id=target_ids[1], url='about:blank', title='New Tab'),
+		],
+		screenshot=base64.b64encode(buffer.getvalue()).decode(),
+		dom_state=SerializedDOMState(_root=None, selector_map={}),
+	)
+	message_manager = MessageManager(
+		task='Find the heading', system_message=SystemMessage(content='system'), file_system=FileSystem(tmp_path)
+	)
+	message_manager.create_state_messages(browser_state, step_info=AgentStepInfo(step_number=0, max_steps=10))
+	return message_manager.get_messages()
+
+
+async def test_agent_state_replays_in_a_new_browser_session(tmp_path):
+	path = tmp_path / 'replay.sqlite'
+	first_session = _state_messages(
+		tmp_path / 'run1', ['A1B2C3D4E5F60718293A4B5C6D7E8F90', 'FF00112233445566778899AABBCC0DE1'], 'white'
+	)
+	second_session = _state_messages(
+		tmp_path / 'run2', ['0F1E2D3C4B5A69788796A5B4C3D2E1F0', '99887766554433221100FFEEDDCC9A2B'], 'black'
+	)
+	assert 'Tab 8F90: https://example.com/' in first_session[-1].text
+	assert any(isinstance(part, ContentPartImageParam) for part in first_session[-1].content)
+
+	recorder = ChatRecordReplay(llm=_mock_llm(), path=path)
+	recorded = await recorder.ainvoke(first_session, _Answer)
+	recorder.close()
+
+	offline = ChatRecordReplay(llm=_mock_llm(), path=path, mode='replay')
+	assert (await offline.ainvoke(second_session, _Answer)).completion == recorded.completion
+
+	strict = ChatRecordReplay(llm=_mock_llm(), path=path, ignore_patterns=(), ignore_images=False)
+	assert strict.request_key(first_session, _Answer) != strict.request_key(second_session, _Answer)
+	offline.close()
@@ -257,6 +257,47 @@ class TestChunkMarkdownMixed:
 		assert chunks[0].content == big_para
 
 
+class TestChunkMarkdownBoundaryCache:
+	"""Chunk boundaries are cached per content, continuations don't re-parse."""
+
+	def test_continuation_reuses_cached_boundaries(self, monkeypatch):
+		from browser_use.dom import markdown_extractor
+
+		parse_calls = 0
+		original_parse = markdown_extractor._parse_atomic_blocks
+
+		def counting_parse(content):
+			nonlocal parse_calls
+			parse_calls += 1
+			return original_parse(content)
+
+		monkeypatch.setattr(markdown_extractor, '_parse_atomic_blocks', counting_parse)
+
+		content = '\n\n'.join(f'## Section {i}\n\nBoundary cache paragraph {i}.' for i in range(200))
+		all_chunks = chunk_markdown_by_structure(content, max_chunk_chars=500)
+		assert parse_calls == 1
+		assert len(all_chunks) > 3
+
+		for chunk in all_chunks[1:]:
+			continued = chunk_markdown_by_structure(content, max_chunk_chars=500, start_from_char=chunk.char_offset_start)
+			assert continued == all_chunks[chunk.chunk_index :]
+		assert parse_calls == 1
+
+		# A different chunk size or different content is chunked again
+		chunk_markdown_by_structure(content, max_chunk_chars=800)
+		chunk_markdown_by_structure(content + '\n\nOne more paragraph.', max_chunk_chars=500)
+		assert parse_calls == 3
+
+	def test_header_preferred_split_with_many_blocks(self):
+		"""Header-preferred splitting still applies in chunks made of many small blocks."""
+		rows = [f'| {i} | row |' for i in range(2000)]
+		rows[1500:1500] = ['## Late header']
+		content = '\n'.join(rows)
+		chunks = chunk_markdown_by_structure(content, max_chunk_chars=len(content) - 100)
+		assert len(chunks) == 2
+		assert chunks[1].content.startswith('## Late header')
+
+
 # ---------------------------------------------------------------------------
 # HTML → markdown → chunk pipeline tests
 # ---------------------------------------------------------------------------
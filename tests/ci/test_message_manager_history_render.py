@@ -0,0 +1,111 @@
+"""Tests for the incrementally rendered agent history in MessageManager."""
+
+from types import SimpleNamespace
+
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.message_manager.views import HistoryItem
+from browser_use.agent.views import AgentStepInfo, MessageCompactionSettings, MessageManagerState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.messages import SystemMessage
+
+
+def _message_manager(tmp_path, **kwargs) -> MessageManager:
+	return MessageManager(
+		task='Test task',
+		system_message=SystemMessage(content='System message'),
+		state=MessageManagerState(),
+		file_system=FileSystem(tmp_path),
+		**kwargs,
+	)
+
+
+def _add_steps(message_manager: MessageManager, start: int, count: int) -> None:
+	for step in range(start, start + count):
+		message_manager.state.agent_history_items.append(
+			HistoryItem(step_number=step, memory=f'memory {step}', next_goal=f'goal {step}', action_results='Result\nok')
+		)
+
+
+def _full_render(items: list[HistoryItem]) -> str:
+	return '\n'.join(item.to_string() for item in items)
+
+
+def test_each_item_is_rendered_once(tmp_path, monkeypatch):
+	message_manager = _message_manager(tmp_path)
+	calls = 0
+	original_to_string = HistoryItem.to_string
+
+	def counting_to_string(self):
+		nonlocal calls
+		calls += 1
+		return original_to_string(self)
+
+	monkeypatch.setattr(HistoryItem, 'to_string', counting_to_string)
+
+	for step in range(1, 51):
+		_add_steps(message_manager, step, 1)
+		message_manager.agent_history_description
+
+	assert calls == 51  # 50 steps + the initial item
+	monkeypatch.setattr(HistoryItem, 'to_string', original_to_string)
+	assert message_manager.agent_history_description == _full_render(message_manager.state.agent_history_items)
+
+
+def test_max_history_items_and_replaced_state(tmp_path):
+	message_manager = _message_manager(tmp_path, max_history_items=6)
+	_add_steps(message_manager, 1, 20)
+	items = message_manager.state.agent_history_items
+
+	description = message_manager.agent_history_description
+	assert description.startswith(items[0].to_string() + '\n<sys>[... 15 previous steps omitted...]</sys>\n')
+	assert description.endswith(_full_render(items[-5:]))
+
+	# replacing or shrinking the list rebuilds the render
+	message_manager.state.agent_history_items = items[:3]
+	assert message_manager.agent_history_description == _full_render(items[:3])
+	message_manager.state.agent_history_items.pop()
+	assert message_manager.agent_history_description == _full_render(items[:2])
+
+
+async def test_compaction_uses_running_count_and_truncates_render(tmp_path):
+	message_manager = _message_manager(tmp_path)
+	settings = MessageCompactionSettings(compact_every_n_steps=1, trigger_char_count=2000, keep_last_items=3)
+	prompts = []
+
+	async def ainvoke(messages):
+		prompts.append(messages[1].text)
+		return SimpleNamespace(completion='summary of the run')
+
+	llm = SimpleNamespace(ainvoke=ainvoke)
+
+	_add_steps(message_manager, 1, 5)
+	assert not await message_manager.maybe_compact_messages(llm, settings, AgentStepInfo(step_number=5, max_steps=100))  # type: ignore[arg-type]
+
+	_add_steps(message_manager, 6, 60)
+	items = list(message_manager.state.agent_history_items)
+	assert await message_manager.maybe_compact_messages(llm, settings, AgentStepInfo(step_number=65, max_steps=100))  # type: ignore[arg-type]
+
+	assert f'<agent_history>\n{_full_render(items).strip()}\n</agent_history>' in prompts[0]
+	kept = message_manager.state.agent_history_items
+	assert kept == [items[0], *items[-3:]]
+	assert message_manager.agent_history_description == (
+		'<compacted_memory>\nsummary of the run\n</compacted_memory>\n' + _full_render(kept)
+	)
+
+	_add_steps(message_manager, 66, 1)
+	assert message_manager.agent_history_description.endswith(_full_render(message_manager.state.agent_history_items))
+
+
+def test_text_is_joined_lazily_and_char_count_kept_running(tmp_path):
+	message_manager = _message_manager(tmp_path)
+	render = message_manager._rendered_history()
+
+	for step in range(1, 21):
+		_add_steps(message_manager, step, 1)
+		render = message_manager._rendered_history()
+		assert render._text is None  # appending does not copy the history
+		assert render.char_count == len(_full_render(message_manager.state.agent_history_items))
+
+	text = render.text
+	assert text == _full_render(message_manager.state.agent_history_items)
+	assert message_manager._rendered_history().text is text  # cached until the next change
@@ -0,0 +1,127 @@
+"""Tests for the CDP-event-driven NetworkTracker shared by the DOM, crash, HAR and downloads watchdogs."""
+
+import asyncio
+import time
+
+import pytest
+
+from browser_use.browser.network_tracker import STALE_REQUEST_SECONDS, NetworkTracker
+
+SESSIONS = {'session-a': 'target-a', 'session-b': 'target-b'}
+
+
+def _tracker() -> NetworkTracker:
+	return NetworkTracker(lambda session_id: SESSIONS.get(session_id or ''))
+
+
+async def _start(tracker: NetworkTracker, request_id: str, url: str, resource_type: str = 'XHR', session: str = 'session-a'):
+	await tracker._on_request_will_be_sent(
+		{'requestId': request_id, 'request': {'url': url, 'method': 'GET'}, 'type': resource_type}, session
+	)
+
+
+async def _finish(tracker: NetworkTracker, request_id: str, session: str = 'session-a'):
+	await tracker._on_loading_finished({'requestId': request_id}, session)
+
+
+async def test_critical_requests_are_filtered_and_tracked_per_target():
+	tracker = _tracker()
+	await _start(tracker, '1', 'https://example.com/api/items')
+	await _start(tracker, '2', 'https://www.google-analytics.com/collect')
+	await _start(tracker, '3', 'https://example.com/stream', resource_type='EventSource')
+	await _start(tracker, '4', 'data:image/png;base64,AAAA', resource_type='Image')
+	await _start(tracker, '5', 'https://other.com/app.js', resource_type='Script', session='session-b')
+
+	assert [request.request_id for request in tracker.in_flight_critical_requests('target-a')] == ['1']
+	assert [request.request_id for request in tracker.in_flight_critical_requests('target-b')] == ['5']
+	assert len(tracker.in_flight_requests()) == 5
+	assert tracker.network_idle_since('target-a') is None
+
+	# stuck requests stop counting as critical
+	tracker.in_flight_requests('target-a')[0].started_at -= STALE_REQUEST_SECONDS + 1
+	assert tracker.in_flight_critical_requests('target-a') == []
+
+	await _finish(tracker, '5', session='session-b')
+	assert tracker.in_flight_requests('target-b') == []
+	idle_since = tracker.network_idle_since('target-b')
+	assert idle_since is not None and time.monotonic() - idle_since < 1
+	assert tracker.network_idle_since('unknown-target') == 0.0
+
+	tracker.clear_requests('target-a')
+	assert tracker.in_flight_requests('target-a') == []
+
+
+async def test_noise_requests_do_not_reset_idle_time():
+	tracker = _tracker()
+	await _start(tracker, '1', 'https://example.com/page')
+	await _finish(tracker, '1')
+	idle_since = tracker.network_idle_since('target-a')
+
+	await _start(tracker, '2', 'https://stats.example.com/beacon/hit')
+	await tracker._on_loading_failed({'requestId': '2'}, 'session-a')
+	assert tracker.network_idle_since('target-a') == idle_since
+
+
+async def test_wait_for_network_idle_returns_when_requests_finish():
+	tracker = _tracker()
+	await _start(tracker, '1', 'https://example.com/api/slow')
+
+	async def finish_soon():
+		await asyncio.sleep(0.05)
+		await _finish(tracker, '1')
+
+	finisher = asyncio.create_task(finish_soon())
+	start = time.monotonic()
+	assert await tracker.wait_for_network_idle('target-a', quiet_ms=20, max_ms=2000)
+	assert time.monotonic() - start < 0.5
+	await finisher
+
+
+async def test_wait_for_network_idle_times_out_while_busy():
+	tracker = _tracker()
+	await _start(tracker, '1', 'https://example.com/api/slow')
+
+	start = time.monotonic()
+	assert not await tracker.wait_for_network_idle('target-a', quiet_ms=20, max_ms=100)
+	assert 0.09 <= time.monotonic() - start < 0.5
+
+	# an idle target only waits out the remaining quiet period
+	await _finish(tracker, '1')
+	tracker._targets['target-a'].last_activity -= 1
+	start = time.monotonic()
+	assert await tracker.wait_for_network_idle('target-a', quiet_ms=100, max_ms=1000)
+	assert time.monotonic() - start < 0.05
+
+
+async def test_subscribers_receive_events_and_replace_by_name():
+	tracker = _tracker()
+	received = []
+
+	async def har(event, session_id):
+		received.append(('har', event['requestId'], session_id))
+
+	def downloads(event, session_id):
+		received.append(('downloads', event['requestId'], session_id))
+
+	def failing(event, session_id):
+		raise RuntimeError('subscriber bug')
+
+	tracker.subscribe('responseReceived', 'har', har)
+	tracker.subscribe('responseReceived', 'downloads', failing)
+	tracker.subscribe('responseReceived', 'downloads', downloads)
+	tracker.subscribe('loadingFinished', 'failing', failing)
+
+	await tracker._on_response_received({'requestId': '7'}, 'session-b')
+	await tracker._on_loading_finished({'requestId': '7'}, 'session-b')
+	assert received == [('har', '7', 'session-b'), ('downloads', '7', 'session-b')]
+
+	tracker.unsubscribe('responseReceived', 'har')
+	await tracker._on_response_received({'requestId': '8'}, None)
+	assert received[-1] == ('downloads', '8', None)
+
+	with pytest.raises(ValueError):
+		tracker.subscribe('dataReceived', 'har', har)
+
+	tracker.reset()
+	await tracker._on_response_received({'requestId': '9'}, None)
+	assert len(received) == 3
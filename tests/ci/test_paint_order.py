@@ -0,0 +1,107 @@
+"""Tests for paint order filtering: RectUnionGrid must agree with the RectUnionPure reference implementation."""
+
+import random
+
+from browser_use.dom.serializer.paint_order import PaintOrderRemover, Rect, RectUnionGrid, RectUnionPure
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, EnhancedSnapshotNode, NodeType, SimplifiedNode
+
+
+def _random_rects(seed: int, count: int) -> list[Rect]:
+	rng = random.Random(seed)
+	rects = []
+	for _ in range(count):
+		x, y = rng.uniform(-50, 1200), rng.uniform(-50, 3000)
+		# mix of tiny, card-sized and full-width layers, plus zero-area edge cases
+		width, height = rng.choice([(0, 20), (16, 16), (300, 180), (1280, 60), (rng.uniform(0, 600), rng.uniform(0, 400))])
+		rects.append(Rect(x, y, x + width, y + height))
+	return rects
+
+
+def test_grid_union_matches_pure_union():
+	for seed in range(5):
+		pure, grid = RectUnionPure(), RectUnionGrid(cell_size=64)
+		for rect in _random_rects(seed, 250):
+			assert grid.contains(rect) == pure.contains(rect)
+			assert grid.add(rect) == pure.add(rect)
+
+
+def test_touching_rects_cover_across_cell_boundaries():
+	grid = RectUnionGrid(cell_size=100)
+	grid.add(Rect(0, 0, 100, 100))
+	grid.add(Rect(100, 0, 250, 100))
+
+	assert grid.contains(Rect(50, 10, 200, 90))
+	assert grid.contains(Rect(100, 0, 100, 100))  # zero-width rect on the shared edge
+	assert not grid.contains(Rect(50, 10, 260, 90))
+
+
+def test_tall_rects_match_pure_union_without_bucketing_every_cell():
+	pure, grid = RectUnionPure(), RectUnionGrid()
+	rects = [Rect(0, 0, 1920, 1e7), Rect(2000, 0, 2400, 1e7), *_random_rects(0, 200)]
+	for rect in rects:
+		assert grid.contains(rect) == pure.contains(rect)
+		assert grid.add(rect) == pure.add(rect)
+
+	assert grid.contains(Rect(10, 5e6, 1900, 5e6 + 500))
+	assert not grid.contains(Rect(1900, 5e6, 2100, 5e6 + 500))
+	# a document-tall wrapper would span ~300k cells; it must not be bucketed into each of them
+	assert sum(len(bucket) for bucket in grid._cells.values()) < 10_000
+
+
+def _make_painted_node(backend_node_id: int, rect: Rect, paint_order: int, background: str) -> SimplifiedNode:
+	snapshot = EnhancedSnapshotNode(
+		is_clickable=None,
+		cursor_style=None,
+		bounds=DOMRect(x=rect.x1, y=rect.y1, width=rect.x2 - rect.x1, height=rect.y2 - rect.y1),
+		clientRects=None,
+		scrollRects=None,
+		computed_styles={'background-color': background, 'opacity': '1'},
+		paint_order=paint_order,
+		stacking_contexts=None,
+	)
+	original = EnhancedDOMTreeNode(
+		node_id=backend_node_id,
+		backend_node_id=backend_node_id,
+		node_type=NodeType.ELEMENT_NODE,
+		node_name='DIV',
+		node_value='',
+		attributes={},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='target-0',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=snapshot,
+	)
+	return SimplifiedNode(original_node=original, children=[])
+
+
+def _build_tree(seed: int) -> SimplifiedNode:
+	rng = random.Random(seed)
+	children = [
+		_make_painted_node(i + 2, rect, rng.randint(0, 200), rng.choice(['rgb(255, 255, 255)', 'rgba(0, 0, 0, 0)']))
+		for i, rect in enumerate(_random_rects(seed, 250))
+	]
+	root = _make_painted_node(1, Rect(0, 0, 1280, 3000), 0, 'rgb(255, 255, 255)')
+	root.children = children
+	return root
+
+
+def test_paint_order_remover_results_do_not_depend_on_union():
+	for seed in range(3):
+		pure_tree, grid_tree = _build_tree(seed), _build_tree(seed)
+
+		PaintOrderRemover(pure_tree, union_factory=RectUnionPure).calculate_paint_order()
+		PaintOrderRemover(grid_tree).calculate_paint_order()
+
+		pure_ignored = [child.ignored_by_paint_order for child in pure_tree.children]
+		grid_ignored = [child.ignored_by_paint_order for child in grid_tree.children]
+		assert grid_ignored == pure_ignored
+		assert any(pure_ignored)
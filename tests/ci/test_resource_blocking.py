@@ -0,0 +1,125 @@
+"""Tests for lean browsing: the ResourceBlocker decisions and the ResourceBlockingWatchdog's Fetch handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+from bubus import EventBus
+
+from browser_use.browser import BrowserProfile, BrowserSession, LeanBrowsingSettings
+from browser_use.browser.events import BrowserConnectedEvent
+from browser_use.browser.resource_blocking import TRANSPARENT_GIF_BASE64, ResourceBlocker, ResourceBlockingStats
+from browser_use.browser.session import Target
+from browser_use.browser.watchdogs.resource_blocking_watchdog import ResourceBlockingWatchdog
+
+
+def test_blocker_decisions():
+	blocker = ResourceBlocker(
+		LeanBrowsingSettings(blocked_domains=['cdn.example-ads.com'], domain_overrides={'*.maps.example.com': ['Font']})
+	)
+
+	assert blocker.decide('https://shop.example.com/logo.png', 'Image') == 'stub'
+	assert blocker.decide('https://shop.example.com/font.woff2', 'Font') == 'stub'
+	assert blocker.decide('https://shop.example.com/intro.mp4', 'Media') == 'block'  # media is never stubbed
+	assert blocker.decide('https://shop.example.com/app.js', 'Script') is None
+	assert blocker.decide('data:image/png;base64,AAAA', 'Image') is None
+
+	# tracker domains and their subdomains, whatever the resource type
+	assert blocker.decide('https://www.google-analytics.com/g/collect?v=2', 'Ping') == 'block'
+	assert blocker.decide('https://securepubads.g.doubleclick.net/tag/js/gpt.js', 'Script') == 'block'
+	assert blocker.decide('https://cdn.example-ads.com/banner.js', 'Script') == 'block'
+	assert blocker.decide('https://uploads.example.com/ads.js', 'Script') is None  # only listed domains, not substrings
+
+	# per page-domain overrides replace the blocked resource types, trackers stay blocked
+	page = 'https://www.maps.example.com/place/1'
+	assert blocker.decide('https://tiles.example.com/1/2/3.png', 'Image', page) is None
+	assert blocker.decide('https://fonts.example.com/roboto.woff2', 'Font', page) == 'stub'
+	assert blocker.decide('https://www.googletagmanager.com/gtm.js', 'Script', page) == 'block'
+
+	without_trackers = ResourceBlocker(LeanBrowsingSettings(block_trackers=False, stub_resources=False))
+	assert without_trackers.decide('https://www.google-analytics.com/analytics.js', 'Script') is None
+	assert without_trackers.decide('https://shop.example.com/logo.png', 'Image') == 'block'
+
+
+def test_fetch_patterns_only_pause_candidates():
+	patterns = ResourceBlocker(
+		LeanBrowsingSettings(block_trackers=False, domain_overrides={'example.com': ['Stylesheet']})
+	).fetch_patterns()
+	assert patterns == [
+		{'urlPattern': '*', 'resourceType': resource_type, 'requestStage': 'Request'}
+		for resource_type in ('Font', 'Image', 'Media', 'Stylesheet')
+	]
+
+	with_trackers = ResourceBlocker(LeanBrowsingSettings()).fetch_patterns()
+	assert {'urlPattern': '*://*.doubleclick.net/*', 'requestStage': 'Request'} in with_trackers
+	assert {'urlPattern': '*'} not in with_trackers
+
+	# patterns that can't be expressed as a Fetch URL glob pause everything, decide() still filters
+	assert ResourceBlocker(LeanBrowsingSettings(blocked_domains=['http*://ads.*/*'])).fetch_patterns() == [
+		{'urlPattern': '*', 'requestStage': 'Request'}
+	]
+
+
+def test_stats_estimate_bytes_saved():
+	stats = ResourceBlockingStats()
+	stats.record('Image', 'stub')
+	stats.record('Image', 'stub')
+	stats.record('Ping', 'block')
+	assert (stats.requests_stubbed, stats.requests_blocked) == (2, 1)
+	assert stats.by_resource_type == {'Image': 2, 'Ping': 1}
+	assert stats.estimated_bytes_saved > 0
+
+
+class _FakeFetch:
+	def __init__(self):
+		self.calls = []
+		self.handlers = {}
+
+	def __getattr__(self, method):
+		async def command(params=None, session_id=None):
+			self.calls.append((method, params, session_id))
+			return {}
+
+		return command
+
+
+async def test_watchdog_answers_paused_requests():
+	session = BrowserSession(browser_profile=BrowserProfile(lean_browsing=True, user_data_dir=None))
+	fetch = _FakeFetch()
+	session._cdp_client_root = SimpleNamespace(  # type: ignore[assignment]
+		send=SimpleNamespace(Fetch=fetch),
+		register=SimpleNamespace(
+			Fetch=SimpleNamespace(requestPaused=lambda handler: fetch.handlers.update(requestPaused=handler))
+		),
+	)
+	page = Target(target_id='page-1', target_type='page', url='https://shop.example.com/')
+	session.session_manager = SimpleNamespace(  # type: ignore[assignment]
+		get_target=lambda target_id: page if target_id == 'page-1' else None,
+		get_target_id_from_session_id=lambda session_id: 'page-1',
+	)
+	watchdog = ResourceBlockingWatchdog(browser_session=session, event_bus=EventBus())
+	object.__setattr__(session, '_resource_blocking_watchdog', watchdog)
+
+	await watchdog.on_BrowserConnectedEvent(BrowserConnectedEvent(cdp_url='ws://fake'))
+	enable = fetch.calls.pop()
+	assert enable[0] == 'enable' and enable[1]['handleAuthRequests'] is False
+
+	on_paused = fetch.handlers['requestPaused']
+	requests = [
+		('1', 'https://shop.example.com/logo.png', 'Image', 'frame-x'),
+		('2', 'https://www.google-analytics.com/collect', 'XHR', 'frame-x'),
+		('3', 'https://shop.example.com/api/cart', 'Fetch', 'frame-x'),
+		('4', 'https://www.doubleclick.net/', 'Document', 'page-1'),  # the tab's own navigation
+	]
+	for request_id, url, resource_type, frame_id in requests:
+		on_paused({'requestId': request_id, 'request': {'url': url}, 'resourceType': resource_type, 'frameId': frame_id}, None)
+	await asyncio.gather(*watchdog._cdp_event_tasks)
+
+	calls = {params['requestId']: (method, params) for method, params, _ in fetch.calls}
+	assert calls['1'][0] == 'fulfillRequest' and calls['1'][1]['body'] == TRANSPARENT_GIF_BASE64
+	assert calls['2'] == ('failRequest', {'requestId': '2', 'errorReason': 'BlockedByClient'})
+	assert calls['3'] == ('continueRequest', {'requestId': '3'})
+	assert calls['4'] == ('continueRequest', {'requestId': '4'})
+
+	stats = session.resource_blocking_stats
+	assert stats is not None
+	assert (stats.requests_stubbed, stats.requests_blocked) == (1, 1)
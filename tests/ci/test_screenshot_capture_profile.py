@@ -0,0 +1,91 @@
+"""Tests for the configurable screenshot capture profile and unchanged-viewport screenshot reuse."""
+
+import base64
+import io
+from types import SimpleNamespace
+
+from bubus import EventBus
+from PIL import Image
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.events import ScreenshotEvent
+from browser_use.browser.watchdogs.screenshot_watchdog import ScreenshotWatchdog, thumbnail_difference
+from browser_use.utils import image_media_type
+
+
+def _jpeg(color: tuple[int, int, int], size=(160, 90), box: tuple[int, int, int, int] | None = None) -> bytes:
+	image = Image.new('RGB', size, color)
+	if box:
+		image.paste((255, 0, 0), box)
+	buffer = io.BytesIO()
+	image.save(buffer, format='JPEG', quality=90)
+	return buffer.getvalue()
+
+
+class _FakePage:
+	def __init__(self):
+		self.captures = []
+		self.thumbnail = _jpeg((255, 255, 255))
+
+	async def getLayoutMetrics(self, session_id=None):
+		return {
+			'cssVisualViewport': {'clientWidth': 1600, 'clientHeight': 900, 'pageX': 0, 'pageY': 300},
+			'visualViewport': {'clientWidth': 1600},
+		}
+
+	async def captureScreenshot(self, params, session_id=None):
+		self.captures.append(params)
+		if params.get('clip', {}).get('scale', 1) < 0.5:  # the change detection thumbnail
+			return {'data': base64.b64encode(self.thumbnail).decode()}
+		return {'data': base64.b64encode(_jpeg((0, 0, 0))).decode()}
+
+
+def _make_watchdog(**profile_kwargs) -> tuple[ScreenshotWatchdog, _FakePage]:
+	session = BrowserSession(browser_profile=BrowserProfile(user_data_dir=None, **profile_kwargs))
+	page = _FakePage()
+	cdp_session = SimpleNamespace(cdp_client=SimpleNamespace(send=SimpleNamespace(Page=page)), session_id='session-1')
+
+	async def get_or_create_cdp_session(*args, **kwargs):
+		return cdp_session
+
+	async def remove_highlights():
+		pass
+
+	object.__setattr__(session, 'get_focused_target', lambda: SimpleNamespace(target_type='page', target_id='tab-1'))
+	object.__setattr__(session, 'get_or_create_cdp_session', get_or_create_cdp_session)
+	object.__setattr__(session, 'remove_highlights', remove_highlights)
+	return ScreenshotWatchdog(browser_session=session, event_bus=EventBus()), page
+
+
+async def test_capture_profile_sets_format_and_downscales_in_browser():
+	watchdog, page = _make_watchdog(screenshot_format='jpeg', screenshot_quality=55, screenshot_max_dimension=800)
+
+	screenshot = await watchdog.on_ScreenshotEvent(ScreenshotEvent())
+
+	assert image_media_type(screenshot) == 'image/jpeg'
+	params = page.captures[-1]
+	assert params['format'] == 'jpeg' and params['quality'] == 55
+	assert params['clip'] == {'x': 0, 'y': 300, 'width': 1600, 'height': 900, 'scale': 0.5}
+	assert watchdog.browser_session._screenshot_scale == 0.5
+
+
+async def test_unchanged_viewport_reuses_previous_screenshot():
+	watchdog, page = _make_watchdog(screenshot_change_threshold=0.01)
+
+	first = await watchdog.on_ScreenshotEvent(ScreenshotEvent())
+	second = await watchdog.on_ScreenshotEvent(ScreenshotEvent())
+	assert second == first
+	assert len(page.captures) == 3  # two thumbnails, one full capture
+
+	page.thumbnail = _jpeg((255, 255, 255), box=(10, 10, 60, 40))
+	await watchdog.on_ScreenshotEvent(ScreenshotEvent())
+	assert len(page.captures) == 5
+
+
+def test_thumbnail_difference_ignores_encoding_noise():
+	white = _jpeg((255, 255, 255))
+
+	assert thumbnail_difference(white, white) == 0.0
+	assert thumbnail_difference(white, _jpeg((252, 252, 252))) == 0.0
+	assert 0.05 < thumbnail_difference(white, _jpeg((255, 255, 255), box=(0, 0, 40, 30))) < 0.15
+	assert thumbnail_difference(white, _jpeg((255, 255, 255), size=(80, 45))) == 1.0
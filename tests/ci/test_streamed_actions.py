@@ -0,0 +1,235 @@
+"""
+Tests for stream_actions: the incremental JSON parser, streaming in the OpenAI and Anthropic adapters, and the
+agent executing actions while the model is still generating its output.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from anthropic.types import Message, ToolUseBlock, Usage
+from openai.types.chat import ChatCompletionChunk
+from pydantic import BaseModel
+
+from browser_use.agent.service import Agent
+from browser_use.agent.views import ActionResult
+from browser_use.llm import BaseChatModel
+from browser_use.llm.anthropic.chat import ChatAnthropic
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.openai.chat import ChatOpenAI
+from browser_use.llm.streaming import JSONArrayItemParser
+from browser_use.llm.views import ChatInvokeCompletion
+
+
+def _chunks(text: str, size: int) -> list[str]:
+	return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_parser_yields_each_item_when_it_closes():
+	output = {
+		'thinking': 'the "action" list [is] {next}',
+		'action': [{'click': {'index': 1}}, {'input': {'index': 2, 'text': 'a, b]}'}}, 3, 'x\\"y', [1, [2]], None],
+		'memory': 'm',
+	}
+	text = '```json\n' + json.dumps(output) + '\n```'
+
+	for size in (1, 3, 7, len(text)):
+		parser = JSONArrayItemParser('action')
+		items = [item for chunk in _chunks(text, size) for item in parser.feed(chunk)]
+		assert items == output['action']
+		assert parser.finished
+
+	parser = JSONArrayItemParser('action')
+	assert parser.feed('{"memory": "a", "action": [{"click": {"index": 1}}, {"scroll"') == [{'click': {'index': 1}}]
+	assert parser.feed(': {"down": true}}') == [{'scroll': {'down': True}}]
+	assert parser.feed(']}{"action": [1]}') == []  # nothing after the top-level object
+
+
+class _Output(BaseModel):
+	memory: str
+	action: list[dict]
+
+
+_OUTPUT_JSON = json.dumps({'memory': 'm', 'action': [{'click': {'index': 1}}, {'done': {'text': 'ok'}}]})
+
+
+async def test_openai_streams_structured_output(monkeypatch):
+	chunks = [
+		ChatCompletionChunk.model_validate(
+			{
+				'id': 'c',
+				'object': 'chat.completion.chunk',
+				'created': 0,
+				'model': 'gpt-4.1-mini',
+				'choices': [
+					{'index': 0, 'delta': {'content': part}, 'finish_reason': 'stop' if i == len(_OUTPUT_JSON) // 10 else None}
+				],
+			}
+		)
+		for i, part in enumerate(_chunks(_OUTPUT_JSON, 10))
+	]
+	chunks.append(
+		ChatCompletionChunk.model_validate(
+			{
+				'id': 'c',
+				'object': 'chat.completion.chunk',
+				'created': 0,
+				'model': 'gpt-4.1-mini',
+				'choices': [],
+				'usage': {'prompt_tokens': 10, 'completion_tokens': 5, 'total_tokens': 15},
+			}
+		)
+	)
+	requests = []
+
+	async def create(**params):
+		requests.append(params)
+
+		async def stream():
+			for chunk in chunks:
+				yield chunk
+
+		return stream()
+
+	llm = ChatOpenAI(model='gpt-4.1-mini', api_key='test')
+	monkeypatch.setattr(
+		llm, 'get_client', lambda: SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+	)
+
+	deltas: list[str] = []
+	result = await llm.ainvoke([UserMessage(content='hi')], _Output, on_output_delta=deltas.append)
+
+	assert ''.join(deltas) == _OUTPUT_JSON
+	assert requests[0]['stream'] is True and requests[0]['stream_options'] == {'include_usage': True}
+	assert result.completion == _Output.model_validate_json(_OUTPUT_JSON)
+	assert result.usage is not None and result.usage.total_tokens == 15
+	assert result.stop_reason == 'stop'
+
+
+async def test_anthropic_streams_tool_input(monkeypatch):
+	final_message = Message(
+		id='m',
+		type='message',
+		role='assistant',
+		model='claude-sonnet-4-5',
+		content=[ToolUseBlock(id='t', type='tool_use', name='_Output', input=json.loads(_OUTPUT_JSON))],
+		stop_reason='tool_use',
+		usage=Usage(input_tokens=10, output_tokens=5),
+	)
+
+	class _Stream:
+		async def __aenter__(self):
+			return self
+
+		async def __aexit__(self, *exc):
+			return False
+
+		async def __aiter__(self):
+			yield SimpleNamespace(type='content_block_start')
+			for part in _chunks(_OUTPUT_JSON, 10):
+				yield SimpleNamespace(type='input_json', partial_json=part)
+
+		async def get_final_message(self):
+			return final_message
+
+	llm = ChatAnthropic(model='claude-sonnet-4-5', api_key='test')
+	monkeypatch.setattr(llm, 'get_client', lambda: SimpleNamespace(messages=SimpleNamespace(stream=lambda **params: _Stream())))
+
+	deltas: list[str] = []
+	result = await llm.ainvoke([UserMessage(content='hi')], _Output, on_output_delta=deltas.append)
+
+	assert ''.join(deltas) == _OUTPUT_JSON
+	assert result.completion == _Output.model_validate_json(_OUTPUT_JSON)
+	assert result.usage is not None and result.usage.completion_tokens == 5
+
+
+def _streaming_llm(output: dict, events: list[str]) -> BaseChatModel:
+	"""Mock LLM that streams its output in small chunks and records when it finished."""
+	llm = AsyncMock(spec=BaseChatModel)
+	llm.model = llm.name = llm.model_name = 'mock-llm'
+	llm.provider = 'mock'
+	llm._verified_api_keys = True
+	text = json.dumps(output)
+
+	async def mock_ainvoke(messages, output_format=None, **kwargs):
+		on_output_delta = kwargs.get('on_output_delta')
+		for part in _chunks(text, 8):
+			if on_output_delta is not None:
+				on_output_delta(part)
+			await asyncio.sleep(0.001)
+		events.append('model finished')
+		return ChatInvokeCompletion(completion=output_format.model_validate_json(text), usage=None)
+
+	llm.ainvoke.side_effect = mock_ainvoke
+	return llm
+
+
+def _agent(llm: BaseChatModel, events: list[str], **kwargs) -> Agent:
+	agent = Agent(task='Test task', llm=llm, **kwargs)
+	agent.browser_profile.wait_between_actions = 0
+
+	async def act(action, **act_kwargs):
+		name = next(iter(action.model_dump(exclude_unset=True)))
+		events.append(name)
+		return ActionResult(is_done=name == 'done', success=True if name == 'done' else None)
+
+	agent.tools.act = act  # type: ignore[method-assign]
+	object.__setattr__(agent.browser_session, 'get_current_page_url', AsyncMock(return_value='https://example.com/'))
+	return agent
+
+
+_AGENT_OUTPUT = {
+	'thinking': 'fill the form',
+	'evaluation_previous_goal': 'ok',
+	'memory': 'form page',
+	'next_goal': 'fill the form',
+	'action': [
+		{'input': {'index': 1, 'text': 'Ada'}},
+		{'input': {'index': 2, 'text': 'Lovelace'}},
+		{'click': {'index': 3}},
+	],
+}
+
+
+async def test_agent_executes_streamed_actions_before_the_output_is_complete():
+	events: list[str] = []
+	agent = _agent(_streaming_llm(_AGENT_OUTPUT, events), events, stream_actions=True)
+	state = SimpleNamespace(url='https://example.com/')
+
+	await agent._get_next_action(state)  # type: ignore[arg-type]
+	await agent._execute_actions()
+
+	assert events.index('input') < events.index('model finished')
+	assert [event for event in events if event != 'model finished'] == ['input', 'input', 'click']
+	assert len(agent.state.last_result or []) == 3
+
+
+async def test_agent_streaming_keeps_terminates_sequence_and_max_actions():
+	events: list[str] = []
+	output = {
+		**_AGENT_OUTPUT,
+		'action': [
+			{'navigate': {'url': 'https://example.com/next'}},
+			{'click': {'index': 3}},
+		],
+	}
+	agent = _agent(_streaming_llm(output, events), events, stream_actions=True)
+	await agent._get_next_action(SimpleNamespace(url='https://example.com/'))  # type: ignore[arg-type]
+	await agent._execute_actions()
+	assert 'click' not in events  # navigate terminates the sequence
+	assert len(agent.state.last_result or []) == 1
+
+	events.clear()
+	agent = _agent(_streaming_llm(_AGENT_OUTPUT, events), events, stream_actions=True, max_actions_per_step=2)
+	await agent._get_next_action(SimpleNamespace(url='https://example.com/'))  # type: ignore[arg-type]
+	await agent._execute_actions()
+	assert events.count('input') == 2 and 'click' not in events
+
+
+async def test_agent_without_stream_actions_waits_for_the_output():
+	events: list[str] = []
+	agent = _agent(_streaming_llm(_AGENT_OUTPUT, events), events)
+	await agent._get_next_action(SimpleNamespace(url='https://example.com/'))  # type: ignore[arg-type]
+	await agent._execute_actions()
+	assert events == ['model finished', 'input', 'input', 'click']
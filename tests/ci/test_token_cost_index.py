@@ -0,0 +1,208 @@
+"""Tests for the TokenCost pricing index, background refresh and per-model usage counters."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens.pricing_index import PricingIndex, build_pricing_index
+from browser_use.tokens.service import TokenCost
+from browser_use.tokens.views import CachedPricingData
+
+PRICING = {
+	'sample_spec': {'input_cost_per_token': 'set to the input cost per token', 'max_tokens': 'LEGACY'},
+	'gpt-test': {
+		'input_cost_per_token': 1e-6,
+		'output_cost_per_token': 4e-6,
+		'cache_read_input_token_cost': 5e-7,
+		'max_tokens': 1000,
+		'litellm_provider': 'openai',
+	},
+	'claude-test': {'input_cost_per_token': 3e-6, 'output_cost_per_token': 1.5e-5, 'cache_creation_input_token_cost': 3.75e-6},
+}
+
+
+def _usage(prompt: int, completion: int, cached: int | None = None, creation: int | None = None) -> ChatInvokeUsage:
+	return ChatInvokeUsage(
+		prompt_tokens=prompt,
+		prompt_cached_tokens=cached,
+		prompt_cache_creation_tokens=creation,
+		prompt_image_tokens=None,
+		completion_tokens=completion,
+		total_tokens=prompt + completion,
+	)
+
+
+def _token_cost(tmp_path) -> TokenCost:
+	tc = TokenCost(include_cost=True)
+	tc._cache_dir = tmp_path
+	tc._pricing_index = PricingIndex(tmp_path / TokenCost.PRICING_INDEX_NAME)
+	return tc
+
+
+def test_pricing_index_lookup(tmp_path):
+	fetched_at = datetime(2026, 1, 2, 3, 4, 5)
+	build_pricing_index(tmp_path / 'index.sqlite', PRICING, fetched_at)
+	index = PricingIndex(tmp_path / 'index.sqlite')
+
+	assert index.fetched_at() == fetched_at
+	assert index.get('gpt-test') == {
+		'input_cost_per_token': 1e-6,
+		'output_cost_per_token': 4e-6,
+		'cache_read_input_token_cost': 5e-7,
+		'cache_creation_input_token_cost': None,
+		'max_tokens': 1000,
+		'max_input_tokens': None,
+		'max_output_tokens': None,
+	}
+	assert index.get('sample_spec')['input_cost_per_token'] is None  # type: ignore[index]
+	assert index.get('unknown-model') is None
+	assert PricingIndex(tmp_path / 'missing.sqlite').get('gpt-test') is None
+
+
+async def test_initialize_does_not_wait_for_the_fetch(tmp_path):
+	tc = _token_cost(tmp_path)
+	release = asyncio.Event()
+
+	async def stalled_fetch():
+		await release.wait()
+		await tc._install_pricing_index(PRICING, datetime.now())
+
+	tc._fetch_and_cache_pricing_data = stalled_fetch  # type: ignore[method-assign]
+
+	start = time.monotonic()
+	await tc.initialize()
+	assert time.monotonic() - start < 1
+	assert await tc.get_model_pricing('gpt-test') is None  # no index yet, the refresh is still running
+
+	release.set()
+	assert tc._refresh_task is not None
+	await tc._refresh_task
+	pricing = await tc.get_model_pricing('gpt-test')
+	assert pricing is not None and pricing.output_cost_per_token == 4e-6
+
+
+async def test_fresh_index_is_not_refreshed_and_json_cache_is_migrated(tmp_path):
+	stale = CachedPricingData(timestamp=datetime.now() - timedelta(days=3), data=PRICING)
+	(tmp_path / 'pricing_20260101_000000.json').write_text(stale.model_dump_json())
+
+	tc = _token_cost(tmp_path)
+	fetches = 0
+
+	async def offline_fetch():
+		nonlocal fetches
+		fetches += 1
+
+	tc._fetch_and_cache_pricing_data = offline_fetch  # type: ignore[method-assign]
+	await tc.initialize()
+	assert tc._refresh_task is not None
+	await tc._refresh_task
+
+	# the stale JSON cache of an older version still prices models while offline
+	assert fetches == 1
+	assert (await tc.get_model_pricing('claude-test')) is not None
+
+	build_pricing_index(tmp_path / TokenCost.PRICING_INDEX_NAME, PRICING, datetime.now())
+	fresh = _token_cost(tmp_path)
+	await fresh.initialize()
+	assert fresh._refresh_task is None
+
+
+async def test_counters_match_per_call_costs(tmp_path):
+	build_pricing_index(tmp_path / TokenCost.PRICING_INDEX_NAME, PRICING, datetime.now())
+	tc = _token_cost(tmp_path)
+	calls = [
+		('gpt-test', _usage(1000, 200, cached=400)),
+		('gpt-test', _usage(1500, 50)),
+		('claude-test', _usage(800, 300, creation=600)),
+		('gpt-test', _usage(10, 5, cached=0)),
+	]
+	for model, usage in calls:
+		tc.add_usage(model, usage)
+
+	summary = await tc.get_usage_summary()
+
+	expected = {}
+	for model, usage in calls:
+		cost = await tc.calculate_cost(model, usage)
+		assert cost is not None
+		expected[model] = expected.get(model, 0.0) + cost.total_cost
+
+	assert summary.entry_count == 4
+	assert summary.total_prompt_tokens == 3310
+	assert summary.total_completion_tokens == 555
+	assert summary.total_prompt_cached_tokens == 400
+	assert summary.by_model['gpt-test'].invocations == 3
+	for model, cost in expected.items():
+		assert abs(summary.by_model[model].cost - cost) < 1e-12
+
+	tokens = tc.get_usage_tokens_for_model('gpt-test')
+	assert (tokens.prompt_tokens, tokens.prompt_cached_tokens, tokens.completion_tokens) == (2510, 400, 255)
+
+	only_claude = await tc.get_usage_summary(model='claude-test')
+	assert list(only_claude.by_model) == ['claude-test']
+
+	recent = await tc.get_usage_summary(since=datetime.now() + timedelta(seconds=1))
+	assert recent.entry_count == 0
+
+	tc.clear_history()
+	assert (await tc.get_usage_summary()).entry_count == 0
+
+
+def test_usage_history_is_bounded():
+	tc = TokenCost()
+	for _ in range(TokenCost.USAGE_HISTORY_LIMIT + 10):
+		tc.add_usage('gpt-test', _usage(1, 1))
+
+	assert len(tc.usage_history) == TokenCost.USAGE_HISTORY_LIMIT
+	assert tc.get_usage_tokens_for_model('gpt-test').prompt_tokens == TokenCost.USAGE_HISTORY_LIMIT + 10
+
+
+class _Clock(datetime):
+	current = datetime(2026, 1, 1, 12, 0)
+
+	@classmethod
+	def now(cls, tz=None):
+		return cls.current
+
+
+async def test_usage_summary_since_sums_minute_totals_beyond_the_history(monkeypatch):
+	from browser_use.tokens import service
+
+	monkeypatch.setattr(service, 'datetime', _Clock)
+	monkeypatch.setattr(_Clock, 'current', datetime(2026, 1, 1, 12, 0))
+	tc = TokenCost()
+	first_minute = _Clock.current
+	_Clock.current = first_minute + timedelta(seconds=30)
+	for _ in range(TokenCost.USAGE_HISTORY_LIMIT + 500):
+		tc.add_usage('gpt-test', _usage(2, 1))
+	_Clock.current = first_minute + timedelta(minutes=2)
+	for _ in range(10):
+		tc.add_usage('claude-test', _usage(5, 5))
+
+	# older than the retained entries: summed per minute, the whole minute `since` falls in included
+	summary = await tc.get_usage_summary(since=first_minute + timedelta(seconds=10))
+	assert summary.by_model['gpt-test'].invocations == TokenCost.USAGE_HISTORY_LIMIT + 500
+	assert summary.total_prompt_tokens == 2 * (TokenCost.USAGE_HISTORY_LIMIT + 500) + 50
+
+	only_gpt = await tc.get_usage_summary(model='gpt-test', since=first_minute)
+	assert list(only_gpt.by_model) == ['gpt-test']
+
+	# within the retained entries: exact
+	recent = await tc.get_usage_summary(since=first_minute + timedelta(minutes=1))
+	assert list(recent.by_model) == ['claude-test'] and recent.entry_count == 10
+
+
+def test_old_minute_totals_are_pruned(monkeypatch):
+	from browser_use.tokens import service
+
+	monkeypatch.setattr(service, 'datetime', _Clock)
+	monkeypatch.setattr(_Clock, 'current', datetime(2026, 1, 1, 12, 0))
+	tc = TokenCost()
+	start = _Clock.current
+	tc.add_usage('gpt-test', _usage(1, 1))
+	_Clock.current = start + TokenCost.USAGE_BUCKET_RETENTION + timedelta(minutes=1)
+	tc.add_usage('gpt-test', _usage(1, 1))
+
+	assert list(tc._usage_by_minute) == [_Clock.current]
+	assert tc._usage_by_minute_pruned == start + timedelta(minutes=1)
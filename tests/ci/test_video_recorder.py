@@ -0,0 +1,68 @@
+"""Tests for VideoRecorderService encoding frames on its own thread."""
+
+import base64
+import io
+import threading
+
+from PIL import Image
+
+import browser_use.browser.video_recorder as video_recorder_module
+from browser_use.browser.profile import ViewportSize
+from browser_use.browser.video_recorder import VideoRecorderService
+
+
+def _frame(color: tuple[int, int, int], size=(100, 50)) -> str:
+	buffer = io.BytesIO()
+	Image.new('RGB', size, color).save(buffer, format='PNG')
+	return base64.b64encode(buffer.getvalue()).decode()
+
+
+class _FakeWriter:
+	def __init__(self):
+		self.frames = []
+		self.closed = False
+		self.release = threading.Event()
+		self.release.set()
+
+	def append_data(self, frame):
+		self.release.wait()
+		self.frames.append((frame.shape, frame[8, 8].tolist(), frame[0, 0].tolist()))
+
+	def close(self):
+		self.closed = True
+
+
+def _start(monkeypatch, tmp_path, **kwargs) -> tuple[VideoRecorderService, _FakeWriter]:
+	writer = _FakeWriter()
+	monkeypatch.setattr(video_recorder_module.iio, 'get_writer', lambda *args, **kw: writer)
+	recorder = VideoRecorderService(tmp_path / 'video.mp4', ViewportSize(width=100, height=50), framerate=30, **kwargs)
+	recorder.start()
+	return recorder, writer
+
+
+def test_frames_are_padded_into_reused_buffer_on_encoder_thread(monkeypatch, tmp_path):
+	recorder, writer = _start(monkeypatch, tmp_path)
+	red, blue = _frame((255, 0, 0)), _frame((0, 0, 255), size=(200, 100))
+
+	for frame in (red, red, blue):
+		recorder.add_frame(frame)
+	recorder.stop_and_save()
+
+	# padded to 112x64, centered, black border
+	assert writer.frames == [((64, 112, 3), [255, 0, 0], [0, 0, 0])] * 2 + [((64, 112, 3), [0, 0, 255], [0, 0, 0])]
+	assert recorder.frames_duplicated == 1
+	assert writer.closed
+
+
+def test_frames_are_dropped_instead_of_blocking_when_encoder_is_behind(monkeypatch, tmp_path):
+	recorder, writer = _start(monkeypatch, tmp_path, max_queued_frames=2)
+	writer.release.clear()  # encoder stuck on the first frame
+
+	for index in range(10):
+		recorder.add_frame(_frame((index, 0, 0)))
+
+	writer.release.set()
+	recorder.stop_and_save()
+
+	assert recorder.frames_dropped >= 7
+	assert len(writer.frames) == 10 - recorder.frames_dropped
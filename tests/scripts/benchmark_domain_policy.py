@@ -0,0 +1,108 @@
+"""
+Benchmark SecurityWatchdog URL checks against large allowed_domains lists.
+
+Builds allow-lists mixing exact hosts, *.domain wildcards, URL prefixes and other globs, then times the
+compiled DomainPolicy (cold, i.e. without the decision LRU, and warm) against the per-pattern loop over
+SecurityWatchdog._is_url_match that it replaces.
+
+Usage:
+	python tests/scripts/benchmark_domain_policy.py
+	python tests/scripts/benchmark_domain_policy.py --sizes 1000 5000 --urls 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Add parent directory to path to import browser_use modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bubus import EventBus
+
+from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.domain_policy import DomainPolicy
+from browser_use.browser.watchdogs.security_watchdog import SecurityWatchdog
+
+
+def build_patterns(size: int, rng: random.Random) -> list[str]:
+	patterns = []
+	for i in range(size):
+		kind = rng.random()
+		if kind < 0.5:
+			patterns.append(f'site{i}.com')
+		elif kind < 0.8:
+			patterns.append(f'*.corp{i}.net')
+		elif kind < 0.95:
+			patterns.append(f'https://docs{i}.io/api')
+		else:
+			patterns.append(f'*shop{i}.org')
+	return patterns
+
+
+def build_urls(count: int, size: int, rng: random.Random) -> list[str]:
+	urls = []
+	for _ in range(count):
+		i = rng.randrange(size * 2)  # about half of the URLs miss every pattern
+		kind = rng.random()
+		if kind < 0.4:
+			urls.append(f'https://site{i}.com/page')
+		elif kind < 0.7:
+			urls.append(f'https://app.eu.corp{i}.net/')
+		elif kind < 0.9:
+			urls.append(f'https://docs{i}.io/api/v2')
+		else:
+			urls.append(f'https://myshop{i}.org')
+	return urls
+
+
+def time_calls(fn, urls: list[str]) -> float:
+	start = time.perf_counter()
+	for url in urls:
+		fn(url)
+	return (time.perf_counter() - start) / len(urls) * 1e6
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000])
+	parser.add_argument('--urls', type=int, default=1000)
+	args = parser.parse_args()
+
+	rng = random.Random(42)
+	watchdog = SecurityWatchdog(
+		browser_session=BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None)),
+		event_bus=EventBus(),
+	)
+
+	print(f'{"patterns":>9} {"compile ms":>11} {"loop µs/url":>12} {"cold µs/url":>12} {"warm µs/url":>12}')
+	for size in args.sizes:
+		patterns = build_patterns(size, rng)
+		urls = build_urls(args.urls, size, rng)
+
+		def loop_check(url: str) -> bool:
+			parsed = urlparse(url)
+			host = parsed.hostname or ''
+			return any(watchdog._is_url_match(url, host, parsed.scheme, pattern) for pattern in patterns)
+
+		start = time.perf_counter()
+		cold = DomainPolicy(allowed_domains=patterns, cache_size=0)
+		compile_ms = (time.perf_counter() - start) * 1000
+		warm = DomainPolicy(allowed_domains=patterns, cache_size=len(urls))
+		for url in urls:
+			warm.is_url_allowed(url)
+
+		mismatches = sum(loop_check(url) != cold.is_url_allowed(url) for url in urls)
+		if mismatches:
+			print(f'!! {mismatches} decisions differ from the per-pattern loop')
+
+		loop_us = time_calls(loop_check, urls)
+		cold_us = time_calls(cold.is_url_allowed, urls)
+		warm_us = time_calls(warm.is_url_allowed, urls)
+		print(f'{size:>9} {compile_ms:>11.1f} {loop_us:>12.1f} {cold_us:>12.1f} {warm_us:>12.2f}')
+
+
+if __name__ == '__main__':
+	main()
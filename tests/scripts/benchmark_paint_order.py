@@ -0,0 +1,135 @@
+"""
+Benchmark paint order filtering on synthetic pages with many painted rectangles.
+
+Builds dashboard / infinite-feed shaped pages (a grid of cards, each with a few painted layers, plus sticky
+headers and modal overlays) and times PaintOrderRemover with each rectangle union implementation. With
+--tall-height the feed also gets an opaque wrapper that tall, like a `body` on a long infinite-scroll page.
+
+Usage:
+	python tests/scripts/benchmark_paint_order.py
+	python tests/scripts/benchmark_paint_order.py --sizes 1000 5000 --pure-limit 5000
+	python tests/scripts/benchmark_paint_order.py --sizes 1000 --tall-height 10000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add parent directory to path to import browser_use modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from browser_use.dom.serializer.paint_order import PaintOrderRemover, RectUnion, RectUnionGrid, RectUnionPure
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, EnhancedSnapshotNode, NodeType, SimplifiedNode
+
+PAGE_WIDTH = 1280
+CARD_WIDTH, CARD_HEIGHT = 300, 220
+LAYERS_PER_CARD = 5
+
+
+def _make_node(backend_node_id: int, bounds: DOMRect, paint_order: int, background: str) -> SimplifiedNode:
+	snapshot = EnhancedSnapshotNode(
+		is_clickable=None,
+		cursor_style=None,
+		bounds=bounds,
+		clientRects=None,
+		scrollRects=None,
+		computed_styles={'background-color': background, 'opacity': '1'},
+		paint_order=paint_order,
+		stacking_contexts=None,
+	)
+	original = EnhancedDOMTreeNode(
+		node_id=backend_node_id,
+		backend_node_id=backend_node_id,
+		node_type=NodeType.ELEMENT_NODE,
+		node_name='DIV',
+		node_value='',
+		attributes={},
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='benchmark',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=snapshot,
+	)
+	return SimplifiedNode(original_node=original, children=[])
+
+
+def build_page(rect_count: int, seed: int = 0, tall_height: float = 0) -> SimplifiedNode:
+	"""A flat page of roughly `rect_count` painted nodes laid out as a feed of cards."""
+	rng = random.Random(seed)
+	cards_per_row = PAGE_WIDTH // CARD_WIDTH
+	card_count = rect_count // LAYERS_PER_CARD
+	page_height = (card_count // cards_per_row + 1) * CARD_HEIGHT
+
+	next_id = 1
+	root = _make_node(next_id, DOMRect(x=0, y=0, width=PAGE_WIDTH, height=page_height), 0, 'rgb(255, 255, 255)')
+	paint_order = 1
+
+	if tall_height:
+		next_id += 1
+		bounds = DOMRect(x=0, y=0, width=PAGE_WIDTH, height=tall_height)
+		root.children.append(_make_node(next_id, bounds, paint_order, 'rgb(255, 255, 255)'))
+		paint_order += 1
+
+	for card in range(card_count):
+		x = (card % cards_per_row) * CARD_WIDTH + rng.uniform(0, 10)
+		y = (card // cards_per_row) * CARD_HEIGHT + rng.uniform(0, 10)
+		for layer in range(LAYERS_PER_CARD):
+			inset = layer * 12
+			next_id += 1
+			bounds = DOMRect(x=x + inset, y=y + inset, width=CARD_WIDTH - 2 * inset, height=CARD_HEIGHT - 2 * inset)
+			background = 'rgb(250, 250, 250)' if layer % 2 == 0 else 'rgba(0, 0, 0, 0)'
+			root.children.append(_make_node(next_id, bounds, paint_order, background))
+			paint_order += 1
+
+		# every 50 cards: a sticky header / overlay painted above everything before it
+		if card % 50 == 49:
+			next_id += 1
+			bounds = DOMRect(x=0, y=y - rng.uniform(0, 400), width=PAGE_WIDTH, height=rng.uniform(60, 600))
+			root.children.append(_make_node(next_id, bounds, paint_order, 'rgb(0, 0, 0)'))
+			paint_order += 1
+
+	return root
+
+
+def time_union(union_factory: Callable[[], RectUnion], rect_count: int, tall_height: float = 0) -> tuple[float, int]:
+	page = build_page(rect_count, tall_height=tall_height)
+	start = time.perf_counter()
+	PaintOrderRemover(page, union_factory=union_factory).calculate_paint_order()
+	elapsed = time.perf_counter() - start
+	return elapsed, sum(1 for node in page.children if node.ignored_by_paint_order)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 10000, 25000, 50000])
+	parser.add_argument('--pure-limit', type=int, default=2000, help='skip the (quadratic) RectUnionPure above this many rects')
+	parser.add_argument('--tall-height', type=float, default=0, help='add an opaque full-width wrapper this many px tall')
+	args = parser.parse_args()
+
+	print(f'{"rects":>8} {"union":>14} {"seconds":>10} {"ignored":>9}')
+	for size in args.sizes:
+		results = {}
+		for union_factory in (RectUnionGrid, RectUnionPure):
+			if union_factory is RectUnionPure and size > args.pure_limit:
+				print(f'{size:>8} {union_factory.__name__:>14} {"skipped":>10}')
+				continue
+			elapsed, ignored = time_union(union_factory, size, args.tall_height)
+			results[union_factory.__name__] = ignored
+			print(f'{size:>8} {union_factory.__name__:>14} {elapsed:>10.3f} {ignored:>9}')
+		if len(set(results.values())) > 1:
+			print(f'  MISMATCH at {size} rects: {results}')
+
+
+if __name__ == '__main__':
+	main()
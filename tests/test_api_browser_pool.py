@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+from api import BrowserPool, CommandRequest, run_agent, stop_agent
+
+
+class FakeBrowser:
+	def __init__(self, slot):
+		self.slot = slot
+		self.started = False
+		self.killed = False
+
+	async def start(self):
+		self.started = True
+
+	async def kill(self):
+		self.killed = True
+
+
+@pytest.mark.asyncio
+async def test_lease_reuses_idle_session_and_waits_at_max_size():
+	pool = BrowserPool(FakeBrowser, min_size=0, max_size=2, idle_timeout=0)
+
+	async with pool.lease() as first:
+		async with pool.lease() as second:
+			assert {first.slot, second.slot} == {0, 1}
+
+			waiter = asyncio.create_task(pool.lease().__aenter__())
+			await asyncio.sleep(0.01)
+			assert not waiter.done()  # pool exhausted
+
+		third = await asyncio.wait_for(waiter, timeout=1)
+		assert third is second
+
+	assert pool.stats() == {'idle': 1, 'leased': 1, 'max': 2}
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_recycled_down_to_min_size():
+	pool = BrowserPool(FakeBrowser, min_size=1, max_size=3, idle_timeout=0)
+
+	async with pool.lease() as a, pool.lease() as b, pool.lease() as c:
+		pass
+
+	killed = await pool.reap_idle()
+
+	assert killed == 2
+	assert pool.stats()['idle'] == 1
+	assert sum(browser.killed for browser in (a, b, c)) == 2
+
+	# the freed slots (and their profile dirs) are handed out again
+	async with pool.lease() as again, pool.lease() as fresh:
+		assert {again.slot, fresh.slot} <= {0, 1, 2}
+
+
+@pytest.mark.asyncio
+async def test_warm_up_starts_min_size_sessions():
+	pool = BrowserPool(FakeBrowser, min_size=2, max_size=3, idle_timeout=0)
+
+	await pool.warm_up()
+
+	assert pool.stats() == {'idle': 2, 'leased': 0, 'max': 3}
+
+
+@pytest.mark.asyncio
+async def test_warm_up_does_not_block_leases_while_a_browser_starts():
+	launched = asyncio.Event()
+	release_launch = asyncio.Event()
+
+	class SlowBrowser(FakeBrowser):
+		async def start(self):
+			launched.set()
+			await release_launch.wait()
+			await super().start()
+
+	pool = BrowserPool(SlowBrowser, min_size=1, max_size=2, idle_timeout=0)
+	warm_up = asyncio.create_task(pool.warm_up())
+	await launched.wait()
+
+	async with asyncio.timeout(1):
+		async with pool.lease() as leased:
+			assert leased.slot == 1  # slot 0 is held by the browser being started
+	assert pool.stats() == {'idle': 1, 'leased': 0, 'max': 2}
+
+	release_launch.set()
+	await warm_up
+	assert pool.stats() == {'idle': 2, 'leased': 0, 'max': 2}
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failure_releases_the_slot():
+	class BrokenBrowser(FakeBrowser):
+		async def start(self):
+			raise RuntimeError('chrome did not start')
+
+	pool = BrowserPool(BrokenBrowser, min_size=1, max_size=1, idle_timeout=0)
+	with pytest.raises(RuntimeError):
+		await pool.warm_up()
+
+	assert pool.size == 0
+	async with pool.lease() as browser:
+		assert browser.slot == 0 and not browser.killed  # a fresh session, not the dead one
+
+
+@pytest.mark.asyncio
+async def test_stop_agent_cancels_only_the_requested_run(monkeypatch):
+	import api
+
+	async def forever():
+		await asyncio.sleep(3600)
+
+	runs = {'run-a': asyncio.create_task(forever()), 'run-b': asyncio.create_task(forever())}
+	monkeypatch.setattr(api, 'active_runs', runs)
+
+	result = await stop_agent(run_id='run-a')
+	await asyncio.sleep(0)
+
+	assert result == {'status': 'success', 'stopped': 1}
+	assert runs['run-a'].cancelled()
+	assert not runs['run-b'].done()
+
+	assert (await stop_agent(run_id='unknown'))['status'] == 'info'
+	assert (await stop_agent())['stopped'] == 1
+
+
+@pytest.mark.asyncio
+async def test_closing_the_stream_keeps_the_run_stoppable_until_it_releases_its_lease(monkeypatch):
+	import api
+
+	class PooledBrowser(FakeBrowser):
+		_id_for_logs = 'fake'
+
+	class StuckOrchestrator:
+		closed = False
+
+		def __init__(self, browser, model_name):
+			pass
+
+		async def run(self, command, thread_id):
+			yield {'planner': {'plan': [{'description': 'wait'}]}}
+			await asyncio.sleep(3600)
+
+		async def close(self):
+			StuckOrchestrator.closed = True
+
+	pool = BrowserPool(PooledBrowser, min_size=0, max_size=1, idle_timeout=0)
+	monkeypatch.setattr(api, 'browser_pool', pool)
+	monkeypatch.setattr(api, 'LAMOrchestrator', StuckOrchestrator)
+	monkeypatch.setattr(api, 'active_runs', {})
+
+	response = await run_agent(CommandRequest(command='wait forever'))
+	run_id = response.headers['X-Run-Id']
+	stream = response.body_iterator
+	assert '"run"' in await anext(stream)
+	assert 'Plano gerado' in await anext(stream)
+	await stream.aclose()  # the client went away mid-run
+
+	task = api.active_runs[run_id]
+	assert not task.done() and pool.stats()['leased'] == 1  # the run is still going
+	assert (await stop_agent(run_id=run_id))['stopped'] == 1
+
+	await asyncio.wait([task], timeout=1)
+	assert task.cancelled() and StuckOrchestrator.closed
+	assert pool.stats()['leased'] == 0
+	assert run_id not in api.active_runs
@@ -0,0 +1,67 @@
+import io
+
+import pytest
+from fastapi import HTTPException
+from PIL import Image
+
+import api
+from api import FrameStore, encode_frame, get_frame, read_screenshot
+
+
+def _png(width: int, height: int) -> bytes:
+	output = io.BytesIO()
+	Image.new('RGBA', (width, height), (200, 10, 10, 255)).save(output, format='PNG')
+	return output.getvalue()
+
+
+def test_encode_frame_downscales_to_jpeg():
+	frame = encode_frame(_png(1920, 1080), max_width=960, quality=50)
+
+	with Image.open(io.BytesIO(frame)) as image:
+		assert image.format == 'JPEG'
+		assert image.size == (960, 540)
+
+
+def test_encode_frame_keeps_small_screenshots_at_original_size():
+	frame = encode_frame(_png(400, 300), max_width=960)
+
+	with Image.open(io.BytesIO(frame)) as image:
+		assert image.size == (400, 300)
+
+
+def test_read_screenshot_reuses_agent_screenshot(tmp_path):
+	screenshot = tmp_path / 'step_3.png'
+	screenshot.write_bytes(b'png-bytes')
+
+	assert read_screenshot(str(screenshot)) == b'png-bytes'
+	assert read_screenshot(str(tmp_path / 'missing.png')) is None
+	assert read_screenshot(None) is None
+
+
+def test_frame_store_evicts_oldest_runs_and_frames():
+	store = FrameStore(max_runs=2, max_frames_per_run=2)
+	store.put('run-a', '1', b'a1')
+	store.put('run-b', '1', b'b1')
+	store.put('run-b', '2', b'b2')
+	store.put('run-b', '3', b'b3')
+	store.put('run-c', '1', b'c1')
+
+	assert store.get('run-a', '1') is None
+	assert store.get('run-b', '1') is None
+	assert store.get('run-b', '3') == b'b3'
+	assert store.get('run-c', '1') == b'c1'
+
+
+@pytest.mark.asyncio
+async def test_get_frame_serves_jpeg_or_404(monkeypatch):
+	store = FrameStore()
+	store.put('run-a', '1', b'jpeg')
+	monkeypatch.setattr(api, 'frame_store', store)
+
+	response = await get_frame('run-a', '1')
+	assert response.body == b'jpeg'
+	assert response.media_type == 'image/jpeg'
+
+	with pytest.raises(HTTPException) as excinfo:
+		await get_frame('run-a', '2')
+	assert excinfo.value.status_code == 404
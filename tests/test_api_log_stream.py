@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+
+import api
+from api import LogStream, SSELogHandler
+
+
+def _stream(max_records=500, policy='drop_oldest'):
+	loop = asyncio.get_running_loop()
+	wakeups = []
+	stream = LogStream(loop, lambda: wakeups.append(1), start_time=0, max_records=max_records, policy=policy)
+	return stream, wakeups
+
+
+@pytest.mark.asyncio
+async def test_burst_of_lines_wakes_the_loop_once():
+	stream, wakeups = _stream()
+
+	for i in range(100):
+		stream.append(f'line {i}')
+	await asyncio.sleep(0)
+
+	assert wakeups == [1]
+	events = stream.drain_events()
+	assert [event['message'] for event in events[:2]] == ['[SYS] line 0', '[SYS] line 1']
+	assert len(events) == 100
+
+	stream.append('after drain')
+	await asyncio.sleep(0)
+	assert wakeups == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_repeated_lines_are_coalesced():
+	stream, _ = _stream()
+
+	for _ in range(5):
+		stream.append('waiting for network')
+	stream.append('done')
+
+	assert [event['message'] for event in stream.drain_events()] == ['[SYS] waiting for network (x5)', '[SYS] done']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	('policy', 'kept'), [('drop_oldest', ['line 7', 'line 8', 'line 9']), ('drop_newest', ['line 0', 'line 1', 'line 2'])]
+)
+async def test_full_buffer_drops_and_reports(policy, kept):
+	stream, _ = _stream(max_records=3, policy=policy)
+	dropped_before = api.log_stream_counters['dropped']
+
+	for i in range(10):
+		stream.append(f'line {i}')
+	events = stream.drain_events()
+
+	assert 'descartadas' in events[0]['message'] and '7' in events[0]['message']
+	assert [event['message'] for event in events[1:]] == [f'[SYS] {line}' for line in kept]
+	assert stream.dropped == 7
+	assert api.log_stream_counters['dropped'] - dropped_before == 7
+	assert stream.drain_events() == []
+
+
+@pytest.mark.asyncio
+async def test_handler_filters_level_and_run_and_accepts_other_threads():
+	stream, _ = _stream()
+	handler = SSELogHandler(stream, run_id='run-a', level=logging.WARNING)
+	logger = logging.getLogger('browser_use.test_log_stream')
+	logger.addHandler(handler)
+	logger.setLevel(logging.DEBUG)
+	token = api.current_run_id.set('run-a')
+	try:
+		logger.info('too verbose')
+		logger.warning('from run a')
+		thread = threading.Thread(target=lambda: logger.warning('from a thread outside the run'))
+		thread.start()
+		thread.join()
+		api.current_run_id.set('run-b')
+		logger.warning('from run b')
+	finally:
+		api.current_run_id.reset(token)
+		logger.removeHandler(handler)
+
+	assert [event['message'] for event in stream.drain_events()] == ['[SYS] from run a']
+
+
+@pytest.mark.asyncio
+async def test_client_log_level_is_restored_when_the_last_client_leaves():
+	stream, _ = _stream()
+	logger = logging.getLogger('browser_use.test_log_level')
+	logger.setLevel(logging.INFO)
+	debug_a = SSELogHandler(stream, run_id='run-a', level=logging.DEBUG)
+	debug_b = SSELogHandler(stream, run_id='run-b', level=logging.DEBUG)
+	warning_c = SSELogHandler(stream, run_id='run-c', level=logging.WARNING)
+
+	api.attach_log_handler(logger, warning_c)
+	assert logger.level == logging.INFO
+	api.attach_log_handler(logger, debug_a)
+	api.attach_log_handler(logger, debug_b)
+	assert logger.level == logging.DEBUG
+
+	api.detach_log_handler(logger, debug_a)
+	assert logger.level == logging.DEBUG  # run b still streams DEBUG
+	api.detach_log_handler(logger, debug_b)
+	assert logger.level == logging.INFO
+	api.detach_log_handler(logger, warning_c)
+	assert logger.level == logging.INFO and not logger.handlers